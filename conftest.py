@@ -1,7 +1,80 @@
 from pathlib import Path
+import os
 import sys
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from engine.bootstrap import BootstrapSnapshot, set_bootstrap_snapshot  # noqa: E402
+from engine.ingestion.deduplication import _reset_hash_bloom_filter  # noqa: E402
+from engine.ingestion.raw_store import ContentAddressedRawStore, set_raw_store  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def in_memory_bootstrap_snapshot():
+    """
+    Keep compiled configs in memory instead of engine/data/bootstrap/.
+
+    Lens, extraction and category loads go through the process-wide bootstrap
+    snapshot, which otherwise writes snapshot.json into the working tree
+    (including entries for temporary test lenses).
+    """
+    set_bootstrap_snapshot(BootstrapSnapshot(None))
+    yield
+    set_bootstrap_snapshot(None)
+
+
+@pytest.fixture(autouse=True)
+def temporary_raw_store(tmp_path):
+    """Write raw payloads saved through the process-wide store outside engine/data/raw/objects."""
+    set_raw_store(ContentAddressedRawStore(tmp_path / "raw_objects"))
+    yield
+    set_raw_store(None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_hash_bloom_filter():
+    """Never carry a bloom filter warmed from one test's database into the next."""
+    _reset_hash_bloom_filter()
+    yield
+    _reset_hash_bloom_filter()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def in_memory_circuit_breakers():
+    """Keep circuit breaker state per process so failures never leak between test runs."""
+    previous = os.environ.get("CIRCUIT_BREAKER_BACKEND")
+    os.environ["CIRCUIT_BREAKER_BACKEND"] = "memory"
+    yield
+    if previous is None:
+        os.environ.pop("CIRCUIT_BREAKER_BACKEND", None)
+    else:
+        os.environ["CIRCUIT_BREAKER_BACKEND"] = previous
+
+
+@pytest.fixture(autouse=True, scope="session")
+def in_memory_rate_limits():
+    """Keep token bucket state per process so test runs never share persisted tokens."""
+    previous = os.environ.get("RATE_LIMIT_BACKEND")
+    os.environ["RATE_LIMIT_BACKEND"] = "memory"
+    yield
+    if previous is None:
+        os.environ.pop("RATE_LIMIT_BACKEND", None)
+    else:
+        os.environ["RATE_LIMIT_BACKEND"] = previous
+
+
+@pytest.fixture(autouse=True, scope="session")
+def lens_contracts_dir(tmp_path_factory):
+    """Write lens contract snapshots (engine.extraction.relens) outside the working tree."""
+    previous = os.environ.get("LENS_CONTRACTS_DIR")
+    os.environ["LENS_CONTRACTS_DIR"] = str(tmp_path_factory.mktemp("lens_contracts"))
+    yield
+    if previous is None:
+        os.environ.pop("LENS_CONTRACTS_DIR", None)
+    else:
+        os.environ["LENS_CONTRACTS_DIR"] = previous
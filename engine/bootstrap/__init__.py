@@ -0,0 +1,23 @@
+"""
+Warm bootstrap snapshot.
+
+Compiled lens, extraction, category and source configs are cached on disk by
+the BootstrapSnapshot in engine.bootstrap.snapshot, so process start-up reads
+one file instead of parsing and validating every YAML input.
+"""
+
+from engine.bootstrap.snapshot import (
+    BootstrapSnapshot,
+    get_bootstrap_snapshot,
+    load_compiled,
+    set_bootstrap_snapshot,
+    warm_bootstrap,
+)
+
+__all__ = [
+    "BootstrapSnapshot",
+    "get_bootstrap_snapshot",
+    "load_compiled",
+    "set_bootstrap_snapshot",
+    "warm_bootstrap",
+]
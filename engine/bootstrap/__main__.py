@@ -0,0 +1,36 @@
+"""
+Compile engine configs into the warm bootstrap snapshot.
+
+Usage:
+    python -m engine.bootstrap
+    python -m engine.bootstrap --lens edinburgh_finds
+"""
+
+import argparse
+
+from engine.bootstrap.snapshot import warm_bootstrap
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compile engine configs into the warm bootstrap snapshot",
+    )
+    parser.add_argument(
+        "--lens",
+        default=None,
+        help="Lens ID to compile as well (engine/lenses/<lens_id>/lens.yaml)",
+    )
+
+    args = parser.parse_args()
+
+    stats = warm_bootstrap(args.lens)
+    print(
+        f"bootstrap snapshot: {stats['path']} "
+        f"({stats['entries']} entries, {stats['compiled']} compiled, {stats['hits']} reused)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,242 @@
+"""
+Warm bootstrap snapshot of compiled engine configuration.
+
+Every process start parses and validates the same YAML files: lens.yaml
+(strict load, validation including the regex checks, contract hash),
+extraction.yaml and canonical_categories.yaml. The snapshot stores their
+compiled results in one JSON file:
+
+- Each entry is keyed by (kind, resolved source path) and records the
+  SHA-256 of the source file it was compiled from. An entry is reused only
+  while the file's bytes are unchanged, so only edited inputs are recompiled.
+- The file also records the snapshot format and an engine version: a hash of
+  the modules that parse and validate these configs. Changing that code
+  discards the whole snapshot.
+- The file is read once per process; a cold or changed input is compiled,
+  stored and written back atomically. Entries for deleted files are dropped
+  when the snapshot is written.
+
+Values that do not survive a JSON round trip (e.g. YAML dates or integer
+keys) are compiled every time instead of being stored. sources.yaml holds API
+keys and is never snapshotted; engine.ingestion.sources_config caches it in
+memory only.
+
+Usage:
+    python -m engine.bootstrap --lens edinburgh_finds
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ENGINE_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_SNAPSHOT_PATH = ENGINE_DIR / "data" / "bootstrap" / "snapshot.json"
+
+# Bump when the snapshot file layout changes
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Modules whose code decides what a compiled config looks like
+COMPILER_MODULES = (
+    "bootstrap/snapshot.py",
+    "extraction/config.py",
+    "extraction/utils/category_mapper.py",
+    "lenses/loader.py",
+    "lenses/regex_guard.py",
+    "lenses/validator.py",
+    "modules/validator.py",
+    "orchestration/lens_bootstrap.py",
+    "orchestration/registry.py",
+)
+
+
+@lru_cache(maxsize=1)
+def engine_version() -> str:
+    """Hash of the snapshot format and the config compiler modules."""
+    digest = hashlib.sha256(f"format:{SNAPSHOT_FORMAT_VERSION}".encode("utf-8"))
+    for relative_path in COMPILER_MODULES:
+        path = ENGINE_DIR / relative_path
+        if path.exists():
+            digest.update(relative_path.encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def file_hash(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of a file's bytes."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _json_stable(value: Any) -> bool:
+    """True if value comes back unchanged from a JSON round trip."""
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+class BootstrapSnapshot:
+    """
+    On-disk cache of compiled configs, keyed by source file hash.
+
+    Attributes:
+        path: Snapshot file (None keeps entries in memory only)
+        hits: Loads served from the snapshot
+        compiled: Loads that had to compile their source
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = DEFAULT_SNAPSHOT_PATH):
+        """
+        Args:
+            path: Snapshot file location (None: do not persist)
+        """
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.compiled = 0
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.RLock()
+
+    def _read_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Entries of the snapshot file, or {} if missing, unreadable or stale."""
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable bootstrap snapshot {self.path}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("engine_version") != engine_version():
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Entries in memory, read from disk on first use."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_entries()
+            return self._entries
+
+    def _write(self) -> None:
+        """Merge with the file on disk and replace it atomically."""
+        if self.path is None:
+            return
+
+        # Keep what other processes compiled meanwhile, drop entries whose source is gone
+        merged = {**self._read_entries(), **self._entries}
+        merged = {key: entry for key, entry in merged.items() if Path(entry["source"]).exists()}
+        self._entries = merged
+
+        payload = {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "engine_version": engine_version(),
+            "entries": merged,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # The snapshot only speeds up start-up; never fail a load because of it
+            logger.warning(f"Could not write bootstrap snapshot {self.path}: {e}")
+
+    def load(self, kind: str, source: Union[str, Path], compile: Callable[[Path], Any]) -> Any:
+        """
+        Return the compiled form of a config file.
+
+        Args:
+            kind: Compiler name (distinguishes several compilations of one file)
+            source: Config file to compile
+            compile: Builds the compiled value from the file path
+
+        Returns:
+            Compiled value (a copy the caller may modify)
+
+        Raises:
+            FileNotFoundError: If source doesn't exist
+            Exception: Whatever compile raises (nothing is stored)
+        """
+        source = Path(source)
+        source_hash = file_hash(source)
+        key = f"{kind}:{source.resolve()}"
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.get("source_hash") == source_hash:
+                self.hits += 1
+                return copy.deepcopy(entry["value"])
+
+            value = compile(source)
+            self.compiled += 1
+            if _json_stable(value):
+                self._entries[key] = {
+                    "source": str(source.resolve()),
+                    "source_hash": source_hash,
+                    "value": copy.deepcopy(value),
+                }
+                self._write()
+            return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for logs and reports."""
+        return {
+            "path": str(self.path) if self.path is not None else None,
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "compiled": self.compiled,
+        }
+
+
+_default_snapshot: Optional[BootstrapSnapshot] = None
+
+
+def get_bootstrap_snapshot() -> BootstrapSnapshot:
+    """Process-wide snapshot."""
+    global _default_snapshot
+    if _default_snapshot is None:
+        _default_snapshot = BootstrapSnapshot()
+    return _default_snapshot
+
+
+def set_bootstrap_snapshot(snapshot: Optional[BootstrapSnapshot]) -> None:
+    """Replace the process-wide snapshot (None builds the default on next use)."""
+    global _default_snapshot
+    _default_snapshot = snapshot
+
+
+def load_compiled(kind: str, source: Union[str, Path], compile: Callable[[Path], Any]) -> Any:
+    """Compile a config file through the process-wide snapshot (see BootstrapSnapshot.load)."""
+    return get_bootstrap_snapshot().load(kind, source, compile)
+
+
+def warm_bootstrap(lens_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Compile every engine config into the snapshot.
+
+    Args:
+        lens_id: Lens to compile as well (optional)
+
+    Returns:
+        Snapshot stats after warming
+    """
+    from engine.extraction.config import load_extraction_config
+    from engine.extraction.utils.category_mapper import DEFAULT_CONFIG_PATH, load_config
+
+    load_extraction_config()
+    if DEFAULT_CONFIG_PATH.exists():
+        load_config()
+    if lens_id:
+        from engine.orchestration.lens_bootstrap import bootstrap_lens
+
+        bootstrap_lens(lens_id)
+    return get_bootstrap_snapshot().stats()
@@ -0,0 +1,15 @@
+"""
+Shared database client.
+
+The engine talks to one Prisma client per process, handed out by the
+ref-counted DbClientProvider in engine.db.client.
+"""
+
+from engine.db.client import (
+    DbClientProvider,
+    db_client,
+    get_db_provider,
+    set_db_provider,
+)
+
+__all__ = ["DbClientProvider", "db_client", "get_db_provider", "set_db_provider"]
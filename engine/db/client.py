@@ -0,0 +1,168 @@
+"""
+Ref-counted Prisma client provider.
+
+Each Prisma().connect() starts the query engine and opens a fresh connection
+pool, so modules that build their own client per call pay that cost every
+time. DbClientProvider holds one client per process instead:
+
+- acquire() connects on the first reference and returns the shared client;
+  release() disconnects when the last reference is released.
+- db_client(db) yields an injected client untouched, or a reference to the
+  shared one. Functions that accept an optional `db` use it, so nested
+  callers share the outermost caller's connection.
+- stats() reports connect/disconnect counts and time spent connecting.
+
+Entry points (CLIs, the orchestration planner) hold a reference for their
+whole run, so the helpers they call reuse one connection.
+
+Example:
+    async with db_client() as db:
+        count = await db.rawingestion.count()
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+
+class DbClientProvider:
+    """
+    One shared Prisma client, connected while referenced.
+
+    Attributes:
+        connects: Completed connect() calls
+        disconnects: Completed disconnect() calls
+        connect_seconds: Total time spent in connect()
+    """
+
+    def __init__(self, factory: Optional[Callable[[], Any]] = None):
+        """
+        Args:
+            factory: Builds the client (default: Prisma)
+        """
+        if factory is None:
+            # Imported here so that importing engine.db does not load the Prisma client
+            from prisma import Prisma
+
+            factory = Prisma
+        self.factory = factory
+        self.connects = 0
+        self.disconnects = 0
+        self.connect_seconds = 0.0
+        self._client: Optional[Any] = None
+        self._connected = False
+        self._refs = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    @property
+    def client(self) -> Any:
+        """The shared client, built on first use (connected only while referenced)."""
+        if self._client is None:
+            self._client = self.factory()
+        return self._client
+
+    @property
+    def refs(self) -> int:
+        """References currently held."""
+        return self._refs
+
+    async def acquire(self) -> Any:
+        """
+        Take a reference to the shared client, connecting it if needed.
+
+        Returns:
+            Connected client
+
+        Raises:
+            Exception: If connecting fails (no reference is taken)
+        """
+        async with self._get_lock():
+            client = self.client
+            if not self._connected:
+                started = time.perf_counter()
+                await client.connect()
+                self.connect_seconds += time.perf_counter() - started
+                self.connects += 1
+                self._connected = True
+            self._refs += 1
+            return client
+
+    async def release(self) -> None:
+        """Drop a reference; the last one disconnects the client."""
+        async with self._get_lock():
+            if self._refs == 0:
+                return
+            self._refs -= 1
+            if self._refs == 0 and self._connected:
+                self._connected = False
+                await self._client.disconnect()
+                self.disconnects += 1
+
+    @asynccontextmanager
+    async def session(self, db: Optional[Any] = None) -> AsyncIterator[Any]:
+        """
+        Yield db if given, otherwise a reference to the shared client.
+
+        Args:
+            db: Connected client supplied by the caller (left as is)
+        """
+        if db is not None:
+            yield db
+            return
+
+        client = await self.acquire()
+        try:
+            yield client
+        finally:
+            await self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection counters for logs and reports."""
+        return {
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "connect_seconds": round(self.connect_seconds, 6),
+            "refs": self._refs,
+            "connected": self._connected,
+        }
+
+
+_default_provider: Optional[DbClientProvider] = None
+
+
+def get_db_provider() -> DbClientProvider:
+    """Process-wide provider."""
+    global _default_provider
+    if _default_provider is None:
+        _default_provider = DbClientProvider()
+    return _default_provider
+
+
+def set_db_provider(provider: Optional[DbClientProvider]) -> None:
+    """Replace the process-wide provider (None builds a new one on next use)."""
+    global _default_provider
+    _default_provider = provider
+
+
+def db_client(db: Optional[Any] = None):
+    """
+    Async context yielding db, or a reference to the process-wide client.
+
+    Args:
+        db: Optional connected client supplied by the caller
+
+    Example:
+        async def count_raw(db: Optional[Prisma] = None) -> int:
+            async with db_client(db) as client:
+                return await client.rawingestion.count()
+    """
+    return get_db_provider().session(db)
@@ -26,8 +26,15 @@ class BaseExtractor(ABC):
     Implementations are responsible for transforming raw ingestion payloads
     into structured entity fields, validating outputs, and separating
     schema-defined attributes from discovered attributes.
+
+    Attributes:
+        extractor_version: Bump when a change alters the extractor's output
+            for the same payload; stored extractions made by an older
+            version are then re-extracted instead of reused.
     """
 
+    extractor_version: str = "1"
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -1,38 +1,59 @@
 """
 Extraction configuration loader.
+
+extraction.yaml is parsed through the warm bootstrap snapshot
+(engine.bootstrap), so it is only re-parsed when the file changes.
 """
 
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import yaml
 
+from engine.bootstrap import load_compiled
+
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config" / "extraction.yaml"
 
 REQUIRED_ROOT_KEYS = {"llm", "trust_levels"}
 REQUIRED_LLM_KEYS = {"model"}
 
 
-def load_extraction_config(config_path: Optional[str] = None) -> Dict[str, Any]:
+def _parse_yaml(config_path: Path) -> Dict[str, Any]:
+    with open(config_path, "r") as handle:
+        return yaml.safe_load(handle) or {}
+
+
+def read_extraction_yaml(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
     """
-    Load and validate extraction configuration from YAML.
+    Parse extraction.yaml without validating it.
 
     Args:
         config_path: Optional path to extraction.yaml
 
     Returns:
-        Dict[str, Any]: Validated configuration dictionary
-    """
-    if config_path is None:
-        config_path = Path(__file__).parent.parent / "config" / "extraction.yaml"
-    else:
-        config_path = Path(config_path)
+        Dict[str, Any]: Parsed configuration (a copy the caller may modify)
 
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+    """
+    config_path = Path(config_path) if config_path is not None else DEFAULT_CONFIG_PATH
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    return load_compiled("extraction_yaml", config_path, _parse_yaml)
 
-    with open(config_path, "r") as handle:
-        config = yaml.safe_load(handle) or {}
 
+def load_extraction_config(config_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load and validate extraction configuration from YAML.
+
+    Args:
+        config_path: Optional path to extraction.yaml
+
+    Returns:
+        Dict[str, Any]: Validated configuration dictionary
+    """
+    config = read_extraction_yaml(config_path)
     _validate_extraction_config(config)
     return config
 
@@ -14,6 +14,7 @@ from typing import Any, Dict, Iterable, List, Optional
 
 from prisma import Prisma
 
+from engine.db import db_client
 from engine.extraction.health_check import calculate_health_metrics
 
 
@@ -98,13 +99,14 @@ def _format_timestamp(value: Optional[datetime]) -> str:
     return "unknown"
 
 
-async def fetch_health_metrics() -> Dict[str, Any]:
-    """Fetch extraction health metrics from the database."""
-    db = Prisma()
+async def fetch_health_metrics(db: Optional[Prisma] = None) -> Dict[str, Any]:
+    """
+    Fetch extraction health metrics from the database.
 
-    await db.connect()
-
-    try:
+    Args:
+        db: Optional connected Prisma client (default: the shared client)
+    """
+    async with db_client(db) as db:
         raw_records = await db.rawingestion.find_many()
         extracted_entities = await db.extractedlisting.find_many()
         failed_extractions = await db.failedextraction.find_many()
@@ -119,8 +121,6 @@ async def fetch_health_metrics() -> Dict[str, Any]:
             failed_extractions=failed_extractions,
             merge_conflicts=merge_conflicts,
         )
-    finally:
-        await db.disconnect()
 
 
 def format_health_report(
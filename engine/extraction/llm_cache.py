@@ -23,6 +23,8 @@ import json
 from typing import Dict, Any, Optional
 from prisma import Prisma
 
+from engine.db import db_client
+
 try:
     from engine.extraction.logging_config import get_extraction_logger
     logger = get_extraction_logger()
@@ -65,12 +67,13 @@ def compute_cache_key(raw_data: Dict[str, Any], prompt: str, model: str) -> str:
     return hash_obj.hexdigest()
 
 
-async def check_llm_cache(cache_key: str) -> Optional[Dict[str, Any]]:
+async def check_llm_cache(cache_key: str, db: Optional[Prisma] = None) -> Optional[Dict[str, Any]]:
     """
     Check if cached extraction exists for the given cache key.
 
     Args:
         cache_key: The extraction cache key (SHA-256 hash)
+        db: Optional connected Prisma client (default: the shared client)
 
     Returns:
         Dictionary with cached extraction data if found, None otherwise.
@@ -84,10 +87,7 @@ async def check_llm_cache(cache_key: str) -> Optional[Dict[str, Any]]:
         ... else:
         ...     result = await llm_client.extract(...)
     """
-    db = Prisma()
-    await db.connect()
-
-    try:
+    async with db_client(db) as db:
         # Look for ExtractedEntity with matching extraction_hash
         record = await db.extractedlisting.find_first(
             where={"extraction_hash": cache_key}
@@ -119,9 +119,6 @@ async def check_llm_cache(cache_key: str) -> Optional[Dict[str, Any]]:
             "entity_type": record.entity_type,
         }
 
-    finally:
-        await db.disconnect()
-
 
 async def store_llm_cache(
     cache_key: str,
@@ -132,6 +129,7 @@ async def store_llm_cache(
     raw_ingestion_id: str,
     discovered_attributes: Optional[Dict[str, Any]] = None,
     external_ids: Optional[Dict[str, Any]] = None,
+    db: Optional[Prisma] = None,
 ) -> str:
     """
     Store LLM extraction result in cache.
@@ -149,6 +147,7 @@ async def store_llm_cache(
         raw_ingestion_id: RawIngestion record ID (required)
         discovered_attributes: Optional discovered attributes
         external_ids: Optional external ID mappings
+        db: Optional connected Prisma client (default: the shared client)
 
     Returns:
         Created ExtractedEntity record ID
@@ -164,10 +163,7 @@ async def store_llm_cache(
         ...     raw_ingestion_id="cmk123..."
         ... )
     """
-    db = Prisma()
-    await db.connect()
-
-    try:
+    async with db_client(db) as db:
         # Serialize JSON fields
         attributes_json = json.dumps(attributes, separators=(',', ':'))
         discovered_json = (
@@ -198,16 +194,14 @@ async def store_llm_cache(
         logger.info(f"Stored extraction in cache: {cache_key[:16]}...")
         return record.id
 
-    finally:
-        await db.disconnect()
-
 
-async def clear_llm_cache(cache_key: str) -> bool:
+async def clear_llm_cache(cache_key: str, db: Optional[Prisma] = None) -> bool:
     """
     Remove cached extraction entry.
 
     Args:
         cache_key: The extraction cache key to delete
+        db: Optional connected Prisma client (default: the shared client)
 
     Returns:
         True if entry was deleted, False if not found
@@ -217,10 +211,7 @@ async def clear_llm_cache(cache_key: str) -> bool:
         >>> if deleted:
         ...     print("Cache cleared")
     """
-    db = Prisma()
-    await db.connect()
-
-    try:
+    async with db_client(db) as db:
         # Find and delete
         record = await db.extractedlisting.find_first(
             where={"extraction_hash": cache_key}
@@ -233,14 +224,14 @@ async def clear_llm_cache(cache_key: str) -> bool:
         logger.info(f"Cleared cache entry: {cache_key[:16]}...")
         return True
 
-    finally:
-        await db.disconnect()
 
-
-async def get_cache_stats() -> Dict[str, Any]:
+async def get_cache_stats(db: Optional[Prisma] = None) -> Dict[str, Any]:
     """
     Get cache statistics.
 
+    Args:
+        db: Optional connected Prisma client (default: the shared client)
+
     Returns:
         Dictionary with cache metrics:
         - total_entries: Total cached extractions
@@ -252,10 +243,7 @@ async def get_cache_stats() -> Dict[str, Any]:
         >>> stats = await get_cache_stats()
         >>> print(f"Cache has {stats['total_entries']} entries")
     """
-    db = Prisma()
-    await db.connect()
-
-    try:
+    async with db_client(db) as db:
         # Count total cached entries (those with extraction_hash)
         total = await db.extractedlisting.count(
             where={"extraction_hash": {"not": None}}
@@ -284,6 +272,3 @@ async def get_cache_stats() -> Dict[str, Any]:
                 if item["model_used"]
             },
         }
-
-    finally:
-        await db.disconnect()
@@ -14,11 +14,8 @@ Features:
 import os
 from typing import TypeVar, Type, Optional, Dict, Any
 from pydantic import BaseModel, ValidationError
-import anthropic
-import instructor
-from pathlib import Path
-import yaml
 
+from engine.extraction.config import read_extraction_yaml
 from engine.extraction.llm_cost import get_usage_tracker, calculate_cost
 from engine.extraction.logging_config import get_extraction_logger, log_llm_call
 
@@ -52,7 +49,11 @@ class InstructorClient:
         # Load configuration
         self._load_config()
 
-        # Initialize Anthropic client with Instructor
+        # Initialize Anthropic client with Instructor. Imported here so the
+        # LLM stack only loads when an LLM extractor actually runs.
+        import anthropic
+        import instructor
+
         self.anthropic_client = anthropic.Anthropic(api_key=self.api_key)
         self.client = instructor.from_anthropic(self.anthropic_client)
 
@@ -69,10 +70,7 @@ class InstructorClient:
 
     def _load_config(self):
         """Load model configuration from extraction.yaml"""
-        config_path = Path(__file__).parent.parent / "config" / "extraction.yaml"
-
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = read_extraction_yaml()
 
         self.model_name = config.get('llm', {}).get('model', 'claude-haiku-20250318')
 
@@ -8,8 +8,8 @@ the value from the most trusted source.
 
 from dataclasses import dataclass, field as dataclass_field
 from typing import Dict, List, Optional, Any
-import yaml
-from pathlib import Path
+
+from engine.extraction.config import read_extraction_yaml
 
 # ---------------------------------------------------------------------------
 # Missingness predicate — single source of truth (architecture.md 9.4)
@@ -75,12 +75,8 @@ class TrustHierarchy:
         Args:
             config_path: Path to extraction.yaml config file
         """
-        if config_path is None:
-            # Default to engine/config/extraction.yaml
-            config_path = Path(__file__).parent.parent / "config" / "extraction.yaml"
-
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Default to engine/config/extraction.yaml
+        config = read_extraction_yaml(config_path)
 
         self.trust_levels: Dict[str, int] = config.get("trust_levels", {})
         self.default_trust = self.trust_levels.get("unknown_source", 10)
@@ -21,6 +21,7 @@ from engine.extraction.extractors import (
     OSMExtractor,
 )
 from engine.ingestion.deduplication import compute_content_hash
+from engine.ingestion.raw_store import load_raw_payload
 from engine.orchestration.execution_context import ExecutionContext
 
 
@@ -63,12 +64,6 @@ def _safe_json_dumps(value: Any) -> Optional[str]:
         return json.dumps({"detail": str(value)})
 
 
-def load_raw_payload(file_path: str) -> Any:
-    """Load a raw ingestion payload from disk."""
-    with open(file_path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
 def _get_items_for_source(source: str, payload: Any) -> List[Any]:
     if source == "google_places":
         if isinstance(payload, dict):
@@ -0,0 +1,765 @@
+"""
+Incremental Re-Lens Job
+
+Re-applies a changed lens contract to published Entity rows without
+re-extracting anything. The previously applied and the new compiled lens
+contracts are diffed (mapping rules, values, module triggers, modules) and
+only the Entity rows that the changed parts can affect have their
+canonical_* dimensions and modules recomputed.
+
+Bookkeeping:
+    - LensEntity.lensHash records the lens hash last applied to each entity
+    - Compiled contracts are snapshotted once per hash under
+      <LENS_CONTRACTS_DIR>/<lens_id>/<lens_hash>.json (default
+      engine/data/lens_contracts) so the previous contract can be recovered
+      for diffing
+    - Entities already on the current hash are skipped; entities whose
+      previous contract cannot be recovered get a full re-lens, as do
+      entities with no recorded hash or no lens membership at all (these are
+      attached to the lens when stamped)
+
+Re-lensing evaluates rules against the published Entity fields (entity_name,
+description, raw_categories, summary, street_address, discovered_attributes),
+which is the same surface the mapping engine uses during extraction.
+
+Usage:
+    python -m engine.extraction.relens --lens edinburgh_finds
+    python -m engine.extraction.relens --lens edinburgh_finds --from path/to/old/lens.yaml --dry-run
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from prisma import Json, Prisma
+
+from engine.extraction.lens_integration import (
+    build_canonical_values_by_facet,
+    enrich_mapping_rules,
+)
+from engine.extraction.merging import CANONICAL_ARRAY_FIELDS, TrustHierarchy
+from engine.extraction.module_extractor import evaluate_module_triggers, execute_field_rules
+from engine.lenses.mapping_engine import execute_mapping_rules, stabilize_canonical_dimensions
+from engine.lenses.ops import (
+    attach_entities_to_lenses,
+    get_applied_lens_hashes,
+    record_applied_lens_hash,
+    restamp_lens_hash,
+)
+
+
+# Compiled lens contract snapshots, one JSON file per (lens_id, lens_hash);
+# the LENS_CONTRACTS_DIR environment variable overrides the location
+LENS_SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / "data" / "lens_contracts"
+
+# Snapshot files this process has written or found (skips re-checking per run)
+_saved_snapshots: Set[Path] = set()
+
+# Entity columns the re-lens job reads to re-evaluate rules
+RELENS_ENTITY_FIELDS = (
+    "entity_name",
+    "description",
+    "raw_categories",
+    "summary",
+    "street_address",
+)
+
+
+# ============================================================
+# Contract snapshots
+# ============================================================
+
+def resolve_snapshot_dir(snapshot_dir: Optional[Path] = None) -> Path:
+    """Snapshot root: the argument, else LENS_CONTRACTS_DIR, else LENS_SNAPSHOT_DIR."""
+    if snapshot_dir is not None:
+        return Path(snapshot_dir)
+    return Path(os.getenv("LENS_CONTRACTS_DIR") or LENS_SNAPSHOT_DIR)
+
+
+def save_contract_snapshot(
+    lens_id: str,
+    lens_hash: str,
+    lens_contract: Dict[str, Any],
+    snapshot_dir: Optional[Path] = None,
+) -> Path:
+    """
+    Persist a compiled lens contract keyed by its hash (write-once).
+
+    Called on every finalize; after the first call for a hash the process
+    returns without touching the filesystem.
+
+    Args:
+        lens_id: Lens identifier
+        lens_hash: Content hash of the contract
+        lens_contract: Compiled lens contract
+        snapshot_dir: Root directory for snapshots (see resolve_snapshot_dir)
+
+    Returns:
+        Path of the snapshot file
+    """
+    path = resolve_snapshot_dir(snapshot_dir) / lens_id / f"{lens_hash}.json"
+    if path in _saved_snapshots:
+        return path
+
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(dict(lens_contract), sort_keys=True), encoding="utf-8")
+        tmp_path.replace(path)
+    _saved_snapshots.add(path)
+    return path
+
+
+def load_contract_snapshot(
+    lens_id: str,
+    lens_hash: str,
+    snapshot_dir: Optional[Path] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a previously snapshotted lens contract.
+
+    Args:
+        lens_id: Lens identifier
+        lens_hash: Content hash of the contract
+        snapshot_dir: Root directory for snapshots (see resolve_snapshot_dir)
+
+    Returns:
+        Compiled lens contract, or None if no snapshot exists for the hash
+    """
+    path = resolve_snapshot_dir(snapshot_dir) / lens_id / f"{lens_hash}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+# ============================================================
+# Contract diff
+# ============================================================
+
+def _canonical_json(value: Any) -> str:
+    """Deterministic JSON encoding used for structural comparison."""
+    return json.dumps(value, sort_keys=True)
+
+
+def _rule_key(rule: Dict[str, Any]) -> str:
+    """Identity of a mapping rule: its id, or canonical + pattern when unnamed."""
+    if rule.get("id"):
+        return f"id:{rule['id']}"
+    return f"rule:{rule.get('canonical')}:{rule.get('pattern')}"
+
+
+@dataclass
+class LensContractDiff:
+    """
+    Structural difference between two compiled lens contracts.
+
+    Only parts of the contract that influence canonical_* dimensions or
+    modules are tracked. Display metadata (labels, icons, SEO) is ignored.
+
+    Attributes:
+        added_rules: Mapping rules present only in the new contract
+        removed_rules: Mapping rules present only in the old contract
+        changed_rules: (old, new) pairs for rules whose definition changed
+        changed_values: Value keys added, removed, or moved to another facet
+        added_triggers: Module triggers present only in the new contract
+        removed_triggers: Module triggers present only in the old contract
+        changed_modules: Module names added, removed, or redefined
+        facets_changed: True if any facet → dimension_source mapping changed
+    """
+
+    added_rules: List[Dict[str, Any]] = field(default_factory=list)
+    removed_rules: List[Dict[str, Any]] = field(default_factory=list)
+    changed_rules: List[tuple] = field(default_factory=list)
+    changed_values: Set[str] = field(default_factory=set)
+    added_triggers: List[Dict[str, Any]] = field(default_factory=list)
+    removed_triggers: List[Dict[str, Any]] = field(default_factory=list)
+    changed_modules: Set[str] = field(default_factory=set)
+    facets_changed: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the contracts are equivalent for canonical_* and modules."""
+        return not (
+            self.added_rules or self.removed_rules or self.changed_rules
+            or self.changed_values or self.added_triggers or self.removed_triggers
+            or self.changed_modules or self.facets_changed
+        )
+
+    @property
+    def requires_full_relens(self) -> bool:
+        """Facet re-mapping moves values between dimensions for every entity."""
+        return self.facets_changed
+
+    @property
+    def affected_canonicals(self) -> Set[str]:
+        """Canonical value keys whose presence on an entity may change."""
+        canonicals = set(self.changed_values)
+        for rule in self.added_rules + self.removed_rules:
+            if rule.get("canonical"):
+                canonicals.add(rule["canonical"])
+        for old_rule, new_rule in self.changed_rules:
+            for rule in (old_rule, new_rule):
+                if rule.get("canonical"):
+                    canonicals.add(rule["canonical"])
+        return canonicals
+
+    @property
+    def candidate_rules(self) -> List[Dict[str, Any]]:
+        """New-contract rules that may now match entities they did not before."""
+        return self.added_rules + [new_rule for _old, new_rule in self.changed_rules]
+
+    @property
+    def changed_trigger_values(self) -> Set[tuple]:
+        """(facet, value) pairs whose module triggers were added or removed."""
+        pairs = set()
+        for trigger in self.added_triggers + self.removed_triggers:
+            when = trigger.get("when", {})
+            if when.get("facet") and when.get("value"):
+                pairs.add((when["facet"], when["value"]))
+        return pairs
+
+    def summary(self) -> Dict[str, int]:
+        """Counts per change kind, for reporting."""
+        return {
+            "rules_added": len(self.added_rules),
+            "rules_removed": len(self.removed_rules),
+            "rules_changed": len(self.changed_rules),
+            "values_changed": len(self.changed_values),
+            "triggers_added": len(self.added_triggers),
+            "triggers_removed": len(self.removed_triggers),
+            "modules_changed": len(self.changed_modules),
+            "facets_changed": int(self.facets_changed),
+        }
+
+
+def diff_lens_contracts(old_contract: Dict[str, Any], new_contract: Dict[str, Any]) -> LensContractDiff:
+    """
+    Diff two compiled lens contracts.
+
+    Args:
+        old_contract: Previously applied lens contract
+        new_contract: Lens contract about to be applied
+
+    Returns:
+        LensContractDiff describing every change that can affect
+        canonical_* dimensions or modules
+
+    Example:
+        >>> old = {"mapping_rules": [{"id": "r1", "pattern": "(?i)padel", "canonical": "padel"}]}
+        >>> new = {"mapping_rules": [{"id": "r1", "pattern": "(?i)pad[e3]l", "canonical": "padel"}]}
+        >>> diff_lens_contracts(old, new).affected_canonicals
+        {"padel"}
+    """
+    diff = LensContractDiff()
+
+    # Mapping rules (keyed by id)
+    old_rules = {_rule_key(r): r for r in old_contract.get("mapping_rules", [])}
+    new_rules = {_rule_key(r): r for r in new_contract.get("mapping_rules", [])}
+    for key, rule in new_rules.items():
+        if key not in old_rules:
+            diff.added_rules.append(rule)
+        elif _canonical_json(old_rules[key]) != _canonical_json(rule):
+            diff.changed_rules.append((old_rules[key], rule))
+    for key, rule in old_rules.items():
+        if key not in new_rules:
+            diff.removed_rules.append(rule)
+
+    # Values: only the facet assignment matters for dimensions
+    old_value_facets = {v.get("key"): v.get("facet") for v in old_contract.get("values", [])}
+    new_value_facets = {v.get("key"): v.get("facet") for v in new_contract.get("values", [])}
+    for key in set(old_value_facets) | set(new_value_facets):
+        if old_value_facets.get(key) != new_value_facets.get(key):
+            diff.changed_values.add(key)
+
+    # Facets: only the dimension_source mapping matters
+    old_dimensions = {k: f.get("dimension_source") for k, f in old_contract.get("facets", {}).items()}
+    new_dimensions = {k: f.get("dimension_source") for k, f in new_contract.get("facets", {}).items()}
+    diff.facets_changed = old_dimensions != new_dimensions
+
+    # Module triggers (triggers carry no id, so compare structurally)
+    old_triggers = {_canonical_json(t): t for t in old_contract.get("module_triggers", [])}
+    new_triggers = {_canonical_json(t): t for t in new_contract.get("module_triggers", [])}
+    diff.added_triggers = [t for key, t in new_triggers.items() if key not in old_triggers]
+    diff.removed_triggers = [t for key, t in old_triggers.items() if key not in new_triggers]
+
+    # Modules
+    old_modules = old_contract.get("modules", {})
+    new_modules = new_contract.get("modules", {})
+    for name in set(old_modules) | set(new_modules):
+        if name not in old_modules or name not in new_modules:
+            diff.changed_modules.add(name)
+        elif _canonical_json(old_modules[name]) != _canonical_json(new_modules[name]):
+            diff.changed_modules.add(name)
+
+    return diff
+
+
+# ============================================================
+# Entity selection and recomputation
+# ============================================================
+
+def _entity_text_fields(entity: Dict[str, Any]) -> List[str]:
+    """String values of every field mapping rules may search."""
+    texts = []
+    for field_name in RELENS_ENTITY_FIELDS:
+        value = entity.get(field_name)
+        if value:
+            texts.append(str(value))
+    discovered = entity.get("discovered_attributes")
+    if isinstance(discovered, dict):
+        texts.extend(str(value) for value in discovered.values() if value is not None)
+    return texts
+
+
+def _entity_canonicals(entity: Dict[str, Any]) -> Set[str]:
+    """Union of the entity's canonical_* values across all dimensions."""
+    values: Set[str] = set()
+    for dimension in CANONICAL_ARRAY_FIELDS:
+        values.update(entity.get(dimension) or [])
+    return values
+
+
+def _trigger_modules_for_values(
+    triggers: Iterable[Dict[str, Any]],
+    modules: Set[str],
+) -> Set[str]:
+    """Trigger values whose triggers attach any of the given modules."""
+    values = set()
+    for trigger in triggers:
+        if set(trigger.get("add_modules", [])) & modules:
+            value = trigger.get("when", {}).get("value")
+            if value:
+                values.add(value)
+    return values
+
+
+def is_entity_affected(
+    entity: Dict[str, Any],
+    diff: LensContractDiff,
+    new_contract: Dict[str, Any],
+) -> bool:
+    """
+    Decide whether a contract diff can change an entity's canonical_* or modules.
+
+    An entity is affected if it currently carries a canonical value touched by
+    the diff (it may lose it), if an added/changed rule now matches its text
+    (it may gain a value), if it carries a value whose module triggers changed,
+    or if it has (or would be triggered into) a redefined module.
+
+    Args:
+        entity: Entity dict (canonical_* arrays, modules, text fields)
+        diff: Contract diff to evaluate
+        new_contract: Contract being applied
+
+    Returns:
+        True if the entity must be recomputed
+    """
+    if diff.requires_full_relens:
+        return True
+
+    current = _entity_canonicals(entity)
+
+    if current & diff.affected_canonicals:
+        return True
+
+    if current & {value for _facet, value in diff.changed_trigger_values}:
+        return True
+
+    if diff.changed_modules:
+        if set((entity.get("modules") or {}).keys()) & diff.changed_modules:
+            return True
+        triggering = _trigger_modules_for_values(
+            new_contract.get("module_triggers", []), diff.changed_modules
+        )
+        if current & triggering:
+            return True
+
+    texts = _entity_text_fields(entity)
+    for rule in diff.candidate_rules:
+        pattern = rule.get("pattern")
+        if pattern and any(re.search(pattern, text) for text in texts):
+            return True
+
+    return False
+
+
+def _entity_sources(entity: Dict[str, Any]) -> List[str]:
+    """Contributing connectors, recovered from provenance and external IDs."""
+    sources = set()
+    source_info = entity.get("source_info")
+    if isinstance(source_info, dict):
+        sources.update(s for s in source_info.values() if isinstance(s, str) and s != "merged")
+    external_ids = entity.get("external_ids")
+    if isinstance(external_ids, dict):
+        sources.update(key[:-3] for key in external_ids if key.endswith("_id"))
+    return TrustHierarchy().sort_by_trust(sorted(sources)) if sources else [""]
+
+
+def _fill_missing(target: Dict[str, Any], incoming: Dict[str, Any]) -> None:
+    """Recursively copy keys from incoming that target does not have yet."""
+    for key, value in incoming.items():
+        if key not in target:
+            target[key] = value
+        elif isinstance(target[key], dict) and isinstance(value, dict):
+            _fill_missing(target[key], value)
+
+
+def _compute_module(
+    module_def: Dict[str, Any],
+    entity: Dict[str, Any],
+    sources: List[str],
+) -> Dict[str, Any]:
+    """Run a module's field rules once per contributing source, trust order first."""
+    field_rules = module_def.get("field_rules", [])
+    if not field_rules:
+        return {}
+
+    module_fields: Dict[str, Any] = {}
+    for source in sources:
+        _fill_missing(module_fields, execute_field_rules(field_rules, entity, source))
+    return module_fields
+
+
+def relens_entity(
+    entity: Dict[str, Any],
+    new_contract: Dict[str, Any],
+    diff: Optional[LensContractDiff] = None,
+) -> Dict[str, Any]:
+    """
+    Recompute canonical_* dimensions and modules for a single entity.
+
+    With a diff, only the canonical values the diff touches are re-decided and
+    module data is kept for modules whose definition did not change. Without a
+    diff (or when facets changed) everything is recomputed from the contract.
+
+    Args:
+        entity: Entity dict (canonical_* arrays, modules, text fields, entity_class)
+        new_contract: Contract being applied
+        diff: Optional diff against the contract previously applied
+
+    Returns:
+        Dict with canonical_activities, canonical_roles, canonical_place_types,
+        canonical_access and modules
+    """
+    facets = new_contract.get("facets", {})
+    enriched_rules = enrich_mapping_rules(
+        new_contract.get("mapping_rules", []),
+        facets,
+        new_contract.get("values", []),
+    )
+    incremental = diff is not None and not diff.requires_full_relens
+
+    if incremental:
+        affected = diff.affected_canonicals
+        dimensions = {
+            dimension: [v for v in (entity.get(dimension) or []) if v not in affected]
+            for dimension in CANONICAL_ARRAY_FIELDS
+        }
+        rules = [rule for rule in enriched_rules if rule["canonical"] in affected]
+        for dimension, values in execute_mapping_rules(rules, entity).items():
+            dimensions.setdefault(dimension, []).extend(values)
+    else:
+        dimensions = execute_mapping_rules(enriched_rules, entity)
+    dimensions = stabilize_canonical_dimensions(dimensions)
+
+    # Module triggers are re-evaluated against the full new dimension set
+    entity_class = entity.get("entity_class")
+    required_modules = evaluate_module_triggers(
+        new_contract.get("module_triggers", []),
+        {
+            "entity_class": entity_class,
+            "canonical_values_by_facet": build_canonical_values_by_facet(dimensions, facets),
+        },
+    )
+
+    current_modules = entity.get("modules") or {}
+    modules_config = new_contract.get("modules", {})
+    sources = _entity_sources(entity)
+    modules: Dict[str, Any] = {}
+
+    for module_name in sorted(required_modules):
+        if module_name not in modules_config:
+            continue
+        if incremental and module_name in current_modules and module_name not in diff.changed_modules:
+            modules[module_name] = current_modules[module_name]
+            continue
+        module_fields = _compute_module(modules_config[module_name], entity, sources)
+        if module_fields:
+            modules[module_name] = module_fields
+
+    return {**dimensions, "modules": modules}
+
+
+def _entity_to_dict(entity: Any) -> Dict[str, Any]:
+    """Flatten a Prisma Entity row into the plain dict the rule engines expect."""
+    data = {
+        "id": entity.id,
+        "entity_class": entity.entity_class,
+        "modules": entity.modules or {},
+        "discovered_attributes": entity.discovered_attributes or {},
+        "source_info": entity.source_info or {},
+        "external_ids": entity.external_ids or {},
+    }
+    for field_name in RELENS_ENTITY_FIELDS:
+        data[field_name] = getattr(entity, field_name, None)
+    for dimension in CANONICAL_ARRAY_FIELDS:
+        data[dimension] = list(getattr(entity, dimension, None) or [])
+    return data
+
+
+def _relens_changed(entity: Dict[str, Any], result: Dict[str, Any]) -> bool:
+    """True if recomputed dimensions or modules differ from the stored row."""
+    for dimension in CANONICAL_ARRAY_FIELDS:
+        if sorted(entity.get(dimension) or []) != result.get(dimension, []):
+            return True
+    return _canonical_json(entity.get("modules") or {}) != _canonical_json(result["modules"])
+
+
+# ============================================================
+# Job
+# ============================================================
+
+async def run_relens(
+    db: Prisma,
+    lens_id: str,
+    lens_contract: Dict[str, Any],
+    lens_hash: str,
+    previous_contract: Optional[Dict[str, Any]] = None,
+    dry_run: bool = False,
+    batch_size: int = 500,
+    snapshot_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Re-apply a lens contract to Entity rows affected by a contract change.
+
+    Members of the lens are scanned, plus entities that belong to no lens
+    (finalized before memberships were recorded). Entities are grouped by
+    their recorded lens hash. Each group is diffed against the new contract
+    (using previous_contract if given, otherwise the snapshot for that hash).
+    Unaffected rows are only re-stamped; affected rows have canonical_* and
+    modules recomputed and written back. Entities without a recorded hash
+    always get a full re-lens.
+
+    Args:
+        db: Connected Prisma client
+        lens_id: Lens identifier
+        lens_contract: Compiled contract to apply
+        lens_hash: Hash of lens_contract
+        previous_contract: Optional contract to diff against for every stale
+                           entity (overrides snapshots, e.g. from --from)
+        dry_run: If True, compute changes without writing
+        batch_size: Entity page size
+        snapshot_dir: Root directory for contract snapshots (see resolve_snapshot_dir)
+
+    Returns:
+        Stats dict: scanned, current, affected, updated, unchanged,
+        restamped, full_relens, and the per-hash diff summaries
+    """
+    if not dry_run:
+        save_contract_snapshot(lens_id, lens_hash, lens_contract, snapshot_dir)
+
+    applied_hashes = await get_applied_lens_hashes(db, lens_id)
+
+    stats: Dict[str, Any] = {
+        "scanned": 0,
+        "current": 0,
+        "affected": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "restamped": 0,
+        "full_relens": 0,
+        "diffs": {},
+    }
+    diffs: Dict[Optional[str], Optional[LensContractDiff]] = {}
+    stale_hashes: Set[str] = set()
+    stamp_ids: List[str] = []
+    attach_ids: List[str] = []
+
+    def diff_for(applied_hash: Optional[str]) -> Optional[LensContractDiff]:
+        # Nothing records which contract built an unstamped entity
+        if applied_hash is None:
+            return None
+        if applied_hash not in diffs:
+            old_contract = previous_contract
+            if old_contract is None and applied_hash:
+                old_contract = load_contract_snapshot(lens_id, applied_hash, snapshot_dir)
+            diffs[applied_hash] = (
+                diff_lens_contracts(old_contract, lens_contract) if old_contract is not None else None
+            )
+            if diffs[applied_hash] is not None:
+                stats["diffs"][applied_hash] = diffs[applied_hash].summary()
+        return diffs[applied_hash]
+
+    cursor: Optional[str] = None
+    while True:
+        where: Dict[str, Any] = {
+            "OR": [
+                {"lensMemberships": {"some": {"lensId": lens_id}}},
+                {"lensMemberships": {"none": {}}},
+            ]
+        }
+        if cursor:
+            where["id"] = {"gt": cursor}
+        query: Dict[str, Any] = {"where": where, "take": batch_size, "order": {"id": "asc"}}
+        rows = await db.entity.find_many(**query)
+        if not rows:
+            break
+        cursor = rows[-1].id
+
+        for row in rows:
+            stats["scanned"] += 1
+            applied_hash = applied_hashes.get(row.id)
+
+            if applied_hash == lens_hash:
+                stats["current"] += 1
+                continue
+
+            entity = _entity_to_dict(row)
+            diff = diff_for(applied_hash)
+
+            if diff is None:
+                stats["full_relens"] += 1
+            elif not is_entity_affected(entity, diff, lens_contract):
+                # Stamp moves in bulk per hash below; the Entity is untouched
+                stale_hashes.add(applied_hash)
+                continue
+
+            stats["affected"] += 1
+            result = relens_entity(entity, lens_contract, diff)
+            stamp_ids.append(row.id)
+            if row.id not in applied_hashes:
+                attach_ids.append(row.id)
+
+            if not _relens_changed(entity, result):
+                stats["unchanged"] += 1
+                continue
+
+            stats["updated"] += 1
+            if not dry_run:
+                await db.entity.update(
+                    where={"id": row.id},
+                    data={
+                        **{dimension: result[dimension] for dimension in CANONICAL_ARRAY_FIELDS},
+                        "modules": Json(result["modules"]),
+                    },
+                )
+
+        if len(rows) < batch_size:
+            break
+
+    if not dry_run:
+        for applied_hash in stale_hashes:
+            stats["restamped"] += await restamp_lens_hash(db, lens_id, applied_hash, lens_hash)
+        await attach_entities_to_lenses([(lens_id, entity_id) for entity_id in attach_ids], db=db)
+        await record_applied_lens_hash(db, lens_id, stamp_ids, lens_hash)
+
+    return stats
+
+
+def format_relens_report(lens_id: str, lens_hash: str, stats: Dict[str, Any]) -> str:
+    """Format run_relens stats for CLI output."""
+    lines = [
+        f"Re-lens: {lens_id} @ {lens_hash[:12]}",
+        f"  Scanned:      {stats['scanned']}",
+        f"  Up to date:   {stats['current']}",
+        f"  Affected:     {stats['affected']}",
+        f"  Updated:      {stats['updated']}",
+        f"  Unchanged:    {stats['unchanged']}",
+        f"  Re-stamped:   {stats['restamped']}",
+        f"  Full re-lens: {stats['full_relens']}",
+    ]
+    for applied_hash, summary in stats["diffs"].items():
+        changes = ", ".join(f"{k}={v}" for k, v in summary.items() if v)
+        lines.append(f"  Diff from {str(applied_hash)[:12]}: {changes or 'no effective changes'}")
+    return "\n".join(lines)
+
+
+async def main_async(
+    lens_id: str,
+    previous_path: Optional[str] = None,
+    dry_run: bool = False,
+    batch_size: int = 500,
+) -> int:
+    """Bootstrap the lens, connect to the database and run the re-lens job."""
+    from engine.orchestration.lens_bootstrap import bootstrap_lens, compile_lens_contract
+
+    ctx = bootstrap_lens(lens_id)
+
+    previous_contract = None
+    if previous_path:
+        path = Path(previous_path)
+        if path.suffix == ".json":
+            previous_contract = json.loads(path.read_text(encoding="utf-8"))
+        else:
+            previous_contract = compile_lens_contract(path)
+
+    db = Prisma()
+    try:
+        await db.connect()
+    except Exception as exc:
+        print(f"Database connection failed: {exc}")
+        return 1
+
+    try:
+        stats = await run_relens(
+            db,
+            lens_id,
+            dict(ctx.lens_contract),
+            ctx.lens_hash,
+            previous_contract=previous_contract,
+            dry_run=dry_run,
+            batch_size=batch_size,
+        )
+        print(format_relens_report(lens_id, ctx.lens_hash, stats))
+        return 0
+    finally:
+        await db.disconnect()
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Incremental re-lens - re-apply a changed lens contract to affected entities",
+    )
+    parser.add_argument(
+        "--lens",
+        required=True,
+        help="Lens ID to apply (engine/lenses/<lens_id>/lens.yaml)",
+    )
+    parser.add_argument(
+        "--from",
+        dest="previous_path",
+        help="Previous lens.yaml or contract snapshot (.json) to diff against "
+             "(default: snapshot recorded for each entity's applied hash)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report affected entities without writing",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Entity page size (default: 500)",
+    )
+
+    args = parser.parse_args()
+
+    return asyncio.run(
+        main_async(
+            lens_id=args.lens,
+            previous_path=args.previous_path,
+            dry_run=args.dry_run,
+            batch_size=args.batch_size,
+        )
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,16 @@
 """
 CLI for running extraction workflows.
 
-Supports single record extraction, per-source batch extraction, and batch all modes.
+Supports single record extraction, per-source batch extraction, batch all modes,
+and bulk re-extraction from the raw archive (--from-archive).
 """
 
 import argparse
 import asyncio
 import json
 import time
-from typing import Dict, Optional, List
-from pathlib import Path
+from datetime import date
+from typing import Dict, Optional, List, Type
 
 from prisma import Prisma
 from tqdm import tqdm
@@ -31,6 +32,8 @@ from engine.extraction.logging_config import (
     log_extraction_failure,
 )
 from engine.extraction.quarantine import record_failed_extraction
+from engine.ingestion.raw_archive import DEFAULT_ARCHIVE_DIR, iter_archived_records
+from engine.ingestion.raw_store import load_raw_payload
 from engine.orchestration.execution_context import ExecutionContext
 
 
@@ -50,15 +53,15 @@ def _create_minimal_context() -> ExecutionContext:
     )
 
 
-def get_extractor_for_source(source: str) -> BaseExtractor:
+def get_extractor_class(source: str) -> Type[BaseExtractor]:
     """
-    Get the appropriate extractor for a given source.
+    Get the extractor class for a given source without instantiating it.
 
     Args:
         source: Source name (e.g., "google_places", "osm")
 
     Returns:
-        BaseExtractor: Extractor instance for the source
+        Type[BaseExtractor]: Extractor class for the source
 
     Raises:
         ValueError: If source is not recognized
@@ -80,7 +83,23 @@ def get_extractor_for_source(source: str) -> BaseExtractor:
             f"Available sources: {', '.join(extractors.keys())}"
         )
 
-    return extractor_class()
+    return extractor_class
+
+
+def get_extractor_for_source(source: str) -> BaseExtractor:
+    """
+    Get the appropriate extractor for a given source.
+
+    Args:
+        source: Source name (e.g., "google_places", "osm")
+
+    Returns:
+        BaseExtractor: Extractor instance for the source
+
+    Raises:
+        ValueError: If source is not recognized
+    """
+    return get_extractor_class(source)()
 
 
 async def run_single_extraction(
@@ -148,9 +167,7 @@ async def run_single_extraction(
 
     # Load raw data from file
     try:
-        raw_data_path = Path(raw.file_path)
-        with open(raw_data_path, "r", encoding="utf-8") as f:
-            raw_data = json.load(f)
+        raw_data = load_raw_payload(raw.file_path)
         logger.info(f"Loaded raw data from: {raw.file_path}")
     except Exception as e:
         error_msg = f"Failed to load raw data from {raw.file_path}: {str(e)}"
@@ -272,6 +289,53 @@ async def run_single_extraction(
         }
 
 
+async def _extract_and_save(
+    db: Prisma,
+    raw_ingestion_id: str,
+    source: str,
+    raw_data: Dict,
+    dry_run: bool,
+) -> Optional[str]:
+    """
+    Extract one raw payload and create its ExtractedEntity.
+
+    Returns:
+        Optional[str]: LLM model used, if any
+    """
+    # Get extractor
+    extractor = get_extractor_for_source(source)
+
+    # Extract
+    extracted = extractor.extract(raw_data, ctx=_create_minimal_context())
+    validated = extractor.validate(extracted)
+    attributes, discovered_attributes = extractor.split_attributes(validated)
+
+    # Prepare external IDs
+    external_ids = {}
+    if "external_id" in validated:
+        external_ids[f"{source}_id"] = validated["external_id"]
+
+    # Get entity_class - default to 'place' if not set
+    entity_class = validated.get("entity_class", "place")
+    model_used = validated.get("model_used")
+
+    # Create ExtractedEntity (unless dry_run)
+    if not dry_run:
+        await db.extractedentity.create(
+            data={
+                "raw_ingestion_id": raw_ingestion_id,
+                "source": source,
+                "entity_class": entity_class,
+                "attributes": json.dumps(attributes),
+                "discovered_attributes": json.dumps(discovered_attributes),
+                "external_ids": json.dumps(external_ids),
+                "model_used": model_used,
+            }
+        )
+
+    return model_used
+
+
 async def run_source_extraction(
     db: Prisma,
     source: str,
@@ -353,28 +417,14 @@ async def run_source_extraction(
                     continue
 
                 # Load raw data
-                raw_data_path = Path(raw_record.file_path)
-                with open(raw_data_path, "r", encoding="utf-8") as f:
-                    raw_data = json.load(f)
-
-                # Get extractor
-                extractor = get_extractor_for_source(raw_record.source)
-
-                # Extract
-                extracted = extractor.extract(raw_data, ctx=_create_minimal_context())
-                validated = extractor.validate(extracted)
-                attributes, discovered_attributes = extractor.split_attributes(validated)
-
-                # Prepare external IDs
-                external_ids = {}
-                if "external_id" in validated:
-                    external_ids[f"{raw_record.source}_id"] = validated["external_id"]
+                raw_data = load_raw_payload(raw_record.file_path)
 
-                # Get entity_class - default to 'place' if not set
-                entity_class = validated.get("entity_class", "place")
+                # Extract and create ExtractedEntity (unless dry_run)
+                model_used = await _extract_and_save(
+                    db, raw_record.id, raw_record.source, raw_data, dry_run
+                )
 
                 # Track LLM usage if model_used is present
-                model_used = validated.get("model_used")
                 if model_used:
                     llm_calls += 1
                     # Estimate cost (simplified - actual cost varies by model)
@@ -382,20 +432,6 @@ async def run_source_extraction(
                     # Rough estimate: ~2000 tokens per call, ~$0.002 per call
                     total_cost += 0.002
 
-                # Create ExtractedEntity (unless dry_run)
-                if not dry_run:
-                    await db.extractedentity.create(
-                        data={
-                            "raw_ingestion_id": raw_record.id,
-                            "source": raw_record.source,
-                            "entity_class": entity_class,
-                            "attributes": json.dumps(attributes),
-                            "discovered_attributes": json.dumps(discovered_attributes),
-                            "external_ids": json.dumps(external_ids),
-                            "model_used": model_used,
-                        }
-                    )
-
                 successful += 1
 
             except Exception as e:
@@ -444,6 +480,122 @@ async def run_source_extraction(
     }
 
 
+async def run_archive_extraction(
+    db: Prisma,
+    source: Optional[str] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    limit: Optional[int] = None,
+    dry_run: bool = False,
+    force_retry: bool = False,
+    archive_root: str = DEFAULT_ARCHIVE_DIR,
+) -> Dict:
+    """
+    Re-extract archived RawIngestion records in one sequential scan.
+
+    Payloads are read in bulk from the Parquet archive partitions matching
+    source/since/until instead of one file per record, and already-extracted
+    records are checked one batch at a time.
+
+    Args:
+        db: Prisma database client
+        source: Source to re-extract (default: all archived sources)
+        since: First ingest date to include
+        until: Last ingest date to include
+        limit: Optional limit on number of records to process
+        dry_run: If True, simulate extraction without saving to database
+        force_retry: If True, re-extract even if already processed
+        archive_root: Archive directory
+
+    Returns:
+        Dict: Summary report with counts, duration, and cost estimate
+    """
+    label = source or "archive"
+    logger.info(f"Starting archive extraction for {label} ({since or 'start'} to {until or 'end'})")
+
+    total_records = 0
+    successful = 0
+    failed = 0
+    already_extracted = 0
+    start_time = time.time()
+    llm_calls = 0
+    total_cost = 0.0
+
+    desc_prefix = "[DRY RUN] " if dry_run else ""
+    with tqdm(desc=f"{desc_prefix}Extracting {label} from archive", unit="record") as pbar:
+        for batch in iter_archived_records(
+            archive_root,
+            sources=[source] if source else None,
+            since=since,
+            until=until,
+        ):
+            if limit is not None:
+                batch = batch[: limit - total_records]
+            total_records += len(batch)
+
+            extracted_ids = set()
+            if not force_retry:
+                existing = await db.extractedentity.find_many(
+                    where={"raw_ingestion_id": {"in": [raw_id for raw_id, _, _ in batch]}}
+                )
+                extracted_ids = {entity.raw_ingestion_id for entity in existing}
+
+            for raw_id, record_source, raw_data in batch:
+                if raw_id in extracted_ids:
+                    already_extracted += 1
+                else:
+                    try:
+                        model_used = await _extract_and_save(
+                            db, raw_id, record_source, raw_data, dry_run
+                        )
+                        if model_used:
+                            llm_calls += 1
+                            total_cost += 0.002
+                        successful += 1
+                    except Exception as e:
+                        logger.error(f"Failed to extract {raw_id}: {str(e)}")
+                        if not dry_run:
+                            await record_failed_extraction(
+                                db,
+                                raw_ingestion_id=raw_id,
+                                source=record_source,
+                                error_message=str(e),
+                            )
+                        failed += 1
+
+                pbar.update(1)
+                pbar.set_postfix(
+                    success=successful,
+                    failed=failed,
+                    skipped=already_extracted,
+                )
+
+            if limit is not None and total_records >= limit:
+                break
+
+    duration = time.time() - start_time
+
+    logger.info(
+        f"Archive extraction complete for {label}: "
+        f"{successful} successful, {failed} failed, "
+        f"{already_extracted} already extracted, "
+        f"duration: {duration:.2f}s"
+    )
+
+    return {
+        "status": "success",
+        "source": label,
+        "total_records": total_records,
+        "successful": successful,
+        "failed": failed,
+        "already_extracted": already_extracted,
+        "duration": duration,
+        "cost_estimate": total_cost,
+        "llm_calls": llm_calls,
+        "dry_run": dry_run,
+    }
+
+
 async def run_all_extraction(
     db: Prisma,
     limit: Optional[int] = None,
@@ -552,9 +704,7 @@ async def run_all_extraction(
                         continue
 
                     # Load raw data
-                    raw_data_path = Path(raw_record.file_path)
-                    with open(raw_data_path, "r", encoding="utf-8") as f:
-                        raw_data = json.load(f)
+                    raw_data = load_raw_payload(raw_record.file_path)
 
                     # Get extractor
                     extractor = get_extractor_for_source(raw_record.source)
@@ -887,6 +1037,22 @@ async def run_cli(args) -> int:
 
             return 0 if result["status"] in ["success", "already_extracted"] else 1
 
+        elif getattr(args, "from_archive", False):
+            # Bulk re-extraction from the Parquet archive
+            result = await run_archive_extraction(
+                db,
+                source=args.source,
+                since=args.since,
+                until=args.until,
+                limit=args.limit,
+                dry_run=dry_run,
+                force_retry=force_retry,
+            )
+
+            print(format_summary_report(result))
+
+            return 0 if result["successful"] > 0 or result["total_records"] == 0 else 1
+
         elif args.source:
             # Per-source batch extraction mode
             result = await run_source_extraction(
@@ -904,7 +1070,7 @@ async def run_cli(args) -> int:
             return 0 if result["successful"] > 0 or result["total_records"] == 0 else 1
 
         else:
-            print("Error: Either --raw-id or --source is required")
+            print("Error: One of --raw-id, --source or --from-archive is required")
             return 1
 
     finally:
@@ -954,6 +1120,21 @@ def main() -> int:
         action="store_true",
         help="Re-extract even if already processed",
     )
+    parser.add_argument(
+        "--from-archive",
+        action="store_true",
+        help="Re-extract archived records in one scan of the Parquet archive (with optional --source)",
+    )
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        help="First ingest date (YYYY-MM-DD) to re-extract, with --from-archive",
+    )
+    parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        help="Last ingest date (YYYY-MM-DD) to re-extract, with --from-archive",
+    )
 
     args = parser.parse_args()
 
@@ -26,14 +26,31 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple
 
+from engine.bootstrap import load_compiled
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "canonical_categories.yaml"
+
 # Cache for config (loaded once per process)
 # Key: config_path (as string), Value: config dict
 _config_cache: Dict[str, Dict] = {}
 
 
+def _compile_config(config_path: Path) -> Dict:
+    """Parse canonical_categories.yaml and check its required sections."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    # Validate required sections
+    required_keys = ['taxonomy', 'mapping_rules', 'promotion_config']
+    for key in required_keys:
+        if key not in config:
+            raise ValueError(f"Missing required section in canonical_categories.yaml: {key}")
+    return config
+
+
 def load_config(config_path: Optional[Path] = None) -> Dict:
     """
     Load canonical categories configuration from YAML file.
@@ -55,7 +72,7 @@ def load_config(config_path: Optional[Path] = None) -> Dict:
     # Determine which config file to use
     if config_path is None:
         # Default to engine config location
-        config_path = Path(__file__).parent.parent.parent / "config" / "canonical_categories.yaml"
+        config_path = DEFAULT_CONFIG_PATH
     else:
         # Convert to Path if string was provided
         config_path = Path(config_path)
@@ -70,15 +87,8 @@ def load_config(config_path: Optional[Path] = None) -> Dict:
     if not config_path.exists():
         raise FileNotFoundError(f"Canonical categories config not found: {config_path}")
 
-    # Load YAML
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
-
-    # Validate required sections
-    required_keys = ['taxonomy', 'mapping_rules', 'promotion_config']
-    for key in required_keys:
-        if key not in config:
-            raise ValueError(f"Missing required section in canonical_categories.yaml: {key}")
+    # Parsed and validated once per file version (see engine.bootstrap)
+    config = load_compiled("canonical_categories", config_path, _compile_config)
 
     # Cache for future calls
     _config_cache[cache_key] = config
@@ -9,7 +9,13 @@ must inherit from BaseConnector and implement its abstract methods.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, Optional
+
+from engine.ingestion.deduplication import find_existing_hashes
+
+if TYPE_CHECKING:
+    import aiohttp
 
 
 class BaseConnector(ABC):
@@ -31,8 +37,25 @@ class BaseConnector(ABC):
     - fetch(): Source-specific logic to retrieve data
     - save(): Persist raw data to filesystem and database
     - is_duplicate(): Check if content has already been ingested
+
+    find_duplicates() checks many hashes in one query; it uses the
+    connector's `db` client and needs no override.
+
+    Pooled connectors (engine/orchestration/connector_pool.py) are reused
+    across runs: the pool injects a shared `db` client and `http_session`,
+    and awaits warm_up() once per instance before its first run.
+
+    Attributes:
+        http_session: Shared aiohttp session, or None to open one per
+            client_session() block
+        rate_limits_per_request: True if fetch() takes a token from the
+            source's limiter for every upstream request (e.g. tiled fetches);
+            the orchestration adapter then takes none per call
     """
 
+    http_session: Optional["aiohttp.ClientSession"] = None
+    rate_limits_per_request: bool = False
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -127,3 +150,55 @@ class BaseConnector(ABC):
                 return existing is not None
         """
         pass
+
+    async def find_duplicates(self, content_hashes: Iterable[str], bloom=None) -> Dict[str, str]:
+        """
+        Check many content hashes with one `hash IN (...)` query per batch.
+
+        Use instead of calling is_duplicate() in a loop when a fetch yields
+        several payloads.
+
+        Args:
+            content_hashes: Hashes of the payloads to check
+            bloom: Optional HashBloomFilter to skip obvious misses
+
+        Returns:
+            Dict mapping already-ingested hashes to their RawIngestion ids
+
+        Example:
+            existing = await connector.find_duplicates(hashes)
+            for content_hash, payload in zip(hashes, payloads):
+                if content_hash not in existing:
+                    await connector.save(payload, source_url)
+        """
+        return await find_existing_hashes(self.db, content_hashes, bloom=bloom)
+
+    async def warm_up(self) -> None:
+        """
+        Prepare a pooled instance before its first run.
+
+        Override to resolve state that would otherwise be built lazily on the
+        first fetch (rate limiters, lookup tables). The default does nothing.
+        """
+
+    @asynccontextmanager
+    async def client_session(self) -> AsyncIterator["aiohttp.ClientSession"]:
+        """
+        HTTP session for one fetch.
+
+        Yields the injected http_session when there is one (it is left open
+        for the next fetch), otherwise a session closed on exit.
+
+        Example:
+            async with self.client_session() as session:
+                async with session.get(url) as response:
+                    return await response.json()
+        """
+        if self.http_session is not None and not self.http_session.closed:
+            yield self.http_session
+            return
+
+        import aiohttp
+
+        async with aiohttp.ClientSession() as session:
+            yield session
@@ -0,0 +1,482 @@
+"""
+Per-connector circuit breaker.
+
+A connector that is down (DNS failure, 5xx storm, hung upstream) costs every
+orchestration run its full timeout. The breaker tracks consecutive failures
+per connector and, once a threshold is reached, rejects calls immediately
+for a cool-down period instead of waiting for the upstream to time out again.
+
+States:
+    closed:    calls pass through; consecutive failures are counted
+    open:      calls are rejected until recovery_timeout has elapsed
+    half_open: a limited number of probe calls pass through; one success
+               closes the breaker, one failure re-opens it
+
+Breakers are keyed by connector name (see get_circuit_breaker). A one-shot
+`cli run` calls each connector once, so a purely in-memory breaker could
+never open there. Breaker state is therefore persisted in a small SQLite
+file (engine/data/circuit_breakers.sqlite3, next to the token-bucket store):
+a breaker created in a new process starts from the failure count and open
+time recorded by earlier runs, and every state change is written back.
+Long-lived processes (the orchestration worker) keep their breaker in
+memory and publish changes; concurrent writers are last-writer-wins.
+
+Settings come from sources.yaml:
+
+    global:
+      circuit_breaker:
+        failure_threshold: 5
+        recovery_timeout: 30
+        state_backend: sqlite   # or "memory": per-process state only
+        # state_path: engine/data/circuit_breakers.sqlite3
+    serper:
+      circuit_breaker:
+        failure_threshold: 3
+
+The CIRCUIT_BREAKER_BACKEND environment variable overrides state_backend.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from engine.ingestion.sources_config import load_sources_config
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT_SECONDS = 30.0
+DEFAULT_HALF_OPEN_MAX_CALLS = 1
+
+DEFAULT_STATE_PATH = Path(__file__).parent.parent / "data" / "circuit_breakers.sqlite3"
+
+SOURCES_CONFIG_PATH = Path(__file__).parent.parent / "config" / "sources.yaml"
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Exception raised when a call is rejected by an open circuit.
+
+    Attributes:
+        name: Circuit (connector) name
+        retry_after: Seconds until the breaker admits a probe call
+    """
+
+    def __init__(self, name: str, retry_after: float):
+        """
+        Initialize CircuitOpenError exception.
+
+        Args:
+            name: Circuit (connector) name
+            retry_after: Seconds until the breaker admits a probe call
+        """
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit open for '{name}' (retry in {retry_after:.1f}s)"
+        )
+
+
+@dataclass(frozen=True)
+class CircuitTransition:
+    """
+    A single breaker state change.
+
+    Attributes:
+        from_state: State before the change
+        to_state: State after the change
+        at: Clock reading when the change happened
+        reason: Short explanation (e.g. "5 consecutive failures")
+    """
+
+    from_state: CircuitState
+    to_state: CircuitState
+    at: float
+    reason: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the transition as a plain dict (for run metrics)."""
+        return {
+            "from": self.from_state.value,
+            "to": self.to_state.value,
+            "at": self.at,
+            "reason": self.reason,
+        }
+
+
+class SQLiteCircuitStateStore:
+    """
+    Breaker state shared between processes through a local SQLite file.
+
+    One row per breaker: state, consecutive failures and the wall-clock time
+    the circuit opened. Reads and writes are single-row statements on a
+    local file, done synchronously from the breaker. Storage errors are
+    logged and ignored: the breaker never fails a call because of them.
+    """
+
+    def __init__(self, path: Path = DEFAULT_STATE_PATH, busy_timeout_seconds: float = 5.0):
+        self.path = Path(path)
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_seconds, isolation_level=None)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS circuit_breaker ("
+                " name TEXT PRIMARY KEY,"
+                " state TEXT NOT NULL,"
+                " consecutive_failures INTEGER NOT NULL,"
+                " opened_at REAL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def load(self, name: str) -> Optional[Dict[str, Any]]:
+        """Recorded state of a breaker (None if never recorded or unreadable)."""
+        try:
+            row = self._connect().execute(
+                "SELECT state, consecutive_failures, opened_at FROM circuit_breaker WHERE name = ?",
+                (name,),
+            ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not read circuit breaker state for %s: %s", name, e)
+            return None
+        if row is None:
+            return None
+        return {"state": row[0], "consecutive_failures": row[1], "opened_at": row[2]}
+
+    def save(self, name: str, state: str, consecutive_failures: int, opened_at: Optional[float]) -> None:
+        """Record a breaker's state (opened_at is wall-clock seconds)."""
+        try:
+            self._connect().execute(
+                "INSERT INTO circuit_breaker (name, state, consecutive_failures, opened_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (name) DO UPDATE SET state = excluded.state, "
+                "consecutive_failures = excluded.consecutive_failures, opened_at = excluded.opened_at, "
+                "updated_at = excluded.updated_at",
+                (name, state, consecutive_failures, opened_at, time.time()),
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not record circuit breaker state for %s: %s", name, e)
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for one connector.
+
+    Example:
+        >>> breaker = CircuitBreaker("serper", failure_threshold=3)
+        >>> if breaker.allow_request():
+        ...     try:
+        ...         result = await connector.fetch(query)
+        ...         breaker.record_success()
+        ...     except Exception:
+        ...         breaker.record_failure()
+        ...         raise
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT_SECONDS,
+        half_open_max_calls: int = DEFAULT_HALF_OPEN_MAX_CALLS,
+        clock: Callable[[], float] = time.monotonic,
+        store: Optional[SQLiteCircuitStateStore] = None,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            name: Circuit (connector) name, used in errors and metrics
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before probing
+            half_open_max_calls: Concurrent probe calls allowed in half-open
+            clock: Monotonic clock (injectable for tests)
+            store: Shared state store; the breaker starts from its recorded
+                state and writes every change back (None: in-memory only)
+            wall_clock: Wall clock used for the persisted open time
+
+        Raises:
+            ValueError: If failure_threshold or half_open_max_calls < 1
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_in_flight = 0
+
+        self.transitions: List[CircuitTransition] = []
+        self.rejected_calls = 0
+
+        self.store = store
+        self._wall_clock = wall_clock
+        if store is not None:
+            self._restore(store.load(name))
+
+    def _restore(self, recorded: Optional[Dict[str, Any]]) -> None:
+        """Start from state recorded by an earlier process."""
+        if not recorded:
+            return
+        self._consecutive_failures = int(recorded.get("consecutive_failures") or 0)
+        opened_at = recorded.get("opened_at")
+        if recorded.get("state") != CircuitState.CLOSED.value and opened_at is not None:
+            # Probe slots are per process: a recorded half-open circuit
+            # restarts as open and moves to half-open once its timeout is up
+            elapsed = max(0.0, self._wall_clock() - opened_at)
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock() - elapsed
+
+    def _persist(self) -> None:
+        if self.store is None:
+            return
+        opened_at = None
+        if self._opened_at is not None:
+            opened_at = self._wall_clock() - (self._clock() - self._opened_at)
+        self.store.save(self.name, self._state.value, self._consecutive_failures, opened_at)
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an expired open circuit reports half_open)."""
+        if self._state == CircuitState.OPEN and self.retry_after() <= 0:
+            self._transition(CircuitState.HALF_OPEN, "recovery timeout elapsed")
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Failures recorded since the last success."""
+        return self._consecutive_failures
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit admits a probe (0 if not open)."""
+        if self._state != CircuitState.OPEN or self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - self._clock())
+
+    def allow_request(self) -> bool:
+        """
+        Decide whether a call may proceed, reserving a probe slot if half-open.
+
+        Every admitted call must be followed by record_success(),
+        record_failure() or release().
+
+        Returns:
+            True if the call may proceed, False if it should fail fast
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and self._half_open_in_flight < self.half_open_max_calls:
+            self._half_open_in_flight += 1
+            return True
+
+        self.rejected_calls += 1
+        return False
+
+    def check(self) -> None:
+        """
+        Like allow_request(), but raise instead of returning False.
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the call
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(self.name, self.retry_after())
+
+    def record_success(self) -> None:
+        """Record a successful call; closes a half-open circuit."""
+        changed = self._consecutive_failures > 0 or self._state != CircuitState.CLOSED
+        self._consecutive_failures = 0
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            self._opened_at = None
+            self._transition(CircuitState.CLOSED, "probe succeeded")
+        if changed:
+            self._persist()
+
+    def record_failure(self) -> None:
+        """Record a failed call; may open (or re-open) the circuit."""
+        self._consecutive_failures += 1
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            self._open("probe failed")
+        elif (
+            self._state == CircuitState.CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._open(f"{self._consecutive_failures} consecutive failures")
+        self._persist()
+
+    def release(self) -> None:
+        """
+        Return an admitted call's slot without recording an outcome.
+
+        For calls admitted by allow_request() that never reached the
+        connector (skipped by rate limiting, cancelled).
+        """
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def reset(self) -> None:
+        """Force the circuit closed and clear failure counts."""
+        self._consecutive_failures = 0
+        self._half_open_in_flight = 0
+        self._opened_at = None
+        if self._state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED, "manual reset")
+        self._persist()
+
+    def _open(self, reason: str) -> None:
+        self._opened_at = self._clock()
+        self._half_open_in_flight = 0
+        self._transition(CircuitState.OPEN, reason)
+
+    def _transition(self, to_state: CircuitState, reason: str) -> None:
+        if to_state == self._state:
+            return
+        self.transitions.append(
+            CircuitTransition(self._state, to_state, self._clock(), reason)
+        )
+        self._state = to_state
+
+
+# Process-wide breakers keyed by connector name, sharing one state store
+_breakers: Dict[str, CircuitBreaker] = {}
+_state_stores: Dict[str, SQLiteCircuitStateStore] = {}
+
+
+def load_circuit_breaker_config(source: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Load breaker settings for a source (source-level overrides global).
+
+    Args:
+        source: Source name in sources.yaml (e.g., "serper")
+        config: Parsed sources.yaml (loaded from engine/config if omitted;
+            defaults are used when the file does not exist)
+
+    Returns:
+        Dict with failure_threshold, recovery_timeout and half_open_max_calls
+    """
+    if config is None:
+        config = _load_sources_config()
+
+    settings = {
+        "failure_threshold": DEFAULT_FAILURE_THRESHOLD,
+        "recovery_timeout": DEFAULT_RECOVERY_TIMEOUT_SECONDS,
+        "half_open_max_calls": DEFAULT_HALF_OPEN_MAX_CALLS,
+    }
+    for section in ((config.get("global") or {}), (config.get(source) or {})):
+        overrides = section.get("circuit_breaker") if isinstance(section, dict) else None
+        if isinstance(overrides, dict):
+            settings.update({k: v for k, v in overrides.items() if k in settings and v is not None})
+    return settings
+
+
+def create_circuit_state_store(config: Optional[Dict[str, Any]] = None) -> Optional[SQLiteCircuitStateStore]:
+    """
+    Create the state store selected by `global.circuit_breaker` in sources.yaml.
+
+    Recognised settings:
+        state_backend: "sqlite" (default) or "memory"
+        state_path: SQLite file (default engine/data/circuit_breakers.sqlite3)
+
+    The CIRCUIT_BREAKER_BACKEND environment variable overrides state_backend.
+
+    Args:
+        config: Parsed sources.yaml (loaded from engine/config if omitted)
+
+    Returns:
+        Store instance, or None for per-process (memory) state
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if config is None:
+        config = _load_sources_config()
+
+    settings = ((config.get("global") or {}).get("circuit_breaker")) or {}
+    backend = os.getenv("CIRCUIT_BREAKER_BACKEND") or settings.get("state_backend", "sqlite")
+
+    if backend == "memory":
+        return None
+    if backend == "sqlite":
+        path = Path(settings.get("state_path") or DEFAULT_STATE_PATH)
+        store = _state_stores.get(str(path))
+        if store is None:
+            store = _state_stores[str(path)] = SQLiteCircuitStateStore(path)
+        return store
+    raise ValueError(f"Unknown circuit breaker state backend: {backend}")
+
+
+def get_circuit_breaker(name: str, config: Optional[Dict[str, Any]] = None) -> CircuitBreaker:
+    """
+    Get (or create) the process-wide breaker for a connector.
+
+    A newly created breaker starts from the state persisted by earlier
+    processes (see create_circuit_state_store).
+
+    Args:
+        name: Connector/source name
+        config: Parsed sources.yaml (only used when the breaker is created)
+
+    Returns:
+        The shared CircuitBreaker for this name
+    """
+    breaker = _breakers.get(name)
+    if breaker is None:
+        try:
+            config = config if config is not None else _load_sources_config()
+        except (OSError, yaml.YAMLError):
+            config = {}
+        breaker = CircuitBreaker(
+            name,
+            **load_circuit_breaker_config(name, config),
+            store=create_circuit_state_store(config),
+        )
+        _breakers[name] = breaker
+    return breaker
+
+
+def _load_sources_config() -> Dict[str, Any]:
+    """Parsed engine/config/sources.yaml ({} when the file does not exist)."""
+    try:
+        return load_sources_config(SOURCES_CONFIG_PATH)
+    except FileNotFoundError:
+        return {}
+
+
+def _reset_circuit_breakers() -> None:
+    """Drop all process-wide breakers (test helper)."""
+    _breakers.clear()
+    _state_stores.clear()
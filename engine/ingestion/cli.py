@@ -30,7 +30,7 @@ from engine.ingestion.connectors.open_charge_map import OpenChargeMapConnector
 from engine.ingestion.connectors.sport_scotland import SportScotlandConnector
 from engine.ingestion.connectors.edinburgh_council import EdinburghCouncilConnector
 from engine.ingestion.deduplication import compute_content_hash
-from prisma import Prisma
+from engine.db import get_db_provider
 
 
 # Connector registry
@@ -96,6 +96,20 @@ async def run_connector(connector_name: str, query: str, verbose: bool = False):
 
         data = await connector.fetch(query)
 
+        # Mirrored connectors: upstream confirmed nothing changed since the
+        # last download, so the payload is already ingested
+        if getattr(connector, 'last_not_modified', False):
+            print(f"  ✓ Not modified since last fetch (served from mirror)")
+            print(f"[4/5] Skipping duplicate check (not modified)")
+            print(f"[5/5] Skipping save (not modified)")
+
+            await connector.db.disconnect()
+
+            print(f"\n{'=' * 80}")
+            print(f"✓ Success! (no changes)")
+            print(f"{'=' * 80}")
+            return 0
+
         # Determine result count based on connector type
         if connector_name == 'serper':
             result_count = len(data.get('organic', []))
@@ -206,10 +220,10 @@ async def get_ingestion_stats() -> dict:
         - failed_count: Number of failed ingestions
         - success_rate: Percentage of successful ingestions
     """
-    db = Prisma()
+    provider = get_db_provider()
 
     try:
-        await db.connect()
+        db = await provider.acquire()
     except Exception as e:
         # Return empty stats if connection fails
         return {
@@ -295,7 +309,7 @@ async def get_ingestion_stats() -> dict:
         }
 
     finally:
-        await db.disconnect()
+        await provider.release()
 
 
 async def show_status():
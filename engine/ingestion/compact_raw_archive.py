@@ -0,0 +1,384 @@
+"""
+Compact aged raw ingestions into the Parquet archive.
+
+RawIngestion records older than --older-than-days are read (any format
+load_raw_payload understands) in (source, ingested_at) order, grouped by
+source and UTC ingest date, and written to engine.ingestion.raw_archive
+partitions together with their metadata columns. A partition is written as
+soon as the scan moves past it, so at most one archive file's worth of
+decoded payloads (DEFAULT_MAX_ROWS_PER_FILE rows) is held in memory. Each
+partition file is written under a hidden temporary name, renamed into
+place, and only then are its records repointed at "<file>.parquet#<row>"
+in a single transaction (one UPDATE per REPOINT_CHUNK_SIZE rows, with a
+timeout scaled to the file's row count); if that transaction fails the
+file is removed, so a record never points at a file that is not there.
+
+Original payload files are deleted only with --delete-originals, once no
+record references them. Segment files hold other records and are never
+deleted.
+
+Usage:
+    python -m engine.ingestion.compact_raw_archive --dry-run
+    python -m engine.ingestion.compact_raw_archive --older-than-days 90 --delete-originals
+"""
+
+import argparse
+import asyncio
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from prisma import Prisma
+
+from engine.ingestion.raw_archive import (
+    DEFAULT_ARCHIVE_DIR,
+    archive_schema,
+    parse_archive_locator,
+    partition_path,
+)
+from engine.ingestion.raw_store import (
+    load_raw_payload,
+    parse_segment_locator,
+    serialize_payload,
+)
+
+
+DEFAULT_OLDER_THAN_DAYS = 30
+DEFAULT_PAGE_SIZE = 1000
+
+# Rows per archive file; one partition may span several files
+DEFAULT_MAX_ROWS_PER_FILE = 50000
+
+# Records repointed per UPDATE statement (two bind parameters each)
+REPOINT_CHUNK_SIZE = 1000
+
+# Repoint transaction timeout: Prisma's 5s default plus this per chunk
+REPOINT_TX_SECONDS_PER_CHUNK = 2.0
+
+
+@dataclass
+class CompactionStats:
+    """
+    Outcome of one compaction run.
+
+    Attributes:
+        records: Aged RawIngestion records examined
+        archived: Records repointed at the archive
+        already_archived: Records already in the archive
+        missing: Records whose payload file no longer exists
+        failed: Records whose payload could not be read or parsed
+        files_written: Parquet files written
+        bytes_before: Size of the archived records' original payloads
+        bytes_after: Size of the Parquet files written
+        originals_deleted: Original payload files removed
+    """
+
+    records: int = 0
+    archived: int = 0
+    already_archived: int = 0
+    missing: int = 0
+    failed: int = 0
+    files_written: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    originals_deleted: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _archive_row(row: Any, payload: Any) -> Dict[str, Any]:
+    return {
+        "raw_ingestion_id": row.id,
+        "source_url": row.source_url,
+        "status": row.status,
+        "hash": row.hash,
+        "ingested_at": _as_utc(row.ingested_at),
+        "orchestration_run_id": getattr(row, "orchestration_run_id", None),
+        "metadata_json": getattr(row, "metadata_json", None),
+        "original_file_path": row.file_path,
+        "payload": serialize_payload(payload).decode("utf-8"),
+    }
+
+
+def write_archive_file(directory: Path, rows: List[Dict[str, Any]]) -> Path:
+    """
+    Write one archive file atomically.
+
+    The file is written under a dot-prefixed name, which dataset scans
+    ignore, and renamed into place once complete.
+
+    Returns:
+        Path of the new file
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f"part-{uuid.uuid4().hex[:12]}.parquet"
+    path = directory / name
+    temp_path = directory / f".{name}.part"
+    table = pa.Table.from_pylist(rows, schema=archive_schema())
+    try:
+        pq.write_table(table, temp_path, compression="zstd")
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return path
+
+
+def _repoint_sql(count: int) -> str:
+    values = ", ".join(f"(${2 * i + 1}, ${2 * i + 2})" for i in range(count))
+    return (
+        'UPDATE "RawIngestion" AS r SET "file_path" = v.file_path '
+        f"FROM (VALUES {values}) AS v(id, file_path) "
+        'WHERE r."id" = v.id'
+    )
+
+
+async def _repoint_records(db: Prisma, locators: List[Tuple[str, str]]) -> None:
+    """
+    Point RawIngestion records at new file paths in one transaction.
+
+    Records are updated REPOINT_CHUNK_SIZE at a time with a single
+    UPDATE ... FROM (VALUES ...) statement, and the transaction timeout
+    grows with the number of chunks, so a full archive file (up to
+    DEFAULT_MAX_ROWS_PER_FILE rows) commits well inside it.
+
+    Args:
+        db: Connected Prisma client
+        locators: (raw_ingestion_id, file_path) pairs
+    """
+    chunks = [
+        locators[start:start + REPOINT_CHUNK_SIZE]
+        for start in range(0, len(locators), REPOINT_CHUNK_SIZE)
+    ]
+    timeout = timedelta(seconds=5 + REPOINT_TX_SECONDS_PER_CHUNK * len(chunks))
+    async with db.tx(timeout=timeout) as tx:
+        for chunk in chunks:
+            params = [value for pair in chunk for value in pair]
+            await tx.execute_raw(_repoint_sql(len(chunk)), *params)
+
+
+async def _flush_partition(
+    db: Prisma,
+    root: Union[str, Path],
+    key: Tuple[str, str],
+    pending: List[Tuple[Any, Dict[str, Any]]],
+    stats: CompactionStats,
+) -> None:
+    source, ingest_date = key
+    path = write_archive_file(
+        partition_path(root, source, ingest_date),
+        [archive_row for _, archive_row in pending],
+    )
+    try:
+        await _repoint_records(
+            db,
+            [(row.id, f"{path.as_posix()}#{index}") for index, (row, _) in enumerate(pending)],
+        )
+    except Exception:
+        path.unlink(missing_ok=True)
+        raise
+
+    stats.files_written += 1
+    stats.bytes_after += path.stat().st_size
+    stats.archived += len(pending)
+
+
+async def compact_raw_ingestions(
+    db: Prisma,
+    older_than_days: int = DEFAULT_OLDER_THAN_DAYS,
+    root: Union[str, Path] = DEFAULT_ARCHIVE_DIR,
+    now: Optional[datetime] = None,
+    dry_run: bool = False,
+    delete_originals: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_rows_per_file: int = DEFAULT_MAX_ROWS_PER_FILE,
+) -> CompactionStats:
+    """
+    Pack aged RawIngestion payloads into the Parquet archive.
+
+    Safe to re-run: archived records are skipped, and a partition that
+    already has files gains a new file rather than being rewritten.
+
+    Args:
+        db: Connected Prisma client
+        older_than_days: Archive records ingested before this many days ago
+        root: Archive directory
+        now: Reference time (default: current UTC time)
+        dry_run: Read and count only; write and update nothing
+        delete_originals: Remove original payload files once unreferenced
+        page_size: Records per query
+        max_rows_per_file: Rows per Parquet file
+
+    Returns:
+        CompactionStats
+    """
+    stats = CompactionStats()
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=older_than_days)
+    # Rows of the partition being scanned; the scan order makes each
+    # partition contiguous, so it is flushed when the key changes
+    pending_key: Optional[Tuple[str, str]] = None
+    pending: List[Tuple[Any, Dict[str, Any]]] = []
+    archived_paths: Set[str] = set()
+
+    cursor = None
+    while True:
+        query = {
+            "where": {"ingested_at": {"lt": cutoff}},
+            "take": page_size,
+            "order": [{"source": "asc"}, {"ingested_at": "asc"}, {"id": "asc"}],
+        }
+        if cursor is not None:
+            query["cursor"] = {"id": cursor}
+            query["skip"] = 1
+        rows = await db.rawingestion.find_many(**query)
+
+        for row in rows:
+            stats.records += 1
+            if parse_archive_locator(row.file_path):
+                stats.already_archived += 1
+                continue
+
+            located = parse_segment_locator(row.file_path)
+            try:
+                payload = load_raw_payload(row.file_path)
+                size = located[2] if located else Path(row.file_path).stat().st_size
+            except FileNotFoundError:
+                stats.missing += 1
+                continue
+            except (OSError, ValueError) as e:
+                print(f"  ✗ {row.id}: cannot read {row.file_path}: {e}")
+                stats.failed += 1
+                continue
+
+            # Segment files hold other records and are never deleted
+            if located is not None:
+                stats.bytes_before += size
+            elif row.file_path not in archived_paths:
+                archived_paths.add(row.file_path)
+                stats.bytes_before += size
+
+            if dry_run:
+                stats.archived += 1
+                continue
+
+            key = (row.source, _as_utc(row.ingested_at).date().isoformat())
+            if key != pending_key:
+                if pending:
+                    await _flush_partition(db, root, pending_key, pending, stats)
+                pending_key, pending = key, []
+            pending.append((row, _archive_row(row, payload)))
+            if len(pending) >= max_rows_per_file:
+                await _flush_partition(db, root, key, pending, stats)
+                pending = []
+
+        if len(rows) < page_size:
+            break
+        cursor = rows[-1].id
+
+    if pending:
+        await _flush_partition(db, root, pending_key, pending, stats)
+
+    if delete_originals and not dry_run:
+        for file_path in sorted(archived_paths):
+            # Content-addressed objects may still back newer records
+            if await db.rawingestion.count(where={"file_path": file_path}):
+                continue
+            try:
+                Path(file_path).unlink()
+            except FileNotFoundError:
+                continue
+            stats.originals_deleted += 1
+
+    return stats
+
+
+async def run_compaction(
+    older_than_days: int,
+    dry_run: bool,
+    delete_originals: bool,
+    page_size: int,
+) -> int:
+    """Run compaction against the configured database."""
+    db = Prisma()
+
+    try:
+        await db.connect()
+    except Exception as exc:
+        print(f"Database connection failed: {exc}")
+        return 1
+
+    try:
+        stats = await compact_raw_ingestions(
+            db,
+            older_than_days=older_than_days,
+            dry_run=dry_run,
+            delete_originals=delete_originals,
+            page_size=page_size,
+        )
+
+        print("Raw Archive Compaction" + (" (dry run)" if dry_run else ""))
+        print(f"  Aged records:     {stats.records}")
+        print(f"  Archived:         {stats.archived}")
+        print(f"  Already archived: {stats.already_archived}")
+        print(f"  Missing files:    {stats.missing}")
+        print(f"  Failed:           {stats.failed}")
+        print(f"  Bytes before:     {stats.bytes_before:,}")
+        if not dry_run:
+            print(f"  Files written:    {stats.files_written} ({stats.bytes_after:,} bytes)")
+            print(f"  Originals deleted: {stats.originals_deleted}")
+
+        return 0 if stats.failed == 0 else 1
+
+    finally:
+        await db.disconnect()
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Pack aged raw ingestions into the partitioned Parquet archive",
+    )
+
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=DEFAULT_OLDER_THAN_DAYS,
+        help=f"Archive records ingested more than this many days ago (default: {DEFAULT_OLDER_THAN_DAYS})",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count what would be archived without writing anything",
+    )
+    parser.add_argument(
+        "--delete-originals",
+        action="store_true",
+        help="Delete original payload files once no record references them",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="RawIngestion records per query",
+    )
+
+    args = parser.parse_args()
+    return asyncio.run(
+        run_compaction(args.older_than_days, args.dry_run, args.delete_originals, args.page_size)
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -25,15 +25,16 @@ License: Open Government License v3.0
 
 import os
 import json
-import yaml
 import aiohttp
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 from prisma import Prisma
 
 from engine.ingestion.base import BaseConnector
-from engine.ingestion.storage import generate_file_path, save_json
+from engine.ingestion.raw_store import get_raw_store
 from engine.ingestion.deduplication import compute_content_hash, check_duplicate
+from engine.ingestion.http_mirror import load_mirror
+from engine.ingestion.sources_config import load_sources_config
 
 
 class EdinburghCouncilConnector(BaseConnector):
@@ -82,20 +83,20 @@ class EdinburghCouncilConnector(BaseConnector):
         await connector.db.disconnect()
     """
 
-    def __init__(self, config_path: str = "engine/config/sources.yaml"):
+    def __init__(self, config_path: str = "engine/config/sources.yaml", db: Optional[Prisma] = None):
         """
         Initialize the Edinburgh Council connector with configuration.
 
         Args:
             config_path: Path to the sources.yaml configuration file
+            db: Shared Prisma client (default: a new client of its own)
 
         Raises:
             FileNotFoundError: If config file doesn't exist
             ValueError: If required configuration is missing
         """
         # Load configuration
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_sources_config(config_path)
 
         if 'edinburgh_council' not in config:
             raise ValueError("Edinburgh Council configuration not found in sources.yaml")
@@ -108,8 +109,12 @@ class EdinburghCouncilConnector(BaseConnector):
         self.timeout = ec_config.get('timeout_seconds', 30)
         self.default_params = ec_config.get('default_params', {})
 
+        # Optional conditional-request mirror (ETag/Last-Modified, 304s)
+        self.mirror = load_mirror(self.source_name, ec_config)
+        self.last_not_modified = False
+
         # Initialize database connection
-        self.db = Prisma()
+        self.db = db if db is not None else Prisma()
 
     @property
     def source_name(self) -> str:
@@ -129,6 +134,9 @@ class EdinburghCouncilConnector(BaseConnector):
         requesting GeoJSON format for easy parsing. The query parameter should be
         the dataset ID or feature service identifier.
 
+        With a mirror configured the request is conditional; a 304 is served
+        from the mirror and sets last_not_modified.
+
         Args:
             query: Dataset ID or feature service name (e.g., "sports_facilities")
 
@@ -170,7 +178,15 @@ class EdinburghCouncilConnector(BaseConnector):
         query_url = f"{self.base_url}/{dataset_id}/query"
 
         # Make ArcGIS REST API request
-        async with aiohttp.ClientSession() as session:
+        self.last_not_modified = False
+        async with self.client_session() as session:
+            if self.mirror is not None:
+                data, self.last_not_modified = await self.mirror.get_json(
+                    session, query_url, params=params, timeout=self.timeout,
+                    label="Edinburgh Council API",
+                )
+                return data
+
             async with session.get(
                 query_url,
                 params=params,
@@ -233,12 +249,10 @@ class EdinburghCouncilConnector(BaseConnector):
             except (IndexError, AttributeError):
                 pass
 
-        # Generate unique file path
+        # Record id (names the file under the "files" raw store backend)
         record_id = f"{dataset_type}_{feature_count}_{content_hash[:8]}"
-        file_path = generate_file_path(self.source_name, record_id)
-
-        # Save GeoJSON to filesystem
-        save_json(file_path, data)
+        # Save to the raw store
+        file_path = get_raw_store().put(self.source_name, record_id, data)
 
         # Prepare metadata as JSON string
         metadata = {
@@ -17,15 +17,15 @@ API Documentation: https://developers.google.com/maps/documentation/places/web-s
 
 import os
 import json
-import yaml
 import aiohttp
 from typing import Dict, Any, Optional
 from datetime import datetime
 from prisma import Prisma
 
 from engine.ingestion.base import BaseConnector
-from engine.ingestion.storage import generate_file_path, save_json
+from engine.ingestion.raw_store import get_raw_store
 from engine.ingestion.deduplication import compute_content_hash, check_duplicate
+from engine.ingestion.sources_config import load_sources_config
 
 
 class GooglePlacesConnector(BaseConnector):
@@ -64,20 +64,20 @@ class GooglePlacesConnector(BaseConnector):
         await connector.db.disconnect()
     """
 
-    def __init__(self, config_path: str = "engine/config/sources.yaml"):
+    def __init__(self, config_path: str = "engine/config/sources.yaml", db: Optional[Prisma] = None):
         """
         Initialize the Google Places connector with configuration.
 
         Args:
             config_path: Path to the sources.yaml configuration file
+            db: Shared Prisma client (default: a new client of its own)
 
         Raises:
             FileNotFoundError: If config file doesn't exist
             ValueError: If API key is missing or invalid
         """
         # Load configuration
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_sources_config(config_path)
 
         if 'google_places' not in config:
             raise ValueError("Google Places configuration not found in sources.yaml")
@@ -102,7 +102,7 @@ class GooglePlacesConnector(BaseConnector):
             'places.id,places.displayName,places.formattedAddress,places.location,places.rating,places.userRatingCount')
 
         # Initialize database connection
-        self.db = Prisma()
+        self.db = db if db is not None else Prisma()
 
     @property
     def source_name(self) -> str:
@@ -160,7 +160,7 @@ class GooglePlacesConnector(BaseConnector):
         }
 
         # Make API request (POST instead of GET for new API)
-        async with aiohttp.ClientSession() as session:
+        async with self.client_session() as session:
             async with session.post(
                 f"{self.base_url}/places:searchText",
                 json=body,
@@ -229,11 +229,8 @@ class GooglePlacesConnector(BaseConnector):
         # Generate a simple record ID based on result count and hash
         record_id = f"places_{result_count}_{content_hash[:8]}"
 
-        # Generate unique file path
-        file_path = generate_file_path(self.source_name, record_id)
-
-        # Save JSON to filesystem
-        save_json(file_path, data)
+        # Save to the raw store
+        file_path = get_raw_store().put(self.source_name, record_id, data)
 
         # Prepare metadata as JSON string
         metadata = {
@@ -20,15 +20,16 @@ API Documentation: https://openchargemap.org/site/develop/api
 
 import os
 import json
-import yaml
 import aiohttp
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from prisma import Prisma
 
 from engine.ingestion.base import BaseConnector
-from engine.ingestion.storage import generate_file_path, save_json
+from engine.ingestion.raw_store import get_raw_store
 from engine.ingestion.deduplication import compute_content_hash, check_duplicate
+from engine.ingestion.http_mirror import load_mirror
+from engine.ingestion.sources_config import load_sources_config
 
 
 class OpenChargeMapConnector(BaseConnector):
@@ -67,20 +68,20 @@ class OpenChargeMapConnector(BaseConnector):
         await connector.db.disconnect()
     """
 
-    def __init__(self, config_path: str = "engine/config/sources.yaml"):
+    def __init__(self, config_path: str = "engine/config/sources.yaml", db: Optional[Prisma] = None):
         """
         Initialize the OpenChargeMap connector with configuration.
 
         Args:
             config_path: Path to the sources.yaml configuration file
+            db: Shared Prisma client (default: a new client of its own)
 
         Raises:
             FileNotFoundError: If config file doesn't exist
             ValueError: If API key is missing or invalid
         """
         # Load configuration
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_sources_config(config_path)
 
         if 'open_charge_map' not in config:
             raise ValueError("OpenChargeMap configuration not found in sources.yaml")
@@ -100,8 +101,12 @@ class OpenChargeMapConnector(BaseConnector):
         self.timeout = ocm_config.get('timeout_seconds', 30)
         self.default_params = ocm_config.get('default_params', {})
 
+        # Optional conditional-request mirror (ETag/Last-Modified, 304s)
+        self.mirror = load_mirror(self.source_name, ocm_config)
+        self.last_not_modified = False
+
         # Initialize database connection
-        self.db = Prisma()
+        self.db = db if db is not None else Prisma()
 
     @property
     def source_name(self) -> str:
@@ -121,6 +126,9 @@ class OpenChargeMapConnector(BaseConnector):
         and longitude coordinates. Returns the raw JSON response containing
         charging station data.
 
+        With a mirror configured the request is conditional; a 304 is served
+        from the mirror and sets last_not_modified.
+
         Args:
             query: Coordinates as "latitude,longitude" (e.g., "55.9533,-3.1883")
 
@@ -161,7 +169,15 @@ class OpenChargeMapConnector(BaseConnector):
         }
 
         # Make API request
-        async with aiohttp.ClientSession() as session:
+        self.last_not_modified = False
+        async with self.client_session() as session:
+            if self.mirror is not None:
+                data, self.last_not_modified = await self.mirror.get_json(
+                    session, f"{self.base_url}/poi/", params=params, timeout=self.timeout,
+                    label="OpenChargeMap API",
+                )
+                return data
+
             async with session.get(
                 f"{self.base_url}/poi/",
                 params=params,
@@ -220,12 +236,10 @@ class OpenChargeMapConnector(BaseConnector):
         else:
             location_slug = 'empty'
 
-        # Generate unique file path
+        # Record id (names the file under the "files" raw store backend)
         record_id = f"{location_slug}_{content_hash[:8]}"
-        file_path = generate_file_path(self.source_name, record_id)
-
-        # Save JSON to filesystem
-        save_json(file_path, data)
+        # Save to the raw store
+        file_path = get_raw_store().put(self.source_name, record_id, data)
 
         # Prepare metadata as JSON string
         metadata = {
@@ -17,16 +17,133 @@ Overpass QL: https://wiki.openstreetmap.org/wiki/Overpass_API/Overpass_QL
 """
 
 import os
+import re
 import json
-import yaml
 import aiohttp
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Union
 from datetime import datetime
 from prisma import Prisma
 
 from engine.ingestion.base import BaseConnector
-from engine.ingestion.storage import generate_file_path, save_json
+from engine.ingestion.raw_store import get_raw_store
 from engine.ingestion.deduplication import compute_content_hash, check_duplicate
+from engine.ingestion.tiling import (
+    BBox,
+    TileCache,
+    TiledFetchStats,
+    fetch_tiles,
+    load_tiling_config,
+    merge_unique,
+    split_bbox,
+)
+from engine.ingestion.token_bucket import get_token_bucket_limiter
+from engine.ingestion.sources_config import load_sources_config
+
+
+def normalize_terms(query: Union[str, Iterable[str]]) -> List[str]:
+    """
+    Normalize a search term or collection of terms.
+
+    Args:
+        query: A single term or an iterable of terms
+
+    Returns:
+        Distinct non-empty terms (stripped), in first-seen order
+    """
+    if isinstance(query, str):
+        query = [query]
+    terms = []
+    for term in query:
+        term = str(term).strip()
+        if term and term not in terms:
+            terms.append(term)
+    return terms
+
+
+def _escape_term(term: str) -> str:
+    """Escape a term for use inside an Overpass QL regex string."""
+    escaped = re.sub(r'([.^$*+?()\[\]{}|\\])', r'\\\1', term)
+    # Overpass QL strings unescape backslashes, so regex escapes are doubled
+    return escaped.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _element_ref(element: Dict[str, Any]) -> str:
+    return f"{element.get('type', 'node')}/{element.get('id')}"
+
+
+def _element_terms(element: Dict[str, Any], terms: Sequence[str]) -> List[str]:
+    """Terms whose sport/leisure filter selected this element."""
+    tags = element.get('tags') or {}
+    sport = tags.get('sport')
+    leisure = tags.get('leisure') or ''
+    return [
+        term for term in terms
+        if sport == term or (leisure and re.search(re.escape(term), leisure))
+    ]
+
+
+def index_elements_by_term(response: Dict[str, Any], terms: Sequence[str]) -> Dict[str, List[str]]:
+    """
+    Attribute the elements of a union Overpass response to the query terms.
+
+    Tagged elements belong to every term whose filter they match. Untagged
+    elements (member nodes/ways output by the `>;` recursion) belong to the
+    terms of the ways and relations that reference them.
+
+    Args:
+        response: Overpass JSON response for a union query
+        terms: Terms the query was built from
+
+    Returns:
+        Dict mapping each term to element refs ("node/123", "way/456")
+    """
+    index: Dict[str, List[str]] = {term: [] for term in terms}
+    members: Dict[str, set] = {term: set() for term in terms}
+
+    elements = response.get('elements', [])
+    for element in elements:
+        if not element.get('tags'):
+            continue
+        for term in _element_terms(element, terms):
+            index[term].append(_element_ref(element))
+            for node_id in element.get('nodes', []):
+                members[term].add(f"node/{node_id}")
+            for member in element.get('members', []):
+                members[term].add(f"{member.get('type')}/{member.get('ref')}")
+
+    for element in elements:
+        if element.get('tags'):
+            continue
+        ref = _element_ref(element)
+        for term in terms:
+            if ref in members[term]:
+                index[term].append(ref)
+    return index
+
+
+def split_response_by_term(response: Dict[str, Any], terms: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Split a union Overpass response into one response per term.
+
+    Each per-term response keeps the top-level metadata (version, osm3s)
+    and only the elements attributed to that term (see
+    index_elements_by_term), so it matches what a single-term query
+    would have returned.
+
+    Args:
+        response: Overpass JSON response for a union query
+        terms: Terms the query was built from
+
+    Returns:
+        Dict mapping each term to its Overpass response
+    """
+    index = response.get('terms') or index_elements_by_term(response, terms)
+    by_ref = {_element_ref(element): element for element in response.get('elements', [])}
+    metadata = {k: v for k, v in response.items() if k not in ('elements', 'terms')}
+    return {
+        term: {**metadata, 'elements': [by_ref[ref] for ref in index.get(term, []) if ref in by_ref]}
+        for term in terms
+    }
 
 
 class OSMConnector(BaseConnector):
@@ -47,7 +164,9 @@ class OSMConnector(BaseConnector):
         - Base URL (no API key required)
         - Timeout settings
         - Rate limits (be respectful - it's a public API)
-        - Default search parameters (location, radius)
+        - Default search parameters (location, radius, optional bbox)
+        - Optional tiling block: the area is split into grid tiles that are
+          queried concurrently and merged (see engine/ingestion/tiling.py)
 
     Usage:
         connector = OSMConnector()
@@ -69,20 +188,20 @@ class OSMConnector(BaseConnector):
         await connector.db.disconnect()
     """
 
-    def __init__(self, config_path: str = "engine/config/sources.yaml"):
+    def __init__(self, config_path: str = "engine/config/sources.yaml", db: Optional[Prisma] = None):
         """
         Initialize the OSM Overpass connector with configuration.
 
         Args:
             config_path: Path to the sources.yaml configuration file
+            db: Shared Prisma client (default: a new client of its own)
 
         Raises:
             FileNotFoundError: If config file doesn't exist
             ValueError: If base URL is missing or invalid
         """
         # Load configuration
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_sources_config(config_path)
 
         if 'openstreetmap' not in config:
             raise ValueError("OpenStreetMap configuration not found in sources.yaml")
@@ -108,8 +227,20 @@ class OSMConnector(BaseConnector):
         self.default_lon = lon
         self.default_radius = self.default_params.get('radius', 50000)
 
+        # Area covered by tiled fetches: explicit bbox, else the default circle's box
+        bbox_str = self.default_params.get('bbox')
+        self.area_bbox = (
+            BBox.from_string(bbox_str) if bbox_str
+            else BBox.around(self.default_lat, self.default_lon, self.default_radius)
+        )
+        self.tiling = load_tiling_config(osm_config)
+        self.rate_limiter = None  # Shared token bucket (resolved lazily)
+        # Tiled fetches take a token per tile
+        self.rate_limits_per_request = self.tiling is not None
+        self.last_tile_stats: Optional[TiledFetchStats] = None
+
         # Initialize database connection
-        self.db = Prisma()
+        self.db = db if db is not None else Prisma()
 
     @property
     def source_name(self) -> str:
@@ -121,19 +252,29 @@ class OSMConnector(BaseConnector):
         """
         return "openstreetmap"
 
-    def _build_overpass_query(self, query: str, lat: Optional[float] = None,
-                              lon: Optional[float] = None, radius: Optional[int] = None) -> str:
+    async def warm_up(self) -> None:
+        """Resolve the shared token bucket used by tiled fetches."""
+        if self.tiling is not None and self.rate_limiter is None:
+            self.rate_limiter = get_token_bucket_limiter(self.source_name)
+
+    def _build_overpass_query(self, query: Union[str, Sequence[str]], lat: Optional[float] = None,
+                              lon: Optional[float] = None, radius: Optional[int] = None,
+                              bbox: Optional[BBox] = None) -> str:
         """
         Build an Overpass QL query for sports facilities.
 
         Constructs a query that searches for OSM elements (nodes, ways, relations)
-        matching the query term with spatial filtering.
+        matching the query term with spatial filtering. Several terms are
+        combined into one union query (regex alternation on the same six
+        statements), so a multi-activity search is a single round trip.
 
         Args:
-            query: Search term (e.g., "padel", "tennis", "sports")
+            query: Search term (e.g., "padel", "tennis", "sports"), or a
+                sequence of terms for a union query
             lat: Latitude for spatial filter (uses default if not provided)
             lon: Longitude for spatial filter (uses default if not provided)
             radius: Radius in meters for spatial filter (uses default if not provided)
+            bbox: Bounding box filter (a tile); replaces the around: filter
 
         Returns:
             str: Overpass QL query string
@@ -148,22 +289,38 @@ class OSMConnector(BaseConnector):
             out body;
             >;
             out skel qt;
+
+            With ["tennis", "padel"] the filters become
+            ["sport"~"^(tennis|padel)$"] and ["leisure"~"tennis|padel"].
         """
-        # Use defaults if not provided
-        lat = lat or self.default_lat
-        lon = lon or self.default_lon
-        radius = radius or self.default_radius
+        terms = normalize_terms(query)
+        if len(terms) == 1:
+            sport_filter = f'["sport"="{terms[0]}"]'
+            leisure_filter = f'["leisure"~"{terms[0]}"]'
+        else:
+            alternation = "|".join(_escape_term(term) for term in terms)
+            sport_filter = f'["sport"~"^({alternation})$"]'
+            leisure_filter = f'["leisure"~"{alternation}"]'
+
+        if bbox is not None:
+            spatial = bbox.to_overpass()
+        else:
+            # Use defaults if not provided
+            lat = lat or self.default_lat
+            lon = lon or self.default_lon
+            radius = radius or self.default_radius
+            spatial = f"(around:{radius},{lat},{lon})"
 
         # Build Overpass QL query
         # Search for nodes, ways, and relations with the query term in various tags
         overpass_query = f"""[out:json];
 (
-  node["sport"="{query}"](around:{radius},{lat},{lon});
-  way["sport"="{query}"](around:{radius},{lat},{lon});
-  relation["sport"="{query}"](around:{radius},{lat},{lon});
-  node["leisure"~"{query}"](around:{radius},{lat},{lon});
-  way["leisure"~"{query}"](around:{radius},{lat},{lon});
-  relation["leisure"~"{query}"](around:{radius},{lat},{lon});
+  node{sport_filter}{spatial};
+  way{sport_filter}{spatial};
+  relation{sport_filter}{spatial};
+  node{leisure_filter}{spatial};
+  way{leisure_filter}{spatial};
+  relation{leisure_filter}{spatial};
 );
 out body;
 >;
@@ -171,7 +328,7 @@ out skel qt;"""
 
         return overpass_query
 
-    async def fetch(self, query: str, lat: Optional[float] = None,
+    async def fetch(self, query: Union[str, Sequence[str]], lat: Optional[float] = None,
                    lon: Optional[float] = None, radius: Optional[int] = None) -> Dict[str, Any]:
         """
         Fetch sports facility data from OpenStreetMap Overpass API.
@@ -179,8 +336,17 @@ out skel qt;"""
         Makes an HTTP POST request to the Overpass API with an Overpass QL query.
         Returns the raw JSON response containing OSM elements.
 
+        When tiling is configured and no explicit location is given, the
+        area is queried tile by tile instead (see _fetch_tiled).
+
+        Several terms are fetched with one union query. The response then
+        carries a "terms" entry mapping each term to the refs of the
+        elements it matched ("node/123"), for provenance; use
+        split_response_by_term() (or fetch_terms()) for per-term responses.
+
         Args:
-            query: Search query (e.g., "padel", "tennis")
+            query: Search query (e.g., "padel", "tennis"), or a sequence of
+                terms (e.g., ["tennis", "padel", "squash"])
             lat: Optional latitude for spatial filter
             lon: Optional longitude for spatial filter
             radius: Optional radius in meters for spatial filter
@@ -200,25 +366,104 @@ out skel qt;"""
             >>> print(f"Found {len(results['elements'])} facilities")
             >>> await connector.db.disconnect()
         """
-        # Build Overpass QL query
-        overpass_query = self._build_overpass_query(query, lat, lon, radius)
-
-        # Make API request (POST with query in body)
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.base_url,
-                data=overpass_query,
-                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
-            ) as response:
-                # Check for HTTP errors
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"Overpass API request failed with status {response.status}: {error_text}"
-                    )
-
-                # Parse and return JSON response
-                return await response.json()
+        terms = normalize_terms(query)
+        if not terms:
+            raise ValueError("At least one search term is required")
+
+        if self.tiling is not None and lat is None and lon is None and radius is None:
+            response = await self._fetch_tiled(terms)
+        else:
+            # Build Overpass QL query
+            overpass_query = self._build_overpass_query(terms, lat, lon, radius)
+
+            async with self.client_session() as session:
+                response = await self._post_overpass(session, overpass_query)
+
+        if len(terms) > 1:
+            response['terms'] = index_elements_by_term(response, terms)
+        return response
+
+    async def fetch_terms(self, terms: Sequence[str], lat: Optional[float] = None,
+                          lon: Optional[float] = None, radius: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several terms in one round trip and return one response per term.
+
+        Args:
+            terms: Search terms (e.g., ["tennis", "padel", "squash"])
+            lat: Optional latitude for spatial filter
+            lon: Optional longitude for spatial filter
+            radius: Optional radius in meters for spatial filter
+
+        Returns:
+            dict: Term -> Overpass response holding that term's elements
+
+        Example:
+            >>> per_term = await connector.fetch_terms(["tennis", "padel"])
+            >>> for term, data in per_term.items():
+            ...     await connector.save(data, f"{connector.base_url}?query={term}")
+        """
+        terms = normalize_terms(terms)
+        response = await self.fetch(terms, lat, lon, radius)
+        return split_response_by_term(response, terms)
+
+    async def _post_overpass(self, session: aiohttp.ClientSession, overpass_query: str) -> Dict[str, Any]:
+        """POST one Overpass QL query and return the parsed JSON response."""
+        async with session.post(
+            self.base_url,
+            data=overpass_query,
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+        ) as response:
+            # Check for HTTP errors
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(
+                    f"Overpass API request failed with status {response.status}: {error_text}"
+                )
+
+            # Parse and return JSON response
+            return await response.json()
+
+    async def _fetch_tiled(self, query: Union[str, Sequence[str]]) -> Dict[str, Any]:
+        """
+        Query the configured area tile by tile and merge the responses.
+
+        Tiles run concurrently (bounded by tiling.max_concurrency), each
+        taking a token from the source's rate limiter; cached tiles are
+        reused. Elements returned by several tiles (ways and relations
+        crossing a tile edge, and their member nodes) are kept once.
+
+        Args:
+            query: Search term or terms
+
+        Returns:
+            dict: Overpass response with the merged elements of every tile
+        """
+        tiles = split_bbox(self.area_bbox, self.tiling.tile_size_km)
+        cache = None
+        if self.tiling.cache_ttl_seconds > 0:
+            cache = TileCache(self.tiling.cache_dir, self.source_name, self.tiling.cache_ttl_seconds)
+        if self.rate_limiter is None:
+            self.rate_limiter = get_token_bucket_limiter(self.source_name)
+
+        stats = TiledFetchStats()
+        async with self.client_session() as session:
+            responses = await fetch_tiles(
+                tiles,
+                lambda tile: self._post_overpass(session, self._build_overpass_query(query, bbox=tile)),
+                max_concurrency=self.tiling.max_concurrency,
+                rate_limiter=self.rate_limiter,
+                cache=cache,
+                request_key="|".join(normalize_terms(query)),
+                stats=stats,
+            )
+        self.last_tile_stats = stats
+
+        merged = {k: v for k, v in responses[0].items() if k != 'elements'} if responses else {}
+        merged['elements'] = merge_unique(
+            (element for response in responses for element in response.get('elements', [])),
+            key=lambda element: (element.get('type'), element.get('id')) if 'id' in element else None,
+        )
+        return merged
 
     async def save(self, data: Dict[str, Any], source_url: str) -> str:
         """
@@ -259,11 +504,8 @@ out skel qt;"""
         # Generate a simple record ID based on element count and hash
         record_id = f"elements_{element_count}_{content_hash[:8]}"
 
-        # Generate unique file path
-        file_path = generate_file_path(self.source_name, record_id)
-
-        # Save JSON to filesystem
-        save_json(file_path, data)
+        # Save to the raw store
+        file_path = get_raw_store().put(self.source_name, record_id, data)
 
         # Prepare metadata as JSON string
         metadata = {
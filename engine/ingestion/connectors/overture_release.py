@@ -1,12 +1,53 @@
-"""Live Overture release connector for downloading Places artifacts over HTTP."""
+"""Live Overture release connector for downloading Places artifacts over HTTP.
+
+Artifacts are streamed to the local cache and decoded with a pyarrow dataset
+scan over the memory-mapped file: only PLACE_COLUMNS are projected, the bbox
+filter is pushed down to parquet row-group statistics, and rows are produced
+batch by batch, so peak memory tracks the matching rows rather than the
+artifact size.
+
+With remote_parquet=True the connector never downloads whole artifacts:
+it reads each artifact's footer with HTTP range requests and fetches only
+the row groups intersecting the bbox (see engine/ingestion/remote_parquet.py).
+The mode is switched on with `remote_parquet: true` in the optional
+overture_release block of sources.yaml; an explicit constructor argument wins.
+"""
 
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import aiohttp
 
 from engine.ingestion.base import BaseConnector
+from engine.ingestion.remote_parquet import RemoteParquetFile
+from engine.ingestion.sources_config import load_sources_config
+
+
+# Columns read from Places artifacts; everything else is never decoded
+PLACE_COLUMNS = (
+    "id",
+    "name",
+    "names",
+    "categories",
+    "confidence",
+    "websites",
+    "socials",
+    "phones",
+    "addresses",
+    "sources",
+    "geometry",
+    "bbox",
+)
+
+# Same Edinburgh area as the SportScotland connector default
+DEFAULT_BBOX = {"minx": -3.4, "miny": 55.85, "maxx": -3.0, "maxy": 56.0}
+
+# Rows per decoded RecordBatch
+DEFAULT_BATCH_SIZE = 10_000
+
+# Streamed download chunk size
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
 
 
 class OvertureReleaseConnector(BaseConnector):
@@ -19,12 +60,34 @@ class OvertureReleaseConnector(BaseConnector):
         blob_base_url: str = "https://overturemaps-us-west-2.s3.amazonaws.com",
         timeout_seconds: int = 30,
         max_artifact_size_bytes: int = 1024 * 1024 * 1024,
+        bbox: Optional[Dict[str, float]] = DEFAULT_BBOX,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        remote_parquet: Optional[bool] = None,
+        db: Optional[Any] = None,
+        config_path: str = "engine/config/sources.yaml",
     ):
+        # The overture_release block of sources.yaml is optional (no API key),
+        # and so is the file itself
+        try:
+            settings = load_sources_config(config_path).get("overture_release") or {}
+        except FileNotFoundError:
+            settings = {}
+        if remote_parquet is None:
+            remote_parquet = bool(settings.get("remote_parquet", False))
+
         self.cache_dir = Path(cache_dir or "engine/data/raw/overture_release")
         self.getting_data_url = getting_data_url
         self.blob_base_url = blob_base_url.rstrip("/")
         self.timeout_seconds = timeout_seconds
         self.max_artifact_size_bytes = max_artifact_size_bytes
+        # minx/miny/maxx/maxy in WGS84; None reads every row
+        self.bbox = dict(bbox) if bbox is not None else None
+        self.batch_size = batch_size
+        # Range-request mode: footer + intersecting row groups of every artifact
+        self.remote_parquet = remote_parquet
+        self.last_transfer: List[Dict[str, Any]] = []
+        # Shared Prisma client, only used by find_duplicates()
+        self.db = db
 
     @property
     def source_name(self) -> str:
@@ -35,6 +98,54 @@ class OvertureReleaseConnector(BaseConnector):
 
         release = await self._resolve_latest_release()
         artifacts = await self._resolve_places_artifacts(release)
+        if self.remote_parquet:
+            rows: List[Dict[str, Any]] = []
+            for path, artifact_url, row_groups in await self._fetch_remote_sources(release, artifacts):
+                rows.extend(self._collect_place_rows(path, artifact_url, row_groups=row_groups))
+            if not rows:
+                raise ValueError(
+                    f"No Overture places rows for release {release} intersect bbox {self.bbox}"
+                )
+            return {"results": rows}
+
+        cache_path, artifact_url = await self._fetch_cached_artifact(release, artifacts)
+        rows = self._decode_place_rows(cache_path, artifact_url)
+        return {"results": rows}
+
+    async def fetch_batches(self, query: str) -> List[Any]:
+        """
+        Fetch place rows as pyarrow RecordBatches (Arrow-native adapter path).
+
+        Same artifact selection, projection and bbox pushdown as fetch(), but
+        rows stay columnar; ConnectorAdapter maps them with compute kernels
+        (see engine/orchestration/arrow_candidates.py).
+
+        Args:
+            query: Ignored (release-driven connector)
+
+        Returns:
+            List of pyarrow.RecordBatch
+        """
+        del query
+
+        release = await self._resolve_latest_release()
+        artifacts = await self._resolve_places_artifacts(release)
+        if self.remote_parquet:
+            sources = await self._fetch_remote_sources(release, artifacts)
+        else:
+            cache_path, artifact_url = await self._fetch_cached_artifact(release, artifacts)
+            sources = [(cache_path, artifact_url, None)]
+
+        return [
+            batch
+            for path, artifact_url, row_groups in sources
+            for batch in self.iter_place_batches(path, artifact_url, row_groups=row_groups)
+        ]
+
+    async def _fetch_cached_artifact(
+        self, release: str, artifacts: List[Dict[str, Any]]
+    ) -> Tuple[Path, str]:
+        """Select the smallest artifact under the size cap and ensure it is cached."""
         eligible_artifacts = [
             artifact for artifact in artifacts if artifact["size_bytes"] <= self.max_artifact_size_bytes
         ]
@@ -42,21 +153,40 @@ class OvertureReleaseConnector(BaseConnector):
             raise ValueError(
                 f"No Overture places parquet artifact for release {release} satisfies size cap {self.max_artifact_size_bytes} bytes"
             )
-        selected_artifact = eligible_artifacts[0]
-        artifact_url = selected_artifact["url"]
-        artifact_size_bytes = selected_artifact["size_bytes"]
+        artifact_url = eligible_artifacts[0]["url"]
         cache_path = self._artifact_cache_path(release, artifact_url)
 
-        if cache_path.exists():
-            file_bytes = cache_path.read_bytes()
-        else:
-            file_bytes = await self._fetch_bytes(artifact_url)
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            cache_path.write_bytes(file_bytes)
-        rows = self._decode_place_rows(file_bytes, artifact_url)
+        if not cache_path.exists():
+            await self._download_artifact(artifact_url, cache_path)
+        return cache_path, artifact_url
 
-        del release, artifact_size_bytes  # Selection metadata is internal; contract returns rows.
-        return {"results": rows}
+    async def _fetch_remote_sources(
+        self, release: str, artifacts: List[Dict[str, Any]]
+    ) -> List[Tuple[Path, str, List[int]]]:
+        """
+        Range-fetch every artifact's intersecting row groups.
+
+        No size cap applies: per artifact only the footer and the projected
+        column chunks of intersecting row groups are transferred. Transfer
+        stats per artifact are kept in self.last_transfer.
+
+        Returns:
+            (sparse path, artifact URL, row groups) for artifacts with matches
+        """
+        sources = []
+        self.last_transfer = []
+        for artifact in artifacts:
+            artifact_url = artifact["url"]
+            remote = RemoteParquetFile(
+                artifact_url,
+                self._artifact_cache_path(release, artifact_url),
+                timeout_seconds=self.timeout_seconds,
+            )
+            result = await remote.fetch_row_groups(bbox=self.bbox, columns=PLACE_COLUMNS)
+            self.last_transfer.append(result.to_dict())
+            if result.row_groups:
+                sources.append((result.path, artifact_url, result.row_groups))
+        return sources
 
     def _artifact_cache_path(self, release: str, artifact_url: str) -> Path:
         artifact_name = artifact_url.rsplit("/", 1)[-1]
@@ -104,30 +234,61 @@ class OvertureReleaseConnector(BaseConnector):
         prefix = f"release/{release}/theme=places/type=place/"
         return f"{self.blob_base_url}?list-type=2&prefix={prefix}"
 
+    def _request_timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=self.timeout_seconds)
+
     async def _fetch_text(self, url: str) -> str:
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
-        ) as session:
-            async with session.get(url) as response:
+        async with self.client_session() as session:
+            async with session.get(url, timeout=self._request_timeout()) as response:
                 if response.status != 200:
                     raise RuntimeError(f"HTTP {response.status} while requesting {url}")
                 return await response.text()
 
-    async def _fetch_bytes(self, url: str) -> bytes:
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
-        ) as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    raise RuntimeError(f"HTTP {response.status} while requesting {url}")
-                return await response.read()
+    async def _download_artifact(self, url: str, cache_path: Path) -> None:
+        """Stream an artifact to the cache; the final path only appears once complete."""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = cache_path.with_name(cache_path.name + ".part")
+        try:
+            async with self.client_session() as session:
+                async with session.get(url, timeout=self._request_timeout()) as response:
+                    if response.status != 200:
+                        raise RuntimeError(f"HTTP {response.status} while requesting {url}")
+                    with open(partial_path, "wb") as handle:
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_BYTES):
+                            handle.write(chunk)
+            partial_path.replace(cache_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
 
-    def _decode_place_rows(
-        self, artifact_bytes: bytes, artifact_url: str
-    ) -> List[Dict[str, Any]]:
+    def iter_place_batches(
+        self,
+        artifact_path: Path,
+        artifact_url: str,
+        row_groups: Optional[List[int]] = None,
+    ) -> Iterator[Any]:
+        """
+        Scan a cached Places artifact batch by batch.
+
+        The file is memory-mapped and read through a pyarrow dataset scanner:
+        only PLACE_COLUMNS present in the artifact are decoded, row groups
+        whose bbox statistics fall outside self.bbox are skipped without
+        being read, and rows without an id are filtered in the scan.
+
+        Args:
+            artifact_path: Local parquet file
+            artifact_url: Source URL (for error messages)
+            row_groups: Only read these row groups (required for sparse
+                remote copies, where other row groups were never downloaded)
+
+        Yields:
+            pyarrow.RecordBatch of at most self.batch_size rows
+
+        Raises:
+            RuntimeError: If pyarrow is missing or the artifact can't be decoded
+        """
         try:
-            import pyarrow as pa
-            import pyarrow.parquet as pq
+            import pyarrow.dataset as ds
+            import pyarrow.fs as pafs
         except ImportError as exc:
             raise RuntimeError(
                 "pyarrow is required to decode Overture parquet artifacts from "
@@ -135,19 +296,77 @@ class OvertureReleaseConnector(BaseConnector):
             ) from exc
 
         try:
-            table = pq.read_table(pa.BufferReader(artifact_bytes))
+            dataset = ds.dataset(
+                str(artifact_path),
+                format="parquet",
+                filesystem=pafs.LocalFileSystem(use_mmap=True),
+            )
+            columns = [column for column in PLACE_COLUMNS if column in dataset.schema.names]
+            scan_filter = self._scan_filter(dataset.schema, ds)
+            if row_groups is None:
+                scanner = dataset.scanner(
+                    columns=columns, filter=scan_filter, batch_size=self.batch_size
+                )
+            else:
+                if not row_groups:
+                    return
+                fragment = next(iter(dataset.get_fragments())).subset(row_group_ids=row_groups)
+                scanner = ds.Scanner.from_fragment(
+                    fragment,
+                    schema=dataset.schema,
+                    columns=columns,
+                    filter=scan_filter,
+                    batch_size=self.batch_size,
+                )
+            for batch in scanner.to_batches():
+                if batch.num_rows:
+                    yield batch
         except Exception as exc:
             raise RuntimeError(
                 f"Failed decoding Overture parquet artifact {artifact_url}"
             ) from exc
 
-        records = table.to_pylist()
-        if not isinstance(records, list):
-            raise ValueError(
-                f"Decoded Overture artifact did not yield row records: {artifact_url}"
+    def _scan_filter(self, schema: Any, ds: Any) -> Optional[Any]:
+        """Build the pushdown filter: id present, bbox intersecting self.bbox."""
+        if "id" not in schema.names:
+            return None
+        expression = ds.field("id").is_valid()
+
+        if self.bbox is None or "bbox" not in schema.names:
+            return expression
+        bbox_type = schema.field("bbox").type
+        bbox_fields = {bbox_type.field(i).name for i in range(getattr(bbox_type, "num_fields", 0))}
+        if not {"xmin", "xmax", "ymin", "ymax"} <= bbox_fields:
+            return expression
+
+        # Overlap test against the per-feature bbox; parquet min/max
+        # statistics on these leaf columns let whole row groups be skipped
+        return (
+            expression
+            & (ds.field("bbox", "xmin") <= self.bbox["maxx"])
+            & (ds.field("bbox", "xmax") >= self.bbox["minx"])
+            & (ds.field("bbox", "ymin") <= self.bbox["maxy"])
+            & (ds.field("bbox", "ymax") >= self.bbox["miny"])
+        )
+
+    def _collect_place_rows(
+        self,
+        artifact_path: Path,
+        artifact_url: str,
+        row_groups: Optional[List[int]] = None,
+    ) -> List[Dict[str, Any]]:
+        filtered_rows: List[Dict[str, Any]] = []
+        for batch in self.iter_place_batches(artifact_path, artifact_url, row_groups=row_groups):
+            # Only one batch is materialized as Python dicts at a time
+            filtered_rows.extend(
+                row for row in batch.to_pylist() if self._is_supported_place_row(row)
             )
+        return filtered_rows
 
-        filtered_rows = [row for row in records if self._is_supported_place_row(row)]
+    def _decode_place_rows(
+        self, artifact_path: Path, artifact_url: str
+    ) -> List[Dict[str, Any]]:
+        filtered_rows = self._collect_place_rows(artifact_path, artifact_url)
         if not filtered_rows:
             raise ValueError(
                 "Decoded Overture artifact contained no rows with required id and "
@@ -17,15 +17,15 @@ API Documentation: https://serper.dev/
 
 import os
 import json
-import yaml
 import aiohttp
 from typing import Dict, Any, Optional
 from datetime import datetime
 from prisma import Prisma
 
 from engine.ingestion.base import BaseConnector
-from engine.ingestion.storage import generate_file_path, save_json
+from engine.ingestion.raw_store import get_raw_store
 from engine.ingestion.deduplication import compute_content_hash, check_duplicate
+from engine.ingestion.sources_config import load_sources_config
 
 
 class SerperConnector(BaseConnector):
@@ -60,20 +60,20 @@ class SerperConnector(BaseConnector):
         await connector.db.disconnect()
     """
 
-    def __init__(self, config_path: str = "engine/config/sources.yaml"):
+    def __init__(self, config_path: str = "engine/config/sources.yaml", db: Optional[Prisma] = None):
         """
         Initialize the Serper connector with configuration.
 
         Args:
             config_path: Path to the sources.yaml configuration file
+            db: Shared Prisma client (default: a new client of its own)
 
         Raises:
             FileNotFoundError: If config file doesn't exist
             ValueError: If API key is missing or invalid
         """
         # Load configuration
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_sources_config(config_path)
 
         if 'serper' not in config:
             raise ValueError("Serper configuration not found in sources.yaml")
@@ -94,7 +94,7 @@ class SerperConnector(BaseConnector):
         self.default_params = serper_config.get('default_params', {})
 
         # Initialize database connection
-        self.db = Prisma()
+        self.db = db if db is not None else Prisma()
 
     @property
     def source_name(self) -> str:
@@ -145,7 +145,7 @@ class SerperConnector(BaseConnector):
         }
 
         # Make API request
-        async with aiohttp.ClientSession() as session:
+        async with self.client_session() as session:
             async with session.post(
                 f"{self.base_url}/search",
                 json=payload,
@@ -197,12 +197,10 @@ class SerperConnector(BaseConnector):
         # Sanitize query for filename (replace spaces and special chars)
         query_slug = query.replace(' ', '_').replace('/', '_')[:50]  # Limit length
 
-        # Generate unique file path
+        # Record id (names the file under the "files" raw store backend)
         record_id = f"{query_slug}_{content_hash[:8]}"
-        file_path = generate_file_path(self.source_name, record_id)
-
-        # Save JSON to filesystem
-        save_json(file_path, data)
+        # Save to the raw store
+        file_path = get_raw_store().put(self.source_name, record_id, data)
 
         # Extract rich text availability for metadata (snippets, descriptions)
         organic_results = data.get('organic', [])
@@ -22,15 +22,39 @@ WFS Standard: OGC Web Feature Service 2.0.0
 
 import os
 import json
-import yaml
+import asyncio
+import itertools
 import aiohttp
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, List, Optional
 from datetime import datetime
 from prisma import Prisma
 
 from engine.ingestion.base import BaseConnector
-from engine.ingestion.storage import generate_file_path, save_json
+from engine.ingestion.raw_store import get_raw_store
 from engine.ingestion.deduplication import compute_content_hash, check_duplicate
+from engine.ingestion.geojson_stream import FeatureStreamParser
+from engine.ingestion.http_mirror import load_mirror
+from engine.ingestion.tiling import (
+    BBox,
+    TileCache,
+    TiledFetchStats,
+    fetch_tiles,
+    load_tiling_config,
+    merge_unique,
+    split_bbox,
+)
+from engine.ingestion.token_bucket import get_token_bucket_limiter
+from engine.ingestion.sources_config import load_sources_config
+
+
+# Response bytes read per chunk when streaming a GetFeature response
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Parsed features buffered between page fetchers and the consumer; page
+# fetchers pause (and stop reading their sockets) when it is full
+FEATURE_QUEUE_SIZE = 500
+
+_PAGES_DONE = object()
 
 
 class SportScotlandConnector(BaseConnector):
@@ -48,6 +72,13 @@ class SportScotlandConnector(BaseConnector):
         - WFS parameters (service, version, request, outputFormat, srsName)
         - Edinburgh bounding box for spatial filtering
         - Rate limits
+        - Optional tiling block: the bbox is split into grid tiles that are
+          requested concurrently and merged (see engine/ingestion/tiling.py)
+        - Optional paging block: layers are read as WFS pages (count /
+          startIndex) fetched concurrently; responses are always parsed
+          incrementally (see iter_features)
+        - Optional mirror block: conditional requests answered from a
+          local copy on 304 (see engine/ingestion/http_mirror.py)
 
     Available Layers:
         - pitches: Sports pitches (football, rugby, hockey, etc.)
@@ -81,20 +112,20 @@ class SportScotlandConnector(BaseConnector):
         await connector.db.disconnect()
     """
 
-    def __init__(self, config_path: str = "engine/config/sources.yaml"):
+    def __init__(self, config_path: str = "engine/config/sources.yaml", db: Optional[Prisma] = None):
         """
         Initialize the SportScotland WFS connector with configuration.
 
         Args:
             config_path: Path to the sources.yaml configuration file
+            db: Shared Prisma client (default: a new client of its own)
 
         Raises:
             FileNotFoundError: If config file doesn't exist
             ValueError: If required configuration is missing
         """
         # Load configuration
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_sources_config(config_path)
 
         if 'sport_scotland' not in config:
             raise ValueError("SportScotland configuration not found in sources.yaml")
@@ -114,9 +145,30 @@ class SportScotlandConnector(BaseConnector):
             'maxx': -3.0,
             'maxy': 56.0
         })
+        self.tiling = load_tiling_config(ss_config)
+
+        # WFS paging (count/startIndex); page_size None requests whole layers
+        paging = ss_config.get('paging') or {}
+        self.page_size = paging.get('page_size')
+        self.page_concurrency = paging.get('max_concurrency', 4)
+        self.page_sort_by = paging.get('sort_by')
+        if self.page_size is not None and self.page_size < 1:
+            raise ValueError("paging.page_size must be at least 1")
+        if self.page_concurrency < 1:
+            raise ValueError("paging.max_concurrency must be at least 1")
+
+        # Optional conditional-request mirror; last_not_modified is True when
+        # every request of the last fetch was answered "not modified"
+        self.mirror = load_mirror(self.source_name, ss_config)
+        self.last_not_modified = False
+        self._request_outcomes = []
+        self.rate_limiter = None  # Shared token bucket (resolved lazily)
+        # Tiled fetches take a token per tile
+        self.rate_limits_per_request = self.tiling is not None
+        self.last_tile_stats: Optional[TiledFetchStats] = None
 
         # Initialize database connection
-        self.db = Prisma()
+        self.db = db if db is not None else Prisma()
 
     @property
     def source_name(self) -> str:
@@ -128,6 +180,11 @@ class SportScotlandConnector(BaseConnector):
         """
         return "sport_scotland"
 
+    async def warm_up(self) -> None:
+        """Resolve the shared token bucket used by tiled fetches."""
+        if self.tiling is not None and self.rate_limiter is None:
+            self.rate_limiter = get_token_bucket_limiter(self.source_name)
+
     def _build_bbox_string(self) -> str:
         """
         Build WFS bbox parameter string from Edinburgh boundaries.
@@ -147,7 +204,8 @@ class SportScotlandConnector(BaseConnector):
 
         Makes an HTTP GET request to the WFS endpoint with GetFeature parameters,
         requesting GeoJSON format for easy parsing. Filters results to Edinburgh
-        area using bounding box spatial filter.
+        area using bounding box spatial filter. When tiling is configured the
+        bbox is requested tile by tile instead (see _fetch_tiled).
 
         Args:
             query: WFS layer name (e.g., "pitches", "tennis_courts", "swimming_pools")
@@ -169,25 +227,204 @@ class SportScotlandConnector(BaseConnector):
             Found 15 tennis courts
             >>> await connector.db.disconnect()
         """
+        layer_name = self._validate_layer_name(query)
+        self._request_outcomes = []
+
+        if self.tiling is not None:
+            data = await self._fetch_tiled(layer_name)
+        else:
+            async with self.client_session() as session:
+                data = await self._get_features(session, layer_name, self._build_bbox_string())
+
+        self._record_not_modified()
+        return data
+
+    async def iter_features(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a layer's features as they are parsed.
+
+        Pages (when paging is configured) are fetched concurrently and each
+        response is parsed incrementally, so features are yielded while
+        later pages are still downloading and memory stays bounded by the
+        feature queue rather than the layer size. Features arrive in
+        completion order, not page order.
+
+        With tiling configured, tiles are fetched (and cached) first and
+        their merged features are then yielded.
+
+        Args:
+            query: WFS layer name
+
+        Yields:
+            GeoJSON features
+
+        Raises:
+            ValueError: If query (layer name) is empty or a response is not
+                a FeatureCollection
+            Exception: For HTTP errors (4xx, 5xx status codes)
+
+        Example:
+            >>> async for feature in connector.iter_features("pub_sptk"):
+            ...     print(feature["properties"]["name"])
+        """
+        layer_name = self._validate_layer_name(query)
+        self._request_outcomes = []
+
+        if self.tiling is not None:
+            collection = await self._fetch_tiled(layer_name)
+            self._record_not_modified()
+            for feature in collection.get('features', []):
+                yield feature
+            return
+
+        async with self.client_session() as session:
+            async for feature in self._iter_layer(session, layer_name, self._build_bbox_string()):
+                yield feature
+        self._record_not_modified()
+
+    def _record_not_modified(self) -> None:
+        """Set last_not_modified from the outcomes of the last fetch's requests."""
+        self.last_not_modified = bool(self._request_outcomes) and all(self._request_outcomes)
+
+    @staticmethod
+    def _validate_layer_name(query: str) -> str:
         # Validate layer name
         if not query or query.strip() == "":
             raise ValueError("Layer name cannot be empty")
+        return query.strip()
 
-        layer_name = query.strip()
-
-        # Build WFS GetFeature request parameters
+    def _build_params(self, layer_name: str, bbox_string: str) -> Dict[str, Any]:
+        """Build WFS GetFeature request parameters for one layer and bbox."""
         params = {
             **self.default_params,  # service, version, request, outputFormat, srsName
             'typeName': f'sh_sptk:{layer_name}',  # Namespaced layer name (Spatial Hub SportScotland workspace)
-            'bbox': self._build_bbox_string()  # Edinburgh spatial filter
+            'bbox': bbox_string  # Spatial filter
         }
 
         # Add API token if configured (Spatial Hub uses 'authkey' parameter)
         if self.api_key:
             params['authkey'] = self.api_key
+        return params
+
+    async def _get_features(self, session: aiohttp.ClientSession, layer_name: str,
+                            bbox_string: str) -> Dict[str, Any]:
+        """Read one layer/bbox (all pages) into a FeatureCollection."""
+        metadata: Dict[str, Any] = {}
+        features = [
+            feature async for feature in self._iter_layer(session, layer_name, bbox_string, metadata)
+        ]
+
+        collection = {**metadata, 'type': metadata.get('type', 'FeatureCollection'), 'features': features}
+        if 'numberReturned' in collection:
+            collection['numberReturned'] = len(features)
+        return collection
+
+    async def _iter_layer(self, session: aiohttp.ClientSession, layer_name: str, bbox_string: str,
+                          metadata: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the features of one layer/bbox, page by page if configured.
+
+        Up to page_concurrency pages are in flight. Page indices are handed
+        out in order; the first page returning fewer than page_size features
+        marks the end of the layer, and no later pages are started.
 
-        # Make WFS request
-        async with aiohttp.ClientSession() as session:
+        Args:
+            session: Open HTTP session
+            layer_name: WFS layer name
+            bbox_string: WFS bbox parameter
+            metadata: Optional dict receiving the collection's top-level
+                members (totalFeatures, crs, ...) from the first response
+        """
+        params = self._build_params(layer_name, bbox_string)
+        if self.page_size is None:
+            async for feature in self._stream_features(session, params, metadata):
+                yield feature
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=FEATURE_QUEUE_SIZE)
+        pages = itertools.count()
+        last_page: Dict[str, Optional[int]] = {'index': None}
+        # Outcomes per page; pages started past the end don't count
+        page_outcomes: Dict[int, List[bool]] = {}
+
+        async def fetch_pages() -> None:
+            for page in pages:
+                if last_page['index'] is not None and page > last_page['index']:
+                    return
+                page_params = {**params, 'count': self.page_size, 'startIndex': page * self.page_size}
+                if self.page_sort_by:
+                    page_params['sortBy'] = self.page_sort_by
+
+                received = 0
+                outcomes = page_outcomes.setdefault(page, [])
+                async for feature in self._stream_features(session, page_params, metadata, outcomes):
+                    await queue.put(feature)
+                    received += 1
+
+                if received < self.page_size:
+                    if last_page['index'] is None or page < last_page['index']:
+                        last_page['index'] = page
+                    return
+
+        async def run_fetchers() -> None:
+            fetchers = [asyncio.ensure_future(fetch_pages()) for _ in range(self.page_concurrency)]
+            try:
+                await asyncio.gather(*fetchers)
+            except asyncio.CancelledError:
+                for fetcher in fetchers:
+                    fetcher.cancel()
+                await asyncio.gather(*fetchers, return_exceptions=True)
+                raise
+            except Exception:
+                # One page failed: stop the others, then wake the consumer
+                for fetcher in fetchers:
+                    fetcher.cancel()
+                await asyncio.gather(*fetchers, return_exceptions=True)
+                await queue.put(_PAGES_DONE)
+                raise
+            for page in sorted(page_outcomes):
+                if page <= last_page['index']:
+                    self._request_outcomes.extend(page_outcomes[page])
+            await queue.put(_PAGES_DONE)
+
+        runner = asyncio.ensure_future(run_fetchers())
+        try:
+            while True:
+                feature = await queue.get()
+                if feature is _PAGES_DONE:
+                    break
+                yield feature
+            await runner  # Re-raise a page failure
+        finally:
+            if not runner.done():
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
+
+    async def _stream_features(self, session: aiohttp.ClientSession, params: Dict[str, Any],
+                               metadata: Optional[Dict[str, Any]] = None,
+                               outcomes: Optional[List[bool]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Make one GetFeature request and yield features as they are parsed.
+
+        The request's not-modified outcome is appended to outcomes (default:
+        the current fetch's outcomes).
+        """
+        parser = FeatureStreamParser()
+        if outcomes is None:
+            outcomes = self._request_outcomes
+
+        if self.mirror is not None:
+            async with self.mirror.get(
+                session, self.base_url, params=params, timeout=self.timeout,
+                label="SportScotland WFS",
+            ) as body:
+                async for chunk in body.iter_chunks():
+                    for feature in parser.feed(chunk):
+                        yield feature
+                for feature in parser.close():
+                    yield feature
+            outcomes.append(body.not_modified)
+        else:
             async with session.get(
                 self.base_url,
                 params=params,
@@ -200,8 +437,64 @@ class SportScotlandConnector(BaseConnector):
                         f"SportScotland WFS request failed with status {response.status}: {error_text}"
                     )
 
-                # Parse and return GeoJSON FeatureCollection
-                return await response.json()
+                # Parse the GeoJSON FeatureCollection incrementally
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_BYTES):
+                    for feature in parser.feed(chunk):
+                        yield feature
+                for feature in parser.close():
+                    yield feature
+            outcomes.append(False)
+
+        if metadata is not None and not metadata:
+            metadata.update(parser.metadata)
+
+    async def _fetch_tiled(self, layer_name: str) -> Dict[str, Any]:
+        """
+        Request the Edinburgh bbox tile by tile and merge the collections.
+
+        Tiles run concurrently (bounded by tiling.max_concurrency), each
+        taking a token from the source's rate limiter; cached tiles are
+        reused. WFS bbox filters match features that intersect the tile, so
+        a facility crossing a tile edge is returned by both tiles and is
+        kept once (by feature id).
+
+        Args:
+            layer_name: WFS layer name
+
+        Returns:
+            dict: GeoJSON FeatureCollection with the features of every tile
+        """
+        tiles = split_bbox(BBox.from_dict(self.edinburgh_bbox), self.tiling.tile_size_km)
+        cache = None
+        if self.tiling.cache_ttl_seconds > 0:
+            cache = TileCache(self.tiling.cache_dir, self.source_name, self.tiling.cache_ttl_seconds)
+        if self.rate_limiter is None:
+            self.rate_limiter = get_token_bucket_limiter(self.source_name)
+
+        stats = TiledFetchStats()
+        async with self.client_session() as session:
+            collections = await fetch_tiles(
+                tiles,
+                lambda tile: self._get_features(session, layer_name, tile.to_wfs()),
+                max_concurrency=self.tiling.max_concurrency,
+                rate_limiter=self.rate_limiter,
+                cache=cache,
+                request_key=layer_name,
+                stats=stats,
+            )
+        self.last_tile_stats = stats
+
+        features = merge_unique(
+            (feature for collection in collections for feature in collection.get('features', [])),
+            key=lambda feature: feature.get('id'),
+        )
+        merged = {k: v for k, v in collections[0].items() if k != 'features'} if collections else {}
+        merged.setdefault('type', 'FeatureCollection')
+        merged['features'] = features
+        for count_key in ('totalFeatures', 'numberMatched', 'numberReturned'):
+            if count_key in merged:
+                merged[count_key] = len(features)
+        return merged
 
     async def save(self, data: Dict[str, Any], source_url: str) -> str:
         """
@@ -253,12 +546,10 @@ class SportScotlandConnector(BaseConnector):
             except (IndexError, AttributeError):
                 pass
 
-        # Generate unique file path
+        # Record id (names the file under the "files" raw store backend)
         record_id = f"{layer_type}_{feature_count}_{content_hash[:8]}"
-        file_path = generate_file_path(self.source_name, record_id)
-
-        # Save GeoJSON to filesystem
-        save_json(file_path, data)
+        # Save to the raw store
+        file_path = get_raw_store().put(self.source_name, record_id, data)
 
         # Prepare metadata as JSON string
         metadata = {
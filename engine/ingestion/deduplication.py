@@ -10,6 +10,9 @@ Key Features:
 - Order-independent hashing (dict key order doesn't matter)
 - Efficient database lookups using hash indexes
 - Works across all data sources (global deduplication)
+- Batch lookups: one `hash IN (...)` query per chunk of hashes
+- Optional in-process bloom filter that skips the query for obvious misses
+  (get_hash_bloom_filter warms one per process for orchestration persistence)
 
 Usage:
     from engine.ingestion.deduplication import compute_content_hash, check_duplicate
@@ -23,14 +26,25 @@ Usage:
         print("Already have this data, skipping")
     else:
         # Save new data...
+
+    # Many payloads at once (returns {hash: raw_ingestion_id} for existing ones)
+    existing = await find_existing_hashes(db, [hash1, hash2, hash3])
 """
 
 import json
 import hashlib
-from typing import Any, Dict
+import math
+from typing import Any, Dict, Iterable, Optional
 from prisma import Prisma
 
 
+# Hashes per `hash IN (...)` query (keeps statements well under parameter limits)
+DEFAULT_HASH_BATCH_SIZE = 500
+
+# Rows per page when warming a bloom filter from the hash index
+BLOOM_WARM_PAGE_SIZE = 10000
+
+
 def compute_content_hash(data: Dict[str, Any]) -> str:
     """
     Compute a SHA-256 hash of the data content.
@@ -94,3 +108,185 @@ async def check_duplicate(db: Prisma, content_hash: str) -> bool:
 
     # Return True if found, False if not
     return existing is not None
+
+
+class HashBloomFilter:
+    """
+    In-process bloom filter over RawIngestion content hashes.
+
+    A negative answer is definitive for the hashes the filter has seen, so
+    find_existing_hashes() can skip the database for payloads that are
+    obviously new; a positive answer may be a false positive and is always
+    confirmed with a query.
+
+    The filter is a snapshot: rows inserted by other processes after it was
+    warmed are unknown to it. Hashes are not unique in RawIngestion, so the
+    worst case of a stale miss is one duplicate row, not a failed insert.
+
+    Example:
+        >>> bloom = HashBloomFilter(capacity=100_000)
+        >>> bloom.add("abc123")
+        >>> "abc123" in bloom
+        True
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        """
+        Args:
+            capacity: Expected number of hashes
+            error_rate: Target false-positive rate at capacity
+
+        Raises:
+            ValueError: If capacity is not positive or error_rate is not in (0, 1)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, content_hash: str) -> Iterable[int]:
+        # Double hashing (Kirsch-Mitzenmacher) from one 128-bit digest
+        digest = hashlib.blake2b(content_hash.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, content_hash: str) -> None:
+        """Record a hash as present."""
+        for position in self._positions(content_hash):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, content_hashes: Iterable[str]) -> None:
+        """Record several hashes as present."""
+        for content_hash in content_hashes:
+            self.add(content_hash)
+
+    def __contains__(self, content_hash: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(content_hash)
+        )
+
+
+async def warm_bloom_filter(
+    db: Prisma,
+    bloom: Optional[HashBloomFilter] = None,
+    page_size: int = BLOOM_WARM_PAGE_SIZE,
+    error_rate: float = 0.01,
+) -> HashBloomFilter:
+    """
+    Load every existing RawIngestion hash into a bloom filter.
+
+    Pages through the table by id, so it is never loaded into memory at
+    once.
+
+    Args:
+        db: Prisma database client instance
+        bloom: Filter to fill (default: a new one sized from the row count)
+        page_size: Rows per query
+        error_rate: False-positive rate for a new filter
+
+    Returns:
+        HashBloomFilter containing every stored hash
+    """
+    if bloom is None:
+        total = await db.rawingestion.count()
+        # Headroom for the rows this process is about to add
+        bloom = HashBloomFilter(capacity=max(1000, total * 2), error_rate=error_rate)
+
+    cursor = None
+    while True:
+        query: Dict[str, Any] = {
+            "take": page_size,
+            "order": {"id": "asc"},
+        }
+        if cursor is not None:
+            query["cursor"] = {"id": cursor}
+            query["skip"] = 1
+        rows = await db.rawingestion.find_many(**query)
+        for row in rows:
+            bloom.add(row.hash)
+        if len(rows) < page_size:
+            return bloom
+        cursor = rows[-1].id
+
+
+_hash_bloom_filter: Optional[HashBloomFilter] = None
+
+
+async def get_hash_bloom_filter(db: Prisma) -> HashBloomFilter:
+    """
+    Process-wide bloom filter, warmed from RawIngestion on first use.
+
+    Later calls return the same filter; PersistenceManager adds the hashes it
+    inserts, so it stays current for this process. Two concurrent first calls
+    may both warm a filter; only the first one stored is kept.
+
+    Args:
+        db: Prisma database client instance (used only to warm the filter)
+
+    Returns:
+        Shared HashBloomFilter
+    """
+    global _hash_bloom_filter
+    if _hash_bloom_filter is None:
+        bloom = await warm_bloom_filter(db)
+        if _hash_bloom_filter is None:
+            _hash_bloom_filter = bloom
+    return _hash_bloom_filter
+
+
+def _reset_hash_bloom_filter() -> None:
+    """Drop the process-wide bloom filter (testing only)."""
+    global _hash_bloom_filter
+    _hash_bloom_filter = None
+
+
+async def find_existing_hashes(
+    db: Prisma,
+    content_hashes: Iterable[str],
+    bloom: Optional[HashBloomFilter] = None,
+    batch_size: int = DEFAULT_HASH_BATCH_SIZE,
+) -> Dict[str, str]:
+    """
+    Look up many content hashes at once.
+
+    Issues one `hash IN (...)` query per batch_size distinct hashes instead
+    of one query per payload. With a bloom filter, hashes the filter has
+    never seen are treated as new without querying.
+
+    Args:
+        db: Prisma database client instance
+        content_hashes: Hashes to check (duplicates are ignored)
+        bloom: Optional filter warmed with warm_bloom_filter()
+        batch_size: Maximum hashes per query
+
+    Returns:
+        Dict mapping each already-ingested hash to the id of its earliest
+        RawIngestion record; new hashes are absent
+
+    Example:
+        >>> existing = await find_existing_hashes(db, hashes)
+        >>> new_hashes = [h for h in hashes if h not in existing]
+    """
+    pending = list(dict.fromkeys(content_hashes))
+    if bloom is not None:
+        pending = [content_hash for content_hash in pending if content_hash in bloom]
+
+    existing: Dict[str, str] = {}
+    for start in range(0, len(pending), batch_size):
+        rows = await db.rawingestion.find_many(
+            where={"hash": {"in": pending[start:start + batch_size]}},
+            order={"ingested_at": "asc"},
+        )
+        for row in rows:
+            existing.setdefault(row.hash, row.id)
+    return existing
@@ -0,0 +1,214 @@
+"""
+Incremental parsing of GeoJSON FeatureCollections.
+
+WFS layers can be large; buffering the whole response and calling
+response.json() holds the raw document and its parsed copy in memory at
+once. FeatureStreamParser is fed response chunks as they arrive and returns
+each feature of the top-level "features" array as soon as it is complete,
+so only the unparsed tail of the stream is buffered. The other top-level
+members (totalFeatures, numberMatched, crs, ...) are collected into
+`metadata`, whichever side of the features array they appear on.
+
+Example:
+    parser = FeatureStreamParser()
+    async for chunk in response.content.iter_chunked(65536):
+        for feature in parser.feed(chunk):
+            handle(feature)
+    parser.close()
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, List, Union
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Parser states
+_START = "start"                # before the top-level "{"
+_MEMBER = "member"              # expecting a key (or "}" if the object is empty)
+_COLON = "colon"                # after a key
+_VALUE = "value"                # expecting a member value
+_AFTER_MEMBER = "after_member"  # expecting "," or "}"
+_ITEMS_START = "items_start"    # after "features": [ (expecting a feature or "]")
+_ITEM = "item"                  # expecting a feature
+_AFTER_ITEM = "after_item"      # expecting "," or "]"
+_DONE = "done"
+
+
+class FeatureStreamParser:
+    """
+    Push parser yielding the features of a streamed FeatureCollection.
+
+    Attributes:
+        metadata: Top-level members other than "features"
+        feature_count: Features returned so far
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = None
+        self._empty_container = True
+        self.metadata: Dict[str, Any] = {}
+        self.feature_count = 0
+
+    @property
+    def done(self) -> bool:
+        """True once the closing "}" of the collection has been read."""
+        return self._state == _DONE
+
+    def feed(self, chunk: Union[bytes, str]) -> List[Dict[str, Any]]:
+        """
+        Add a chunk of the response and return the features it completed.
+
+        Args:
+            chunk: Next bytes (UTF-8) or text of the response
+
+        Returns:
+            Features completed by this chunk, in document order
+
+        Raises:
+            ValueError: If the stream is not a JSON object with a features array
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._text.decode(chunk)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+
+        features: List[Dict[str, Any]] = []
+        while self._step(features):
+            pass
+        return features
+
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        Signal end of stream.
+
+        Returns:
+            Any features completed by the final bytes
+
+        Raises:
+            ValueError: If the collection is truncated
+        """
+        features = self.feed(self._text.decode(b"", final=True))
+        if self._state != _DONE:
+            raise ValueError(
+                f"Truncated GeoJSON FeatureCollection (after {self.feature_count} features)"
+            )
+        return features
+
+    def _peek(self):
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else None
+
+    def _decode(self):
+        """
+        Decode the JSON value at the cursor.
+
+        Returns (True, value) once the value is complete and followed by at
+        least one more character (so numbers split across chunks are never
+        cut short), otherwise (False, None) to wait for more data.
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            return False, None
+        if _WHITESPACE.match(self._buffer, end).end() >= len(self._buffer):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str, expected: str) -> None:
+        raise ValueError(
+            f"Invalid GeoJSON FeatureCollection: expected {expected}, got {char!r}"
+        )
+
+    def _step(self, features: List[Dict[str, Any]]) -> bool:
+        """Advance one token; return False when more data is needed."""
+        if self._state == _DONE:
+            return False
+        char = self._peek()
+        if char is None:
+            return False
+
+        if self._state == _START:
+            if char != "{":
+                self._expect(char, '"{"')
+            self._pos += 1
+            self._state = _MEMBER
+            self._empty_container = True
+            return True
+
+        if self._state == _MEMBER:
+            if char == "}" and self._empty_container:
+                self._pos += 1
+                self._state = _DONE
+                return False
+            if char != '"':
+                self._expect(char, "a member name")
+            complete, key = self._decode()
+            if not complete:
+                return False
+            self._key = key
+            self._state = _COLON
+            return True
+
+        if self._state == _COLON:
+            if char != ":":
+                self._expect(char, '":"')
+            self._pos += 1
+            self._state = _VALUE
+            return True
+
+        if self._state == _VALUE:
+            if self._key == "features" and char == "[":
+                self._pos += 1
+                self._state = _ITEMS_START
+                return True
+            complete, value = self._decode()
+            if not complete:
+                return False
+            self.metadata[self._key] = value
+            self._state = _AFTER_MEMBER
+            return True
+
+        if self._state == _AFTER_MEMBER:
+            self._pos += 1
+            if char == ",":
+                self._state = _MEMBER
+                self._empty_container = False
+                return True
+            if char == "}":
+                self._state = _DONE
+                return False
+            self._expect(char, '"," or "}"')
+
+        if self._state in (_ITEMS_START, _ITEM):
+            if char == "]" and self._state == _ITEMS_START:
+                self._pos += 1
+                self._state = _AFTER_MEMBER
+                return True
+            complete, feature = self._decode()
+            if not complete:
+                return False
+            features.append(feature)
+            self.feature_count += 1
+            self._state = _AFTER_ITEM
+            return True
+
+        if self._state == _AFTER_ITEM:
+            self._pos += 1
+            if char == ",":
+                self._state = _ITEM
+                return True
+            if char == "]":
+                self._state = _AFTER_MEMBER
+                return True
+            self._expect(char, '"," or "]"')
+
+        return False
@@ -13,7 +13,8 @@ Each check returns a status (healthy, warning, critical) and supporting metrics.
 import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List
-from prisma import Prisma
+
+from engine.db import get_db_provider
 
 
 def now_utc() -> datetime:
@@ -104,10 +105,10 @@ async def check_failed_ingestions(
         >>> if result['status'] == 'critical':
         ...     print(f"High failure rate: {result['failure_rate']:.1f}%")
     """
-    db = Prisma()
+    provider = get_db_provider()
 
     try:
-        await db.connect()
+        db = await provider.acquire()
     except Exception as e:
         return {
             'status': 'critical',
@@ -170,7 +171,7 @@ async def check_failed_ingestions(
         }
 
     finally:
-        await db.disconnect()
+        await provider.release()
 
 
 async def check_stale_data(threshold_hours: int = 24) -> Dict[str, Any]:
@@ -195,10 +196,10 @@ async def check_stale_data(threshold_hours: int = 24) -> Dict[str, Any]:
         >>> for source in result['stale_sources']:
         ...     print(f"{source['source']} is {source['hours_since']} hours old")
     """
-    db = Prisma()
+    provider = get_db_provider()
 
     try:
-        await db.connect()
+        db = await provider.acquire()
     except Exception as e:
         return {
             'status': 'critical',
@@ -264,7 +265,7 @@ async def check_stale_data(threshold_hours: int = 24) -> Dict[str, Any]:
         }
 
     finally:
-        await db.disconnect()
+        await provider.release()
 
 
 async def check_api_quota() -> Dict[str, Any]:
@@ -288,10 +289,10 @@ async def check_api_quota() -> Dict[str, Any]:
         >>> for source, quota_info in result['quota_by_source'].items():
         ...     print(f"{source}: {quota_info['requests_today']} requests today")
     """
-    db = Prisma()
+    provider = get_db_provider()
 
     try:
-        await db.connect()
+        db = await provider.acquire()
     except Exception as e:
         return {
             'status': 'critical',
@@ -370,4 +371,4 @@ async def check_api_quota() -> Dict[str, Any]:
         }
 
     finally:
-        await db.disconnect()
+        await provider.release()
@@ -0,0 +1,316 @@
+"""
+Conditional-request mirror for slow-changing HTTP datasets.
+
+Open datasets such as Edinburgh Council layers, SportScotland WFS layers
+and Open Charge Map results rarely change, but each run downloads them in
+full and only then discovers (by content hash) that nothing changed. The
+mirror keeps the last payload of every request plus its ETag/Last-Modified
+validators, sends If-None-Match / If-Modified-Since on the next request,
+and serves a 304 Not Modified from the local copy.
+
+Every response carries a `not_modified` flag: True for a 304, and also for
+a 200 whose body is byte-identical to the mirrored copy (servers that send
+no validators). Connectors expose it as `last_not_modified` so downstream
+stages can skip hashing, duplicate checks and saves for unchanged data.
+
+Layout (one directory per source):
+
+    engine/data/mirror/<source>/<key>.body   last payload (raw bytes)
+    engine/data/mirror/<source>/<key>.json   validators and metadata
+
+The key is a hash of the URL and query parameters; parameters (which may
+include API keys) are never written to disk.
+
+Configured per source in sources.yaml:
+
+    edinburgh_council:
+      mirror:
+        enabled: true
+        directory: engine/data/mirror   # optional
+"""
+
+import hashlib
+import json
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import aiohttp
+
+
+DEFAULT_MIRROR_DIR = "engine/data/mirror"
+
+# Bytes per chunk when streaming a body to/from the mirror
+MIRROR_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass
+class MirrorEntry:
+    """
+    Validators and bookkeeping for one mirrored request.
+
+    Attributes:
+        url: Request URL (without query parameters)
+        etag: ETag of the mirrored payload, if the server sent one
+        last_modified: Last-Modified of the mirrored payload, if sent
+        content_hash: SHA-256 of the mirrored payload
+        size: Payload size in bytes
+        fetched_at: When the payload was last downloaded (ISO 8601, UTC)
+        validated_at: When the server last confirmed it (ISO 8601, UTC)
+    """
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+    size: int
+    fetched_at: str
+    validated_at: str
+
+
+@dataclass
+class MirrorStats:
+    """
+    Request counters for one mirror.
+
+    Attributes:
+        requests: Requests made through the mirror
+        not_modified: Requests answered 304 and served from the mirror
+        unchanged: 200 responses identical to the mirrored payload
+        bytes_downloaded: Body bytes received from the network
+        bytes_served_from_mirror: Body bytes served from local copies
+    """
+
+    requests: int = 0
+    not_modified: int = 0
+    unchanged: int = 0
+    bytes_downloaded: int = 0
+    bytes_served_from_mirror: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class MirroredBody:
+    """
+    Body of one mirrored response, read with iter_chunks().
+
+    not_modified is final once the body has been read completely.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], not_modified: bool, from_mirror: bool):
+        self._chunks = chunks
+        self.not_modified = not_modified
+        self.from_mirror = from_mirror
+
+    def iter_chunks(self) -> AsyncIterator[bytes]:
+        """Iterate over the body bytes (network or local copy)."""
+        return self._chunks
+
+    async def read(self) -> bytes:
+        """Read the whole body."""
+        return b"".join([chunk async for chunk in self._chunks])
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def load_mirror(source: str, source_config: Optional[Dict[str, Any]]) -> Optional["HttpMirror"]:
+    """
+    Build a source's mirror from its `mirror` block in sources.yaml.
+
+    Args:
+        source: Source name (mirror subdirectory)
+        source_config: The source's section of sources.yaml
+
+    Returns:
+        HttpMirror, or None if the source has no enabled mirror block
+    """
+    block = (source_config or {}).get("mirror")
+    if not isinstance(block, dict) or not block.get("enabled", True):
+        return None
+    return HttpMirror(source, block.get("directory", DEFAULT_MIRROR_DIR))
+
+
+class HttpMirror:
+    """
+    Local mirror answering conditional GETs for one source.
+
+    Example:
+        mirror = HttpMirror("edinburgh_council")
+        async with aiohttp.ClientSession() as session:
+            data, not_modified = await mirror.get_json(session, url, params=params)
+    """
+
+    def __init__(self, source: str, root: str = DEFAULT_MIRROR_DIR):
+        """
+        Args:
+            source: Source name (mirror subdirectory)
+            root: Mirror root directory
+        """
+        self.source = source
+        self.directory = Path(root) / source
+        self.stats = MirrorStats()
+
+    @staticmethod
+    def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Stable key for a URL plus query parameters."""
+        canonical = json.dumps(
+            [url, sorted((str(k), str(v)) for k, v in (params or {}).items())]
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def load_entry(self, key: str) -> Optional[MirrorEntry]:
+        """Return the mirrored entry for a key, if its payload is present."""
+        meta_path = self.directory / f"{key}.json"
+        if not (self.directory / f"{key}.body").exists():
+            return None
+        try:
+            return MirrorEntry(**json.loads(meta_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_entry(self, key: str, entry: MirrorEntry) -> None:
+        meta_path = self.directory / f"{key}.json"
+        partial = meta_path.with_suffix(".json.part")
+        partial.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+        partial.replace(meta_path)
+
+    @asynccontextmanager
+    async def get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        label: str = "HTTP",
+    ) -> AsyncIterator[MirroredBody]:
+        """
+        Conditional GET, yielding the body from the network or the mirror.
+
+        A 200 body is written to the mirror as it is read and replaces the
+        previous copy only once it has been read completely.
+
+        Args:
+            session: Open HTTP session
+            url: Request URL
+            params: Query parameters
+            timeout: Total request timeout in seconds
+            label: Prefix for error messages (e.g. "SportScotland WFS")
+
+        Yields:
+            MirroredBody
+
+        Raises:
+            Exception: For HTTP errors (any status other than 200/304, or a
+                304 with no mirrored payload)
+        """
+        key = self.request_key(url, params)
+        entry = self.load_entry(key)
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        self.stats.requests += 1
+        async with session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            if response.status == 304 and entry is not None:
+                entry.validated_at = _utc_now()
+                self._save_entry(key, entry)
+                self.stats.not_modified += 1
+                self.stats.bytes_served_from_mirror += entry.size
+                yield MirroredBody(self._read_local(key), not_modified=True, from_mirror=True)
+                return
+
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(
+                    f"{label} request failed with status {response.status}: {error_text}"
+                )
+
+            body = MirroredBody(None, not_modified=False, from_mirror=False)
+            body._chunks = self._download(key, url, response, entry, body)
+            yield body
+
+    async def get_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        label: str = "HTTP",
+    ) -> Tuple[Any, bool]:
+        """
+        Conditional GET of a JSON resource.
+
+        Returns:
+            Tuple of (parsed JSON, not_modified)
+        """
+        async with self.get(session, url, params=params, timeout=timeout, label=label) as body:
+            payload = await body.read()
+        return json.loads(payload), body.not_modified
+
+    async def _read_local(self, key: str) -> AsyncIterator[bytes]:
+        with open(self.directory / f"{key}.body", "rb") as f:
+            while True:
+                chunk = f.read(MIRROR_CHUNK_BYTES)
+                if not chunk:
+                    return
+                yield chunk
+
+    async def _download(
+        self,
+        key: str,
+        url: str,
+        response: aiohttp.ClientResponse,
+        previous: Optional[MirrorEntry],
+        body: MirroredBody,
+    ) -> AsyncIterator[bytes]:
+        """Stream a 200 body to the caller and into the mirror."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        body_path = self.directory / f"{key}.body"
+        partial = body_path.with_suffix(".body.part")
+        digest = hashlib.sha256()
+        size = 0
+
+        try:
+            with open(partial, "wb") as f:
+                async for chunk in response.content.iter_chunked(MIRROR_CHUNK_BYTES):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+                    yield chunk
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        partial.replace(body_path)
+        self.stats.bytes_downloaded += size
+
+        content_hash = digest.hexdigest()
+        now = _utc_now()
+        unchanged = previous is not None and previous.content_hash == content_hash
+        if unchanged:
+            self.stats.unchanged += 1
+        body.not_modified = unchanged
+
+        self._save_entry(key, MirrorEntry(
+            url=url,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=content_hash,
+            size=size,
+            fetched_at=previous.fetched_at if unchanged else now,
+            validated_at=now,
+        ))
@@ -0,0 +1,225 @@
+"""
+Move existing raw payload files into the configured raw store.
+
+Every RawIngestion whose file_path is not already a store object is read
+(any format load_raw_payload understands), written to the store, where
+identical payloads collapse into one object, and repointed at the new path.
+Original files are deleted only with --delete-originals, once every record
+that referenced them has been migrated.
+
+Usage:
+    python -m engine.ingestion.migrate_raw_store --dry-run
+    python -m engine.ingestion.migrate_raw_store --delete-originals
+"""
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Set
+
+from prisma import Prisma
+
+from engine.ingestion.raw_archive import parse_archive_locator
+from engine.ingestion.raw_store import (
+    RawStore,
+    get_raw_store,
+    load_raw_payload,
+    parse_segment_locator,
+)
+
+
+DEFAULT_PAGE_SIZE = 500
+
+
+@dataclass
+class MigrationStats:
+    """
+    Outcome of one migration run.
+
+    Attributes:
+        records: RawIngestion records examined
+        migrated: Records repointed at a store object
+        already_migrated: Records already in the raw store or the archive
+        missing: Records whose file no longer exists
+        failed: Records whose file could not be read or parsed
+        files_before: Distinct original files of migrated records
+        bytes_before: Size of those files
+        objects_written: New store objects
+        bytes_after: Size of the new store objects
+        originals_deleted: Original files removed
+    """
+
+    records: int = 0
+    migrated: int = 0
+    already_migrated: int = 0
+    missing: int = 0
+    failed: int = 0
+    files_before: int = 0
+    bytes_before: int = 0
+    objects_written: int = 0
+    bytes_after: int = 0
+    originals_deleted: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+async def migrate_raw_store(
+    db: Prisma,
+    store: RawStore,
+    dry_run: bool = False,
+    delete_originals: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> MigrationStats:
+    """
+    Migrate RawIngestion payload files into a raw store.
+
+    Safe to re-run: records already in the store are skipped, and objects
+    are write-once.
+
+    Args:
+        db: Connected Prisma client
+        store: Destination store
+        dry_run: Read and count only; write and update nothing
+        delete_originals: Remove original files after migration
+        page_size: Records per query
+
+    Returns:
+        MigrationStats
+    """
+    stats = MigrationStats()
+    written_before = store.stats.written
+    bytes_written_before = store.stats.bytes_written
+    migrated_paths: Set[str] = set()
+    unreadable_paths: Set[str] = set()
+
+    cursor = None
+    while True:
+        query = {"take": page_size, "order": {"id": "asc"}}
+        if cursor is not None:
+            query["cursor"] = {"id": cursor}
+            query["skip"] = 1
+        rows = await db.rawingestion.find_many(**query)
+
+        for row in rows:
+            stats.records += 1
+            # Archived records stay in the archive
+            if store.owns(row.file_path) or parse_archive_locator(row.file_path):
+                stats.already_migrated += 1
+                continue
+
+            path = Path(row.file_path)
+            located = parse_segment_locator(row.file_path)
+            try:
+                payload = load_raw_payload(row.file_path)
+                size = located[2] if located else path.stat().st_size
+            except FileNotFoundError:
+                stats.missing += 1
+                continue
+            except (OSError, ValueError) as e:
+                print(f"  ✗ {row.id}: cannot read {row.file_path}: {e}")
+                stats.failed += 1
+                unreadable_paths.add(row.file_path)
+                continue
+
+            if row.file_path not in migrated_paths:
+                stats.files_before += 1
+                stats.bytes_before += size
+            if located is None:
+                # Segment files hold other records and are never deleted
+                migrated_paths.add(row.file_path)
+            stats.migrated += 1
+
+            if dry_run:
+                continue
+            new_path = store.put(row.source, path.name.split(".")[0], payload)
+            await db.rawingestion.update(
+                where={"id": row.id},
+                data={"file_path": new_path},
+            )
+
+        if len(rows) < page_size:
+            break
+        cursor = rows[-1].id
+
+    store.finish()
+    stats.objects_written = store.stats.written - written_before
+    stats.bytes_after = store.stats.bytes_written - bytes_written_before
+
+    if delete_originals and not dry_run:
+        for file_path in sorted(migrated_paths - unreadable_paths):
+            try:
+                Path(file_path).unlink()
+            except FileNotFoundError:
+                continue
+            stats.originals_deleted += 1
+
+    return stats
+
+
+async def run_migration(dry_run: bool, delete_originals: bool, page_size: int) -> int:
+    """Run the migration against the configured database and store."""
+    db = Prisma()
+
+    try:
+        await db.connect()
+    except Exception as exc:
+        print(f"Database connection failed: {exc}")
+        return 1
+
+    try:
+        stats = await migrate_raw_store(
+            db,
+            get_raw_store(),
+            dry_run=dry_run,
+            delete_originals=delete_originals,
+            page_size=page_size,
+        )
+
+        print("Raw Store Migration" + (" (dry run)" if dry_run else ""))
+        print(f"  Records:          {stats.records}")
+        print(f"  Migrated:         {stats.migrated}")
+        print(f"  Already migrated: {stats.already_migrated}")
+        print(f"  Missing files:    {stats.missing}")
+        print(f"  Failed:           {stats.failed}")
+        print(f"  Files before:     {stats.files_before} ({stats.bytes_before:,} bytes)")
+        if not dry_run:
+            print(f"  Objects written:  {stats.objects_written} ({stats.bytes_after:,} bytes)")
+            print(f"  Originals deleted: {stats.originals_deleted}")
+
+        return 0 if stats.failed == 0 else 1
+
+    finally:
+        await db.disconnect()
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Move raw payload files into the configured raw store",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count what would be migrated without writing anything",
+    )
+    parser.add_argument(
+        "--delete-originals",
+        action="store_true",
+        help="Delete original files once their records point at the store",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="RawIngestion records per query",
+    )
+
+    args = parser.parse_args()
+    return asyncio.run(run_migration(args.dry_run, args.delete_originals, args.page_size))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
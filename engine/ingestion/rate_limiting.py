@@ -17,7 +17,7 @@ request expiry based on sliding time windows.
 import time
 import yaml
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List
 from functools import wraps
 from collections import deque
 
@@ -110,6 +110,18 @@ class RateLimiter:
         while self._request_log and self._request_log[0] < cutoff_time:
             self._request_log.popleft()
 
+    def _requests_in_window(self, window_seconds: int) -> List[float]:
+        """
+        Return request timestamps inside a window, oldest first.
+
+        Only entries older than the longest window (one hour) are discarded,
+        so counting the minute window never drops entries the hour window
+        still needs.
+        """
+        self._clean_expired_requests(3600)
+        cutoff_time = time.time() - window_seconds
+        return [t for t in self._request_log if t >= cutoff_time]
+
     def get_request_count_last_minute(self) -> int:
         """
         Get the number of requests made in the last minute.
@@ -117,8 +129,7 @@ class RateLimiter:
         Returns:
             Number of requests in the last 60 seconds
         """
-        self._clean_expired_requests(60)
-        return len(self._request_log)
+        return len(self._requests_in_window(60))
 
     def get_request_count_last_hour(self) -> int:
         """
@@ -127,8 +138,7 @@ class RateLimiter:
         Returns:
             Number of requests in the last 3600 seconds
         """
-        self._clean_expired_requests(3600)
-        return len(self._request_log)
+        return len(self._requests_in_window(3600))
 
     def can_make_request(self) -> bool:
         """
@@ -172,29 +182,23 @@ class RateLimiter:
         current_time = time.time()
         wait_times = []
 
-        # Check per-minute limit
-        if self.requests_per_minute is not None:
-            count_last_minute = self.get_request_count_last_minute()
-            if count_last_minute >= self.requests_per_minute:
-                # Find the oldest request in the minute window
-                # It will expire 60 seconds after it was made
-                oldest_request = self._request_log[0]
-                wait_time = 60 - (current_time - oldest_request)
-                if wait_time > 0:
-                    wait_times.append(wait_time)
-
-        # Check per-hour limit
-        if self.requests_per_hour is not None:
-            count_last_hour = self.get_request_count_last_hour()
-            if count_last_hour >= self.requests_per_hour:
-                # Find the oldest request in the hour window
-                oldest_request = self._request_log[0]
-                wait_time = 3600 - (current_time - oldest_request)
+        # Each exhausted window frees a slot when its oldest request expires
+        for limit, window_seconds in (
+            (self.requests_per_minute, 60),
+            (self.requests_per_hour, 3600),
+        ):
+            if limit is None:
+                continue
+            in_window = self._requests_in_window(window_seconds)
+            if len(in_window) >= limit:
+                # Oldest request that must expire to get back under the limit
+                oldest_request = in_window[len(in_window) - limit]
+                wait_time = window_seconds - (current_time - oldest_request)
                 if wait_time > 0:
                     wait_times.append(wait_time)
 
-        # Return the minimum wait time (earliest we can make a request)
-        return min(wait_times) if wait_times else 0
+        # Every exhausted window must free a slot, so wait for the slowest
+        return max(wait_times) if wait_times else 0
 
 
 # Global registry of rate limiters (one per source)
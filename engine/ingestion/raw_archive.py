@@ -0,0 +1,224 @@
+"""
+Parquet archive of historical raw ingestions.
+
+Aged raw payloads are packed by engine.ingestion.compact_raw_archive into
+Parquet files partitioned by source and ingest date:
+
+    engine/data/raw/archive/source=serper/ingest_date=2026-01-13/part-1a2b3c4d.parquet
+
+Each row holds one RawIngestion's metadata columns plus its payload as
+compact JSON text. The record's file_path becomes "<file>.parquet#<row>",
+which load_raw_payload() resolves like any other raw path, and bulk readers
+(re-extraction, analytics) scan whole partitions with scan_archive() instead
+of opening one file per record.
+
+pyarrow is imported lazily: only archive reads and compaction need it.
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+DEFAULT_ARCHIVE_DIR = "engine/data/raw/archive"
+
+# Row groups kept decoded for single-record reads
+MAX_CACHED_ROW_GROUPS = 8
+
+_ARCHIVE_LOCATOR = re.compile(r"^(?P<path>.+\.parquet)#(?P<row>\d+)$")
+
+
+def parse_archive_locator(file_path: str) -> Optional[Tuple[str, int]]:
+    """
+    Split an archived record path into (parquet file, row index).
+
+    Returns:
+        Tuple, or None if file_path is not an archive record
+    """
+    match = _ARCHIVE_LOCATOR.match(file_path)
+    if match is None:
+        return None
+    return match.group("path"), int(match.group("row"))
+
+
+def archive_schema():
+    """
+    pyarrow schema of an archive file.
+
+    source and ingest_date are not stored in the file; they come from the
+    partition path.
+    """
+    import pyarrow as pa
+
+    return pa.schema([
+        ("raw_ingestion_id", pa.string()),
+        ("source_url", pa.string()),
+        ("status", pa.string()),
+        ("hash", pa.string()),
+        ("ingested_at", pa.timestamp("us", tz="UTC")),
+        ("orchestration_run_id", pa.string()),
+        ("metadata_json", pa.string()),
+        ("original_file_path", pa.string()),
+        ("payload", pa.string()),
+    ])
+
+
+def partition_path(root: Union[str, Path], source: str, ingest_date: str) -> Path:
+    """Directory of one (source, ingest date) partition."""
+    return Path(root) / f"source={source}" / f"ingest_date={ingest_date}"
+
+
+class _RowGroupCache:
+    """Payload columns of recently read row groups (LRU)."""
+
+    def __init__(self, max_entries: int = MAX_CACHED_ROW_GROUPS):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int], List[Optional[str]]]" = OrderedDict()
+        self._offsets: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def payload(self, path: str, row: int) -> str:
+        import pyarrow.parquet as pq
+
+        with self._lock:
+            parquet_file = None
+            offsets = self._offsets.get(path)
+            if offsets is None:
+                parquet_file = pq.ParquetFile(path)
+                offsets = [0]
+                for index in range(parquet_file.num_row_groups):
+                    offsets.append(offsets[-1] + parquet_file.metadata.row_group(index).num_rows)
+                self._offsets[path] = offsets
+            if not 0 <= row < offsets[-1]:
+                raise OSError(f"Archive {path} has {offsets[-1]} rows; no row {row}")
+
+            group = next(index for index in range(len(offsets) - 1) if row < offsets[index + 1])
+            key = (path, group)
+            payloads = self._entries.get(key)
+            if payloads is None:
+                parquet_file = parquet_file or pq.ParquetFile(path)
+                payloads = parquet_file.read_row_group(group, columns=["payload"]).column(0).to_pylist()
+                self._entries[key] = payloads
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+
+        payload = payloads[row - offsets[group]]
+        if payload is None:
+            raise OSError(f"Archive {path} row {row} has no payload")
+        return payload
+
+
+_row_groups = _RowGroupCache()
+
+
+def read_archived_payload(file_path: str) -> bytes:
+    """
+    Read one archived payload's JSON bytes.
+
+    Args:
+        file_path: "<file>.parquet#<row>" locator
+
+    Raises:
+        OSError: If the archive file or row is missing
+    """
+    located = parse_archive_locator(file_path)
+    if located is None:
+        raise OSError(f"Not an archive record: {file_path}")
+    return _row_groups.payload(*located).encode("utf-8")
+
+
+def _partition_filter(sources, since, until):
+    import pyarrow.dataset as ds
+
+    expression = None
+
+    def both(left, right):
+        return right if left is None else left & right
+
+    if sources:
+        expression = both(expression, ds.field("source").isin(list(sources)))
+    if since is not None:
+        expression = both(expression, ds.field("ingest_date") >= since.isoformat())
+    if until is not None:
+        expression = both(expression, ds.field("ingest_date") <= until.isoformat())
+    return expression
+
+
+def scan_archive(
+    root: Union[str, Path] = DEFAULT_ARCHIVE_DIR,
+    sources: Optional[Sequence[str]] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = 1024,
+) -> Iterator[Any]:
+    """
+    Scan archived records as pyarrow RecordBatches.
+
+    Only the partitions matching sources/since/until are opened, and only
+    the requested columns are decoded, so a month of one source is a single
+    sequential read of that month's files.
+
+    Args:
+        root: Archive directory
+        sources: Sources to include (default: all)
+        since: First ingest date to include
+        until: Last ingest date to include
+        columns: Columns to read, including the partition columns "source"
+            and "ingest_date" (default: all)
+        batch_size: Maximum rows per batch
+
+    Yields:
+        pyarrow.RecordBatch
+    """
+    if not Path(root).exists():
+        return
+
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    partitioning = ds.partitioning(
+        pa.schema([("source", pa.string()), ("ingest_date", pa.string())]),
+        flavor="hive",
+    )
+    dataset = ds.dataset(str(root), format="parquet", partitioning=partitioning)
+    scanner = dataset.scanner(
+        columns=list(columns) if columns is not None else None,
+        filter=_partition_filter(sources, since, until),
+        batch_size=batch_size,
+    )
+    yield from scanner.to_batches()
+
+
+def iter_archived_records(
+    root: Union[str, Path] = DEFAULT_ARCHIVE_DIR,
+    sources: Optional[Sequence[str]] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    batch_size: int = 1024,
+) -> Iterator[List[Tuple[str, str, Any]]]:
+    """
+    Scan archived payloads for re-extraction.
+
+    Yields:
+        Lists of (raw_ingestion_id, source, parsed payload), one per batch
+    """
+    for batch in scan_archive(
+        root,
+        sources=sources,
+        since=since,
+        until=until,
+        columns=["raw_ingestion_id", "source", "payload"],
+        batch_size=batch_size,
+    ):
+        ids, batch_sources, payloads = (batch.column(i).to_pylist() for i in range(3))
+        yield [
+            (raw_id, source, json.loads(payload))
+            for raw_id, source, payload in zip(ids, batch_sources, payloads)
+        ]
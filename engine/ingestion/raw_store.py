@@ -0,0 +1,620 @@
+"""
+Raw Payload Stores
+
+Raw payloads used to be written as pretty-printed JSON, one timestamped file
+per save, so identical payloads were rewritten under new names and the raw
+directory grew to hundreds of thousands of small files. A RawStore decides
+where and how a payload is written; the path it returns is what goes into
+RawIngestion.file_path, and load_raw_payload() reads any such path back.
+
+Stores:
+    ContentAddressedRawStore (default)
+        Compact JSON, compressed (zstd when the zstandard package is
+        installed, gzip otherwise), named by the SHA-256 of the serialized
+        payload and sharded two levels deep. Objects are write-once: saving
+        the same payload again returns the existing path.
+
+            engine/data/raw/objects/3f/a2/3fa2...c9.json.zst
+
+    SegmentLogRawStore
+        Append-only JSONL segment per run: a run's payloads become a few
+        large sequential writes instead of one file each. A record's path
+        is "<segment>#<offset>:<length>" and is read back with mmap.
+
+            engine/data/raw/segments/20260114T101500_4242_1a2b3c4d.jsonl#5120:734
+
+    JsonFileRawStore
+        The original layout (engine/data/raw/<source>/<date>_<id>.json).
+
+Configured in engine/config/app.yaml:
+
+    raw_store:
+      backend: content_addressed   # or: segments, files
+      compression: zstd            # zstd | gzip | none (content_addressed)
+      root: engine/data/raw/objects
+
+Existing files are moved into the store with:
+
+    python -m engine.ingestion.migrate_raw_store
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import re
+import threading
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import yaml
+
+from engine.ingestion.storage import generate_file_path, save_json
+
+
+DEFAULT_OBJECTS_DIR = "engine/data/raw/objects"
+DEFAULT_SEGMENTS_DIR = "engine/data/raw/segments"
+
+# Segments roll over once they reach this size
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+# Write buffer of an open segment (records reach disk in chunks of this size)
+SEGMENT_BUFFER_BYTES = 1024 * 1024
+
+# Segment mmaps kept open for reads
+MAX_OPEN_SEGMENT_MAPS = 16
+
+_SEGMENT_LOCATOR = re.compile(r"^(?P<path>.+\.jsonl)#(?P<offset>\d+):(?P<length>\d+)$")
+
+APP_CONFIG_PATH = Path(__file__).parent.parent / "config" / "app.yaml"
+
+# File suffix appended after ".json" for each compression
+COMPRESSION_SUFFIXES = {"zstd": ".zst", "gzip": ".gz", "none": ""}
+
+DEFAULT_COMPRESSION_LEVELS = {"zstd": 10, "gzip": 6}
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def default_compression() -> str:
+    """zstd if the zstandard package is installed, otherwise gzip."""
+    return "zstd" if _zstandard() is not None else "gzip"
+
+
+def serialize_payload(payload: Any) -> bytes:
+    """Compact, UTF-8 JSON encoding used for stored objects."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def parse_segment_locator(file_path: str) -> Optional[Tuple[str, int, int]]:
+    """
+    Split a segment record path into (segment, offset, length).
+
+    Returns:
+        Tuple, or None if file_path is not a segment record
+    """
+    match = _SEGMENT_LOCATOR.match(file_path)
+    if match is None:
+        return None
+    return match.group("path"), int(match.group("offset")), int(match.group("length"))
+
+
+class _SegmentMaps:
+    """Read-only mmaps of recently read segments (LRU)."""
+
+    def __init__(self, max_open: int = MAX_OPEN_SEGMENT_MAPS):
+        self.max_open = max_open
+        self._maps: "OrderedDict[str, mmap.mmap]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(self, segment: str, offset: int, length: int) -> bytes:
+        end = offset + length
+        with self._lock:
+            mapped = self._maps.get(segment)
+            # Segments still being written grow: remap when the record lies past the end
+            if mapped is None or end > len(mapped):
+                if mapped is not None:
+                    del self._maps[segment]
+                    mapped.close()
+                with open(segment, "rb") as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if end > size:
+                        raise OSError(
+                            f"Segment {segment} holds {size} bytes; record ends at {end}"
+                        )
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[segment] = mapped
+                while len(self._maps) > self.max_open:
+                    _, evicted = self._maps.popitem(last=False)
+                    evicted.close()
+            else:
+                self._maps.move_to_end(segment)
+            mapped.seek(offset)
+            return mapped.read(length)
+
+    def forget(self, segment: str) -> None:
+        with self._lock:
+            mapped = self._maps.pop(segment, None)
+            if mapped is not None:
+                mapped.close()
+
+
+_segment_maps = _SegmentMaps()
+
+# Segments open for writing in this process, so reads can flush them first
+_open_segments: "weakref.WeakValueDictionary[str, SegmentLogRawStore]" = weakref.WeakValueDictionary()
+
+
+def read_raw_bytes(file_path: Union[str, Path]) -> bytes:
+    """
+    Read a raw payload file, decompressing it if needed.
+
+    The compression is taken from the file suffix (.zst, .gz), so legacy
+    .json files and store objects are read the same way. Segment records
+    ("<segment>.jsonl#<offset>:<length>") are read through mmap and archived
+    records ("<file>.parquet#<row>") from their Parquet row group.
+
+    Args:
+        file_path: RawIngestion.file_path
+
+    Returns:
+        The payload's JSON bytes
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    located = parse_segment_locator(str(file_path))
+    if located is not None:
+        writer = _open_segments.get(located[0])
+        if writer is not None:
+            writer.flush()
+        return _segment_maps.read(*located)
+    if ".parquet#" in str(file_path):
+        # Imported here: the archive reader needs pyarrow
+        from engine.ingestion.raw_archive import read_archived_payload
+
+        return read_archived_payload(str(file_path))
+
+    path = Path(file_path) if isinstance(file_path, str) else file_path
+    name = str(path)
+    if name.endswith(".zst"):
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise OSError(f"Reading {name} requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(path.read_bytes())
+    if name.endswith(".gz"):
+        return gzip.decompress(path.read_bytes())
+    return path.read_bytes()
+
+
+def read_raw_text(file_path: Union[str, Path]) -> str:
+    """
+    Read a raw payload file as JSON text.
+
+    Uncompressed files are read with Path.read_text, as before stores existed.
+    """
+    path = Path(file_path) if isinstance(file_path, str) else file_path
+    name = str(path)
+    if name.endswith((".zst", ".gz")) or "#" in name:
+        return read_raw_bytes(path).decode("utf-8")
+    return path.read_text(encoding="utf-8")
+
+
+def load_raw_payload(file_path: Union[str, Path]) -> Any:
+    """
+    Load the payload behind a RawIngestion.file_path.
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return json.loads(read_raw_bytes(file_path))
+
+
+@dataclass
+class RawStoreStats:
+    """
+    Write counters for one store.
+
+    Attributes:
+        written: Payloads written as new files
+        reused: Payloads that were already stored (nothing written)
+        bytes_written: Bytes written to disk (after compression)
+    """
+
+    written: int = 0
+    reused: int = 0
+    bytes_written: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class RawStore(ABC):
+    """
+    Where raw payloads are written.
+
+    put() returns the path to record in RawIngestion.file_path; every store
+    writes files that load_raw_payload() can read.
+    """
+
+    def __init__(self):
+        self.stats = RawStoreStats()
+
+    @abstractmethod
+    def put(self, source: str, record_id: str, payload: Any) -> str:
+        """
+        Store a payload.
+
+        Args:
+            source: Source name (e.g. "serper")
+            record_id: Human-readable id for stores that name files by it
+            payload: JSON-serializable payload
+
+        Returns:
+            str: Path to record in RawIngestion.file_path
+        """
+
+    def owns(self, file_path: str) -> bool:
+        """True if file_path was written by this store."""
+        return False
+
+    def finish(self) -> None:
+        """End of a run: make everything written so far durable."""
+
+    def get(self, file_path: str) -> Any:
+        """Load a stored payload."""
+        return load_raw_payload(file_path)
+
+
+class JsonFileRawStore(RawStore):
+    """Pretty-printed JSON file per save under engine/data/raw/<source>/."""
+
+    def put(self, source: str, record_id: str, payload: Any) -> str:
+        file_path = generate_file_path(source, record_id)
+        save_json(file_path, payload)
+        self.stats.written += 1
+        self.stats.bytes_written += os.path.getsize(file_path)
+        return file_path
+
+
+class ContentAddressedRawStore(RawStore):
+    """
+    Write-once, compressed store keyed by payload content.
+
+    Example:
+        >>> store = ContentAddressedRawStore(compression="gzip")
+        >>> path = store.put("serper", "padel", {"organic": []})
+        >>> store.put("serper", "padel_again", {"organic": []}) == path
+        True
+        >>> load_raw_payload(path)
+        {'organic': []}
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DEFAULT_OBJECTS_DIR,
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+    ):
+        """
+        Args:
+            root: Object directory
+            compression: "zstd", "gzip" or "none" (default: zstd if
+                available, otherwise gzip)
+            level: Compression level (default per codec)
+
+        Raises:
+            ValueError: If the compression is unknown
+            ImportError: If zstd is requested without the zstandard package
+        """
+        super().__init__()
+        compression = compression or default_compression()
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(
+                f"Unknown raw store compression {compression!r} "
+                f"(expected one of: {', '.join(COMPRESSION_SUFFIXES)})"
+            )
+        if compression == "zstd" and _zstandard() is None:
+            raise ImportError("zstd raw store compression requires the zstandard package")
+
+        self.root = Path(root)
+        self.compression = compression
+        self.level = level if level is not None else DEFAULT_COMPRESSION_LEVELS.get(compression)
+        self.suffix = ".json" + COMPRESSION_SUFFIXES[compression]
+
+    def path_for(self, digest: str) -> Path:
+        """Object path for a SHA-256 hex digest."""
+        return self.root / digest[:2] / digest[2:4] / f"{digest}{self.suffix}"
+
+    def owns(self, file_path: str) -> bool:
+        path = Path(file_path)
+        try:
+            path.relative_to(self.root)
+        except ValueError:
+            return False
+        return str(path).endswith(self.suffix)
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return _zstandard().ZstdCompressor(level=self.level).compress(data)
+        if self.compression == "gzip":
+            # mtime=0 keeps the output deterministic
+            return gzip.compress(data, compresslevel=self.level, mtime=0)
+        return data
+
+    def put(self, source: str, record_id: str, payload: Any) -> str:
+        data = serialize_payload(payload)
+        path = self.path_for(hashlib.sha256(data).hexdigest())
+
+        if path.exists():
+            self.stats.reused += 1
+            return path.as_posix()
+
+        compressed = self._compress(data)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name: concurrent writers of the same object both
+        # succeed, and the replace is atomic
+        partial = path.with_name(f"{path.name}.{uuid.uuid4().hex}.part")
+        try:
+            partial.write_bytes(compressed)
+            os.replace(partial, path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        self.stats.written += 1
+        self.stats.bytes_written += len(compressed)
+        return path.as_posix()
+
+
+@dataclass
+class SegmentRecord:
+    """
+    One record of a segment's offset index.
+
+    Attributes:
+        offset: Byte offset of the record in the segment
+        length: Record length in bytes (without the trailing newline)
+        content_hash: SHA-256 of the record bytes (None when rebuilt by scan)
+        source: Source name (None when rebuilt by scan)
+        record_id: Record id passed to put() (None when rebuilt by scan)
+    """
+
+    offset: int
+    length: int
+    content_hash: Optional[str] = None
+    source: Optional[str] = None
+    record_id: Optional[str] = None
+
+
+def load_segment_index(segment: Union[str, Path]) -> List[SegmentRecord]:
+    """
+    Read a segment's offset index.
+
+    The index (<segment>.idx) is written when the segment is closed; for a
+    segment without one (still open, or its writer crashed) the offsets are
+    rebuilt by scanning the newline-delimited records.
+
+    Args:
+        segment: Segment file path
+
+    Returns:
+        Records in file order
+    """
+    segment = Path(segment)
+    index_path = segment.with_name(segment.name + ".idx")
+    if index_path.exists():
+        with open(index_path, "r", encoding="utf-8") as f:
+            return [SegmentRecord(*json.loads(line)) for line in f if line.strip()]
+
+    records = []
+    with open(segment, "rb") as f:
+        offset = 0
+        for line in f:
+            if line.endswith(b"\n"):
+                records.append(SegmentRecord(offset, len(line) - 1))
+            offset += len(line)
+    return records
+
+
+class SegmentLogRawStore(RawStore):
+    """
+    Append-only JSONL segments with an offset index.
+
+    Each record is one line of compact JSON. Writes are buffered and reach
+    disk in large sequential chunks; a read of a record that is still
+    buffered flushes the segment first, and finish() (called at the end of
+    every persistence run) and interpreter exit close it. Records still
+    buffered when the process dies are lost, and their paths then fail to
+    load like a missing file.
+
+    Within one segment, identical payloads are stored once.
+
+    Example:
+        >>> store = SegmentLogRawStore()
+        >>> path = store.put("serper", "padel", {"organic": []})
+        >>> store.finish()
+        >>> load_raw_payload(path)
+        {'organic': []}
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DEFAULT_SEGMENTS_DIR,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    ):
+        """
+        Args:
+            root: Segment directory
+            max_segment_bytes: Size at which a new segment is started
+        """
+        super().__init__()
+        self.root = Path(root)
+        self.max_segment_bytes = max_segment_bytes
+        self._lock = threading.Lock()
+        self._segment: Optional[str] = None
+        self._file = None
+        self._size = 0
+        self._index: List[SegmentRecord] = []
+        self._locations: Dict[str, str] = {}
+
+    @property
+    def segment(self) -> Optional[str]:
+        """Path of the segment currently open for writing."""
+        return self._segment
+
+    def owns(self, file_path: str) -> bool:
+        located = parse_segment_locator(file_path)
+        if located is None:
+            return False
+        try:
+            Path(located[0]).relative_to(self.root)
+        except ValueError:
+            return False
+        return True
+
+    def put(self, source: str, record_id: str, payload: Any) -> str:
+        data = serialize_payload(payload)
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            locator = self._locations.get(digest)
+            if locator is not None:
+                self.stats.reused += 1
+                return locator
+
+            if self._file is not None and self._size + len(data) + 1 > self.max_segment_bytes:
+                self._close_segment()
+            if self._file is None:
+                self._open_segment()
+
+            offset = self._size
+            self._file.write(data + b"\n")
+            self._size += len(data) + 1
+            self._index.append(SegmentRecord(offset, len(data), digest, source, record_id))
+
+            locator = f"{self._segment}#{offset}:{len(data)}"
+            self._locations[digest] = locator
+            self.stats.written += 1
+            self.stats.bytes_written += len(data) + 1
+            return locator
+
+    def flush(self) -> None:
+        """Write buffered records to the segment file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def finish(self) -> None:
+        """Close the current segment; the next put() starts a new one."""
+        with self._lock:
+            self._close_segment()
+
+    def _open_segment(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = self.root / f"{timestamp}_{os.getpid()}_{uuid.uuid4().hex[:8]}.jsonl"
+        self._file = open(path, "xb", buffering=SEGMENT_BUFFER_BYTES)
+        self._segment = path.as_posix()
+        self._size = 0
+        self._index = []
+        _open_segments[self._segment] = self
+
+    def _close_segment(self) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        _open_segments.pop(self._segment, None)
+        _segment_maps.forget(self._segment)
+
+        index_path = Path(self._segment + ".idx")
+        partial = index_path.with_name(index_path.name + ".part")
+        with open(partial, "w", encoding="utf-8") as f:
+            for record in self._index:
+                f.write(json.dumps(list(asdict(record).values())) + "\n")
+        partial.replace(index_path)
+
+        self._file = None
+        self._segment = None
+        self._index = []
+        self._locations = {}
+
+
+@atexit.register
+def _close_open_segments() -> None:
+    for store in list(_open_segments.values()):
+        store.finish()
+
+
+def load_raw_store(config: Optional[Dict[str, Any]]) -> RawStore:
+    """
+    Build a store from a `raw_store` config block.
+
+    Args:
+        config: The raw_store block of app.yaml (None for defaults)
+
+    Returns:
+        Configured RawStore
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    config = config or {}
+    backend = config.get("backend", "content_addressed")
+    if backend == "files":
+        return JsonFileRawStore()
+    if backend == "segments":
+        return SegmentLogRawStore(
+            root=config.get("root", DEFAULT_SEGMENTS_DIR),
+            max_segment_bytes=int(config.get("max_segment_bytes", DEFAULT_MAX_SEGMENT_BYTES)),
+        )
+    if backend == "content_addressed":
+        return ContentAddressedRawStore(
+            root=config.get("root", DEFAULT_OBJECTS_DIR),
+            compression=config.get("compression"),
+            level=config.get("level"),
+        )
+    raise ValueError(
+        f"Unknown raw store backend {backend!r} (expected content_addressed, segments or files)"
+    )
+
+
+_default_store: Optional[RawStore] = None
+
+
+def get_raw_store() -> RawStore:
+    """
+    Process-wide store configured by the raw_store block of app.yaml.
+
+    Returns:
+        RawStore shared by connectors and orchestration persistence
+    """
+    global _default_store
+    if _default_store is None:
+        config = None
+        if APP_CONFIG_PATH.exists():
+            with open(APP_CONFIG_PATH, "r", encoding="utf-8") as f:
+                config = (yaml.safe_load(f) or {}).get("raw_store")
+        _default_store = load_raw_store(config)
+    return _default_store
+
+
+def set_raw_store(store: Optional[RawStore]) -> None:
+    """Replace the process-wide store (None reloads it from app.yaml)."""
+    global _default_store
+    _default_store = store
@@ -0,0 +1,409 @@
+"""
+Partial download of remote parquet files via HTTP range requests.
+
+Overture artifacts are hundreds of megabytes each, while a lens only needs
+the rows inside its own area. Parquet keeps all layout information in a
+footer at the end of the file, so the file can be read selectively:
+
+1. Fetch the tail of the file (suffix range) and decode the footer.
+2. Pick the row groups whose bbox statistics intersect the lens area.
+3. Download only the column chunks of those row groups (and only the
+   projected columns), coalescing neighbouring ranges into few requests.
+
+Bytes are written at their original offsets into a sparse local file of the
+full remote size, so pyarrow can open it as a normal parquet file as long as
+only the selected row groups are read. A JSON manifest next to the file
+records which byte ranges are present; a later refresh downloads only
+ranges it doesn't have yet (nothing at all for an unchanged artifact).
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+
+# Initial tail fetch; large enough for typical footers in one request
+FOOTER_PROBE_BYTES = 64 * 1024
+
+# Ranges closer than this are fetched in one request (the gap is re-downloaded)
+RANGE_COALESCE_GAP_BYTES = 256 * 1024
+
+_PARQUET_MAGIC = b"PAR1"
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+Range = Tuple[int, int]  # [start, end) byte offsets
+
+
+class RangeRequestsNotSupported(RuntimeError):
+    """The server ignored a Range header (answered 200 with the full body)."""
+
+
+@dataclass
+class RemoteParquetResult:
+    """
+    Outcome of a partial remote parquet fetch.
+
+    Attributes:
+        path: Sparse local copy (valid for the selected row groups only)
+        row_groups: Row group indices whose bbox intersects the area
+        row_groups_total: Row groups in the remote file
+        bytes_downloaded: Bytes transferred by this call
+        total_bytes: Size of the remote file
+    """
+
+    path: Path
+    row_groups: List[int]
+    row_groups_total: int
+    bytes_downloaded: int
+    total_bytes: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return transfer stats as a plain dict (for logging / reports)."""
+        return {
+            "path": str(self.path),
+            "row_groups": list(self.row_groups),
+            "row_groups_total": self.row_groups_total,
+            "bytes_downloaded": self.bytes_downloaded,
+            "total_bytes": self.total_bytes,
+        }
+
+
+@dataclass
+class SparseFileManifest:
+    """
+    Byte ranges present in a sparse local copy of a remote file.
+
+    Attributes:
+        url: Remote URL the ranges were fetched from
+        size: Remote file size in bytes
+        ranges: Sorted, non-overlapping [start, end) ranges present locally
+    """
+
+    url: str
+    size: int
+    ranges: List[Range] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SparseFileManifest"]:
+        """Load a manifest, returning None if missing or unreadable."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(
+                url=data["url"],
+                size=int(data["size"]),
+                ranges=[(int(start), int(end)) for start, end in data["ranges"]],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: Path) -> None:
+        """Write the manifest atomically."""
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(
+            json.dumps({"url": self.url, "size": self.size, "ranges": self.ranges}),
+            encoding="utf-8",
+        )
+        temp_path.replace(path)
+
+    def missing(self, wanted: Iterable[Range]) -> List[Range]:
+        """Return the parts of `wanted` not yet present locally."""
+        gaps: List[Range] = []
+        for start, end in merge_ranges(wanted):
+            cursor = start
+            for have_start, have_end in self.ranges:
+                if have_end <= cursor or have_start >= end:
+                    continue
+                if have_start > cursor:
+                    gaps.append((cursor, have_start))
+                cursor = max(cursor, have_end)
+                if cursor >= end:
+                    break
+            if cursor < end:
+                gaps.append((cursor, end))
+        return gaps
+
+    def add(self, new_range: Range) -> None:
+        """Record a downloaded range."""
+        self.ranges = merge_ranges(self.ranges + [new_range])
+
+
+def merge_ranges(ranges: Iterable[Range], gap: int = 0) -> List[Range]:
+    """
+    Sort and merge [start, end) ranges that overlap or are within `gap` bytes.
+
+    Args:
+        ranges: Byte ranges
+        gap: Merge ranges separated by at most this many bytes
+
+    Returns:
+        Sorted, non-overlapping ranges
+    """
+    merged: List[Range] = []
+    for start, end in sorted(r for r in ranges if r[1] > r[0]):
+        if merged and start <= merged[-1][1] + gap:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def parse_content_range(header: Optional[str]) -> Optional[Tuple[int, int, Optional[int]]]:
+    """
+    Parse a Content-Range header ("bytes 100-199/1000").
+
+    Returns:
+        (start, end_inclusive, total_or_None), or None if absent/unparseable
+    """
+    match = _CONTENT_RANGE.match(header or "")
+    if match is None:
+        return None
+    total = match.group(3)
+    return int(match.group(1)), int(match.group(2)), None if total == "*" else int(total)
+
+
+def select_row_groups(metadata: Any, bbox: Optional[Dict[str, float]]) -> List[int]:
+    """
+    Row groups whose bbox column statistics intersect an area.
+
+    Uses the min/max statistics of the bbox.xmin/xmax/ymin/ymax leaf
+    columns. Row groups without usable statistics are kept (never skip
+    data that might match).
+
+    Args:
+        metadata: pyarrow.parquet.FileMetaData
+        bbox: {"minx", "miny", "maxx", "maxy"}; None selects every row group
+
+    Returns:
+        Selected row group indices in file order
+    """
+    if bbox is None:
+        return list(range(metadata.num_row_groups))
+
+    selected = []
+    for index in range(metadata.num_row_groups):
+        bounds = _row_group_bounds(metadata.row_group(index))
+        if bounds is None:
+            selected.append(index)
+            continue
+        xmin, xmax, ymin, ymax = bounds
+        if (
+            xmin <= bbox["maxx"]
+            and xmax >= bbox["minx"]
+            and ymin <= bbox["maxy"]
+            and ymax >= bbox["miny"]
+        ):
+            selected.append(index)
+    return selected
+
+
+def _row_group_bounds(row_group: Any) -> Optional[Tuple[float, float, float, float]]:
+    stats: Dict[str, Any] = {}
+    for column_index in range(row_group.num_columns):
+        column = row_group.column(column_index)
+        if column.path_in_schema in ("bbox.xmin", "bbox.xmax", "bbox.ymin", "bbox.ymax"):
+            statistics = column.statistics
+            if statistics is None or not statistics.has_min_max:
+                return None
+            stats[column.path_in_schema] = statistics
+    if len(stats) != 4:
+        return None
+    # Smallest xmin / largest xmax etc. bound every feature in the group
+    return (
+        stats["bbox.xmin"].min,
+        stats["bbox.xmax"].max,
+        stats["bbox.ymin"].min,
+        stats["bbox.ymax"].max,
+    )
+
+
+def column_chunk_ranges(
+    metadata: Any,
+    row_groups: Sequence[int],
+    columns: Optional[Sequence[str]] = None,
+) -> List[Range]:
+    """
+    Byte ranges holding the given row groups' column chunks.
+
+    Args:
+        metadata: pyarrow.parquet.FileMetaData
+        row_groups: Row group indices
+        columns: Top-level column names to include (None = all columns)
+
+    Returns:
+        Merged [start, end) ranges
+    """
+    wanted = set(columns) if columns is not None else None
+    ranges: List[Range] = []
+    for index in row_groups:
+        row_group = metadata.row_group(index)
+        for column_index in range(row_group.num_columns):
+            column = row_group.column(column_index)
+            if wanted is not None and column.path_in_schema.split(".", 1)[0] not in wanted:
+                continue
+            start = column.data_page_offset
+            if column.has_dictionary_page and column.dictionary_page_offset:
+                start = min(start, column.dictionary_page_offset)
+            ranges.append((start, start + column.total_compressed_size))
+    return merge_ranges(ranges)
+
+
+class RemoteParquetFile:
+    """
+    Sparse local copy of a remote parquet file, filled by range requests.
+
+    Example:
+        >>> remote = RemoteParquetFile(url, Path("cache/part-00000.parquet"))
+        >>> result = await remote.fetch_row_groups(bbox=EDINBURGH, columns=["id", "names"])
+        >>> pq.ParquetFile(result.path).iter_batches(row_groups=result.row_groups)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        cache_path: Path,
+        timeout_seconds: int = 30,
+        coalesce_gap_bytes: int = RANGE_COALESCE_GAP_BYTES,
+    ):
+        """
+        Initialize RemoteParquetFile.
+
+        Args:
+            url: Remote parquet URL (server must honour Range requests)
+            cache_path: Local sparse file path (manifest stored alongside)
+            timeout_seconds: Total timeout per HTTP request
+            coalesce_gap_bytes: Merge download ranges closer than this
+        """
+        self.url = url
+        self.cache_path = Path(cache_path)
+        self.manifest_path = self.cache_path.with_name(self.cache_path.name + ".ranges.json")
+        self.timeout_seconds = timeout_seconds
+        self.coalesce_gap_bytes = coalesce_gap_bytes
+        self.bytes_downloaded = 0
+
+    async def fetch_row_groups(
+        self,
+        bbox: Optional[Dict[str, float]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> RemoteParquetResult:
+        """
+        Download the footer and the column chunks of intersecting row groups.
+
+        Args:
+            bbox: Area filter ({"minx", "miny", "maxx", "maxy"}); None = all
+            columns: Top-level columns to download (None = all)
+
+        Returns:
+            RemoteParquetResult describing the sparse file and transfer
+
+        Raises:
+            RangeRequestsNotSupported: If the server ignores Range headers
+            RuntimeError: On HTTP errors or a malformed parquet footer
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError(
+                f"pyarrow is required to read remote parquet footers from {self.url}"
+            ) from exc
+
+        self.bytes_downloaded = 0
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+        ) as session:
+            manifest = await self._ensure_footer(session)
+
+            metadata = pq.ParquetFile(self.cache_path).metadata
+            available = set(metadata.schema.to_arrow_schema().names)
+            projected = [c for c in columns if c in available] if columns is not None else None
+            row_groups = select_row_groups(metadata, bbox)
+
+            wanted = column_chunk_ranges(metadata, row_groups, projected)
+            for start, end in merge_ranges(manifest.missing(wanted), gap=self.coalesce_gap_bytes):
+                await self._download_range(session, manifest, start, end)
+
+        return RemoteParquetResult(
+            path=self.cache_path,
+            row_groups=row_groups,
+            row_groups_total=metadata.num_row_groups,
+            bytes_downloaded=self.bytes_downloaded,
+            total_bytes=manifest.size,
+        )
+
+    async def _ensure_footer(self, session: aiohttp.ClientSession) -> SparseFileManifest:
+        manifest = SparseFileManifest.load(self.manifest_path)
+        if (
+            manifest is not None
+            and manifest.url == self.url
+            and self.cache_path.exists()
+            and self.cache_path.stat().st_size == manifest.size
+        ):
+            if not manifest.missing([(max(0, manifest.size - 8), manifest.size)]):
+                footer_length = self._read_footer_length(manifest.size)
+                footer_start = manifest.size - 8 - footer_length
+                if not manifest.missing([(footer_start, manifest.size)]):
+                    return manifest
+
+        # Unknown or stale copy: start a fresh sparse file from the tail
+        tail, total = await self._get_range(session, f"bytes=-{FOOTER_PROBE_BYTES}")
+        if total is None:
+            raise RuntimeError(f"Server did not report a size for {self.url}")
+        if tail[-4:] != _PARQUET_MAGIC:
+            raise RuntimeError(f"Not a parquet file (bad footer magic): {self.url}")
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, "wb") as handle:
+            handle.truncate(total)
+        manifest = SparseFileManifest(url=self.url, size=total)
+        self._write_at(manifest, total - len(tail), tail)
+
+        footer_length = int.from_bytes(tail[-8:-4], "little")
+        footer_start = total - 8 - footer_length
+        if footer_start < 0:
+            raise RuntimeError(f"Corrupt parquet footer length in {self.url}")
+        if footer_start < total - len(tail):
+            # Footer larger than the probe: fetch the remainder
+            await self._download_range(session, manifest, footer_start, total - len(tail))
+
+        manifest.save(self.manifest_path)
+        return manifest
+
+    async def _download_range(
+        self, session: aiohttp.ClientSession, manifest: SparseFileManifest, start: int, end: int
+    ) -> None:
+        body, _ = await self._get_range(session, f"bytes={start}-{end - 1}")
+        if len(body) != end - start:
+            raise RuntimeError(
+                f"Short range response from {self.url}: wanted {end - start} bytes, got {len(body)}"
+            )
+        self._write_at(manifest, start, body)
+        manifest.save(self.manifest_path)
+
+    async def _get_range(
+        self, session: aiohttp.ClientSession, range_header: str
+    ) -> Tuple[bytes, Optional[int]]:
+        async with session.get(self.url, headers={"Range": range_header}) as response:
+            if response.status == 200:
+                raise RangeRequestsNotSupported(
+                    f"Server ignored Range request for {self.url}"
+                )
+            if response.status != 206:
+                raise RuntimeError(f"HTTP {response.status} while requesting {self.url}")
+            body = await response.read()
+            content_range = parse_content_range(response.headers.get("Content-Range"))
+            self.bytes_downloaded += len(body)
+            return body, content_range[2] if content_range else None
+
+    def _write_at(self, manifest: SparseFileManifest, offset: int, data: bytes) -> None:
+        with open(self.cache_path, "r+b") as handle:
+            handle.seek(offset)
+            handle.write(data)
+        manifest.add((offset, offset + len(data)))
+
+    def _read_footer_length(self, size: int) -> int:
+        with open(self.cache_path, "rb") as handle:
+            handle.seek(size - 8)
+            return int.from_bytes(handle.read(4), "little")
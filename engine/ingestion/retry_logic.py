@@ -7,7 +7,13 @@ data ingestion connectors (network errors, rate limits, temporary service issues
 Key Components:
 - retry_with_backoff: Decorator for applying retry logic to async functions
 - MaxRetriesExceeded: Exception raised when all retry attempts are exhausted
-- Exponential backoff: Delay increases exponentially between retries
+- Exponential backoff: Delay increases exponentially between retries,
+  optionally jittered so concurrent workers don't retry in lockstep
+  (sources.yaml-configured decorators jitter by default)
+- Retry-After: 429/503 responses that carry a Retry-After header are waited
+  out for (at least) the server-requested time instead of the backoff guess
+- Circuit breaker: optional per-connector breaker (circuit_breaker.py) that
+  stops retrying a connector that is clearly down
 - Configuration loading: Load retry settings from sources.yaml
 
 The retry system helps improve reliability by automatically handling temporary
@@ -15,11 +21,20 @@ failures without manual intervention.
 """
 
 import asyncio
+import random
 import yaml
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Iterable
 from functools import wraps
 
+from engine.ingestion.circuit_breaker import CircuitBreaker
+
+
+# Status codes worth retrying when sources.yaml doesn't say otherwise
+DEFAULT_RETRY_ON_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
 
 class MaxRetriesExceeded(Exception):
     """
@@ -54,11 +69,137 @@ class MaxRetriesExceeded(Exception):
         self.__cause__ = original_exception
 
 
+def get_status_code(exception: Exception) -> Optional[int]:
+    """
+    Extract an HTTP status code from a client exception, if it carries one.
+
+    Supports aiohttp.ClientResponseError (.status), requests/httpx errors
+    (.response.status_code) and exceptions exposing .status_code directly.
+
+    Args:
+        exception: The raised exception
+
+    Returns:
+        Status code, or None if the exception has no HTTP response attached
+    """
+    for holder in (exception, getattr(exception, "response", None)):
+        if holder is None:
+            continue
+        for attr in ("status", "status_code"):
+            value = getattr(holder, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def parse_retry_after(value: Any, now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Accepts both forms allowed by RFC 9110: delay-seconds ("120") and an
+    HTTP-date ("Wed, 21 Oct 2026 07:28:00 GMT").
+
+    Args:
+        value: Header value (str, int or float)
+        now: Current time for HTTP-date values (defaults to utcnow)
+
+    Returns:
+        Non-negative seconds to wait, or None if the value is unparseable
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+
+    text = str(value).strip()
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+def get_retry_after(exception: Exception) -> Optional[float]:
+    """
+    Extract the server-requested retry delay from a client exception.
+
+    Looks for a retry_after attribute, then a Retry-After header on the
+    exception (aiohttp) or on its response (requests/httpx).
+
+    Args:
+        exception: The raised exception
+
+    Returns:
+        Seconds to wait, or None if the server didn't say
+    """
+    explicit = getattr(exception, "retry_after", None)
+    if isinstance(explicit, (int, float)):
+        return max(0.0, float(explicit))
+
+    for holder in (exception, getattr(exception, "response", None)):
+        headers = getattr(holder, "headers", None) if holder is not None else None
+        if not headers:
+            continue
+        try:
+            value = headers.get("Retry-After")
+            if value is None:
+                value = headers.get("retry-after")
+        except AttributeError:
+            continue
+        if value is not None:
+            return parse_retry_after(value)
+    return None
+
+
+def compute_backoff_delay(
+    attempt: int,
+    initial_delay: float = 1.0,
+    backoff_factor: float = 2.0,
+    max_delay: float = 60.0,
+    jitter: bool = False,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """
+    Delay before retry number `attempt` (0-based).
+
+    Without jitter this is initial_delay * backoff_factor^attempt capped at
+    max_delay. With jitter the delay is drawn uniformly from [delay/2, delay]
+    ("equal jitter"): retries from concurrent workers spread out, while
+    every retry still waits at least half the nominal backoff.
+
+    Args:
+        attempt: Retry number (0 for the first retry)
+        initial_delay: Delay before the first retry
+        backoff_factor: Multiplier per attempt
+        max_delay: Upper bound on the nominal delay
+        jitter: Randomize the delay
+        rng: Random source (injectable for tests)
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(initial_delay * (backoff_factor ** attempt), max_delay)
+    if jitter and delay > 0:
+        delay = (rng or random).uniform(delay / 2, delay)
+    return delay
+
+
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
-    max_delay: float = 60.0
+    max_delay: float = 60.0,
+    jitter: bool = False,
+    retry_on_status_codes: Optional[Iterable[int]] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
 ) -> Callable:
     """
     Decorator to add retry logic with exponential backoff to async functions.
@@ -70,11 +211,24 @@ def retry_with_backoff(
     The decorator catches all exceptions and retries until max_retries is exhausted.
     After all retries fail, it raises MaxRetriesExceeded with the original exception.
 
+    Delays are jittered (see compute_backoff_delay) only with jitter=True;
+    create_retry_decorator_from_config turns it on by default. When the
+    exception carries a Retry-After (429/503), the retry waits at least that
+    long; if the server asks for more than max_delay, retrying is abandoned
+    immediately rather than sleeping past the caller's budget.
+
     Args:
         max_retries: Maximum number of retry attempts (0 means no retries, just one attempt)
         initial_delay: Initial delay in seconds before first retry
         backoff_factor: Multiplier for exponential backoff (typically 2.0)
         max_delay: Maximum delay in seconds between retries (caps exponential growth)
+        jitter: Randomize delays to avoid synchronized retries
+        retry_on_status_codes: If given, exceptions carrying an HTTP status
+            outside this set (e.g. 400, 401, 404) are re-raised immediately.
+            Exceptions without a status are always retried.
+        circuit_breaker: Optional breaker for the connector. Each attempt is
+            recorded on it, and once it opens no further attempts are made
+            (CircuitOpenError is raised as-is, never retried).
 
     Returns:
         Decorated function with retry logic
@@ -90,23 +244,48 @@ def retry_with_backoff(
 
     Raises:
         MaxRetriesExceeded: When all retry attempts are exhausted
+        CircuitOpenError: When circuit_breaker rejects an attempt
     """
+    retryable_statuses = (
+        frozenset(retry_on_status_codes) if retry_on_status_codes is not None else None
+    )
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
             last_exception = None
-            current_delay = initial_delay
 
             # Attempt the function: 1 initial attempt + max_retries retries
             for attempt in range(max_retries + 1):
+                if circuit_breaker is not None:
+                    # Fail fast once the connector is known to be down
+                    circuit_breaker.check()
+
                 try:
                     # Execute the function
                     result = await func(*args, **kwargs)
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_success()
                     return result
 
                 except Exception as e:
                     last_exception = e
 
+                    # Client errors (bad request, auth, not found) won't fix
+                    # themselves - and don't mean the connector is down
+                    status = get_status_code(e)
+                    if (
+                        retryable_statuses is not None
+                        and status is not None
+                        and status not in retryable_statuses
+                    ):
+                        if circuit_breaker is not None:
+                            circuit_breaker.release()
+                        raise
+
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_failure()
+
                     # If this was the last attempt, raise MaxRetriesExceeded
                     if attempt == max_retries:
                         raise MaxRetriesExceeded(
@@ -114,14 +293,21 @@ def retry_with_backoff(
                             original_exception=e
                         )
 
-                    # Wait before retrying (with exponential backoff)
-                    # Cap delay at max_delay to prevent unbounded growth
-                    delay = min(current_delay, max_delay)
+                    # Wait before retrying (exponential backoff, jittered if
+                    # enabled), honouring a server-requested Retry-After
+                    delay = compute_backoff_delay(
+                        attempt, initial_delay, backoff_factor, max_delay, jitter
+                    )
+                    retry_after = get_retry_after(e)
+                    if retry_after is not None:
+                        if retry_after > max_delay:
+                            raise MaxRetriesExceeded(
+                                max_retries=attempt,
+                                original_exception=e
+                            )
+                        delay = max(delay, retry_after)
                     await asyncio.sleep(delay)
 
-                    # Increase delay for next retry (exponential backoff)
-                    current_delay *= backoff_factor
-
             # This should never be reached, but just in case
             raise MaxRetriesExceeded(
                 max_retries=max_retries,
@@ -149,7 +335,9 @@ def load_retry_config_from_yaml(source: str) -> Dict[str, Any]:
             "max_retries": int,
             "initial_delay": float,
             "backoff_factor": float,
-            "max_delay": float
+            "max_delay": float,
+            "jitter": bool,
+            "retry_on_status_codes": list[int]
         }
 
     Raises:
@@ -188,7 +376,9 @@ def load_retry_config_from_yaml(source: str) -> Dict[str, Any]:
             "max_retries": 3,
             "initial_delay": 1.0,
             "backoff_factor": 2.0,
-            "max_delay": 60.0
+            "max_delay": 60.0,
+            "jitter": True,
+            "retry_on_status_codes": list(DEFAULT_RETRY_ON_STATUS_CODES),
         }
 
     # Map YAML config keys to function parameter names
@@ -201,19 +391,29 @@ def load_retry_config_from_yaml(source: str) -> Dict[str, Any]:
         "max_retries": max_retries,
         "initial_delay": retry_config.get("initial_delay", 1.0),
         "backoff_factor": retry_config.get("backoff_factor", 2.0),
-        "max_delay": retry_config.get("max_delay", 60.0)
+        "max_delay": retry_config.get("max_delay", 60.0),
+        "jitter": retry_config.get("jitter", True),
+        "retry_on_status_codes": list(
+            retry_config.get("retry_on_status_codes", DEFAULT_RETRY_ON_STATUS_CODES)
+        ),
     }
 
 
-def create_retry_decorator_from_config(source: str) -> Callable:
+def create_retry_decorator_from_config(
+    source: str,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+) -> Callable:
     """
     Create a retry decorator configured from sources.yaml.
 
     This is a convenience function that loads retry configuration from YAML
-    and returns a configured retry_with_backoff decorator.
+    and returns a configured retry_with_backoff decorator. Delays are
+    jittered unless the source's retry block sets jitter: false.
 
     Args:
         source: Name of the data source
+        circuit_breaker: Optional breaker to consult and record attempts on
+            (e.g. get_circuit_breaker(source))
 
     Returns:
         Configured retry_with_backoff decorator
@@ -236,5 +436,8 @@ def create_retry_decorator_from_config(source: str) -> Callable:
         max_retries=config["max_retries"],
         initial_delay=config["initial_delay"],
         backoff_factor=config["backoff_factor"],
-        max_delay=config["max_delay"]
+        max_delay=config["max_delay"],
+        jitter=config["jitter"],
+        retry_on_status_codes=config["retry_on_status_codes"],
+        circuit_breaker=circuit_breaker,
     )
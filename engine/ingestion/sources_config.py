@@ -0,0 +1,67 @@
+"""
+Cached access to engine/config/sources.yaml.
+
+Every connector, the token bucket registry and the connector pool read the
+same file. load_sources_config() parses it once per (mtime, size) and hands
+each caller its own copy, so an edit on disk is picked up on the next call
+without re-parsing the file for every connector of every run. The file holds
+API keys, so it is deliberately kept out of the warm bootstrap snapshot
+(engine.bootstrap), which is written to disk.
+"""
+
+import copy
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import yaml
+
+
+DEFAULT_SOURCES_CONFIG = "engine/config/sources.yaml"
+
+_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_lock = threading.Lock()
+
+
+def sources_config_signature(config_path: Union[str, Path] = DEFAULT_SOURCES_CONFIG) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a sources file, or None if missing."""
+    try:
+        stat = Path(config_path).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_sources_config(config_path: Union[str, Path] = DEFAULT_SOURCES_CONFIG) -> Dict[str, Any]:
+    """
+    Parse sources.yaml, reusing the last parse while the file is unchanged.
+
+    Args:
+        config_path: Path to the sources.yaml configuration file
+
+    Returns:
+        Parsed configuration (a copy the caller may modify)
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+    """
+    key = str(Path(config_path).resolve())
+    signature = sources_config_signature(config_path)
+    if signature is None:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    with _lock:
+        cached = _cache.get(key)
+        if cached is None or cached[0] != signature:
+            with open(config_path, "r") as f:
+                config = yaml.safe_load(f) or {}
+            cached = (signature, config)
+            _cache[key] = cached
+
+    return copy.deepcopy(cached[1])
+
+
+def clear_sources_config_cache() -> None:
+    """Drop every cached parse (testing only)."""
+    with _lock:
+        _cache.clear()
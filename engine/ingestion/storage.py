@@ -17,6 +17,9 @@ Storage Organization:
 
 All raw data is stored as JSON files with timestamps for easy chronological
 organization and debugging.
+
+This is the layout of the "files" raw store backend; connectors save through
+engine.ingestion.raw_store, which defaults to content-addressed objects.
 """
 
 import os
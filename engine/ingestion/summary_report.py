@@ -17,8 +17,8 @@ Reports can be generated programmatically or displayed via CLI.
 import asyncio
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
-from prisma import Prisma
 
+from engine.db import get_db_provider
 from engine.ingestion.health_check import check_health
 
 
@@ -47,10 +47,10 @@ async def get_summary_data() -> Dict[str, Any]:
         >>> print(f"Total records: {data['overview']['total_records']}")
         >>> print(f"Success rate: {data['overview']['success_rate']:.1f}%")
     """
-    db = Prisma()
+    provider = get_db_provider()
 
     try:
-        await db.connect()
+        db = await provider.acquire()
     except Exception as e:
         # Return empty structure if connection fails
         return {
@@ -184,7 +184,7 @@ async def get_summary_data() -> Dict[str, Any]:
         }
 
     finally:
-        await db.disconnect()
+        await provider.release()
 
 
 async def generate_summary_report() -> Dict[str, Any]:
@@ -0,0 +1,329 @@
+"""
+Tiled area fetches for spatial connectors.
+
+Area-based sources (Overpass, SportScotland WFS) answer one request for the
+whole lens area. Large areas are slow, hit server-side timeouts, and a
+failure throws the whole result away. This module splits the area into a
+grid of tiles that are fetched concurrently (bounded, and under the source's
+token-bucket limiter), caches each tile's response on disk so a failed or
+repeated refresh only refetches missing tiles, and merges the per-tile
+results, dropping features returned by more than one tile (anything that
+straddles a tile edge).
+
+Tiling is configured per source in sources.yaml:
+
+    openstreetmap:
+      tiling:
+        tile_size_km: 10        # Grid cell edge length
+        max_concurrency: 4      # Tiles in flight at once
+        cache_ttl_seconds: 3600 # 0 disables the tile cache
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional
+
+
+KM_PER_DEGREE_LAT = 111.32
+
+DEFAULT_TILE_SIZE_KM = 10.0
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_CACHE_TTL_SECONDS = 3600
+DEFAULT_TILE_CACHE_DIR = "engine/data/cache/tiles"
+
+
+@dataclass(frozen=True)
+class BBox:
+    """
+    Geographic bounding box in WGS84 degrees.
+
+    Attributes:
+        minx: West longitude
+        miny: South latitude
+        maxx: East longitude
+        maxy: North latitude
+    """
+
+    minx: float
+    miny: float
+    maxx: float
+    maxy: float
+
+    @classmethod
+    def from_string(cls, value: str) -> "BBox":
+        """Parse "west,south,east,north" (the sources.yaml bbox format)."""
+        parts = [float(part) for part in value.split(",")]
+        if len(parts) != 4:
+            raise ValueError(f"Bounding box needs 4 values (west,south,east,north), got: {value!r}")
+        return cls(*parts)
+
+    @classmethod
+    def from_dict(cls, value: Dict[str, float]) -> "BBox":
+        """Build from a {minx, miny, maxx, maxy} mapping."""
+        return cls(
+            float(value["minx"]), float(value["miny"]),
+            float(value["maxx"]), float(value["maxy"]),
+        )
+
+    @classmethod
+    def around(cls, lat: float, lon: float, radius_m: float) -> "BBox":
+        """Smallest box containing the circle of radius_m around (lat, lon)."""
+        dlat = radius_m / 1000 / KM_PER_DEGREE_LAT
+        dlon = radius_m / 1000 / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 1e-6))
+        return cls(lon - dlon, lat - dlat, lon + dlon, lat + dlat)
+
+    @property
+    def key(self) -> str:
+        """Stable string form (cache keys, logs)."""
+        return f"{self.minx:.6f},{self.miny:.6f},{self.maxx:.6f},{self.maxy:.6f}"
+
+    def to_wfs(self) -> str:
+        """WFS bbox parameter (minx,miny,maxx,maxy)."""
+        return f"{self.minx},{self.miny},{self.maxx},{self.maxy}"
+
+    def to_overpass(self) -> str:
+        """Overpass QL bbox filter (south,west,north,east)."""
+        return f"({self.miny},{self.minx},{self.maxy},{self.maxx})"
+
+
+@dataclass
+class TilingConfig:
+    """
+    Tiling settings for one source.
+
+    Attributes:
+        tile_size_km: Target tile edge length in kilometres
+        max_concurrency: Maximum tiles fetched at once
+        cache_ttl_seconds: Tile cache lifetime (0 disables caching)
+        cache_dir: Root directory of the tile cache
+    """
+
+    tile_size_km: float = DEFAULT_TILE_SIZE_KM
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS
+    cache_dir: str = DEFAULT_TILE_CACHE_DIR
+
+
+def load_tiling_config(source_config: Optional[Dict[str, Any]]) -> Optional[TilingConfig]:
+    """
+    Read a source's `tiling` block.
+
+    Args:
+        source_config: The source's section of sources.yaml
+
+    Returns:
+        TilingConfig, or None if the source has no tiling block (or
+        sets enabled: false)
+
+    Raises:
+        ValueError: If tile_size_km or max_concurrency is not positive
+    """
+    block = (source_config or {}).get("tiling")
+    if not isinstance(block, dict) or block.get("enabled") is False:
+        return None
+
+    settings = TilingConfig(
+        tile_size_km=float(block.get("tile_size_km", DEFAULT_TILE_SIZE_KM)),
+        max_concurrency=int(block.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)),
+        cache_ttl_seconds=float(block.get("cache_ttl_seconds", DEFAULT_CACHE_TTL_SECONDS)),
+        cache_dir=block.get("cache_dir", DEFAULT_TILE_CACHE_DIR),
+    )
+    if settings.tile_size_km <= 0:
+        raise ValueError("tiling.tile_size_km must be positive")
+    if settings.max_concurrency < 1:
+        raise ValueError("tiling.max_concurrency must be at least 1")
+    return settings
+
+
+def split_bbox(bbox: BBox, tile_size_km: float) -> List[BBox]:
+    """
+    Split a bounding box into a grid of roughly tile_size_km square tiles.
+
+    Tiles share edges exactly (no gaps), ordered row by row from the
+    south-west corner.
+
+    Args:
+        bbox: Area to cover
+        tile_size_km: Target tile edge length in kilometres
+
+    Returns:
+        List of tile bounding boxes covering bbox
+    """
+    mid_lat = (bbox.miny + bbox.maxy) / 2
+    height_km = (bbox.maxy - bbox.miny) * KM_PER_DEGREE_LAT
+    width_km = (bbox.maxx - bbox.minx) * KM_PER_DEGREE_LAT * math.cos(math.radians(mid_lat))
+
+    rows = max(1, math.ceil(height_km / tile_size_km))
+    cols = max(1, math.ceil(width_km / tile_size_km))
+    ys = [bbox.miny + (bbox.maxy - bbox.miny) * i / rows for i in range(rows)] + [bbox.maxy]
+    xs = [bbox.minx + (bbox.maxx - bbox.minx) * j / cols for j in range(cols)] + [bbox.maxx]
+
+    return [
+        BBox(xs[j], ys[i], xs[j + 1], ys[i + 1])
+        for i in range(rows)
+        for j in range(cols)
+    ]
+
+
+class TileCache:
+    """
+    On-disk cache of per-tile responses.
+
+    Entries are keyed by source, request (query text/parameters) and tile,
+    and expire after ttl_seconds (by file modification time).
+    """
+
+    def __init__(self, root: Path, source: str, ttl_seconds: float, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            root: Cache root directory
+            source: Source name (subdirectory)
+            ttl_seconds: Entry lifetime in seconds
+            clock: Wall-clock source (injectable for tests)
+        """
+        self.directory = Path(root) / source
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+    def _path(self, request_key: str, tile: BBox) -> Path:
+        digest = hashlib.sha256(f"{request_key}\n{tile.key}".encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, request_key: str, tile: BBox) -> Optional[Any]:
+        """Return the cached response for a tile, or None if missing/expired."""
+        path = self._path(request_key, tile)
+        try:
+            if self._clock() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, request_key: str, tile: BBox, payload: Any) -> None:
+        """Store a tile response (written atomically)."""
+        path = self._path(request_key, tile)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".part")
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        partial.replace(path)
+
+
+@dataclass
+class TiledFetchStats:
+    """
+    Outcome counts for one tiled fetch.
+
+    Attributes:
+        tiles: Tiles in the grid
+        cache_hits: Tiles served from the tile cache
+        fetched: Tiles fetched from the source
+        failed: Tiles whose fetch raised
+    """
+
+    tiles: int = 0
+    cache_hits: int = 0
+    fetched: int = 0
+    failed: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "tiles": self.tiles,
+            "cache_hits": self.cache_hits,
+            "fetched": self.fetched,
+            "failed": self.failed,
+        }
+
+
+async def fetch_tiles(
+    tiles: List[BBox],
+    fetch_tile: Callable[[BBox], Awaitable[Any]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    rate_limiter=None,
+    cache: Optional[TileCache] = None,
+    request_key: str = "",
+    stats: Optional[TiledFetchStats] = None,
+) -> List[Any]:
+    """
+    Fetch every tile concurrently and return the responses in tile order.
+
+    Cached tiles are returned without a request or rate-limit token. Every
+    tile is attempted even if some fail; successful tiles are cached first,
+    so a retry only refetches the tiles that failed.
+
+    Args:
+        tiles: Tiles to fetch
+        fetch_tile: Coroutine function fetching one tile
+        max_concurrency: Maximum tiles in flight
+        rate_limiter: Optional TokenBucketLimiter (one token per fetched tile)
+        cache: Optional tile cache
+        request_key: Identifies the request in cache keys (query text, layer)
+        stats: Optional TiledFetchStats to fill in
+
+    Returns:
+        One response per tile, in the order of `tiles`
+
+    Raises:
+        Exception: The first tile failure, after all tiles have finished
+    """
+    stats = stats if stats is not None else TiledFetchStats()
+    stats.tiles = len(tiles)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(tile: BBox) -> Any:
+        if cache is not None:
+            cached = cache.get(request_key, tile)
+            if cached is not None:
+                stats.cache_hits += 1
+                return cached
+
+        async with semaphore:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            try:
+                payload = await fetch_tile(tile)
+            except Exception:
+                stats.failed += 1
+                raise
+            stats.fetched += 1
+
+        if cache is not None:
+            cache.put(request_key, tile, payload)
+        return payload
+
+    results = await asyncio.gather(*(run(tile) for tile in tiles), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def merge_unique(items: Iterable[Any], key: Callable[[Any], Optional[Hashable]]) -> List[Any]:
+    """
+    Concatenate per-tile items, keeping the first occurrence of each key.
+
+    Items whose key is None are always kept.
+
+    Args:
+        items: Items from all tiles, in tile order
+        key: Identity of an item (e.g. OSM (type, id), feature id)
+
+    Returns:
+        Deduplicated list preserving first-seen order
+    """
+    seen = set()
+    merged = []
+    for item in items:
+        identity = key(item)
+        if identity is not None:
+            if identity in seen:
+                continue
+            seen.add(identity)
+        merged.append(item)
+    return merged
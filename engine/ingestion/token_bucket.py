@@ -0,0 +1,450 @@
+"""
+Async token-bucket rate limiting shared across worker processes.
+
+Complements rate_limiting.RateLimiter (single-process, check-then-reject)
+with a limiter that callers simply await:
+
+    limiter = get_token_bucket_limiter("serper")
+    if limiter:
+        await limiter.acquire()
+    response = await session.get(...)
+
+Key properties:
+- Multiple windows per source (per second/minute/hour/day). Each window is
+  an independent bucket refilled continuously at limit/period; a request
+  needs a token from every bucket.
+- Bursts are smoothed, not rejected: acquire() sleeps until every bucket
+  has a token. A timeout turns an unreasonably long wait into
+  RateLimitExceeded.
+- Bucket state lives in a pluggable store so several worker processes
+  share one budget:
+    * MemoryBucketStore   - single process (tests, one-off CLIs)
+    * SQLiteBucketStore   - local file, serialized by BEGIN IMMEDIATE
+    * PostgresBucketStore - RateLimitBucket table, serialized by a
+                            transaction-scoped advisory lock
+
+Limits come from the `rate_limits` block of each source in sources.yaml
+(requests_per_second / requests_per_minute / requests_per_hour /
+requests_per_day, optional burst). The store backend comes from
+`global.rate_limiting` in the same file.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from engine.db import db_client
+from engine.ingestion.rate_limiting import RateLimitExceeded
+from engine.ingestion.sources_config import load_sources_config
+
+
+SOURCES_CONFIG_PATH = Path(__file__).parent.parent / "config" / "sources.yaml"
+DEFAULT_SQLITE_PATH = Path(__file__).parent.parent / "data" / "rate_limits.sqlite3"
+
+# sources.yaml rate_limits key -> (window name, period seconds)
+WINDOW_PERIODS: Dict[str, Tuple[str, float]] = {
+    "requests_per_second": ("per_second", 1.0),
+    "requests_per_minute": ("per_minute", 60.0),
+    "requests_per_hour": ("per_hour", 3600.0),
+    "requests_per_day": ("per_day", 86400.0),
+}
+
+# Bucket state: window name -> (tokens, refilled_at unix seconds)
+BucketState = Dict[str, Tuple[float, float]]
+
+
+@dataclass(frozen=True)
+class RateWindow:
+    """
+    One token bucket.
+
+    Attributes:
+        name: Window name (e.g. "per_minute"), used in errors and as storage key
+        limit: Requests allowed per period
+        period_seconds: Window length
+        burst: Bucket capacity (defaults to limit). A smaller burst spreads
+            requests more evenly across the period.
+    """
+
+    name: str
+    limit: int
+    period_seconds: float
+    burst: Optional[int] = None
+
+    @property
+    def capacity(self) -> float:
+        return float(min(self.burst or self.limit, self.limit))
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.limit / self.period_seconds
+
+
+def plan_acquire(
+    state: BucketState,
+    windows: List[RateWindow],
+    cost: float,
+    now: float,
+) -> Tuple[float, Optional[str], BucketState]:
+    """
+    Refill every bucket to `now` and try to take `cost` tokens from all.
+
+    Pure function shared by every store; stores only add locking and
+    persistence around it.
+
+    Args:
+        state: Current bucket state (missing windows start full)
+        windows: Windows to enforce
+        cost: Tokens to take from each bucket
+        now: Current unix time
+
+    Returns:
+        (wait_seconds, limiting_window, new_state). wait_seconds is 0 when the
+        tokens were taken; otherwise nothing was taken and the caller should
+        retry after wait_seconds.
+    """
+    refilled: BucketState = {}
+    wait_seconds = 0.0
+    limiting_window = None
+
+    for window in windows:
+        tokens, refilled_at = state.get(window.name, (window.capacity, now))
+        elapsed = max(0.0, now - refilled_at)
+        tokens = min(window.capacity, tokens + elapsed * window.refill_per_second)
+        refilled[window.name] = (tokens, now)
+
+        if tokens < cost:
+            window_wait = (cost - tokens) / window.refill_per_second
+            if window_wait > wait_seconds:
+                wait_seconds = window_wait
+                limiting_window = window.name
+
+    if wait_seconds > 0:
+        return wait_seconds, limiting_window, refilled
+
+    taken = {name: (tokens - cost, at) for name, (tokens, at) in refilled.items()}
+    return 0.0, None, taken
+
+
+class MemoryBucketStore:
+    """In-process bucket store (state is not shared between processes)."""
+
+    def __init__(self):
+        self._state: Dict[str, BucketState] = {}
+        self._lock = threading.Lock()
+
+    async def take(self, key: str, windows: List[RateWindow], cost: float, now: float) -> Tuple[float, Optional[str]]:
+        with self._lock:
+            wait, window, new_state = plan_acquire(self._state.get(key, {}), windows, cost, now)
+            self._state[key] = new_state
+        return wait, window
+
+
+class SQLiteBucketStore:
+    """
+    Bucket store in a local SQLite file, shared by processes on one host.
+
+    Every take runs inside BEGIN IMMEDIATE, which holds SQLite's write lock
+    for the read-modify-write, so concurrent workers cannot double-spend.
+    """
+
+    def __init__(self, path: Path = DEFAULT_SQLITE_PATH, busy_timeout_seconds: float = 30.0):
+        self.path = Path(path)
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_bucket ("
+                " key TEXT NOT NULL,"
+                " window TEXT NOT NULL,"
+                " tokens REAL NOT NULL,"
+                " refilled_at REAL NOT NULL,"
+                " PRIMARY KEY (key, window))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout_seconds,
+                isolation_level=None,  # Explicit BEGIN/COMMIT below
+            )
+            self._local.conn = conn
+        return conn
+
+    def _take_sync(self, key: str, windows: List[RateWindow], cost: float, now: float) -> Tuple[float, Optional[str]]:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT window, tokens, refilled_at FROM rate_limit_bucket WHERE key = ?",
+                (key,),
+            ).fetchall()
+            state = {window: (tokens, refilled_at) for window, tokens, refilled_at in rows}
+
+            wait, limiting_window, new_state = plan_acquire(state, windows, cost, now)
+
+            conn.executemany(
+                "INSERT INTO rate_limit_bucket (key, window, tokens, refilled_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key, window) DO UPDATE SET tokens = excluded.tokens, "
+                "refilled_at = excluded.refilled_at",
+                [(key, window, tokens, at) for window, (tokens, at) in new_state.items()],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return wait, limiting_window
+
+    async def take(self, key: str, windows: List[RateWindow], cost: float, now: float) -> Tuple[float, Optional[str]]:
+        # SQLite blocks on the file lock; keep the event loop free
+        return await asyncio.to_thread(self._take_sync, key, windows, cost, now)
+
+
+class PostgresBucketStore:
+    """
+    Bucket store in the RateLimitBucket table, shared by every worker.
+
+    The read-modify-write runs in an interactive transaction serialized per
+    key by pg_advisory_xact_lock, released automatically at commit.
+
+    Without an explicit client the store resolves the process-wide client
+    from engine.db on every take(), so a long-lived store never holds on to
+    the client of whichever run created it.
+    """
+
+    def __init__(self, db=None):
+        """
+        Args:
+            db: Connected Prisma client (default: the engine.db client at call time)
+        """
+        self.db = db
+
+    async def take(self, key: str, windows: List[RateWindow], cost: float, now: float) -> Tuple[float, Optional[str]]:
+        async with db_client(self.db) as db, db.tx() as tx:
+            await tx.query_raw(
+                "SELECT 1 AS locked FROM (SELECT pg_advisory_xact_lock(hashtext($1))) AS lock",
+                key,
+            )
+            rows = await tx.ratelimitbucket.find_many(where={"key": key})
+            state = {row.window: (row.tokens, row.refilled_at) for row in rows}
+
+            wait, limiting_window, new_state = plan_acquire(state, windows, cost, now)
+
+            for window, (tokens, refilled_at) in new_state.items():
+                await tx.ratelimitbucket.upsert(
+                    where={"key_window": {"key": key, "window": window}},
+                    data={
+                        "create": {"key": key, "window": window, "tokens": tokens, "refilled_at": refilled_at},
+                        "update": {"tokens": tokens, "refilled_at": refilled_at},
+                    },
+                )
+        return wait, limiting_window
+
+
+class TokenBucketLimiter:
+    """
+    Awaitable multi-window token-bucket limiter for one source.
+
+    Example:
+        limiter = TokenBucketLimiter(
+            "serper",
+            [RateWindow("per_minute", 60, 60), RateWindow("per_hour", 1000, 3600)],
+            store=SQLiteBucketStore(),
+        )
+        await limiter.acquire()           # waits as long as needed
+        await limiter.acquire(timeout=5)  # RateLimitExceeded if wait > 5s
+    """
+
+    def __init__(self, source: str, windows: List[RateWindow], store=None, clock=time.time, sleep=asyncio.sleep):
+        """
+        Args:
+            source: Source name (bucket key)
+            windows: Windows to enforce (at least one)
+            store: Bucket store (defaults to MemoryBucketStore)
+            clock: Wall-clock source (must agree across processes)
+            sleep: Async sleep function (injectable for tests)
+
+        Raises:
+            ValueError: If no windows are given
+        """
+        if not windows:
+            raise ValueError(f"Token bucket for '{source}' needs at least one window")
+        self.source = source
+        self.windows = list(windows)
+        self.store = store or MemoryBucketStore()
+        self._clock = clock
+        self._sleep = sleep
+
+        # Observability
+        self.acquired = 0
+        self.total_wait_seconds = 0.0
+
+    async def acquire(self, cost: float = 1, timeout: Optional[float] = None) -> float:
+        """
+        Wait until `cost` tokens are available in every window, then take them.
+
+        Args:
+            cost: Tokens to take (1 per request)
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitExceeded: If the required wait exceeds timeout
+            ValueError: If cost exceeds a window's capacity (never satisfiable)
+        """
+        for window in self.windows:
+            if cost > window.capacity:
+                raise ValueError(
+                    f"Cost {cost} exceeds {window.name} capacity {window.capacity} for '{self.source}'"
+                )
+
+        started = self._clock()
+        waited = 0.0
+        while True:
+            wait, limiting_window = await self.store.take(self.source, self.windows, cost, self._clock())
+            if wait <= 0:
+                self.acquired += 1
+                self.total_wait_seconds += waited
+                return waited
+
+            if timeout is not None and waited + wait > timeout:
+                window = next(w for w in self.windows if w.name == limiting_window)
+                raise RateLimitExceeded(
+                    source=self.source,
+                    limit_type=window.name,
+                    limit_value=window.limit,
+                )
+
+            await self._sleep(wait)
+            waited = self._clock() - started
+
+
+def load_rate_windows(source: str, config: Optional[Dict[str, Any]] = None) -> List[RateWindow]:
+    """
+    Build the windows for a source from its sources.yaml `rate_limits` block.
+
+    Args:
+        source: Source key in sources.yaml
+        config: Parsed sources.yaml (loaded from disk if omitted)
+
+    Returns:
+        Windows for every configured (non-null) limit; empty if unlimited
+
+    Raises:
+        KeyError: If source not found in configuration
+        FileNotFoundError: If sources.yaml doesn't exist
+    """
+    config = config if config is not None else _load_sources_config()
+    if source not in config:
+        raise KeyError(f"Source '{source}' not found in configuration")
+
+    rate_limits = (config[source] or {}).get("rate_limits") or {}
+    burst = rate_limits.get("burst")
+
+    windows = []
+    for key, (name, period) in WINDOW_PERIODS.items():
+        limit = rate_limits.get(key)
+        if limit:
+            windows.append(RateWindow(name=name, limit=int(limit), period_seconds=period, burst=burst))
+    return windows
+
+
+def create_bucket_store(config: Optional[Dict[str, Any]] = None, db=None):
+    """
+    Create the bucket store selected by `global.rate_limiting` in sources.yaml.
+
+    Recognised settings:
+        backend: "sqlite" (default), "postgres" or "memory"
+        sqlite_path: SQLite file (default engine/data/rate_limits.sqlite3)
+
+    The RATE_LIMIT_BACKEND environment variable overrides `backend`.
+
+    Args:
+        config: Parsed sources.yaml (loaded from disk if omitted)
+        db: Connected Prisma client for the postgres backend (default: the
+            engine.db client, resolved on every call)
+
+    Returns:
+        Bucket store instance
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if config is None:
+        try:
+            config = _load_sources_config()
+        except FileNotFoundError:
+            config = {}
+
+    settings = ((config.get("global") or {}).get("rate_limiting")) or {}
+    backend = os.getenv("RATE_LIMIT_BACKEND") or settings.get("backend", "sqlite")
+
+    if backend == "memory":
+        return MemoryBucketStore()
+    if backend == "sqlite":
+        return SQLiteBucketStore(Path(settings.get("sqlite_path") or DEFAULT_SQLITE_PATH))
+    if backend == "postgres":
+        return PostgresBucketStore(db)
+    raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+# Process-wide limiters (one per source) sharing one store
+_token_bucket_limiters: Dict[str, Optional[TokenBucketLimiter]] = {}
+_default_store = None
+
+
+def get_token_bucket_limiter(source: str, store=None) -> Optional[TokenBucketLimiter]:
+    """
+    Get the shared limiter for a source, built from sources.yaml.
+
+    The default store is process-wide and never bound to a caller's client
+    (the postgres store resolves engine.db per call).
+
+    Args:
+        source: Source key in sources.yaml (connector source_name)
+        store: Bucket store override (defaults to create_bucket_store())
+
+    Returns:
+        TokenBucketLimiter, or None if sources.yaml is missing or the source
+        has no configured limits
+    """
+    global _default_store
+
+    if source not in _token_bucket_limiters:
+        try:
+            config = _load_sources_config()
+            windows = load_rate_windows(source, config)
+        except (FileNotFoundError, KeyError):
+            windows = []
+
+        if not windows:
+            _token_bucket_limiters[source] = None
+        else:
+            if store is None:
+                if _default_store is None:
+                    _default_store = create_bucket_store(config)
+                store = _default_store
+            _token_bucket_limiters[source] = TokenBucketLimiter(source, windows, store=store)
+
+    return _token_bucket_limiters[source]
+
+
+def _reset_token_bucket_limiters() -> None:
+    """Reset the process-wide limiter registry (testing only)."""
+    global _default_store
+    _token_bucket_limiters.clear()
+    _default_store = None
+
+
+def _load_sources_config() -> Dict[str, Any]:
+    return load_sources_config(SOURCES_CONFIG_PATH)
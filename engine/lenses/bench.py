@@ -0,0 +1,202 @@
+"""
+lens-bench: regex cost report for a lens.
+
+Times every regex in a lens (mapping rules and module field rules) against
+the regex guard's adversarial inputs plus a text corpus, and lists the
+slowest rules first. Reads lens.yaml directly (no validation) so a lens
+rejected by GATE 5 can still be inspected. The bench budget is stricter than
+the gate's: it also times the corpus and the longest pump inputs.
+
+Usage:
+    python -m engine.lenses.bench --lens edinburgh_finds
+    python -m engine.lenses.bench --lens edinburgh_finds --corpus descriptions.txt --top 5
+"""
+
+import argparse
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import yaml
+
+from engine.lenses.regex_guard import DEFAULT_CORPUS, REGEX_COST_BUDGET_MS, measure_pattern_cost
+
+LENSES_DIR = Path(__file__).parent
+
+
+@dataclass
+class RuleBenchmark:
+    """
+    Cost of one lens regex rule.
+
+    Attributes:
+        rule_id: Rule identifier (mapping rule id / module field rule_id)
+        kind: "mapping_rule" or "field_rule:<module>"
+        pattern: Regex source
+        worst_ms: Slowest single search over guard + corpus inputs
+        corpus_ms: Total time to search every corpus document once
+        hazards: Static catastrophic-backtracking shapes
+        error: Compile error, if the pattern is invalid
+    """
+
+    rule_id: str
+    kind: str
+    pattern: str
+    worst_ms: float = 0.0
+    corpus_ms: float = 0.0
+    hazards: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.worst_ms > REGEX_COST_BUDGET_MS
+
+
+def collect_lens_patterns(config: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    Collect every regex in a lens config.
+
+    Args:
+        config: Parsed lens.yaml
+
+    Returns:
+        List of {"rule_id", "kind", "pattern"} dicts
+    """
+    patterns = []
+    for index, rule in enumerate(config.get("mapping_rules") or []):
+        if rule.get("pattern"):
+            patterns.append({
+                "rule_id": rule.get("id") or f"{rule.get('canonical', 'rule')}#{index}",
+                "kind": "mapping_rule",
+                "pattern": rule["pattern"],
+            })
+
+    for module_name, module in (config.get("modules") or {}).items():
+        for index, rule in enumerate((module or {}).get("field_rules") or []):
+            if rule.get("pattern"):
+                patterns.append({
+                    "rule_id": rule.get("rule_id") or f"{module_name}#{index}",
+                    "kind": f"field_rule:{module_name}",
+                    "pattern": rule["pattern"],
+                })
+    return patterns
+
+
+def bench_lens(config: Dict[str, Any], corpus: Optional[Iterable[str]] = None) -> List[RuleBenchmark]:
+    """
+    Benchmark every regex rule in a lens, slowest first.
+
+    Args:
+        config: Parsed lens.yaml
+        corpus: Documents to search (defaults to the guard's DEFAULT_CORPUS)
+
+    Returns:
+        RuleBenchmark list sorted by worst_ms descending
+    """
+    documents = list(corpus) if corpus is not None else list(DEFAULT_CORPUS)
+    results = []
+
+    for entry in collect_lens_patterns(config):
+        result = RuleBenchmark(**entry)
+        try:
+            compiled = re.compile(entry["pattern"])
+        except re.error as e:
+            result.error = str(e)
+            results.append(result)
+            continue
+
+        cost = measure_pattern_cost(entry["pattern"], corpus=documents)
+        result.worst_ms = cost.worst_ms
+        result.hazards = cost.hazards
+
+        if not cost.exceeds():
+            started = time.perf_counter()
+            for document in documents:
+                compiled.search(document)
+            result.corpus_ms = (time.perf_counter() - started) * 1000
+
+        results.append(result)
+
+    return sorted(results, key=lambda r: r.worst_ms, reverse=True)
+
+
+def format_bench_report(lens_id: str, results: List[RuleBenchmark], top: Optional[int] = None) -> str:
+    """Format bench_lens results for CLI output."""
+    shown = results[:top] if top else results
+    lines = [
+        f"lens-bench: {lens_id} ({len(results)} patterns, budget {REGEX_COST_BUDGET_MS:.0f}ms)",
+        f"  {'worst ms':>9}  {'corpus ms':>9}  {'status':<8}  rule",
+    ]
+    for result in shown:
+        if result.error:
+            status = "INVALID"
+        elif result.over_budget:
+            status = "OVER"
+        elif result.hazards:
+            status = "HAZARD"
+        else:
+            status = "ok"
+        lines.append(
+            f"  {result.worst_ms:>9.2f}  {result.corpus_ms:>9.2f}  {status:<8}  "
+            f"{result.rule_id} [{result.kind}]"
+        )
+        if result.hazards:
+            lines.append(f"{'':>34}{', '.join(result.hazards)}")
+        if result.error:
+            lines.append(f"{'':>34}{result.error}")
+    return "\n".join(lines)
+
+
+def load_corpus(path: Path) -> List[str]:
+    """Load a corpus file: one document per non-empty line."""
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="lens-bench - report the slowest regex rules in a lens",
+    )
+    parser.add_argument(
+        "--lens",
+        required=True,
+        help="Lens ID (engine/lenses/<lens_id>/lens.yaml) or path to a lens.yaml",
+    )
+    parser.add_argument(
+        "--corpus",
+        help="Text file with one document per line (e.g. exported descriptions); "
+             "added to the built-in long-text corpus",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=None,
+        help="Only show the N slowest rules",
+    )
+
+    args = parser.parse_args()
+
+    lens_path = Path(args.lens)
+    if not lens_path.is_file():
+        lens_path = LENSES_DIR / args.lens / "lens.yaml"
+    if not lens_path.exists():
+        print(f"Lens file not found: {lens_path}")
+        return 1
+
+    config = yaml.safe_load(lens_path.read_text(encoding="utf-8")) or {}
+    corpus = list(DEFAULT_CORPUS)
+    if args.corpus:
+        corpus.extend(load_corpus(Path(args.corpus)))
+
+    results = bench_lens(config, corpus=corpus)
+    print(format_bench_report(args.lens, results, top=args.top))
+
+    # Non-zero exit when any rule is invalid, hazardous or over the bench budget
+    failing = [r for r in results if r.error or r.hazards or r.over_budget]
+    return 1 if failing else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,199 @@
+"""
+Precompiled keyword automaton for lens vocabulary matching.
+
+Query feature extraction and connector trigger evaluation used to loop over
+every lens keyword list with `kw in query` on each request. KeywordAutomaton
+compiles all vocabulary terms once (Aho-Corasick over characters) and reports
+every hit in a single left-to-right pass over the query, independent of how
+many keywords the lens defines.
+
+Each keyword carries one or more group labels (e.g. "activity", "location",
+"trigger:sport_scotland:0") so a single scan serves every consumer. Hits
+record whether they start/end on a word boundary so callers can choose
+between whole-word matching (location names: "in" must not match "indoor")
+and word-prefix matching (activity terms: "court" should match "courts").
+
+Keywords are matched case-sensitively against the text as given; callers
+pass lowercase queries and the automaton lowercases keywords at build time.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Set, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """
+    A single vocabulary match within a scanned text.
+
+    Attributes:
+        keyword: The matched keyword (lowercased)
+        start: Start offset in the scanned text
+        end: End offset (exclusive) in the scanned text
+        groups: Group labels the keyword was registered under
+        word_start: True if the match begins on a word boundary
+        word_end: True if the match ends on a word boundary
+    """
+
+    keyword: str
+    start: int
+    end: int
+    groups: FrozenSet[str]
+    word_start: bool
+    word_end: bool
+
+    @property
+    def whole_word(self) -> bool:
+        """True if the match is bounded by word boundaries on both sides."""
+        return self.word_start and self.word_end
+
+
+class KeywordMatches:
+    """
+    Result of one automaton scan, queryable by group.
+
+    Matching modes:
+        "substring": any occurrence counts
+        "prefix": match must start on a word boundary (plurals still match)
+        "word": match must be a whole word/phrase
+    """
+
+    def __init__(self, hits: List[KeywordHit]):
+        self.hits = hits
+
+    def keywords(self, group: str, mode: str = "prefix") -> Set[str]:
+        """
+        Distinct keywords of a group that matched under the given mode.
+
+        Args:
+            group: Group label the keywords were registered under
+            mode: "substring", "prefix" or "word"
+
+        Returns:
+            Set of matched keywords
+        """
+        return {hit.keyword for hit in self.hits if group in hit.groups and _accepts(hit, mode)}
+
+    def any(self, group: str, mode: str = "prefix") -> bool:
+        """Return True if any keyword of the group matched under the given mode."""
+        return any(group in hit.groups and _accepts(hit, mode) for hit in self.hits)
+
+    def count(self, group: str, mode: str = "prefix") -> int:
+        """Return the number of distinct keywords of the group that matched."""
+        return len(self.keywords(group, mode))
+
+
+def _accepts(hit: KeywordHit, mode: str) -> bool:
+    if mode == "word":
+        return hit.whole_word
+    if mode == "prefix":
+        return hit.word_start
+    if mode == "substring":
+        return True
+    raise ValueError(f"Unknown keyword match mode: {mode!r}")
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over grouped keywords.
+
+    Build once per vocabulary (e.g. per QueryLens at load time) and reuse for
+    every query. Scanning is O(len(text) + number of hits).
+
+    Example:
+        >>> automaton = KeywordAutomaton({"activity": ["padel", "tennis"], "location": ["leith"]})
+        >>> matches = automaton.scan("padel courts in leith")
+        >>> matches.keywords("activity")
+        {'padel'}
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]):
+        """
+        Compile the automaton.
+
+        Args:
+            groups: Mapping of group label -> keywords. A keyword may appear
+                in several groups; empty/whitespace keywords are ignored.
+        """
+        keyword_groups: Dict[str, Set[str]] = {}
+        for group, keywords in groups.items():
+            for keyword in keywords or []:
+                if not isinstance(keyword, str):
+                    continue
+                normalized = keyword.lower()
+                if not normalized.strip():
+                    continue
+                keyword_groups.setdefault(normalized, set()).add(group)
+
+        # State 0 is the root; transitions are per-state dicts keyed by char
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, FrozenSet[str]]]] = [[]]
+
+        for keyword, keyword_group_set in keyword_groups.items():
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((keyword, frozenset(keyword_group_set)))
+
+        # Breadth-first failure links; outputs are merged along fail chains
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+        self.keyword_count = len(keyword_groups)
+
+    def scan(self, text: str) -> KeywordMatches:
+        """
+        Find every keyword occurrence in text in a single pass.
+
+        Args:
+            text: Text to scan (callers normalize case)
+
+        Returns:
+            KeywordMatches with one hit per occurrence
+        """
+        hits: List[KeywordHit] = []
+        state = 0
+        length = len(text)
+
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for keyword, groups in self._output[state]:
+                end = index + 1
+                start = end - len(keyword)
+                hits.append(
+                    KeywordHit(
+                        keyword=keyword,
+                        start=start,
+                        end=end,
+                        groups=groups,
+                        word_start=start == 0 or not _is_word_char(text[start - 1]),
+                        word_end=end == length or not _is_word_char(text[end]),
+                    )
+                )
+
+        return KeywordMatches(hits)
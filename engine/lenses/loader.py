@@ -527,6 +527,16 @@ class LensRegistry:
     """
 
     _lenses: Dict[str, VerticalLens] = {}
+    _signatures: Dict[str, Optional[tuple]] = {}
+
+    @staticmethod
+    def _file_signature(config_path: Path) -> Optional[tuple]:
+        """Return (mtime_ns, size) for a lens file, or None if missing."""
+        try:
+            stat = Path(config_path).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     @classmethod
     def register(cls, lens_id: str, config_path: Path) -> None:
@@ -537,8 +547,52 @@ class LensRegistry:
             lens_id: Unique identifier for the lens
             config_path: Path to lens.yaml file
         """
+        signature = cls._file_signature(config_path)
         lens = VerticalLens(config_path)
         cls._lenses[lens_id] = lens
+        cls._signatures[lens_id] = signature
+
+    @classmethod
+    def refresh(cls, lens_id: str) -> bool:
+        """
+        Reload a registered lens if its lens.yaml changed on disk.
+
+        The new file is fully loaded and validated before it replaces the
+        registered instance, so a broken edit never evicts a working lens.
+
+        Args:
+            lens_id: Lens identifier
+
+        Returns:
+            True if the lens was reloaded, False if the file is unchanged
+
+        Raises:
+            KeyError: If lens_id not found
+            LensConfigError: If the changed file fails validation (the
+                previously registered lens stays active)
+        """
+        lens = cls.get_lens(lens_id)
+        signature = cls._file_signature(lens.config_path)
+        if signature is None or signature == cls._signatures.get(lens_id):
+            return False
+
+        # Build first, swap after: a failed load leaves the old lens in place
+        cls._lenses[lens_id] = VerticalLens(lens.config_path)
+        cls._signatures[lens_id] = signature
+        return True
+
+    @classmethod
+    def refresh_all(cls) -> List[str]:
+        """
+        Reload every registered lens whose file changed.
+
+        Returns:
+            Lens IDs that were reloaded
+
+        Raises:
+            LensConfigError: If a changed file fails validation
+        """
+        return [lens_id for lens_id in list(cls._lenses) if cls.refresh(lens_id)]
 
     @classmethod
     def get_lens(cls, lens_id: str) -> VerticalLens:
@@ -3,19 +3,40 @@ Lens membership operations.
 
 Provides explicit API for managing entity membership in lenses via the LensEntity table.
 These operations perform direct DB writes and are the single source of truth for lens membership.
+
+Every operation accepts an optional connected Prisma client. When omitted,
+the process-wide client from engine.db is used (connected for the call unless
+a caller already holds it); batch callers should pass their own client and
+use the bulk operations, which touch many (lens, entity) pairs in a handful
+of statements.
 """
 
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
 from prisma import Prisma
-from typing import Optional
+
+from engine.db import db_client
+
+
+# Rows per create_many / delete_many statement (keeps bind parameters well
+# under the Postgres limit)
+MEMBERSHIP_BATCH_SIZE = 1000
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
-async def attach_entity_to_lens(entity_id: str, lens_id: str) -> bool:
+async def attach_entity_to_lens(entity_id: str, lens_id: str, db: Optional[Prisma] = None) -> bool:
     """
     Attach an entity to a lens by creating a LensEntity record.
 
     Args:
         entity_id: The ID of the entity to attach
         lens_id: The ID of the lens to attach to
+        db: Optional connected Prisma client (default: the shared client)
 
     Returns:
         True if the membership was created, False if it already existed
@@ -23,44 +44,17 @@ async def attach_entity_to_lens(entity_id: str, lens_id: str) -> bool:
     Raises:
         Exception: If the database operation fails
     """
-    db = Prisma()
-    await db.connect()
-
-    try:
-        # Check if membership already exists
-        existing = await db.lensentity.find_unique(
-            where={
-                'lensId_entityId': {
-                    'lensId': lens_id,
-                    'entityId': entity_id
-                }
-            }
-        )
-
-        if existing:
-            return False
-
-        # Create new membership
-        await db.lensentity.create(
-            data={
-                'lensId': lens_id,
-                'entityId': entity_id
-            }
-        )
-
-        return True
-
-    finally:
-        await db.disconnect()
+    return await attach_entities_to_lenses([(lens_id, entity_id)], db=db) == 1
 
 
-async def detach_entity_from_lens(entity_id: str, lens_id: str) -> bool:
+async def detach_entity_from_lens(entity_id: str, lens_id: str, db: Optional[Prisma] = None) -> bool:
     """
     Detach an entity from a lens by deleting the LensEntity record.
 
     Args:
         entity_id: The ID of the entity to detach
         lens_id: The ID of the lens to detach from
+        db: Optional connected Prisma client (default: the shared client)
 
     Returns:
         True if the membership was deleted, False if it didn't exist
@@ -68,39 +62,16 @@ async def detach_entity_from_lens(entity_id: str, lens_id: str) -> bool:
     Raises:
         Exception: If the database operation fails
     """
-    db = Prisma()
-    await db.connect()
-
-    try:
-        # Try to delete the membership
-        result = await db.lensentity.delete(
-            where={
-                'lensId_entityId': {
-                    'lensId': lens_id,
-                    'entityId': entity_id
-                }
-            }
-        )
-
-        return result is not None
-
-    except Exception as e:
-        # If the record doesn't exist, Prisma will raise an exception
-        # Check if it's a "not found" error
-        if 'Record to delete does not exist' in str(e):
-            return False
-        raise
+    return await detach_entities_from_lenses([(lens_id, entity_id)], db=db) == 1
 
-    finally:
-        await db.disconnect()
 
-
-async def get_entity_lenses(entity_id: str) -> list[str]:
+async def get_entity_lenses(entity_id: str, db: Optional[Prisma] = None) -> list[str]:
     """
     Get all lens IDs that an entity is a member of.
 
     Args:
         entity_id: The ID of the entity
+        db: Optional connected Prisma client (default: the shared client)
 
     Returns:
         List of lens IDs
@@ -108,26 +79,21 @@ async def get_entity_lenses(entity_id: str) -> list[str]:
     Raises:
         Exception: If the database operation fails
     """
-    db = Prisma()
-    await db.connect()
-
-    try:
-        memberships = await db.lensentity.find_many(
+    async with db_client(db) as client:
+        memberships = await client.lensentity.find_many(
             where={'entityId': entity_id}
         )
 
         return [m.lensId for m in memberships]
 
-    finally:
-        await db.disconnect()
-
 
-async def get_lens_entities(lens_id: str) -> list[str]:
+async def get_lens_entities(lens_id: str, db: Optional[Prisma] = None) -> list[str]:
     """
     Get all entity IDs that are members of a lens.
 
     Args:
         lens_id: The ID of the lens
+        db: Optional connected Prisma client (default: the shared client)
 
     Returns:
         List of entity IDs
@@ -135,15 +101,209 @@ async def get_lens_entities(lens_id: str) -> list[str]:
     Raises:
         Exception: If the database operation fails
     """
-    db = Prisma()
-    await db.connect()
-
-    try:
-        memberships = await db.lensentity.find_many(
+    async with db_client(db) as client:
+        memberships = await client.lensentity.find_many(
             where={'lensId': lens_id}
         )
 
         return [m.entityId for m in memberships]
 
-    finally:
-        await db.disconnect()
+
+async def attach_entities_to_lenses(
+    pairs: Iterable[Tuple[str, str]],
+    db: Optional[Prisma] = None,
+    batch_size: int = MEMBERSHIP_BATCH_SIZE,
+) -> int:
+    """
+    Attach many entities to lenses with batched create_many(skip_duplicates).
+
+    Existing memberships are left untouched (including their lensHash).
+
+    Args:
+        pairs: (lens_id, entity_id) pairs; duplicates are ignored
+        db: Optional connected Prisma client (default: the shared client)
+        batch_size: Rows per create_many statement
+
+    Returns:
+        Number of membership rows created
+
+    Raises:
+        Exception: If the database operation fails
+    """
+    pairs = list(dict.fromkeys(pairs))
+    if not pairs:
+        return 0
+
+    created = 0
+    async with db_client(db) as client:
+        for chunk in _chunks(pairs, batch_size):
+            created += await client.lensentity.create_many(
+                data=[{'lensId': lens_id, 'entityId': entity_id} for lens_id, entity_id in chunk],
+                skip_duplicates=True,
+            )
+    return created
+
+
+async def detach_entities_from_lenses(
+    pairs: Iterable[Tuple[str, str]],
+    db: Optional[Prisma] = None,
+    batch_size: int = MEMBERSHIP_BATCH_SIZE,
+) -> int:
+    """
+    Detach many entities from lenses with one delete_many per lens (batched).
+
+    Pairs without a membership row are ignored.
+
+    Args:
+        pairs: (lens_id, entity_id) pairs
+        db: Optional connected Prisma client (default: the shared client)
+        batch_size: Entity IDs per delete_many statement
+
+    Returns:
+        Number of membership rows deleted
+
+    Raises:
+        Exception: If the database operation fails
+    """
+    entities_by_lens: Dict[str, List[str]] = defaultdict(list)
+    for lens_id, entity_id in dict.fromkeys(pairs):
+        entities_by_lens[lens_id].append(entity_id)
+    if not entities_by_lens:
+        return 0
+
+    deleted = 0
+    async with db_client(db) as client:
+        for lens_id, entity_ids in entities_by_lens.items():
+            for chunk in _chunks(entity_ids, batch_size):
+                deleted += await client.lensentity.delete_many(
+                    where={'lensId': lens_id, 'entityId': {'in': chunk}}
+                )
+    return deleted
+
+
+async def sync_lens_membership(
+    lens_id: str,
+    entity_ids: Iterable[str],
+    db: Optional[Prisma] = None,
+    batch_size: int = MEMBERSHIP_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Make a lens's membership exactly match a set of entity IDs.
+
+    Reads the current members once, then applies the set difference: missing
+    entities are attached with create_many, stale ones removed with
+    delete_many. Unchanged rows are not written (their lensHash is kept).
+
+    Args:
+        lens_id: The ID of the lens
+        entity_ids: Desired member entity IDs
+        db: Optional connected Prisma client (default: the shared client)
+        batch_size: Rows per write statement
+
+    Returns:
+        Dict with "added", "removed" and "unchanged" counts
+
+    Raises:
+        Exception: If the database operation fails
+    """
+    desired = set(entity_ids)
+
+    async with db_client(db) as client:
+        existing = set(await get_lens_entities(lens_id, db=client))
+
+        to_add = sorted(desired - existing)
+        to_remove = sorted(existing - desired)
+
+        added = await attach_entities_to_lenses(
+            [(lens_id, entity_id) for entity_id in to_add], db=client, batch_size=batch_size
+        )
+        removed = await detach_entities_from_lenses(
+            [(lens_id, entity_id) for entity_id in to_remove], db=client, batch_size=batch_size
+        )
+
+    return {
+        'added': added,
+        'removed': removed,
+        'unchanged': len(desired & existing),
+    }
+
+
+async def get_applied_lens_hashes(db: Prisma, lens_id: str) -> Dict[str, Optional[str]]:
+    """
+    Get the lens contract hash last applied to each member entity of a lens.
+
+    Args:
+        db: Connected Prisma client
+        lens_id: The ID of the lens
+
+    Returns:
+        Dict mapping entity ID to its recorded lens hash (None if never recorded)
+
+    Raises:
+        Exception: If the database operation fails
+    """
+    memberships = await db.lensentity.find_many(
+        where={'lensId': lens_id}
+    )
+
+    return {m.entityId: m.lensHash for m in memberships}
+
+
+async def record_applied_lens_hash(
+    db: Prisma,
+    lens_id: str,
+    entity_ids: Iterable[str],
+    lens_hash: str,
+) -> int:
+    """
+    Record the lens contract hash applied to a set of entities.
+
+    Only existing memberships are re-stamped: entities that are not members
+    of the lens are left alone (membership is managed by the attach/detach
+    and sync operations above).
+
+    Args:
+        db: Connected Prisma client
+        lens_id: The ID of the lens
+        entity_ids: IDs of the entities the contract was applied to
+        lens_hash: Content hash of the applied lens contract
+
+    Returns:
+        Number of membership rows stamped
+
+    Raises:
+        Exception: If the database operation fails
+    """
+    entity_ids = list(dict.fromkeys(entity_ids))
+    stamped = 0
+    for chunk in _chunks(entity_ids, MEMBERSHIP_BATCH_SIZE):
+        stamped += await db.lensentity.update_many(
+            where={'lensId': lens_id, 'entityId': {'in': chunk}},
+            data={'lensHash': lens_hash},
+        )
+    return stamped
+
+
+async def restamp_lens_hash(db: Prisma, lens_id: str, old_hash: str, new_hash: str) -> int:
+    """
+    Move every membership stamped with old_hash onto new_hash.
+
+    Used when a contract change provably cannot affect an entity: the row
+    is re-stamped without touching the Entity itself.
+
+    Args:
+        db: Connected Prisma client
+        lens_id: The ID of the lens
+        old_hash: Previously applied lens hash
+        new_hash: Newly applied lens hash
+
+    Returns:
+        Number of membership rows re-stamped
+
+    Raises:
+        Exception: If the database operation fails
+    """
+    return await db.lensentity.update_many(
+        where={'lensId': lens_id, 'lensHash': old_hash},
+        data={'lensHash': new_hash},
+    )
@@ -9,11 +9,17 @@ This coexists with the comprehensive VerticalLens loader (loader.py) which handl
 the full lens configuration (facets, values, modules, triggers, etc.).
 """
 
+import logging
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+from engine.lenses.keyword_automaton import KeywordAutomaton, KeywordMatches
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class QueryLensConfig:
@@ -59,6 +65,48 @@ class QueryLens:
         self.config = config
         self.lens_name = config.lens_name
 
+        # Compile all vocabulary + trigger keywords into one automaton so
+        # feature extraction and connector routing share a single scan
+        self.automaton = KeywordAutomaton(self._keyword_groups(config))
+        self._scan = lru_cache(maxsize=256)(self.automaton.scan)
+
+    @staticmethod
+    def _trigger_group(connector_name: str, index: int) -> str:
+        return f"trigger:{connector_name}:{index}"
+
+    @classmethod
+    def _keyword_groups(cls, config: QueryLensConfig) -> Dict[str, List[str]]:
+        """Collect every keyword list in the config under a group label."""
+        groups: Dict[str, List[str]] = {
+            "activity": list(config.activity_keywords),
+            "facility": list(config.facility_keywords),
+            "location": list(config.location_indicators),
+        }
+        for connector_name, rules in (config.connector_rules or {}).items():
+            for index, trigger in enumerate((rules or {}).get("triggers", [])):
+                groups[cls._trigger_group(connector_name, index)] = (
+                    list(trigger.get("keywords", []))
+                    + list(trigger.get("activity_keywords", []))
+                    + list(trigger.get("brands", []))
+                )
+        return groups
+
+    def match_keywords(self, query: str) -> KeywordMatches:
+        """
+        Scan a query against the lens vocabulary in a single pass.
+
+        Results are cached per query string, so feature extraction and
+        connector routing for the same query reuse one scan.
+
+        Args:
+            query: Query string (lowercased by the caller)
+
+        Returns:
+            KeywordMatches queryable by group ("activity", "facility",
+            "location", or a connector trigger group)
+        """
+        return self._scan(query)
+
     def get_activity_keywords(self) -> List[str]:
         """
         Get activity-related keywords for query feature extraction.
@@ -126,7 +174,9 @@ class QueryLens:
         connector_rules = self.config.connector_rules
 
         for connector_name, rules in connector_rules.items():
-            if self._matches_triggers(normalized_query, query_features, rules.get("triggers", [])):
+            if self._matches_triggers(
+                normalized_query, query_features, rules.get("triggers", []), connector_name
+            ):
                 connectors.append(connector_name)
 
         return connectors
@@ -135,11 +185,16 @@ class QueryLens:
         self,
         query: str,
         query_features: Optional["QueryFeatures"],
-        triggers: List[Dict[str, Any]]
+        triggers: List[Dict[str, Any]],
+        connector_name: str,
     ) -> bool:
         """
         Check if query matches any trigger rule for a connector.
 
+        Keyword checks use the precompiled lens automaton and match at word
+        starts: plurals still match ("court" -> "courts") but a keyword never
+        matches mid-word ("ball" does not match "football").
+
         Trigger types:
         - any_keyword_match: Match if query contains N keywords
         - category_search: Match if looks like category search
@@ -151,30 +206,25 @@ class QueryLens:
             query: Normalized query string
             query_features: Optional QueryFeatures object
             triggers: List of trigger rule dicts
+            connector_name: Connector the triggers belong to (selects the
+                automaton group for each trigger)
 
         Returns:
             True if any trigger matches, False otherwise
         """
-        for trigger in triggers:
-            trigger_type = trigger.get("type")
+        matches = self.match_keywords(query)
 
-            if trigger_type == "any_keyword_match":
-                keywords = trigger.get("keywords", [])
-                threshold = trigger.get("threshold", 1)
-                matches = sum(1 for kw in keywords if kw in query)
-                if matches >= threshold:
-                    return True
+        for index, trigger in enumerate(triggers):
+            trigger_type = trigger.get("type")
+            group = self._trigger_group(connector_name, index)
 
-            elif trigger_type == "location_match":
-                keywords = trigger.get("keywords", [])
+            if trigger_type in ("any_keyword_match", "location_match"):
                 threshold = trigger.get("threshold", 1)
-                matches = sum(1 for kw in keywords if kw in query)
-                if matches >= threshold:
+                if matches.count(group) >= threshold:
                     return True
 
             elif trigger_type == "facility_search":
-                keywords = trigger.get("keywords", [])
-                if any(kw in query for kw in keywords):
+                if matches.any(group):
                     location_required = trigger.get("location_required", False)
                     if not location_required:
                         return True
@@ -184,13 +234,11 @@ class QueryLens:
 
             elif trigger_type == "category_search":
                 if query_features and query_features.looks_like_category_search:
-                    activity_keywords = trigger.get("activity_keywords", [])
-                    if any(kw in query for kw in activity_keywords):
+                    if matches.any(group):
                         return True
 
             elif trigger_type == "brand_mention":
-                brands = trigger.get("brands", [])
-                if any(brand in query for brand in brands):
+                if matches.any(group):
                     return True
 
         return False
@@ -247,10 +295,23 @@ def load_query_lens(lens_name: str) -> QueryLens:
     return QueryLens(config)
 
 
+def _lens_file_signature(lens_name: str) -> Optional[tuple]:
+    """Return (mtime_ns, size) of a lens.yaml, or None if it does not exist."""
+    try:
+        stat = Path(f"engine/lenses/{lens_name}/lens.yaml").stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def get_active_lens(lens_name: Optional[str] = None) -> QueryLens:
     """
     Get active query lens (with caching).
 
+    The cached lens is reloaded when its lens.yaml changes on disk (mtime or
+    size), so long-lived workers pick up vocabulary edits without a restart.
+    If the edited file fails to load, the previously cached lens is kept.
+
     Args:
         lens_name: Lens identifier (defaults to "padel" if not specified)
 
@@ -265,11 +326,23 @@ def get_active_lens(lens_name: Optional[str] = None) -> QueryLens:
     if lens_name is None:
         lens_name = "edinburgh_finds"  # Default lens
 
-    # Simple caching: load once and reuse
+    # Cache entries are (signature, QueryLens); reload when the file changes
     if not hasattr(get_active_lens, "_cache"):
         get_active_lens._cache = {}
 
-    if lens_name not in get_active_lens._cache:
-        get_active_lens._cache[lens_name] = load_query_lens(lens_name)
-
-    return get_active_lens._cache[lens_name]
+    signature = _lens_file_signature(lens_name)
+    cached = get_active_lens._cache.get(lens_name)
+
+    if cached is None:
+        get_active_lens._cache[lens_name] = (signature, load_query_lens(lens_name))
+    elif signature is not None and cached[0] != signature:
+        try:
+            get_active_lens._cache[lens_name] = (signature, load_query_lens(lens_name))
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning(
+                "Query lens '%s' reload failed, keeping previous version: %s",
+                lens_name,
+                e,
+            )
+
+    return get_active_lens._cache[lens_name][1]
@@ -0,0 +1,411 @@
+"""
+Regex cost guard for lens patterns.
+
+Mapping-rule patterns run against every field of every extracted entity,
+including multi-kilobyte Serper descriptions. Python's `re` is a
+backtracking engine, so a single pathological pattern (nested quantifiers,
+overlapping alternation under a repeat) can stall extraction for minutes.
+
+Two complementary checks:
+
+1. Static shape analysis (find_backtracking_hazards): walks the parsed
+   pattern and flags the shapes that cause exponential backtracking.
+2. Empirical timing (measure_pattern_cost): runs the pattern against
+   adversarial inputs derived from the pattern itself (pump strings with a
+   non-matching suffix, grown step by step) and corpus-like long text, and
+   reports the worst observed search time.
+
+Lens validation (GATE 5) runs both: the static check, then
+measure_validation_cost, which times only the adversarial inputs up to a
+moderate length against a generous budget. Exponential shapes the static
+check misses blow through that budget within a few dozen characters, while
+linear and polynomial patterns stay far below it on any host. lens-bench
+reports the full timing (corpus and the longest pump inputs) against the
+stricter REGEX_COST_BUDGET_MS.
+
+Adversarial inputs grow gradually and timing stops at the first input over
+budget, so an exponential pattern is caught at a short input length instead
+of hanging the caller.
+"""
+
+import string
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Set, Tuple
+
+import re
+
+try:  # Python 3.11+
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
+
+# lens-bench flags patterns slower than this on any one guard input
+REGEX_COST_BUDGET_MS = 50.0
+
+# Pump repetitions used to grow adversarial inputs (small steps first so
+# exponential blowup is caught before it becomes a hang)
+PUMP_LENGTHS: Tuple[int, ...] = (4, 8, 12, 16, 20, 24, 32, 64, 256, 1024, 4096)
+
+# GATE 5 rejects patterns slower than this on any adversarial input. Far
+# above timer noise and slow hosts; exponential patterns cross it anyway.
+VALIDATION_COST_BUDGET_MS = 250.0
+
+# Pump repetitions timed by GATE 5: steps of 4 up to 64 (no exponential
+# pattern jumps from under budget to a hang between steps), and no long
+# inputs on which linear scans would be timed
+VALIDATION_PUMP_LENGTHS: Tuple[int, ...] = tuple(range(4, 65, 4)) + (128, 256)
+
+# Long, description-like text representative of Serper/Google snippets
+DEFAULT_CORPUS: Tuple[str, ...] = (
+    "Indoor padel and tennis venue with 6 courts, sports centre, cafe and parking. " * 150,
+    "Edinburgh Leisure Centre - swimming pool, gym, squash courts; open 7 days.\n" * 150,
+    " " * 5000 + "x",
+    "a" * 10000,
+)
+
+_REPEAT_OPS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+_ALL_CHARS = frozenset(string.printable)
+_CATEGORY_CHARS = {
+    sre_constants.CATEGORY_DIGIT: frozenset(string.digits),
+    sre_constants.CATEGORY_WORD: frozenset(string.ascii_letters + string.digits + "_"),
+    sre_constants.CATEGORY_SPACE: frozenset(string.whitespace),
+}
+
+
+@dataclass
+class PatternCost:
+    """
+    Measured cost of one pattern.
+
+    Attributes:
+        pattern: The regex source
+        worst_ms: Slowest single search observed (milliseconds)
+        worst_input_length: Length of the input that produced worst_ms
+        inputs_tried: Number of guard inputs evaluated
+        hazards: Static backtracking hazards found in the pattern
+    """
+
+    pattern: str
+    worst_ms: float = 0.0
+    worst_input_length: int = 0
+    inputs_tried: int = 0
+    hazards: List[str] = field(default_factory=list)
+
+    def exceeds(self, budget_ms: float = REGEX_COST_BUDGET_MS) -> bool:
+        """Return True if the worst observed search exceeded the budget."""
+        return self.worst_ms > budget_ms
+
+
+def find_backtracking_hazards(pattern: str) -> List[str]:
+    """
+    Flag regex shapes prone to catastrophic backtracking.
+
+    Detected shapes:
+        - Nested quantifiers that can split the same text several ways: a
+          variable repeat at the end of an unbounded repeat's body that can
+          consume the body's first character, e.g. (a+)+, (\\w+\\s?)*
+        - Unbounded repeat over alternation whose branches can start with the
+          same character: (x\\w|\\wy)+, (foo|\\w+bar)+
+        - Unbounded repeat over alternatives where one is a prefix of another
+          and the rest can start the next iteration: (a|aa)+, (ab|abab)*
+          (the parser factors these into a(?:|a), so the branches alone do
+          not overlap)
+
+    Possessive quantifiers and atomic groups never backtrack and are skipped.
+    Polynomial blowups (e.g. (a|ab)*c) are left to measure_pattern_cost.
+
+    Args:
+        pattern: Regex source
+
+    Returns:
+        Human-readable hazard descriptions (empty if none found)
+
+    Raises:
+        re.error: If the pattern does not compile
+    """
+    hazards: List[str] = []
+    _walk(sre_parse.parse(pattern), hazards)
+    # Preserve order, drop duplicates
+    return list(dict.fromkeys(hazards))
+
+
+def _walk(items, hazards: List[str]) -> None:
+    for op, av in items:
+        if op in _REPEAT_OPS:
+            _, max_count, sub = av
+            if max_count == sre_constants.MAXREPEAT:
+                # Iteration boundary is ambiguous when the body's trailing
+                # repeat can also start the next iteration
+                if _tail_repeat_chars(list(sub)) & _first_chars(list(sub)):
+                    hazards.append("nested unbounded quantifiers")
+                for branch_op, branch_av in _unwrap_groups(sub):
+                    if branch_op == sre_constants.BRANCH and _branches_overlap(branch_av[1]):
+                        hazards.append("overlapping alternation under an unbounded quantifier")
+                if _tail_alternation_chars(list(sub)) & _first_chars(list(sub)):
+                    hazards.append("overlapping alternation under an unbounded quantifier")
+            _walk(sub, hazards)
+        elif op == sre_constants.SUBPATTERN:
+            _walk(av[-1], hazards)
+        elif op == sre_constants.BRANCH:
+            for branch in av[1]:
+                _walk(branch, hazards)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            _walk(av[1], hazards)
+        # ATOMIC_GROUP / POSSESSIVE_REPEAT: no backtracking into the body
+
+
+def _unwrap_groups(items):
+    """Yield top-level items, looking through plain (capturing/non-capturing) groups."""
+    for op, av in items:
+        if op == sre_constants.SUBPATTERN:
+            yield from _unwrap_groups(av[-1])
+        else:
+            yield op, av
+
+
+def _tail_repeat_chars(items) -> Set[str]:
+    """Characters consumable by variable repeats in tail position of a sub-pattern."""
+    chars: Set[str] = set()
+    for op, av in reversed(items):
+        if op in _REPEAT_OPS:
+            min_count, max_count, sub = av
+            if min_count != max_count:
+                chars |= _first_chars(list(sub))
+            if min_count > 0:
+                return chars
+        elif op == sre_constants.SUBPATTERN:
+            chars |= _tail_repeat_chars(list(av[-1]))
+            if not _nullable(list(av[-1])):
+                return chars
+        elif op == sre_constants.BRANCH:
+            for branch in av[1]:
+                chars |= _tail_repeat_chars(list(branch))
+            if not any(_nullable(list(b)) for b in av[1]):
+                return chars
+        elif op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue
+        else:
+            return chars
+    return chars
+
+
+def _tail_alternation_chars(items) -> Set[str]:
+    """
+    Characters that can start the optional part of an alternation in tail
+    position, i.e. one with an empty alternative: (a|aa) parses as a(?:|a).
+    """
+    for op, av in reversed(items):
+        if op == sre_constants.BRANCH:
+            branches = [list(branch) for branch in av[1]]
+            if not any(_nullable(branch) for branch in branches):
+                return set()
+            chars: Set[str] = set()
+            for branch in branches:
+                chars |= _first_chars(branch)
+            return chars
+        if op == sre_constants.SUBPATTERN:
+            return _tail_alternation_chars(list(av[-1]))
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue
+        return set()
+    return set()
+
+
+def _branches_overlap(branches) -> bool:
+    seen: Set[str] = set()
+    for branch in branches:
+        first = _first_chars(list(branch))
+        if first & seen:
+            return True
+        seen |= first
+    return False
+
+
+def _first_chars(items) -> Set[str]:
+    """
+    Approximate set of characters a sub-pattern can start with.
+
+    Case is folded (patterns here are almost always (?i)) and anything not
+    modelled precisely is treated as matching any character - the analysis
+    errs towards reporting overlap.
+    """
+    chars: Set[str] = set()
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            chars |= {chr(av).lower()}
+            return chars
+        if op in (sre_constants.NOT_LITERAL, sre_constants.ANY):
+            return chars | set(_ALL_CHARS)
+        if op == sre_constants.IN:
+            return chars | _class_chars(av)
+        if op == sre_constants.SUBPATTERN:
+            sub = list(av[-1])
+            chars |= _first_chars(sub)
+            if not _nullable(sub):
+                return chars
+            continue
+        if op == sre_constants.BRANCH:
+            for branch in av[1]:
+                chars |= _first_chars(list(branch))
+            if not any(_nullable(list(b)) for b in av[1]):
+                return chars
+            continue
+        if op in _REPEAT_OPS or op == getattr(sre_constants, "POSSESSIVE_REPEAT", None):
+            min_count, _, sub = av
+            chars |= _first_chars(list(sub))
+            if min_count > 0:
+                return chars
+            continue
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue  # Zero-width
+        return chars | set(_ALL_CHARS)
+    return chars
+
+
+def _nullable(items) -> bool:
+    for op, av in items:
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue
+        if op in _REPEAT_OPS and av[0] == 0:
+            continue
+        if op == sre_constants.SUBPATTERN and _nullable(list(av[-1])):
+            continue
+        if op == sre_constants.BRANCH and any(_nullable(list(b)) for b in av[1]):
+            continue
+        return False
+    return True
+
+
+def _class_chars(class_items) -> Set[str]:
+    chars: Set[str] = set()
+    for op, av in class_items:
+        if op == sre_constants.NEGATE:
+            return set(_ALL_CHARS)
+        if op == sre_constants.LITERAL:
+            chars.add(chr(av).lower())
+        elif op == sre_constants.RANGE:
+            low, high = av
+            chars |= {chr(c).lower() for c in range(low, min(high, 127) + 1)}
+        elif op == sre_constants.CATEGORY:
+            chars |= _CATEGORY_CHARS.get(av, _ALL_CHARS)
+        else:
+            return set(_ALL_CHARS)
+    return chars
+
+
+def adversarial_inputs(pattern: str, pump_lengths: Tuple[int, ...] = PUMP_LENGTHS) -> List[str]:
+    """
+    Build pump-style inputs that exercise a pattern's repeats.
+
+    Each repeated sub-pattern contributes a character it can start with; the
+    pump string is repeated with increasing length and terminated with a
+    character that forces the overall match to fail (maximising backtracking).
+
+    Args:
+        pattern: Regex source
+        pump_lengths: Pump repetitions, shortest first
+
+    Returns:
+        Inputs ordered shortest first
+    """
+    pump_chars: List[str] = []
+    _collect_pump_chars(sre_parse.parse(pattern), pump_chars)
+    if not pump_chars:
+        return []
+
+    pump = "".join(dict.fromkeys(pump_chars))
+    return [pump * count + "\x00!" for count in pump_lengths]
+
+
+def _collect_pump_chars(items, pump_chars: List[str]) -> None:
+    for op, av in items:
+        if op in _REPEAT_OPS or op == getattr(sre_constants, "POSSESSIVE_REPEAT", None):
+            first = _first_chars(list(av[2]))
+            if first:
+                # Prefer a "typical" character (letter/space) for readability
+                pump_chars.append(sorted(first, key=lambda c: (not c.isalnum(), c))[0])
+            _collect_pump_chars(av[2], pump_chars)
+        elif op == sre_constants.SUBPATTERN:
+            _collect_pump_chars(av[-1], pump_chars)
+        elif op == sre_constants.BRANCH:
+            for branch in av[1]:
+                _collect_pump_chars(branch, pump_chars)
+
+
+def measure_pattern_cost(
+    pattern: str,
+    corpus: Optional[Iterable[str]] = None,
+    budget_ms: float = REGEX_COST_BUDGET_MS,
+    pump_lengths: Tuple[int, ...] = PUMP_LENGTHS,
+) -> PatternCost:
+    """
+    Time a pattern against adversarial and corpus-derived inputs.
+
+    Adversarial inputs are tried shortest first and timing stops at the first
+    input over budget, so exponential patterns are reported without hanging.
+
+    Args:
+        pattern: Regex source
+        corpus: Extra real-world inputs (defaults to DEFAULT_CORPUS)
+        budget_ms: Per-input budget used to stop early
+        pump_lengths: Pump repetitions for the adversarial inputs
+
+    Returns:
+        PatternCost with the worst observed search time
+
+    Raises:
+        re.error: If the pattern does not compile
+    """
+    compiled = re.compile(pattern)
+    cost = PatternCost(pattern=pattern, hazards=find_backtracking_hazards(pattern))
+
+    inputs = adversarial_inputs(pattern, pump_lengths)
+    inputs += list(corpus if corpus is not None else DEFAULT_CORPUS)
+    for text in inputs:
+        elapsed_ms = _time_search(compiled, text)
+        if elapsed_ms > budget_ms:
+            # Re-time once so a scheduler hiccup doesn't fail a lens
+            elapsed_ms = min(elapsed_ms, _time_search(compiled, text))
+
+        cost.inputs_tried += 1
+        if elapsed_ms > cost.worst_ms:
+            cost.worst_ms = elapsed_ms
+            cost.worst_input_length = len(text)
+        if elapsed_ms > budget_ms:
+            break
+
+    return cost
+
+
+def measure_validation_cost(pattern: str) -> PatternCost:
+    """
+    Time a pattern the way lens validation (GATE 5) does.
+
+    Only adversarial inputs (VALIDATION_PUMP_LENGTHS) are timed, against
+    VALIDATION_COST_BUDGET_MS; compare with cost.exceeds(VALIDATION_COST_BUDGET_MS).
+
+    Args:
+        pattern: Regex source
+
+    Returns:
+        PatternCost with the worst observed search time
+
+    Raises:
+        re.error: If the pattern does not compile
+    """
+    return measure_pattern_cost(
+        pattern,
+        corpus=(),
+        budget_ms=VALIDATION_COST_BUDGET_MS,
+        pump_lengths=VALIDATION_PUMP_LENGTHS,
+    )
+
+
+def _time_search(compiled: "re.Pattern", text: str) -> float:
+    started = time.perf_counter()
+    compiled.search(text)
+    return (time.perf_counter() - started) * 1000
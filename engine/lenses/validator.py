@@ -7,7 +7,7 @@ GATE 1: Schema validation - Required top-level sections must be present
 GATE 2: Canonical reference integrity - All references must be valid
 GATE 3: Connector reference validation - Connectors must exist in registry
 GATE 4: Identifier uniqueness - Keys must be unique
-GATE 5: Regex compilation validation - Patterns must be valid regex
+GATE 5: Regex validation - Patterns must compile and stay within the cost budget
 GATE 6: Smoke coverage validation - Every facet must have values
 GATE 7: Fail-fast enforcement - Errors abort immediately at load time
 
@@ -18,6 +18,12 @@ at lens load time (not at runtime).
 import re
 from typing import Any, Dict, List, Set
 
+from engine.lenses.regex_guard import (
+    VALIDATION_COST_BUDGET_MS,
+    find_backtracking_hazards,
+    measure_validation_cost,
+)
+
 
 class ValidationError(Exception):
     """Raised when lens configuration violates architectural contracts."""
@@ -59,7 +65,7 @@ def validate_lens_config(config: Dict[str, Any]) -> None:
         GATE 2: Canonical reference integrity
         GATE 3: Connector reference validation
         GATE 4: Identifier uniqueness
-        GATE 5: Regex compilation validation
+        GATE 5: Regex compilation + backtracking + cost validation
         GATE 6: Smoke coverage validation
         GATE 7: Fail-fast enforcement (implicit in all gates)
 
@@ -95,7 +101,7 @@ def validate_lens_config(config: Dict[str, Any]) -> None:
     _validate_unique_value_keys(values)
     # Facet key uniqueness implicitly enforced by dict structure
 
-    # GATE 5: Regex compilation validation
+    # GATE 5: Regex compilation + backtracking + cost validation
     _validate_regex_patterns(mapping_rules)
 
     # GATE 6: Smoke coverage validation
@@ -339,15 +345,23 @@ def _validate_connector_references(connector_rules: Dict[str, Any]) -> None:
 
 def _validate_regex_patterns(mapping_rules: List[Dict[str, Any]]) -> None:
     """
-    GATE 5: Regex compilation validation.
+    GATE 5: Regex compilation, backtracking and cost validation.
+
+    All mapping_rules.pattern must be valid regex patterns. Patterns run
+    against every field of every entity (including long descriptions), so
+    each must also be free of catastrophic-backtracking shapes and search
+    adversarial inputs within VALIDATION_COST_BUDGET_MS.
 
-    All mapping_rules.pattern must be valid regex patterns.
+    The budget is generous and only pump inputs are timed, so machine speed
+    does not decide whether a lens loads; lens-bench (engine.lenses.bench)
+    reports the full cost against the stricter bench budget.
 
     Args:
         mapping_rules: Mapping rules section of lens config
 
     Raises:
-        ValidationError: If any pattern is an invalid regex
+        ValidationError: If any pattern is an invalid regex, has a
+            catastrophic-backtracking shape, or exceeds the cost budget
     """
     for rule in mapping_rules:
         pattern = rule.get("pattern")
@@ -365,6 +379,22 @@ def _validate_regex_patterns(mapping_rules: List[Dict[str, Any]]) -> None:
                 f"Regex error: {e}"
             )
 
+        # Reject known exponential shapes before timing them
+        hazards = find_backtracking_hazards(pattern)
+        if hazards:
+            raise ValidationError(
+                f"Regex pattern in mapping rule for '{canonical}' is prone to "
+                f"catastrophic backtracking ({', '.join(hazards)}): {pattern}"
+            )
+
+        cost = measure_validation_cost(pattern)
+        if cost.exceeds(VALIDATION_COST_BUDGET_MS):
+            raise ValidationError(
+                f"Regex pattern in mapping rule for '{canonical}' exceeds cost budget: "
+                f"{cost.worst_ms:.1f}ms on a {cost.worst_input_length}-char input "
+                f"(budget {VALIDATION_COST_BUDGET_MS:.0f}ms): {pattern}"
+            )
+
 
 def _validate_facet_coverage(facets: Dict[str, Any], values: List[Dict[str, Any]]) -> None:
     """
@@ -0,0 +1,21 @@
+-- CreateTable
+CREATE TABLE "OrchestrationJob" (
+    "id" TEXT NOT NULL,
+    "query" TEXT NOT NULL,
+    "lens_id" TEXT,
+    "ingestion_mode" TEXT NOT NULL DEFAULT 'discover_many',
+    "persist" BOOLEAN NOT NULL DEFAULT false,
+    "status" TEXT NOT NULL DEFAULT 'queued',
+    "attempts" INTEGER NOT NULL DEFAULT 0,
+    "worker_id" TEXT,
+    "locked_at" TIMESTAMP(3),
+    "run_id" TEXT,
+    "error" TEXT,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "OrchestrationJob_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "OrchestrationJob_status_createdAt_idx" ON "OrchestrationJob"("status", "createdAt");
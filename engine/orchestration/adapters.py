@@ -13,16 +13,27 @@ import asyncio
 import time
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from prisma import Prisma
 
 from engine.ingestion.base import BaseConnector
+from engine.ingestion.circuit_breaker import CircuitBreaker
+from engine.ingestion.rate_limiting import RateLimitExceeded
+from engine.lenses.query_lens import get_active_lens
+from engine.orchestration.arrow_candidates import map_overture_batch
 from engine.orchestration.execution_context import ExecutionContext
 from engine.orchestration.execution_plan import ConnectorSpec
 from engine.orchestration.query_features import QueryFeatures
 from engine.orchestration.types import IngestRequest
 
+if TYPE_CHECKING:
+    from engine.ingestion.token_bucket import TokenBucketLimiter
+
+
+# Floor for the fetch timeout left after a rate-limit wait, so a token granted
+# right at the deadline still gets a chance to complete
+MIN_FETCH_TIMEOUT_SECONDS = 1.0
 
 def normalize_for_json(data: Any) -> Any:
     """
@@ -84,16 +95,29 @@ class ConnectorAdapter:
         }
     """
 
-    def __init__(self, connector: BaseConnector, spec: ConnectorSpec):
+    def __init__(
+        self,
+        connector: BaseConnector,
+        spec: ConnectorSpec,
+        rate_limiter: Optional["TokenBucketLimiter"] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
         """
         Initialize ConnectorAdapter.
 
         Args:
             connector: BaseConnector instance to adapt
             spec: ConnectorSpec with metadata (name, phase, trust_level, cost)
+            rate_limiter: Optional shared token-bucket limiter for the source;
+                execute() waits for a token before calling the connector
+                (unless the connector takes its own per request)
+            circuit_breaker: Optional per-connector breaker; execute() skips
+                the connector immediately while the circuit is open
         """
         self.connector = connector
         self.spec = spec
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
 
     async def execute(
         self,
@@ -107,13 +131,18 @@ class ConnectorAdapter:
         Execute connector and write results to state.
 
         This is the main entry point called by the Orchestrator. It:
+        0. Checks the circuit breaker - fails fast if the connector is down
         1. Checks rate limit (PL-004) - skips if at/over limit
+        1b. Waits for a token-bucket slot (per-minute/hour smoothing shared
+            across workers) - skips if the wait exceeds the connector timeout
         2. Translates query for connector-specific requirements
-        3. Calls connector.fetch() directly (async)
+        3. Calls connector.fetch() directly (async), fetch_batches() for
+           Arrow-native connectors, or iter_features() for streaming ones
         4. Extracts items from connector response
-        5. Maps each item to canonical candidate schema
+        5. Maps each item to canonical candidate schema (whole RecordBatches
+           at once on the Arrow-native path; as items arrive when streaming)
         6. Appends candidates to state.candidates
-        7. Records metrics in state.metrics
+        7. Records metrics in state.metrics (including breaker state changes)
         8. Handles errors gracefully (logs to state.errors)
 
         Args:
@@ -128,7 +157,36 @@ class ConnectorAdapter:
         candidates_added = 0
         mapping_failures = 0
 
+        breaker = self.circuit_breaker
+        transitions_before = len(breaker.transitions) if breaker is not None else 0
+        admitted = False
+        fetch_attempted = False
+
         try:
+            # Fail fast while the connector is known to be down, instead of
+            # waiting out its timeout on every run
+            if breaker is not None:
+                if not breaker.allow_request():
+                    error_msg = (
+                        f"Circuit open after repeated failures "
+                        f"(retry in {breaker.retry_after():.0f}s)"
+                    )
+                    state.errors.append({
+                        "connector": self.spec.name,
+                        "error": error_msg,
+                        "circuit_open": True
+                    })
+                    state.metrics[self.spec.name] = {
+                        "executed": False,
+                        "error": error_msg,
+                        "circuit_open": True,
+                        # The wait this run would otherwise have paid
+                        "time_saved_ms": int(self.spec.timeout_seconds * 1000),
+                        "cost_usd": 0.0
+                    }
+                    return
+                admitted = True
+
             # Check rate limit before executing (PL-004)
             if db is not None and not await self._check_rate_limit(db):
                 # At/over limit: skip connector, record error
@@ -146,33 +204,53 @@ class ConnectorAdapter:
                 }
                 return
 
+            # Smooth bursts across workers: wait for a token rather than fail.
+            # The wait is charged to the connector timeout so a call never
+            # takes longer than timeout_seconds end to end.
+            fetch_timeout = self.spec.timeout_seconds
+            if self.rate_limiter is not None and not self._limits_per_request():
+                waited = await self.rate_limiter.acquire(timeout=self.spec.timeout_seconds)
+                fetch_timeout = max(fetch_timeout - waited, MIN_FETCH_TIMEOUT_SECONDS)
+
             # Increment usage counter before execution (PL-004)
             if db is not None:
                 await self._increment_usage(db)
             # Translate query for connector-specific requirements
             # (e.g., Sport Scotland needs layer names, not natural language)
-            translated_query = self._translate_query(request.query, query_features)
+            translated_query = self._translate_query(request.query, query_features, request.lens)
 
             # Call connector.fetch() with timeout enforcement (PL-002)
-            results = await asyncio.wait_for(
-                self.connector.fetch(translated_query),
-                timeout=self.spec.timeout_seconds
-            )
-
-            # Extract items from connector-specific response format
-            items = self._extract_items(results)
-            items_received = len(items)
-
-            # Map each item to canonical candidate schema
-            for item in items:
-                try:
-                    candidate = self._map_to_candidate(item)
-                    state.candidates.append(candidate)
-                    candidates_added += 1
-                except Exception as e:
-                    # Track mapping failures for observability
-                    mapping_failures += 1
-                    # Don't raise - continue processing other items
+            fetch_attempted = True
+            results = await self._fetch(translated_query, timeout=fetch_timeout)
+
+            if self._is_arrow_native():
+                # Columnar mapping; raw rows stay in the batches until needed
+                for batch in results:
+                    items_received += batch.num_rows
+                    candidates, failures = map_overture_batch(batch, self.connector.source_name)
+                    state.candidates.extend(candidates)
+                    candidates_added += len(candidates)
+                    mapping_failures += failures
+            elif self._is_streaming():
+                # Items were mapped as they streamed in (see _map_stream)
+                items_received, candidates, mapping_failures = results
+                state.candidates.extend(candidates)
+                candidates_added = len(candidates)
+            else:
+                # Extract items from connector-specific response format
+                items = self._extract_items(results)
+                items_received = len(items)
+
+                # Map each item to canonical candidate schema
+                for item in items:
+                    try:
+                        candidate = self._map_to_candidate(item)
+                        state.candidates.append(candidate)
+                        candidates_added += 1
+                    except Exception as e:
+                        # Track mapping failures for observability
+                        mapping_failures += 1
+                        # Don't raise - continue processing other items
 
             # Record success metrics
             elapsed_ms = int((time.time() - start_time) * 1000)
@@ -184,6 +262,23 @@ class ConnectorAdapter:
                 "execution_time_ms": elapsed_ms,
                 "cost_usd": self.spec.estimated_cost_usd,
             }
+            # Mirrored connectors report when upstream data was unchanged
+            if getattr(self.connector, "last_not_modified", False) is True:
+                state.metrics[self.spec.name]["not_modified"] = True
+
+        except RateLimitExceeded as e:
+            # Token bucket wait would exceed the connector timeout: skip
+            state.errors.append({
+                "connector": self.spec.name,
+                "error": str(e),
+                "rate_limited": True
+            })
+            state.metrics[self.spec.name] = {
+                "executed": False,
+                "error": str(e),
+                "rate_limited": True,
+                "cost_usd": 0.0
+            }
 
         except asyncio.TimeoutError:
             # Timeout error: Connector exceeded timeout_seconds (PL-002)
@@ -226,19 +321,135 @@ class ConnectorAdapter:
                 "cost_usd": 0.0,  # No cost if failed
             }
 
+        finally:
+            if breaker is not None:
+                if admitted and not fetch_attempted:
+                    # Skipped before reaching the connector: no outcome to record
+                    breaker.release()
+                self._record_circuit_metrics(state, transitions_before)
+
+    def _is_arrow_native(self) -> bool:
+        """
+        True if the connector yields RecordBatches the adapter can map
+        column-wise (currently Overture release artifacts).
+        """
+        return (
+            self.connector.source_name == "overture_release"
+            and callable(getattr(type(self.connector), "fetch_batches", None))
+        )
+
+    def _limits_per_request(self) -> bool:
+        """
+        True if the connector takes a token from the same source limiter for
+        every upstream request (tiled OSM / SportScotland fetches), so a
+        token taken here would be charged twice.
+        """
+        return getattr(self.connector, "rate_limits_per_request", False) is True
+
+    def _is_streaming(self) -> bool:
+        """
+        True if the connector streams items as they are parsed
+        (iter_features, e.g. paged SportScotland WFS layers).
+        """
+        return callable(getattr(type(self.connector), "iter_features", None))
+
+    async def _map_stream(self, query: str) -> Tuple[int, List[Dict[str, Any]], int]:
+        """
+        Map streamed items to candidates as they arrive, so the raw response
+        is never held in full.
+
+        Args:
+            query: Connector-specific query
+
+        Returns:
+            Tuple of (items_received, candidates, mapping_failures)
+        """
+        items_received = 0
+        candidates = []
+        mapping_failures = 0
+        async for item in self.connector.iter_features(query):
+            items_received += 1
+            try:
+                candidates.append(self._map_to_candidate(item))
+            except Exception:
+                mapping_failures += 1
+        return items_received, candidates, mapping_failures
+
+    async def _fetch(self, query: str, timeout: Optional[float] = None) -> Any:
+        """
+        Call connector.fetch() (fetch_batches() for Arrow-native connectors,
+        iter_features() for streaming ones) under the connector timeout,
+        recording the outcome on the circuit breaker.
+
+        Args:
+            query: Connector-specific query
+            timeout: Remaining timeout budget in seconds (default: spec timeout)
+
+        Returns:
+            Raw connector response, a list of RecordBatches, or the
+            (items_received, candidates, mapping_failures) of a stream
+        """
+        breaker = self.circuit_breaker
+        if self._is_arrow_native():
+            fetch = self.connector.fetch_batches
+        elif self._is_streaming():
+            fetch = self._map_stream
+        else:
+            fetch = self.connector.fetch
+        try:
+            results = await asyncio.wait_for(
+                fetch(query),
+                timeout=self.spec.timeout_seconds if timeout is None else timeout
+            )
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.release()
+            raise
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+
+        if breaker is not None:
+            breaker.record_success()
+        return results
+
+    def _record_circuit_metrics(
+        self, state: "OrchestratorState", transitions_before: int
+    ) -> None:
+        """
+        Add circuit breaker state (and any changes during this call) to the
+        connector's run metrics.
+
+        Args:
+            state: Orchestrator state holding the metrics
+            transitions_before: len(breaker.transitions) at execute() start
+        """
+        metrics = state.metrics.get(self.spec.name)
+        if metrics is None:
+            return
+        breaker = self.circuit_breaker
+        metrics["circuit_state"] = breaker.state.value
+        new_transitions = breaker.transitions[transitions_before:]
+        if new_transitions:
+            metrics["circuit_transitions"] = [t.to_dict() for t in new_transitions]
+
     def _translate_query(
-        self, query: str, query_features: QueryFeatures
-    ) -> str:
+        self, query: str, query_features: QueryFeatures, lens_name: Optional[str] = None
+    ) -> Union[str, List[str]]:
         """
         Translate natural language query to connector-specific format.
 
         Different connectors have different input requirements:
         - Most connectors: Accept natural language queries directly
         - Sport Scotland: Requires WFS layer names (e.g., "tennis_courts", "pitches")
+        - OpenStreetMap: Multi-activity queries become a list of activity
+          terms, fetched with one union Overpass query
 
         Args:
             query: Natural language query from user
             query_features: Extracted query features (for sports detection)
+            lens_name: Lens whose vocabulary identifies activity terms
 
         Returns:
             Translated query appropriate for this connector
@@ -249,9 +460,43 @@ class ConnectorAdapter:
         if source == "sport_scotland":
             return self._translate_to_sport_scotland_layer(query, query_features)
 
+        if source == "openstreetmap":
+            return self._translate_to_osm_terms(query, lens_name)
+
         # All other connectors accept natural language queries
         return query
 
+    def _translate_to_osm_terms(
+        self, query: str, lens_name: Optional[str] = None
+    ) -> Union[str, List[str]]:
+        """
+        Translate a multi-activity query into OSM activity terms.
+
+        "tennis padel squash" would otherwise be one Overpass round trip per
+        term when fanned out; returning the terms lets OSMConnector combine
+        them into a single union query. Queries naming fewer than two lens
+        activity keywords (whole words) are passed through unchanged.
+
+        Args:
+            query: Natural language query (e.g., "tennis padel squash")
+            lens_name: Lens providing activity vocabulary (default lens if None)
+
+        Returns:
+            Activity terms in query order, or the original query
+        """
+        try:
+            lens = get_active_lens(lens_name)
+        except FileNotFoundError:
+            return query
+
+        matches = lens.match_keywords(query.strip().lower())
+        terms = []
+        for hit in sorted(matches.hits, key=lambda h: h.start):
+            if "activity" in hit.groups and hit.whole_word and hit.keyword not in terms:
+                terms.append(hit.keyword)
+
+        return terms if len(terms) > 1 else query
+
     def _translate_to_sport_scotland_layer(
         self, query: str, query_features: QueryFeatures
     ) -> str:
@@ -0,0 +1,206 @@
+"""
+Arrow-native candidate mapping for columnar connectors.
+
+Connectors that decode parquet (Overture) can hand the adapter pyarrow
+RecordBatches instead of Python dicts. The canonical candidate columns
+(ids, name, lat, lng, address) are computed for the whole batch with
+pyarrow.compute kernels; only the final per-candidate dicts are built in
+Python.
+
+Each candidate's "raw" is a LazyRawRow pointing back into its batch. The
+row is converted to a JSON-ready dict only when something reads it
+(persistence of an accepted entity), so candidates dropped by dedupe never
+pay for materialization or a full raw copy.
+
+pyarrow is imported lazily: only connectors that produce batches need it.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class LazyRawRow:
+    """
+    Raw payload of one RecordBatch row, decoded on first use.
+
+    Example:
+        >>> raw = LazyRawRow(batch, 3)
+        >>> payload = raw.materialize()  # JSON-ready dict, cached
+    """
+
+    __slots__ = ("_batch", "_index", "_value")
+
+    def __init__(self, batch: Any, index: int):
+        """
+        Initialize LazyRawRow.
+
+        Args:
+            batch: pyarrow.RecordBatch holding the row
+            index: Row index within the batch
+        """
+        self._batch = batch
+        self._index = index
+        self._value: Optional[Dict[str, Any]] = None
+
+    @property
+    def materialized(self) -> bool:
+        """True once the row has been decoded."""
+        return self._value is not None
+
+    def materialize(self) -> Dict[str, Any]:
+        """Decode the row into a JSON-serializable dict (cached)."""
+        if self._value is None:
+            # Imported here: adapters imports this module at load time
+            from engine.orchestration.adapters import normalize_for_json
+
+            row = self._batch.slice(self._index, 1).to_pylist()[0]
+            self._value = normalize_for_json(row)
+            self._batch = None  # Release the batch reference
+        return self._value
+
+
+def resolve_raw(raw: Any) -> Any:
+    """
+    Return a candidate's raw payload, materializing a LazyRawRow.
+
+    Args:
+        raw: candidate["raw"] (dict or LazyRawRow)
+
+    Returns:
+        JSON-serializable raw payload
+    """
+    if isinstance(raw, LazyRawRow):
+        return raw.materialize()
+    return raw
+
+
+def map_overture_batch(batch: Any, source: str = "overture_release") -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Map an Overture places RecordBatch to canonical candidates.
+
+    Column rules match ConnectorAdapter._map_overture_release:
+        - ids.overture: id (as string)
+        - name: non-blank `name`, else names.primary (or names.primary.value),
+          whitespace-trimmed; rows without one are mapping failures
+        - lat/lng: Point geometry coordinates ([lng, lat]); when geometry is
+          not a struct (WKB in published releases) the bbox centre is used
+        - address: first addresses[].freeform, when present
+
+    Args:
+        batch: pyarrow.RecordBatch from the connector
+        source: Candidate source name
+
+    Returns:
+        Tuple of (candidates, mapping_failures)
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    num_rows = batch.num_rows
+    if num_rows == 0:
+        return [], 0
+
+    ids = _column(batch, "id")
+    names = _name_column(batch, pa, pc)
+    if ids is None or names is None:
+        return [], num_rows
+
+    ids = pc.cast(ids, pa.string())
+    lat, lng = _coordinate_columns(batch, pa, pc)
+    address = _address_column(batch, pa, pc)
+
+    usable = pc.and_(pc.is_valid(ids), pc.is_valid(names))
+    row_indices = pc.indices_nonzero(usable).to_pylist()
+
+    id_values = ids.to_pylist()
+    name_values = names.to_pylist()
+    lat_values = lat.to_pylist() if lat is not None else None
+    lng_values = lng.to_pylist() if lng is not None else None
+    address_values = address.to_pylist() if address is not None else None
+
+    candidates = []
+    for index in row_indices:
+        candidate = {
+            "ids": {"overture": id_values[index]},
+            "lat": lat_values[index] if lat_values is not None else None,
+            "lng": lng_values[index] if lng_values is not None else None,
+            "name": name_values[index],
+            "source": source,
+            "raw": LazyRawRow(batch, index),
+        }
+        if address_values is not None and address_values[index]:
+            candidate["address"] = address_values[index]
+        candidates.append(candidate)
+
+    return candidates, num_rows - len(candidates)
+
+
+def _column(batch: Any, name: str) -> Optional[Any]:
+    index = batch.schema.get_field_index(name)
+    return batch.column(index) if index >= 0 else None
+
+
+def _struct_child(array: Any, field_name: str, pa: Any, pc: Any) -> Optional[Any]:
+    if array is None or not pa.types.is_struct(array.type):
+        return None
+    if array.type.get_field_index(field_name) < 0:
+        return None
+    return pc.struct_field(array, field_name)
+
+
+def _non_blank(array: Any, pa: Any, pc: Any) -> Optional[Any]:
+    if array is None:
+        return None
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        return None
+    trimmed = pc.utf8_trim_whitespace(array)
+    return pc.if_else(
+        pc.greater(pc.utf8_length(trimmed), 0), trimmed, pa.scalar(None, trimmed.type)
+    )
+
+
+def _name_column(batch: Any, pa: Any, pc: Any) -> Optional[Any]:
+    primary = _struct_child(_column(batch, "names"), "primary", pa, pc)
+    options = [
+        _non_blank(_column(batch, "name"), pa, pc),
+        _non_blank(primary, pa, pc),
+        _non_blank(_struct_child(primary, "value", pa, pc), pa, pc),
+    ]
+    options = [pc.cast(option, pa.string()) for option in options if option is not None]
+    if not options:
+        return None
+    return pc.coalesce(*options) if len(options) > 1 else options[0]
+
+
+def _coordinate_columns(batch: Any, pa: Any, pc: Any) -> Tuple[Optional[Any], Optional[Any]]:
+    geometry = _column(batch, "geometry")
+    geometry_type = _struct_child(geometry, "type", pa, pc)
+    coordinates = _struct_child(geometry, "coordinates", pa, pc)
+
+    if geometry_type is not None and coordinates is not None and pa.types.is_list(coordinates.type):
+        is_point = pc.and_kleene(
+            pc.equal(geometry_type, "Point"),
+            pc.greater_equal(pc.list_value_length(coordinates), 2),
+        )
+        # Fixed-size slice pads short lists with nulls, so element access is safe
+        pair = pc.list_slice(coordinates, 0, 2, return_fixed_size_list=True)
+        null_double = pa.scalar(None, pa.float64())
+        lng = pc.if_else(is_point, pc.cast(pc.list_element(pair, 0), pa.float64()), null_double)
+        lat = pc.if_else(is_point, pc.cast(pc.list_element(pair, 1), pa.float64()), null_double)
+        return lat, lng
+
+    bbox = _column(batch, "bbox")
+    bounds = [_struct_child(bbox, field, pa, pc) for field in ("xmin", "xmax", "ymin", "ymax")]
+    if any(bound is None for bound in bounds):
+        return None, None
+    xmin, xmax, ymin, ymax = (pc.cast(bound, pa.float64()) for bound in bounds)
+    lng = pc.divide(pc.add(xmin, xmax), 2.0)
+    lat = pc.divide(pc.add(ymin, ymax), 2.0)
+    return lat, lng
+
+
+def _address_column(batch: Any, pa: Any, pc: Any) -> Optional[Any]:
+    addresses = _column(batch, "addresses")
+    if addresses is None or not pa.types.is_list(addresses.type):
+        return None
+    first = pc.list_element(pc.list_slice(addresses, 0, 1, return_fixed_size_list=True), 0)
+    return _non_blank(_struct_child(first, "freeform", pa, pc), pa, pc)
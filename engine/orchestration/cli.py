@@ -3,6 +3,8 @@ CLI for Intelligent Ingestion Orchestration.
 
 Provides command-line interface for executing orchestrated ingestion:
 - python -m engine.orchestration.cli run "query string"
+- python -m engine.orchestration.cli enqueue "query string"  (add a job to the queue)
+- python -m engine.orchestration.cli worker                  (run queued jobs until stopped)
 
 Outputs a structured report with:
 - Query echo
@@ -21,77 +23,18 @@ from typing import Dict, Any
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent.parent / ".env")
 
-from engine.orchestration.planner import orchestrate
+# The planner, adapters and connector pool pull in Prisma, aiohttp, the
+# extraction pipeline and fuzzy matching; they are imported when a run starts
+# so that argument parsing and --help stay fast (see engine.orchestration.import_bench)
 from engine.orchestration.types import IngestRequest, IngestionMode
 from engine.orchestration.execution_context import ExecutionContext
-from engine.orchestration.adapters import ConnectorAdapter
-from engine.orchestration.orchestrator_state import OrchestratorState
-from engine.orchestration.query_features import QueryFeatures
-from engine.orchestration.execution_plan import (
-    ConnectorSpec as PlanConnectorSpec,
-    ExecutionPhase,
-)
 from engine.orchestration.registry import CONNECTOR_REGISTRY, get_connector_instance
-from engine.lenses.loader import VerticalLens, LensConfigError
+from engine.orchestration.lens_bootstrap import bootstrap_lens
+from engine.lenses.loader import LensConfigError
 
 import os
 
 
-def bootstrap_lens(lens_id: str) -> ExecutionContext:
-    """
-    Bootstrap: Load and validate lens configuration ONCE at CLI entry point.
-
-    Per docs/target-architecture.md 3.2: "Lens loading occurs only during engine bootstrap."
-    This function enforces the bootstrap boundary by loading the lens exactly
-    once and creating an ExecutionContext for runtime use.
-
-    Args:
-        lens_id: The lens identifier (e.g., "edinburgh_finds")
-
-    Returns:
-        ExecutionContext with validated lens contract
-
-    Raises:
-        LensConfigError: If lens validation fails (fail-fast per architecture)
-        FileNotFoundError: If lens file doesn't exist
-    """
-    # Load lens from disk
-    lens_path = Path(__file__).parent.parent / "lenses" / lens_id / "lens.yaml"
-
-    if not lens_path.exists():
-        raise FileNotFoundError(
-            f"Lens file not found: {lens_path}\n"
-            f"Available lenses should be in: engine/lenses/<lens_id>/lens.yaml"
-        )
-
-    # Load and validate lens (fail-fast on validation errors)
-    vertical_lens = VerticalLens(lens_path)
-
-    # Extract compiled, immutable lens contract (plain dict)
-    # Shallow copy for defensive programming
-    lens_contract = {
-        "mapping_rules": list(vertical_lens.mapping_rules),
-        "module_triggers": list(vertical_lens.module_triggers),
-        "modules": dict(vertical_lens.domain_modules),
-        "facets": dict(vertical_lens.facets),
-        "values": list(vertical_lens.values),
-        "confidence_threshold": vertical_lens.confidence_threshold,
-    }
-
-    # Compute deterministic content hash for reproducibility
-    import hashlib
-    import json
-    canonical_contract = json.dumps(lens_contract, sort_keys=True)
-    lens_hash = hashlib.sha256(canonical_contract.encode("utf-8")).hexdigest()
-
-    # Create and return ExecutionContext with lens metadata per docs/target-architecture.md 3.6
-    return ExecutionContext(
-        lens_id=lens_id,
-        lens_contract=lens_contract,
-        lens_hash=lens_hash
-    )
-
-
 # ANSI color codes for terminal output
 class Colors:
     """ANSI color codes for terminal formatting."""
@@ -158,6 +101,12 @@ def format_report(report: Dict[str, Any]) -> str:
     # Add persistence info if available
     if "persisted_count" in report:
         lines.append(f"  Persisted to DB:     {colorize(str(report['persisted_count']), Colors.GREEN)}")
+    if "db_connections" in report:
+        db_stats = report["db_connections"]
+        lines.append(
+            f"  DB Connections:      {db_stats['connects']} connects, "
+            f"{db_stats['disconnects']} disconnects ({db_stats['connect_seconds']:.3f}s)"
+        )
 
     lines.append("")
 
@@ -191,6 +140,11 @@ def format_report(report: Dict[str, Any]) -> str:
             f"  {colorize(f'{extraction_success}/{extraction_total}', status_color)} "
             f"entities extracted successfully"
         )
+        if report.get("extraction_reused"):
+            lines.append(
+                f"  {report['extraction_reused']} reused from unchanged payloads "
+                f"({report['extraction_reuse_rate']:.0%} reuse rate)"
+            )
 
         # List extraction failures if any
         extraction_errors = report.get("extraction_errors", [])
@@ -276,6 +230,14 @@ async def orchestrate_single_connector(
     connector selection while preserving adapter execution, metrics, and
     deduplication behavior.
     """
+    from engine.orchestration.adapters import ConnectorAdapter
+    from engine.orchestration.execution_plan import (
+        ConnectorSpec as PlanConnectorSpec,
+        ExecutionPhase,
+    )
+    from engine.orchestration.orchestrator_state import OrchestratorState
+    from engine.orchestration.query_features import QueryFeatures
+
     registry_spec = CONNECTOR_REGISTRY[connector_name]
     execution_spec = PlanConnectorSpec(
         name=registry_spec.name,
@@ -316,6 +278,82 @@ async def orchestrate_single_connector(
     }
 
 
+async def orchestrate(request: IngestRequest, *, ctx: ExecutionContext) -> Dict[str, Any]:
+    """Run the planner's orchestrate(), importing the planner on first use."""
+    from engine.orchestration.planner import orchestrate as run_orchestration
+
+    return await run_orchestration(request, ctx=ctx)
+
+
+async def _orchestrate_and_close_pool(request: IngestRequest, ctx) -> Dict[str, Any]:
+    """Run orchestrate(), then close the connector pool's HTTP session before the loop ends."""
+    from engine.orchestration.connector_pool import close_connector_pool
+
+    try:
+        return await orchestrate(request, ctx=ctx)
+    finally:
+        await close_connector_pool()
+
+
+async def enqueue_job(args: argparse.Namespace) -> str:
+    """Add a job to the orchestration queue and return its id."""
+    from engine.db import get_db_provider
+    from engine.orchestration.job_queue import create_job_queue, resolve_queue_backend
+
+    backend = resolve_queue_backend(args.queue)
+    provider = get_db_provider()
+    db = await provider.acquire() if backend == "postgres" else None
+    try:
+        queue = create_job_queue(backend, db=db, sqlite_path=args.sqlite_path)
+        return await queue.enqueue(
+            args.query,
+            lens_id=args.lens,
+            ingestion_mode=args.mode,
+            persist=args.persist,
+        )
+    finally:
+        if db is not None:
+            await provider.release()
+
+
+async def run_worker(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run an OrchestrationWorker until it is stopped (SIGINT/SIGTERM) or drained."""
+    import signal
+
+    from engine.db import get_db_provider
+    from engine.orchestration.job_queue import create_job_queue, resolve_queue_backend
+    from engine.orchestration.worker import OrchestrationWorker
+
+    backend = resolve_queue_backend(args.queue)
+    provider = get_db_provider()
+    db = await provider.acquire() if backend == "postgres" else None
+    try:
+        queue = create_job_queue(backend, db=db, sqlite_path=args.sqlite_path)
+        worker = OrchestrationWorker(
+            queue,
+            concurrency=args.concurrency,
+            poll_interval=args.poll_interval,
+            default_lens_id=args.lens or os.getenv("LENS_ID"),
+            stale_after_seconds=args.requeue_stale_after,
+        )
+
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, worker.stop)
+            except (NotImplementedError, RuntimeError):
+                pass  # Not supported on this platform; Ctrl+C still interrupts
+
+        print(colorize(
+            f"Worker {worker.worker_id} polling {backend} queue (concurrency {args.concurrency})",
+            Colors.CYAN,
+        ))
+        return await worker.run(max_jobs=args.max_jobs, drain=args.drain)
+    finally:
+        if db is not None:
+            await provider.release()
+
+
 def main():
     """
     CLI entry point for orchestration.
@@ -366,6 +404,80 @@ def main():
         help="Run exactly one connector by name (bypasses planner selection)",
     )
 
+    # enqueue command
+    enqueue_parser = subparsers.add_parser("enqueue", help="Add an orchestration job to the queue")
+    enqueue_parser.add_argument("query", type=str, help="Search query string")
+    enqueue_parser.add_argument(
+        "--mode",
+        type=str,
+        choices=["discover_many", "resolve_one"],
+        default="discover_many",
+        help="Ingestion mode (default: discover_many)",
+    )
+    enqueue_parser.add_argument(
+        "--persist",
+        action="store_true",
+        help="Persist accepted entities to database (default: False)",
+    )
+    enqueue_parser.add_argument(
+        "--lens",
+        type=str,
+        default=None,
+        help="Lens ID for the job (default: the worker's lens)",
+    )
+
+    # worker command
+    worker_parser = subparsers.add_parser("worker", help="Run queued orchestration jobs until stopped")
+    worker_parser.add_argument(
+        "--lens",
+        type=str,
+        default=None,
+        help="Lens for jobs that do not name one (default: LENS_ID environment variable)",
+    )
+    worker_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum jobs running at once (default: 4)",
+    )
+    worker_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between polls of an empty queue (default: 1.0)",
+    )
+    worker_parser.add_argument(
+        "--max-jobs",
+        type=int,
+        default=None,
+        help="Exit after running this many jobs",
+    )
+    worker_parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="Exit once the queue is empty",
+    )
+    worker_parser.add_argument(
+        "--requeue-stale-after",
+        type=float,
+        default=None,
+        help="At start-up, requeue jobs left running for more than this many seconds",
+    )
+
+    for queue_parser in (enqueue_parser, worker_parser):
+        queue_parser.add_argument(
+            "--queue",
+            choices=["postgres", "sqlite"],
+            default=None,
+            help="Job queue backend (default: ORCHESTRATION_QUEUE_BACKEND or postgres)",
+        )
+        queue_parser.add_argument(
+            "--sqlite-path",
+            type=str,
+            default=None,
+            help="SQLite queue file (default: engine/data/orchestration_jobs.sqlite3)",
+        )
+
     # Parse arguments
     args = parser.parse_args()
 
@@ -461,7 +573,7 @@ def main():
                 orchestrate_single_connector(args.connector, request, ctx=ctx)
             )
         else:
-            report = asyncio.run(orchestrate(request, ctx=ctx))
+            report = asyncio.run(_orchestrate_and_close_pool(request, ctx))
 
         # Format and print report
         formatted = format_report(report)
@@ -470,6 +582,26 @@ def main():
         # Exit successfully
         sys.exit(0)
 
+    if args.command == "enqueue":
+        job_id = asyncio.run(enqueue_job(args))
+        print(colorize(f"Queued job {job_id}", Colors.GREEN))
+        sys.exit(0)
+
+    if args.command == "worker":
+        if args.concurrency < 1:
+            print(colorize("ERROR: --concurrency must be at least 1", Colors.RED))
+            sys.exit(1)
+
+        try:
+            stats = asyncio.run(run_worker(args))
+        except (LensConfigError, FileNotFoundError) as e:
+            print(colorize(f"ERROR: {e}", Colors.RED))
+            sys.exit(1)
+
+        # Failed jobs are recorded in the queue; a clean shutdown still exits 0
+        print(f"Jobs completed: {stats['completed']}, failed: {stats['failed']}")
+        sys.exit(0)
+
 
 if __name__ == "__main__":
     main()
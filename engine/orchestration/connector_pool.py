@@ -0,0 +1,178 @@
+"""
+Connector instance pool.
+
+get_connector_instance() builds a connector from scratch: it parses
+sources.yaml, creates a Prisma client and, on every fetch, opens an HTTP
+session. Orchestration runs instead lease connectors from a process-wide
+ConnectorPool:
+
+- Released instances are kept idle and handed to the next run that asks for
+  the same connector, so a connector is built and warmed up once per process
+  rather than once per run.
+- Instances built from an older sources.yaml (different mtime or size) are
+  dropped and rebuilt, so configuration edits apply to the next run.
+- Every leased connector gets the run's database client (or the process-wide
+  client from engine.db) and one shared aiohttp session instead of its own.
+- BaseConnector.warm_up() is awaited once, when an instance is built.
+
+A leased instance belongs to one run until it is released; concurrent runs
+asking for the same connector get separate instances.
+
+Example:
+    connector = await acquire_connector("serper", db=db)
+    try:
+        results = await connector.fetch("padel edinburgh")
+    finally:
+        release_connector(connector)
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from engine.db import get_db_provider
+from engine.ingestion.base import BaseConnector
+from engine.ingestion.sources_config import DEFAULT_SOURCES_CONFIG, sources_config_signature
+from engine.orchestration.registry import get_connector_instance
+
+if TYPE_CHECKING:
+    import aiohttp
+    from prisma import Prisma
+
+
+# Idle instances kept per connector name
+DEFAULT_MAX_IDLE_PER_CONNECTOR = 4
+
+
+class ConnectorPool:
+    """
+    Reusable connector instances with a shared database client and HTTP session.
+
+    Attributes:
+        built: Instances constructed so far
+        reused: Leases served by an idle instance
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., BaseConnector] = get_connector_instance,
+        config_path: str = DEFAULT_SOURCES_CONFIG,
+        max_idle_per_connector: int = DEFAULT_MAX_IDLE_PER_CONNECTOR,
+    ):
+        """
+        Args:
+            factory: Builds a connector from (name, db=client)
+            config_path: sources.yaml whose changes invalidate idle instances
+            max_idle_per_connector: Idle instances kept per connector name
+        """
+        self.factory = factory
+        self.config_path = config_path
+        self.max_idle_per_connector = max_idle_per_connector
+        self.built = 0
+        self.reused = 0
+        self._idle: Dict[str, List[Tuple[Any, BaseConnector]]] = {}
+        self._leased: Dict[int, Tuple[str, Any]] = {}
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _shared_db(self) -> "Prisma":
+        """Client for connectors leased without one: the process-wide client."""
+        return get_db_provider().client
+
+    def _http_session(self) -> "aiohttp.ClientSession":
+        """Shared session of the running event loop."""
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # A session cannot outlive its loop; runs under a new asyncio.run() get a new one
+            self._session = aiohttp.ClientSession()
+            self._session_loop = loop
+        return self._session
+
+    async def acquire(self, connector_name: str, db: Optional["Prisma"] = None) -> BaseConnector:
+        """
+        Lease a connector for one run.
+
+        Args:
+            connector_name: Name of the connector (must exist in CONNECTOR_REGISTRY)
+            db: The run's Prisma client (default: the process-wide client)
+
+        Returns:
+            BaseConnector with db and http_session injected
+
+        Raises:
+            KeyError: If connector_name is not in CONNECTOR_REGISTRY
+        """
+        signature = sources_config_signature(self.config_path)
+        idle = self._idle.get(connector_name, [])
+
+        connector = None
+        while idle:
+            built_for, candidate = idle.pop()
+            if built_for == signature:
+                connector = candidate
+                break
+
+        if connector is None:
+            connector = self.factory(connector_name, db=db if db is not None else self._shared_db())
+            await connector.warm_up()
+            self.built += 1
+        else:
+            self.reused += 1
+
+        connector.db = db if db is not None else self._shared_db()
+        connector.http_session = self._http_session()
+        self._leased[id(connector)] = (connector_name, signature)
+        return connector
+
+    def release(self, connector: BaseConnector) -> None:
+        """
+        Return a leased connector to the pool.
+
+        Connectors the pool did not lease are ignored.
+        """
+        leased = self._leased.pop(id(connector), None)
+        if leased is None:
+            return
+
+        connector_name, signature = leased
+        # Do not keep the finished run's client alive through an idle instance
+        connector.db = self._shared_db()
+        idle = self._idle.setdefault(connector_name, [])
+        if len(idle) < self.max_idle_per_connector:
+            idle.append((signature, connector))
+
+    async def close(self) -> None:
+        """Drop idle instances and close the shared HTTP session."""
+        self._idle.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+
+_default_pool: Optional[ConnectorPool] = None
+
+
+def get_connector_pool() -> ConnectorPool:
+    """Process-wide pool used by orchestration runs."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = ConnectorPool()
+    return _default_pool
+
+
+async def acquire_connector(connector_name: str, db: Optional["Prisma"] = None) -> BaseConnector:
+    """Lease a connector from the process-wide pool (see ConnectorPool.acquire)."""
+    return await get_connector_pool().acquire(connector_name, db=db)
+
+
+def release_connector(connector: BaseConnector) -> None:
+    """Return a connector to the process-wide pool."""
+    get_connector_pool().release(connector)
+
+
+async def close_connector_pool() -> None:
+    """Close the process-wide pool's HTTP session and drop its idle instances."""
+    if _default_pool is not None:
+        await _default_pool.close()
@@ -7,6 +7,8 @@ from prisma import Prisma, Json
 from prisma.models import ExtractedEntity
 from engine.extraction.deduplication import SlugGenerator
 from engine.extraction.merging import EntityMerger, TrustHierarchy
+from engine.extraction.relens import save_contract_snapshot
+from engine.lenses.ops import attach_entities_to_lenses, record_applied_lens_hash
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +23,9 @@ class EntityFinalizer:
 
     async def finalize_entities(
         self,
-        orchestration_run_id: str
+        orchestration_run_id: str,
+        context: Optional[Any] = None,
+        extracted_entity_ids: Optional[List[str]] = None,
     ) -> Dict[str, int]:
         """
         Finalize all ExtractedEntity records for an orchestration run.
@@ -31,9 +35,16 @@ class EntityFinalizer:
         2. Group by deduplication key (slug or external_id)
         3. For each group, create or update Entity
         4. Generate slugs for URLs
+        5. Attach to the lens and record its hash (if context carries one)
 
         Args:
             orchestration_run_id: OrchestrationRun ID
+            context: Optional ExecutionContext; when it carries a lens_hash the
+                     finalized entities are attached to its lens and stamped
+                     with the hash so the re-lens job can later diff against
+                     the contract they were built with
+            extracted_entity_ids: Earlier ExtractedEntity records the run reused
+                     instead of extracting again (persistence reused_entity_ids)
 
         Returns:
             Stats dict: {"entities_created": N, "entities_updated": M, "conflicts": K}
@@ -49,12 +60,12 @@ class EntityFinalizer:
         # 2. Load extracted entities created during or after this orchestration run
         # This handles the case where RawIngestion records are reused (duplicates)
         # but new ExtractedEntity records are still created
+        # Reused extractions predate the run and are linked by id
+        where = {"createdAt": {"gte": orchestration_run.createdAt}}
+        if extracted_entity_ids:
+            where = {"OR": [where, {"id": {"in": list(extracted_entity_ids)}}]}
         extracted_entities = await self.db.extractedentity.find_many(
-            where={
-                "createdAt": {
-                    "gte": orchestration_run.createdAt
-                }
-            },
+            where=where,
             include={"raw_ingestion": True}
         )
 
@@ -66,6 +77,7 @@ class EntityFinalizer:
 
         # 3. Finalize each group
         stats = {"entities_created": 0, "entities_updated": 0, "conflicts": 0}
+        finalized_ids = []
 
         for identity_key, group in entity_groups.items():
             finalized_data = await self._finalize_group(group)
@@ -80,11 +92,23 @@ class EntityFinalizer:
                     where={"id": existing.id},
                     data=finalized_data
                 )
+                finalized_ids.append(existing.id)
                 stats["entities_updated"] += 1
             else:
-                await self.db.entity.create(data=finalized_data)
+                created = await self.db.entity.create(data=finalized_data)
+                finalized_ids.append(created.id)
                 stats["entities_created"] += 1
 
+        # 5. Attach the entities to the lens that produced their canonical_* /
+        # modules and record that lens contract's hash on the memberships
+        lens_hash = getattr(context, "lens_hash", None)
+        if lens_hash and finalized_ids:
+            save_contract_snapshot(context.lens_id, lens_hash, context.lens_contract)
+            await attach_entities_to_lenses(
+                [(context.lens_id, entity_id) for entity_id in finalized_ids], db=self.db
+            )
+            await record_applied_lens_hash(self.db, context.lens_id, finalized_ids, lens_hash)
+
         return stats
 
     def _group_by_identity(
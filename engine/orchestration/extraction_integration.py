@@ -6,12 +6,16 @@ extraction of entities from RawIngestion records. Distinguishes between structur
 sources (which skip LLM extraction) and unstructured sources (which require it).
 """
 
+import hashlib
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from prisma import Prisma
-from engine.extraction.run import get_extractor_for_source
+from engine.extraction.config import load_extraction_config
+from engine.extraction.run import get_extractor_class, get_extractor_for_source
+from engine.ingestion.raw_store import read_raw_text
 from engine.orchestration.execution_context import ExecutionContext
 
 
@@ -29,6 +33,9 @@ UNSTRUCTURED_SOURCES = {
     "openstreetmap",     # OSM - free-form tags with no standard schema
 }
 
+# One extractor instance per source, when enabled by share_extractors()
+_shared_extractors: Optional[Dict[str, Any]] = None
+
 
 def _create_minimal_context() -> ExecutionContext:
     """Create minimal ExecutionContext for extraction without full lens contract."""
@@ -82,10 +89,93 @@ def needs_extraction(source: str) -> bool:
     return True
 
 
+def share_extractors(enabled: bool = True) -> None:
+    """
+    Reuse one extractor instance per source instead of building one per record.
+
+    Long-lived workers enable this so LLM clients and prompt templates are
+    created once per process. Extractors run synchronously, so concurrent
+    orchestrations on one event loop never interleave inside an instance.
+
+    Args:
+        enabled: True to share instances, False to drop them and build per record
+    """
+    global _shared_extractors
+    _shared_extractors = {} if enabled else None
+
+
+def _extractor_for(source: str) -> Any:
+    """Extractor for a source: the shared instance if sharing is enabled."""
+    if _shared_extractors is None:
+        return get_extractor_for_source(source)
+    extractor = _shared_extractors.get(source)
+    if extractor is None:
+        extractor = get_extractor_for_source(source)
+        _shared_extractors[source] = extractor
+    return extractor
+
+
+@lru_cache(maxsize=1)
+def _configured_llm_model() -> Optional[str]:
+    """LLM model from extraction.yaml (None if it cannot be loaded)."""
+    try:
+        return load_extraction_config()["llm"]["model"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _lens_fingerprint(context: Optional[Any]) -> str:
+    """The context's lens_hash, or a hash of its contract when it has none."""
+    if context is None:
+        return "none"
+    lens_hash = getattr(context, "lens_hash", None)
+    if lens_hash:
+        return str(lens_hash)
+    contract = getattr(context, "lens_contract", None) or {}
+    return hashlib.sha256(
+        json.dumps(contract, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def extraction_reuse_key(content_hash: str, source: str, context: Optional[Any] = None) -> Optional[str]:
+    """
+    Key under which an extraction of a raw payload can be reused.
+
+    Covers everything extract_entity's output depends on: the raw payload
+    hash, the extractor and its extractor_version, the lens contract and,
+    for sources that need LLM extraction, the configured model. Stored as
+    ExtractedEntity.extraction_hash.
+
+    Args:
+        content_hash: RawIngestion hash of the payload
+        source: Source connector name
+        context: Optional ExecutionContext with lens contract
+
+    Returns:
+        SHA-256 hex key, or None if the source has no extractor
+    """
+    try:
+        extractor_class = get_extractor_class(source)
+    except ValueError:
+        return None
+
+    model = _configured_llm_model() if needs_extraction(source) else None
+    key_input = "|".join([
+        content_hash,
+        source,
+        f"{extractor_class.__name__}:{extractor_class.extractor_version}",
+        _lens_fingerprint(context),
+        model or "none",
+    ])
+    return hashlib.sha256(key_input.encode("utf-8")).hexdigest()
+
+
 async def extract_entity(
     raw_ingestion_id: str,
     db: Prisma,
-    context: Optional[Any] = None
+    context: Optional[Any] = None,
+    raw_data: Optional[Any] = None,
+    raw_ingestion: Optional[Any] = None,
 ) -> Dict[str, Any]:
     """
     Extract entity data from a RawIngestion record using the hybrid extraction engine.
@@ -93,10 +183,17 @@ async def extract_entity(
     Loads the raw data from disk, selects the appropriate extractor for the source,
     and runs the complete extraction pipeline: extract -> validate -> split_attributes.
 
+    Callers that already hold the parsed payload and the record (persistence,
+    which has just created both) pass them in, and the record lookup and the
+    raw file read are skipped.
+
     Args:
         raw_ingestion_id: ID of the RawIngestion record to extract
         db: Prisma database client
         context: Optional ExecutionContext with lens contract
+        raw_data: Optional parsed raw payload (skips reading the raw file)
+        raw_ingestion: Optional RawIngestion record, or any object with its
+            source (skips the database lookup)
 
     Returns:
         Dict with extracted entity data:
@@ -118,33 +215,35 @@ async def extract_entity(
         >>>     print(result["attributes"]["name"])  # "Test Venue"
     """
     # Step 1: Load RawIngestion record
-    raw_ingestion = await db.rawingestion.find_unique(
-        where={"id": raw_ingestion_id}
-    )
+    if raw_ingestion is None:
+        raw_ingestion = await db.rawingestion.find_unique(
+            where={"id": raw_ingestion_id}
+        )
 
-    if not raw_ingestion:
-        raise ValueError(f"RawIngestion record not found: {raw_ingestion_id}")
+        if not raw_ingestion:
+            raise ValueError(f"RawIngestion record not found: {raw_ingestion_id}")
 
     source = raw_ingestion.source
-    file_path = raw_ingestion.file_path
 
     # Step 2: Load raw data from file
-    try:
-        raw_data_path = Path(file_path)
-        raw_data_str = raw_data_path.read_text(encoding="utf-8")
-        raw_data = json.loads(raw_data_str)
-    except (FileNotFoundError, OSError) as e:
-        raise IOError(
-            f"Failed to load raw data from {file_path}: {str(e)}"
-        ) from e
-    except json.JSONDecodeError as e:
-        raise IOError(
-            f"Failed to parse JSON from {file_path}: {str(e)}"
-        ) from e
+    if raw_data is None:
+        file_path = raw_ingestion.file_path
+        try:
+            raw_data_path = Path(file_path)
+            raw_data_str = read_raw_text(raw_data_path)
+            raw_data = json.loads(raw_data_str)
+        except (FileNotFoundError, OSError) as e:
+            raise IOError(
+                f"Failed to load raw data from {file_path}: {str(e)}"
+            ) from e
+        except json.JSONDecodeError as e:
+            raise IOError(
+                f"Failed to parse JSON from {file_path}: {str(e)}"
+            ) from e
 
     # Step 3: Get appropriate extractor for source
     try:
-        extractor = get_extractor_for_source(source)
+        extractor = _extractor_for(source)
     except ValueError as e:
         raise ValueError(
             f"No extractor found for source: {source}"
@@ -0,0 +1,196 @@
+"""
+import-bench: startup cost of the orchestration CLI.
+
+Imports a module in a fresh interpreter under `python -X importtime`, sums
+the self time of every imported module and lists the heaviest imports. It
+also reports which dependencies that should only load once a run starts
+(Prisma, aiohttp, the LLM stack, connector and extractor modules) were
+imported anyway, so an eager import creeping back in shows up here.
+
+Usage:
+    python -m engine.orchestration.import_bench
+    python -m engine.orchestration.import_bench --module engine.orchestration.cli --top 15 --budget-ms 150
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+DEFAULT_MODULE = "engine.orchestration.cli"
+
+# Modules that must not be imported just to parse CLI arguments
+DEFERRED_MODULES = (
+    "prisma",
+    "aiohttp",
+    "anthropic",
+    "instructor",
+    "fuzzywuzzy",
+    "engine.orchestration.planner",
+    "engine.ingestion.connectors",
+    "engine.extraction.extractors",
+)
+
+
+@dataclass
+class ImportTiming:
+    """
+    One line of -X importtime output.
+
+    Attributes:
+        module: Imported module name
+        self_us: Time spent importing the module itself (microseconds)
+        cumulative_us: Time including the module's own imports (microseconds)
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class ImportBenchmark:
+    """
+    Import profile of one module.
+
+    Attributes:
+        module: Module that was imported
+        timings: Every import, in the order importtime reported it
+        deferred_loaded: DEFERRED_MODULES that were imported anyway
+    """
+
+    module: str
+    timings: List[ImportTiming] = field(default_factory=list)
+    deferred_loaded: List[str] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        """Sum of every module's self time."""
+        return sum(t.self_us for t in self.timings) / 1000
+
+    @property
+    def module_ms(self) -> float:
+        """Cumulative import time of the benchmarked module."""
+        for timing in self.timings:
+            if timing.module == self.module:
+                return timing.cumulative_us / 1000
+        return 0.0
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Parse `python -X importtime` stderr.
+
+    Args:
+        output: Captured stderr
+
+    Returns:
+        ImportTiming list (header and unrelated lines are skipped)
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # Column header
+        timings.append(ImportTiming(parts[2].strip(), self_us, cumulative_us))
+    return timings
+
+
+def find_deferred(timings: Sequence[ImportTiming], deferred: Sequence[str] = DEFERRED_MODULES) -> List[str]:
+    """Return the deferred modules (or their submodules) that appear in timings."""
+    imported = {t.module for t in timings}
+    return [
+        name for name in deferred
+        if any(module == name or module.startswith(name + ".") for module in imported)
+    ]
+
+
+def bench_import(module: str = DEFAULT_MODULE, python: str = sys.executable) -> ImportBenchmark:
+    """
+    Import module in a fresh interpreter and profile it.
+
+    Args:
+        module: Dotted module name to import
+        python: Interpreter to run
+
+    Returns:
+        ImportBenchmark
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr.strip()[-2000:]}")
+
+    timings = parse_importtime(completed.stderr)
+    return ImportBenchmark(module=module, timings=timings, deferred_loaded=find_deferred(timings))
+
+
+def format_import_report(result: ImportBenchmark, top: int = 10) -> str:
+    """Format bench_import results for CLI output."""
+    lines = [
+        f"import-bench: {result.module}",
+        f"  module cumulative: {result.module_ms:.1f}ms",
+        f"  interpreter total: {result.total_ms:.1f}ms ({len(result.timings)} modules)",
+        f"  {'cumul ms':>9}  {'self ms':>8}  module",
+    ]
+    heaviest = sorted(result.timings, key=lambda t: t.cumulative_us, reverse=True)[:top]
+    for timing in heaviest:
+        lines.append(f"  {timing.cumulative_us / 1000:>9.1f}  {timing.self_us / 1000:>8.1f}  {timing.module}")
+    if result.deferred_loaded:
+        lines.append(f"  eagerly imported: {', '.join(result.deferred_loaded)}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="import-bench - report the startup import cost of a module",
+    )
+    parser.add_argument(
+        "--module",
+        default=DEFAULT_MODULE,
+        help=f"Module to import (default: {DEFAULT_MODULE})",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Show the N heaviest imports (default: 10)",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Fail when the module's cumulative import time exceeds this",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        result = bench_import(args.module)
+    except RuntimeError as e:
+        print(str(e))
+        return 1
+
+    print(format_import_report(result, top=args.top))
+
+    # Non-zero exit when a deferred dependency is imported eagerly or the budget is blown
+    over_budget = args.budget_ms is not None and result.module_ms > args.budget_ms
+    return 1 if result.deferred_loaded or over_budget else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
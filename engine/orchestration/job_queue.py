@@ -0,0 +1,296 @@
+"""
+Orchestration job queue for long-lived workers.
+
+`engine.orchestration.cli enqueue` adds jobs; `engine.orchestration.cli worker`
+claims and runs them (see engine.orchestration.worker). Two stores:
+
+- PostgresJobQueue - the OrchestrationJob table. Workers claim with
+  `FOR UPDATE SKIP LOCKED`, so any number of workers on any host pull
+  disjoint jobs without blocking each other.
+- SQLiteJobQueue   - local file for development without Postgres; claims run
+  inside BEGIN IMMEDIATE, so workers on one host never claim the same job.
+
+Job lifecycle: queued -> running -> completed | failed. A job left running
+by a worker that died is put back with requeue_stale().
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+DEFAULT_SQLITE_PATH = Path(__file__).parent.parent / "data" / "orchestration_jobs.sqlite3"
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class QueuedJob:
+    """
+    A claimed orchestration job.
+
+    Attributes:
+        id: Job identifier
+        query: Query to orchestrate
+        lens_id: Lens to run under (None: the worker's default lens)
+        ingestion_mode: IngestionMode value
+        persist: Whether accepted entities are persisted
+        attempts: Times the job has been claimed, including this one
+    """
+
+    id: str
+    query: str
+    lens_id: Optional[str] = None
+    ingestion_mode: str = "discover_many"
+    persist: bool = False
+    attempts: int = 1
+
+
+class SQLiteJobQueue:
+    """
+    Job queue in a local SQLite file, shared by workers on one host.
+
+    Claims run inside BEGIN IMMEDIATE, which holds SQLite's write lock while
+    queued rows are selected and marked running.
+    """
+
+    def __init__(self, path: Path = DEFAULT_SQLITE_PATH, busy_timeout_seconds: float = 30.0):
+        self.path = Path(path)
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS orchestration_job ("
+                " id TEXT PRIMARY KEY,"
+                " query TEXT NOT NULL,"
+                " lens_id TEXT,"
+                " ingestion_mode TEXT NOT NULL,"
+                " persist INTEGER NOT NULL,"
+                " status TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " worker_id TEXT,"
+                " locked_at REAL,"
+                " run_id TEXT,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS orchestration_job_status_created "
+                "ON orchestration_job (status, created_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout_seconds,
+                isolation_level=None,  # Explicit BEGIN/COMMIT below
+            )
+            self._local.conn = conn
+        return conn
+
+    def _enqueue_sync(self, query: str, lens_id: Optional[str], ingestion_mode: str, persist: bool) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._connect().execute(
+            "INSERT INTO orchestration_job (id, query, lens_id, ingestion_mode, persist, status, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (job_id, query, lens_id, ingestion_mode, int(persist), QUEUED, now, now),
+        )
+        return job_id
+
+    def _claim_sync(self, worker_id: str, limit: int) -> List[QueuedJob]:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT id, query, lens_id, ingestion_mode, persist, attempts FROM orchestration_job "
+                "WHERE status = ? ORDER BY created_at LIMIT ?",
+                (QUEUED, limit),
+            ).fetchall()
+            now = time.time()
+            conn.executemany(
+                "UPDATE orchestration_job SET status = ?, worker_id = ?, locked_at = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                [(RUNNING, worker_id, now, now, row[0]) for row in rows],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return [
+            QueuedJob(
+                id=job_id,
+                query=query,
+                lens_id=lens_id,
+                ingestion_mode=ingestion_mode,
+                persist=bool(persist),
+                attempts=attempts + 1,
+            )
+            for job_id, query, lens_id, ingestion_mode, persist, attempts in rows
+        ]
+
+    def _finish_sync(self, job_id: str, status: str, run_id: Optional[str], error: Optional[str]) -> None:
+        self._connect().execute(
+            "UPDATE orchestration_job SET status = ?, run_id = ?, error = ?, updated_at = ? WHERE id = ?",
+            (status, run_id, error, time.time(), job_id),
+        )
+
+    def _requeue_stale_sync(self, stale_after_seconds: float) -> int:
+        now = time.time()
+        cursor = self._connect().execute(
+            "UPDATE orchestration_job SET status = ?, worker_id = NULL, locked_at = NULL, updated_at = ? "
+            "WHERE status = ? AND locked_at < ?",
+            (QUEUED, now, RUNNING, now - stale_after_seconds),
+        )
+        return cursor.rowcount
+
+    # SQLite blocks on the file lock; keep the event loop free
+    async def enqueue(
+        self,
+        query: str,
+        lens_id: Optional[str] = None,
+        ingestion_mode: str = "discover_many",
+        persist: bool = False,
+    ) -> str:
+        return await asyncio.to_thread(self._enqueue_sync, query, lens_id, ingestion_mode, persist)
+
+    async def claim(self, worker_id: str, limit: int = 1) -> List[QueuedJob]:
+        return await asyncio.to_thread(self._claim_sync, worker_id, limit)
+
+    async def complete(self, job_id: str, run_id: Optional[str] = None) -> None:
+        await asyncio.to_thread(self._finish_sync, job_id, COMPLETED, run_id, None)
+
+    async def fail(self, job_id: str, error: str, run_id: Optional[str] = None) -> None:
+        await asyncio.to_thread(self._finish_sync, job_id, FAILED, run_id, error)
+
+    async def requeue_stale(self, stale_after_seconds: float) -> int:
+        return await asyncio.to_thread(self._requeue_stale_sync, stale_after_seconds)
+
+
+class PostgresJobQueue:
+    """
+    Job queue in the OrchestrationJob table, shared by every worker.
+
+    claim() marks the oldest queued rows running in one statement; rows
+    locked by another worker's claim are skipped rather than waited on.
+    """
+
+    def __init__(self, db):
+        """
+        Args:
+            db: Connected Prisma client
+        """
+        self.db = db
+
+    async def enqueue(
+        self,
+        query: str,
+        lens_id: Optional[str] = None,
+        ingestion_mode: str = "discover_many",
+        persist: bool = False,
+    ) -> str:
+        job = await self.db.orchestrationjob.create(
+            data={
+                "query": query,
+                "lens_id": lens_id,
+                "ingestion_mode": ingestion_mode,
+                "persist": persist,
+                "status": QUEUED,
+            }
+        )
+        return job.id
+
+    async def claim(self, worker_id: str, limit: int = 1) -> List[QueuedJob]:
+        rows = await self.db.query_raw(
+            'UPDATE "OrchestrationJob" SET "status" = $1, "worker_id" = $2, "locked_at" = NOW(), '
+            '"attempts" = "attempts" + 1, "updatedAt" = NOW() '
+            'WHERE "id" IN ('
+            ' SELECT "id" FROM "OrchestrationJob" WHERE "status" = $3'
+            ' ORDER BY "createdAt" LIMIT $4 FOR UPDATE SKIP LOCKED'
+            ') '
+            'RETURNING "id", "query", "lens_id", "ingestion_mode", "persist", "attempts", "createdAt"',
+            RUNNING,
+            worker_id,
+            QUEUED,
+            limit,
+        )
+        rows = sorted(rows, key=lambda row: row["createdAt"])
+        return [
+            QueuedJob(
+                id=row["id"],
+                query=row["query"],
+                lens_id=row["lens_id"],
+                ingestion_mode=row["ingestion_mode"],
+                persist=bool(row["persist"]),
+                attempts=row["attempts"],
+            )
+            for row in rows
+        ]
+
+    async def complete(self, job_id: str, run_id: Optional[str] = None) -> None:
+        await self.db.orchestrationjob.update(
+            where={"id": job_id},
+            data={"status": COMPLETED, "run_id": run_id, "error": None},
+        )
+
+    async def fail(self, job_id: str, error: str, run_id: Optional[str] = None) -> None:
+        await self.db.orchestrationjob.update(
+            where={"id": job_id},
+            data={"status": FAILED, "run_id": run_id, "error": error},
+        )
+
+    async def requeue_stale(self, stale_after_seconds: float) -> int:
+        return await self.db.execute_raw(
+            'UPDATE "OrchestrationJob" SET "status" = $1, "worker_id" = NULL, "locked_at" = NULL, '
+            '"updatedAt" = NOW() '
+            'WHERE "status" = $2 AND "locked_at" < NOW() - make_interval(secs => $3)',
+            QUEUED,
+            RUNNING,
+            float(stale_after_seconds),
+        )
+
+
+def resolve_queue_backend(backend: Optional[str] = None) -> str:
+    """Backend name: the argument, else ORCHESTRATION_QUEUE_BACKEND, else "postgres"."""
+    return backend or os.getenv("ORCHESTRATION_QUEUE_BACKEND") or "postgres"
+
+
+def create_job_queue(backend: Optional[str] = None, db=None, sqlite_path: Optional[Path] = None):
+    """
+    Create the job queue for a worker or enqueue command.
+
+    See resolve_queue_backend() for how the backend is chosen.
+
+    Args:
+        backend: "postgres" (default) or "sqlite"
+        db: Connected Prisma client (required for the postgres backend)
+        sqlite_path: SQLite file (default engine/data/orchestration_jobs.sqlite3)
+
+    Returns:
+        Job queue instance
+
+    Raises:
+        ValueError: If the backend is unknown, or postgres is selected without db
+    """
+    backend = resolve_queue_backend(backend)
+
+    if backend == "sqlite":
+        return SQLiteJobQueue(Path(sqlite_path) if sqlite_path else DEFAULT_SQLITE_PATH)
+    if backend == "postgres":
+        if db is None:
+            raise ValueError("Postgres job queue requires a connected Prisma client")
+        return PostgresJobQueue(db)
+    raise ValueError(f"Unknown job queue backend: {backend}")
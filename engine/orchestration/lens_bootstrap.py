@@ -0,0 +1,143 @@
+"""
+Lens bootstrap for the orchestration runtime.
+
+Loads a lens.yaml, validates it, compiles it into the plain-dict lens
+contract and wraps it in an ExecutionContext. Shared by the orchestration
+CLI, the re-lens job and the lens watcher so every entry point compiles
+and hashes contracts identically.
+
+Compiled contracts are kept in the warm bootstrap snapshot (engine.bootstrap)
+keyed by the lens.yaml content hash, so starting a process with an unchanged
+lens skips YAML parsing and validation.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from engine.bootstrap import load_compiled
+from engine.lenses.loader import VerticalLens
+from engine.orchestration.execution_context import ExecutionContext
+
+
+# Lens directory layout: engine/lenses/<lens_id>/lens.yaml
+LENSES_DIR = Path(__file__).parent.parent / "lenses"
+
+
+def resolve_lens_path(lens_id: str) -> Path:
+    """
+    Resolve the lens.yaml path for a lens identifier.
+
+    Args:
+        lens_id: The lens identifier (e.g., "edinburgh_finds")
+
+    Returns:
+        Path to engine/lenses/<lens_id>/lens.yaml (may not exist)
+    """
+    return LENSES_DIR / lens_id / "lens.yaml"
+
+
+def compile_lens_contract(lens_path: Path) -> Dict[str, Any]:
+    """
+    Load, validate and compile a lens.yaml into its runtime contract.
+
+    Args:
+        lens_path: Path to a lens.yaml file
+
+    Returns:
+        Plain dict lens contract (mapping_rules, module_triggers, modules,
+        facets, values, confidence_threshold)
+
+    Raises:
+        LensConfigError: If lens validation fails
+    """
+    vertical_lens = VerticalLens(lens_path)
+
+    # Extract compiled, immutable lens contract (plain dict)
+    # Shallow copy for defensive programming
+    return {
+        "mapping_rules": list(vertical_lens.mapping_rules),
+        "module_triggers": list(vertical_lens.module_triggers),
+        "modules": dict(vertical_lens.domain_modules),
+        "facets": dict(vertical_lens.facets),
+        "values": list(vertical_lens.values),
+        "confidence_threshold": vertical_lens.confidence_threshold,
+    }
+
+
+def compute_lens_hash(lens_contract: Dict[str, Any]) -> str:
+    """
+    Compute the deterministic content hash of a compiled lens contract.
+
+    Args:
+        lens_contract: Compiled lens contract dict
+
+    Returns:
+        SHA-256 hex digest of the canonical (sorted-key) JSON encoding
+    """
+    canonical_contract = json.dumps(lens_contract, sort_keys=True)
+    return hashlib.sha256(canonical_contract.encode("utf-8")).hexdigest()
+
+
+def _compile_with_hash(lens_path: Path) -> Dict[str, Any]:
+    lens_contract = compile_lens_contract(lens_path)
+    return {"contract": lens_contract, "lens_hash": compute_lens_hash(lens_contract)}
+
+
+def load_lens_contract(lens_path: Path) -> Tuple[Dict[str, Any], str]:
+    """
+    Compiled contract and hash of a lens.yaml, reused from the bootstrap
+    snapshot while the file is unchanged.
+
+    Args:
+        lens_path: Path to a lens.yaml file
+
+    Returns:
+        (lens_contract, lens_hash)
+
+    Raises:
+        LensConfigError: If lens validation fails
+        FileNotFoundError: If the file doesn't exist
+    """
+    compiled = load_compiled("lens_contract", lens_path, _compile_with_hash)
+    return compiled["contract"], compiled["lens_hash"]
+
+
+def bootstrap_lens(lens_id: str) -> ExecutionContext:
+    """
+    Bootstrap: Load and validate lens configuration ONCE at CLI entry point.
+
+    Per docs/target-architecture.md 3.2: "Lens loading occurs only during engine bootstrap."
+    This function enforces the bootstrap boundary by loading the lens exactly
+    once and creating an ExecutionContext for runtime use.
+
+    Args:
+        lens_id: The lens identifier (e.g., "edinburgh_finds")
+
+    Returns:
+        ExecutionContext with validated lens contract
+
+    Raises:
+        LensConfigError: If lens validation fails (fail-fast per architecture)
+        FileNotFoundError: If lens file doesn't exist
+    """
+    # Load lens from disk
+    lens_path = resolve_lens_path(lens_id)
+
+    if not lens_path.exists():
+        raise FileNotFoundError(
+            f"Lens file not found: {lens_path}\n"
+            f"Available lenses should be in: engine/lenses/<lens_id>/lens.yaml"
+        )
+
+    # Load and validate lens (fail-fast on validation errors), with its
+    # deterministic content hash for reproducibility
+    lens_contract, lens_hash = load_lens_contract(lens_path)
+
+    # Create and return ExecutionContext with lens metadata per docs/target-architecture.md 3.6
+    return ExecutionContext(
+        lens_id=lens_id,
+        lens_contract=lens_contract,
+        lens_hash=lens_hash
+    )
@@ -0,0 +1,278 @@
+"""
+Lens hot reload for long-lived orchestration workers.
+
+A one-shot CLI run bootstraps its lens exactly once (see lens_bootstrap).
+A long-lived worker must instead pick up lens.yaml edits without a restart.
+LensWatcher keeps the current ExecutionContext behind a single reference:
+
+- A background check stats lens.yaml (cheap) and only hashes the content
+  when mtime/size moved.
+- A changed file is validated and compiled off the request path. Only a
+  successful compile replaces the reference; a broken edit is recorded as a
+  failure and the previous contract keeps serving.
+- Runs call current() once at start and keep that ExecutionContext for
+  their whole lifetime, so in-flight runs never see a half-applied lens.
+
+ExecutionContext stays frozen; the swap replaces the whole object.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from engine.lenses.loader import LensConfigError
+from engine.lenses.query_lens import get_active_lens
+from engine.orchestration.execution_context import ExecutionContext
+from engine.orchestration.lens_bootstrap import (
+    compute_lens_hash,
+    load_lens_contract,
+    resolve_lens_path,
+)
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_POLL_INTERVAL_SECONDS = 2.0
+
+
+@dataclass
+class LensReloadMetrics:
+    """
+    Counters and timings for lens reloads.
+
+    Attributes:
+        checks: Number of change checks performed
+        reloads: Number of successful contract swaps
+        failures: Number of changed files that failed validation/compile
+        last_reload_ms: Duration of the most recent reload attempt
+        total_reload_ms: Cumulative duration of all reload attempts
+        last_error: Error message from the most recent failure (cleared on success)
+        last_reload_at: Unix timestamp of the most recent successful swap
+        lens_hash: Hash of the contract currently being served
+    """
+
+    checks: int = 0
+    reloads: int = 0
+    failures: int = 0
+    last_reload_ms: float = 0.0
+    total_reload_ms: float = 0.0
+    last_error: Optional[str] = None
+    last_reload_at: Optional[float] = None
+    lens_hash: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return metrics as a plain dict (for logging / reports)."""
+        return asdict(self)
+
+
+class LensWatcher:
+    """
+    Watches a lens.yaml and atomically swaps the ExecutionContext on change.
+
+    The initial load is fail-fast (same contract as bootstrap_lens); later
+    reloads never raise and never replace a working contract with a broken one.
+
+    Example:
+        >>> watcher = LensWatcher("edinburgh_finds")
+        >>> await watcher.start()
+        >>> ctx = watcher.current()  # take once per run
+        >>> await orchestrate(request, ctx=ctx)
+    """
+
+    def __init__(
+        self,
+        lens_id: str,
+        lens_path: Optional[Path] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ):
+        """
+        Load the lens and create the initial ExecutionContext.
+
+        Args:
+            lens_id: The lens identifier (e.g., "edinburgh_finds")
+            lens_path: Override for the lens.yaml location (defaults to
+                engine/lenses/<lens_id>/lens.yaml)
+            poll_interval: Seconds between background change checks
+
+        Raises:
+            FileNotFoundError: If the lens file doesn't exist
+            LensConfigError: If the initial lens fails validation
+        """
+        self.lens_id = lens_id
+        self.lens_path = Path(lens_path) if lens_path else resolve_lens_path(lens_id)
+        self.poll_interval = poll_interval
+        self.metrics = LensReloadMetrics()
+
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._failed_digest: Optional[str] = None
+
+        if not self.lens_path.exists():
+            raise FileNotFoundError(f"Lens file not found: {self.lens_path}")
+
+        self._signature = self._stat_signature()
+        self._digest = self._file_digest()
+        lens_contract, _ = load_lens_contract(self.lens_path)
+        self._context = self._build_context(lens_contract)
+        self.metrics.lens_hash = self._context.lens_hash
+
+    def current(self) -> ExecutionContext:
+        """
+        Return the ExecutionContext new runs should use.
+
+        A single attribute read: callers take it once at run start and keep
+        it, so a concurrent swap never affects an in-flight run.
+        """
+        return self._context
+
+    def check_for_changes(self) -> bool:
+        """
+        Reload the lens if lens.yaml changed since the last successful load.
+
+        Returns:
+            True if a new contract was swapped in, False otherwise
+        """
+        self.metrics.checks += 1
+
+        signature = self._stat_signature()
+        if signature is None or signature == self._signature:
+            return False
+
+        # mtime/size moved - confirm the content actually changed
+        digest = self._file_digest()
+        if digest == self._digest:
+            self._signature = signature
+            return False
+        if digest == self._failed_digest:
+            # Same broken content we already rejected; wait for the next edit
+            return False
+
+        return self.reload(signature=signature, digest=digest)
+
+    def reload(
+        self,
+        signature: Optional[tuple] = None,
+        digest: Optional[str] = None,
+    ) -> bool:
+        """
+        Validate and compile lens.yaml, swapping the contract on success.
+
+        Args:
+            signature: Pre-computed (mtime_ns, size), stat'd if omitted
+            digest: Pre-computed content digest, hashed if omitted
+
+        Returns:
+            True if the contract was swapped, False on failure or when the
+            compiled contract is identical to the current one
+        """
+        with self._lock:
+            signature = signature or self._stat_signature()
+            digest = digest or self._file_digest()
+            started = time.perf_counter()
+
+            try:
+                lens_contract, _ = load_lens_contract(self.lens_path)
+            except (LensConfigError, OSError) as e:
+                self._record_timing(started)
+                self.metrics.failures += 1
+                self.metrics.last_error = str(e)
+                self._failed_digest = digest
+                logger.warning(
+                    "Lens '%s' reload failed, keeping contract %s: %s",
+                    self.lens_id,
+                    self._short_hash(self._context.lens_hash),
+                    e,
+                )
+                return False
+
+            new_context = self._build_context(lens_contract)
+            self._record_timing(started)
+            self._signature = signature
+            self._digest = digest
+            self._failed_digest = None
+            self.metrics.last_error = None
+
+            if new_context.lens_hash == self._context.lens_hash:
+                # Cosmetic edit (comments, ordering) - nothing to swap
+                return False
+
+            previous_hash = self._context.lens_hash
+            self._context = new_context
+            self.metrics.reloads += 1
+            self.metrics.last_reload_at = time.time()
+            self.metrics.lens_hash = new_context.lens_hash
+
+        # Keep query-time vocabulary in step with the swapped contract
+        try:
+            get_active_lens(self.lens_id)
+        except (OSError, ValueError) as e:
+            logger.debug("Query lens refresh skipped for '%s': %s", self.lens_id, e)
+
+        logger.info(
+            "Lens '%s' reloaded: %s -> %s (%.1fms)",
+            self.lens_id,
+            self._short_hash(previous_hash),
+            self._short_hash(new_context.lens_hash),
+            self.metrics.last_reload_ms,
+        )
+        return True
+
+    async def start(self) -> None:
+        """Start polling for lens changes in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        """Stop background polling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _poll_loop(self) -> None:
+        # File IO and YAML compile run in a thread so the event loop
+        # (and any in-flight orchestration) is never blocked by a reload
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await asyncio.to_thread(self.check_for_changes)
+            except Exception as e:  # Never let the watcher die silently
+                logger.error("Lens watcher for '%s' check failed: %s", self.lens_id, e)
+
+    def _build_context(self, lens_contract: Dict[str, Any]) -> ExecutionContext:
+        return ExecutionContext(
+            lens_id=self.lens_id,
+            lens_contract=lens_contract,
+            lens_hash=compute_lens_hash(lens_contract),
+        )
+
+    def _stat_signature(self) -> Optional[tuple]:
+        try:
+            stat = self.lens_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _file_digest(self) -> Optional[str]:
+        try:
+            return hashlib.sha256(self.lens_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def _record_timing(self, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.metrics.last_reload_ms = elapsed_ms
+        self.metrics.total_reload_ms += elapsed_ms
+
+    @staticmethod
+    def _short_hash(lens_hash: Optional[str]) -> str:
+        return lens_hash[:12] if lens_hash else "-"
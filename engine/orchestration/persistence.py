@@ -10,17 +10,79 @@ import hashlib
 import json
 import logging
 import traceback
+import uuid
 from datetime import datetime, timezone
-from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, List, Any, Optional
 from prisma import Prisma
 
-from engine.orchestration.extraction_integration import extract_entity
-from engine.ingestion.deduplication import check_duplicate
+from engine.db import get_db_provider
+from engine.orchestration.extraction_integration import extract_entity, extraction_reuse_key
+from engine.ingestion.deduplication import (
+    DEFAULT_HASH_BATCH_SIZE,
+    HashBloomFilter,
+    find_existing_hashes,
+)
+from engine.ingestion.raw_store import RawStore, get_raw_store
+from engine.orchestration.arrow_candidates import resolve_raw
 
 # Set up structured logging with prefix
 logger = logging.getLogger(__name__)
 
+# Pending raw/entity writes per persistence run
+DEFAULT_WRITE_BEHIND_DEPTH = 256
+
+
+def _new_record_id() -> str:
+    """Client-side id for a new RawIngestion (the schema default is cuid())."""
+    return f"c{uuid.uuid4().hex}"
+
+
+class _WriteBehind:
+    """
+    FIFO of writes run by one background task.
+
+    submit() returns a future for the write's result. A write given an
+    `after` future runs only if that write succeeded and otherwise fails
+    with its error, so an ExtractedEntity insert never precedes (or
+    outlives the failure of) the RawIngestion it references.
+    """
+
+    def __init__(self, max_pending: int):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, write, *args, after: Optional[asyncio.Future] = None, **kwargs) -> asyncio.Future:
+        if self._worker is None:
+            self._worker = asyncio.ensure_future(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((future, write, args, kwargs, after))
+        # Let the worker start the write (raw store writes run in a thread)
+        await asyncio.sleep(0)
+        return future
+
+    async def drain(self) -> None:
+        """Wait for every submitted write to finish."""
+        if self._worker is None:
+            return
+        await self._queue.put(None)
+        await self._worker
+        self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            future, write, args, kwargs, after = item
+            try:
+                if after is not None:
+                    # Re-raises the dependency's error
+                    await after
+                future.set_result(await write(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
 
 class PersistenceManager:
     """
@@ -30,31 +92,51 @@ class PersistenceManager:
     and handles database operations with error handling.
     """
 
-    def __init__(self, db: Optional[Prisma] = None):
+    def __init__(
+        self,
+        db: Optional[Prisma] = None,
+        bloom_filter: Optional[HashBloomFilter] = None,
+        hash_batch_size: int = DEFAULT_HASH_BATCH_SIZE,
+        raw_store: Optional[RawStore] = None,
+        write_behind_depth: int = DEFAULT_WRITE_BEHIND_DEPTH,
+    ):
         """
         Initialize persistence manager.
 
         Args:
             db: Prisma database client (optional, will create if not provided)
+            bloom_filter: Optional HashBloomFilter warmed from the RawIngestion
+                hash index; payloads it has never seen skip the duplicate query
+            hash_batch_size: Candidates whose duplicate check shares one query
+            raw_store: Where raw payloads are written (default: the store
+                configured in app.yaml)
+            write_behind_depth: Queued raw/entity writes before extraction
+                waits for the writer to catch up
         """
         self.db = db
-        self._db_created = False
+        self._db_acquired = False
+        self.bloom_filter = bloom_filter
+        self.hash_batch_size = hash_batch_size
+        self.raw_store = raw_store if raw_store is not None else get_raw_store()
+        self.write_behind_depth = write_behind_depth
 
     async def __aenter__(self):
         """Async context manager entry - connect to database."""
         if self.db is None:
-            self.db = Prisma()
-            self._db_created = True
-
-        if not self.db.is_connected():
+            # Reference to the process-wide client (engine.db)
+            self.db = await get_db_provider().acquire()
+            self._db_acquired = True
+        elif not self.db.is_connected():
             await self.db.connect()
 
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit - disconnect from database."""
-        if self._db_created and self.db is not None:
-            await self.db.disconnect()
+        """Async context manager exit - release the shared client if taken."""
+        if self._db_acquired:
+            self._db_acquired = False
+            self.db = None
+            await get_db_provider().release()
 
     async def persist_entities(
         self,
@@ -67,7 +149,18 @@ class PersistenceManager:
         Persist accepted entities to the database.
 
         Creates RawIngestion records first to maintain data lineage,
-        then creates linked ExtractedEntity records.
+        then creates linked ExtractedEntity records. Payload hashes are
+        checked for existing RawIngestion records hash_batch_size
+        candidates at a time, one query per batch.
+
+        A candidate whose payload, extractor version, lens and model match a
+        stored ExtractedEntity (see extraction_reuse_key) is not extracted
+        again; the stored record is linked to the run via reused_entity_ids.
+
+        Extraction runs on the in-memory payload. The raw store write and
+        the RawIngestion/ExtractedEntity inserts are queued write-behind and
+        complete, in order, while later candidates are extracted; the run
+        waits for them before returning, so the counts below are final.
 
         Args:
             accepted_entities: List of accepted (deduplicated) candidate dicts
@@ -77,146 +170,281 @@ class PersistenceManager:
 
         Returns:
             Dict with persistence statistics:
-            - persisted_count: Number of entities successfully saved
+            - persisted_count: Number of entities successfully saved or reused
             - persistence_errors: List of errors that occurred
+            - reused_count: Number of stored extractions reused
+            - reused_entity_ids: IDs of the reused ExtractedEntity records
         """
         persisted_count = 0
         persistence_errors = []
 
-        for candidate in accepted_entities:
-            try:
-                # Step 1: Save raw payload to disk (like ingestion system)
-                source = candidate.get("source", "orchestration")
-                candidate_name = candidate.get("name", "unknown")
-                raw_item = candidate.get("raw", {})
-
-                # Create directory structure: engine/data/raw/<source>/
-                data_dir = Path("engine/data/raw") / source
-                data_dir.mkdir(parents=True, exist_ok=True)
-
-                # Generate content hash for deduplication
-                raw_payload_str = json.dumps(raw_item, indent=2)
-                content_hash = hashlib.sha256(raw_payload_str.encode()).hexdigest()[:16]
-
-                # Step 2: Check for duplicate (RI-001: Ingestion-level deduplication)
-                is_duplicate = await check_duplicate(self.db, content_hash)
-
-                if is_duplicate:
-                    # Reuse existing RawIngestion record (RI-002: Replay stability)
-                    raw_ingestion = await self.db.rawingestion.find_first(
-                        where={"hash": content_hash}
-                    )
-                    logger.debug(
-                        f"[PERSIST] Duplicate payload detected for source={source}, "
-                        f"reusing existing raw_ingestion_id={raw_ingestion.id}, hash={content_hash}"
-                    )
-                else:
-                    # New payload - save to disk and create RawIngestion record
-                    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-                    file_name = f"{timestamp}_{content_hash}.json"
-                    file_path = data_dir / file_name
-
-                    # Write raw payload to disk
-                    file_path.write_text(raw_payload_str, encoding="utf-8")
-
-                    # Generate source URL from raw item (connector-specific)
-                    source_url = self._extract_source_url(raw_item, source, candidate_name)
-
-                    # Create RawIngestion record
-                    raw_ingestion_data = {
-                        "source": source,
-                        "source_url": source_url,
-                        "file_path": str(file_path.relative_to(Path("."))),  # Relative path from project root
-                        "status": "success",
-                        "hash": content_hash,
-                        "metadata_json": json.dumps({
-                            "ingestion_mode": "orchestration",
-                            "candidate_name": candidate_name,
-                        }),
-                    }
-
-                    # Link to OrchestrationRun if provided
-                    if orchestration_run_id:
-                        raw_ingestion_data["orchestration_run_id"] = orchestration_run_id
-
-                    raw_ingestion = await self.db.rawingestion.create(data=raw_ingestion_data)
-
-                    logger.debug(
-                        f"[PERSIST] Created new RawIngestion: source={source}, "
-                        f"raw_ingestion_id={raw_ingestion.id}, hash={content_hash}"
+        # RawIngestion ids of payloads seen this run, and the pending writes
+        # of the ones created by it
+        known_ids: Dict[str, str] = {}
+        raw_writes: Dict[str, asyncio.Future] = {}
+        entity_writes = []
+        reused_entity_ids: List[str] = []
+        write_behind = _WriteBehind(self.write_behind_depth)
+
+        try:
+            for start in range(0, len(accepted_entities), self.hash_batch_size):
+                chunk = accepted_entities[start:start + self.hash_batch_size]
+
+                # Step 1: Serialize and hash the chunk's payloads up front so the
+                # duplicate check below is a single batched query
+                prepared = []
+                for candidate in chunk:
+                    try:
+                        # Arrow-native candidates decode their raw row only here
+                        raw_item = resolve_raw(candidate.get("raw", {}))
+                        # Hash of the pretty-printed payload (matches existing records)
+                        raw_payload_str = json.dumps(raw_item, indent=2)
+                    except Exception as e:
+                        self._record_failure(candidate, e, None, persistence_errors, errors)
+                        continue
+                    content_hash = hashlib.sha256(raw_payload_str.encode()).hexdigest()[:16]
+                    prepared.append((candidate, raw_item, content_hash))
+
+                # Step 2: Check for duplicates (RI-001: Ingestion-level deduplication).
+                # Records created earlier in this run may not be inserted yet, so
+                # they are matched from known_ids rather than the database.
+                try:
+                    known_ids.update(await find_existing_hashes(
+                        self.db,
+                        [content_hash for *_, content_hash in prepared if content_hash not in known_ids],
+                        bloom=self.bloom_filter,
+                    ))
+                except Exception as e:
+                    for candidate, *_ in prepared:
+                        self._record_failure(candidate, e, None, persistence_errors, errors)
+                    continue
+
+                # Step 2b: Look up stored extractions of unchanged payloads, keyed on
+                # (raw hash, extractor version, lens, model), one query per batch
+                reuse_keys = [
+                    extraction_reuse_key(
+                        content_hash, candidate.get("source", "orchestration"), context
                     )
-
-                # Step 3: Extract entity with full pipeline (Phase 1 + Phase 2 lens application)
-                # All sources go through extract_entity() to ensure lens application happens
-                # (LA-003 fix: structured sources need lens enrichment too)
-                logger.debug(
-                    f"[PERSIST] Extracting entity from source={source}, "
-                    f"raw_ingestion_id={raw_ingestion.id}, entity_name={candidate_name}"
+                    for candidate, _, content_hash in prepared
+                ]
+                reusable = await self._find_reusable_extractions(reuse_keys)
+
+                for (candidate, raw_item, content_hash), reuse_key in zip(prepared, reuse_keys):
+                    raw_ingestion_id = None
+                    try:
+                        source = candidate.get("source", "orchestration")
+                        candidate_name = candidate.get("name", "unknown")
+                        raw_ingestion_id = known_ids.get(content_hash)
+
+                        reused = reusable.get(reuse_key) if raw_ingestion_id is not None else None
+                        if reused is not None:
+                            # Same payload, extractor, lens and model: link the stored
+                            # extraction to this run instead of extracting again
+                            logger.debug(
+                                f"[PERSIST] Reusing ExtractedEntity {reused.id} for source={source}, "
+                                f"raw_ingestion_id={raw_ingestion_id}, entity_name={candidate_name}"
+                            )
+                            reused_entity_ids.append(reused.id)
+                            continue
+
+                        if raw_ingestion_id is not None:
+                            # Reuse existing RawIngestion record (RI-002: Replay stability)
+                            logger.debug(
+                                f"[PERSIST] Duplicate payload detected for source={source}, "
+                                f"reusing existing raw_ingestion_id={raw_ingestion_id}, hash={content_hash}"
+                            )
+                        else:
+                            # New payload - the id is generated here so extraction can
+                            # start before the raw store write and RawIngestion insert
+                            raw_ingestion_id = _new_record_id()
+
+                            # Generate source URL from raw item (connector-specific)
+                            source_url = self._extract_source_url(raw_item, source, candidate_name)
+
+                            # RawIngestion record (file_path is set by the write)
+                            raw_ingestion_data = {
+                                "id": raw_ingestion_id,
+                                "source": source,
+                                "source_url": source_url,
+                                "status": "success",
+                                "hash": content_hash,
+                                "metadata_json": json.dumps({
+                                    "ingestion_mode": "orchestration",
+                                    "candidate_name": candidate_name,
+                                }),
+                            }
+
+                            # Link to OrchestrationRun if provided
+                            if orchestration_run_id:
+                                raw_ingestion_data["orchestration_run_id"] = orchestration_run_id
+
+                            raw_writes[content_hash] = await write_behind.submit(
+                                self._write_raw_ingestion, raw_ingestion_data, raw_item
+                            )
+
+                            # Later candidates in this run with the same payload reuse it
+                            known_ids[content_hash] = raw_ingestion_id
+                            if self.bloom_filter is not None:
+                                self.bloom_filter.add(content_hash)
+
+                            logger.debug(
+                                f"[PERSIST] Queued new RawIngestion: source={source}, "
+                                f"raw_ingestion_id={raw_ingestion_id}, hash={content_hash}"
+                            )
+
+                        # Step 3: Extract entity with full pipeline (Phase 1 + Phase 2 lens application)
+                        # All sources go through extract_entity() to ensure lens application happens
+                        # (LA-003 fix: structured sources need lens enrichment too)
+                        logger.debug(
+                            f"[PERSIST] Extracting entity from source={source}, "
+                            f"raw_ingestion_id={raw_ingestion_id}, entity_name={candidate_name}"
+                        )
+
+                        # Hand the in-memory payload over; nothing is re-read from disk.
+                        # Identical payloads share a record, so the candidate's source
+                        # stands in for the record's.
+                        extracted_data = await extract_entity(
+                            raw_ingestion_id,
+                            self.db,
+                            context,
+                            raw_data=raw_item,
+                            raw_ingestion=SimpleNamespace(id=raw_ingestion_id, source=source),
+                        )
+
+                        # Log extraction success with details
+                        entity_class = extracted_data["entity_class"]
+                        attr_count = len(extracted_data.get("attributes", {}))
+                        logger.debug(
+                            f"[PERSIST] Successfully extracted entity: entity_class={entity_class}, "
+                            f"attributes={attr_count}, raw_ingestion_id={raw_ingestion_id}"
+                        )
+
+                        # Build entity_data from extraction result
+                        entity_data = {
+                            "source": source,
+                            "entity_class": extracted_data["entity_class"],
+                            "attributes": json.dumps(extracted_data["attributes"]),
+                            "discovered_attributes": json.dumps(extracted_data["discovered_attributes"]),
+                            "raw_ingestion_id": raw_ingestion_id,
+                            "extraction_hash": reuse_key,
+                        }
+
+                        # Add optional fields if present
+                        if "external_ids" in extracted_data:
+                            entity_data["external_ids"] = json.dumps(extracted_data["external_ids"])
+
+                        if "model_used" in extracted_data:
+                            entity_data["model_used"] = extracted_data["model_used"]
+
+                        # Step 4: Queue the ExtractedEntity insert behind its RawIngestion
+                        entity_write = await write_behind.submit(
+                            self.db.extractedentity.create,
+                            data=entity_data,
+                            after=raw_writes.get(content_hash),
+                        )
+                        entity_writes.append((candidate, raw_ingestion_id, entity_write))
+
+                    except Exception as e:
+                        self._record_failure(candidate, e, raw_ingestion_id, persistence_errors, errors)
+
+        finally:
+            await write_behind.drain()
+
+        for candidate, raw_ingestion_id, entity_write in entity_writes:
+            if entity_write.exception() is not None:
+                self._record_failure(
+                    candidate, entity_write.exception(), raw_ingestion_id, persistence_errors, errors
                 )
-
-                # Use extraction engine to properly extract and structure the data
-                extracted_data = await extract_entity(raw_ingestion.id, self.db, context)
-
-                # Log extraction success with details
-                entity_class = extracted_data["entity_class"]
-                attr_count = len(extracted_data.get("attributes", {}))
-                logger.debug(
-                    f"[PERSIST] Successfully extracted entity: entity_class={entity_class}, "
-                    f"attributes={attr_count}, raw_ingestion_id={raw_ingestion.id}"
-                )
-
-                # Build entity_data from extraction result
-                entity_data = {
-                    "source": source,
-                    "entity_class": extracted_data["entity_class"],
-                    "attributes": json.dumps(extracted_data["attributes"]),
-                    "discovered_attributes": json.dumps(extracted_data["discovered_attributes"]),
-                    "raw_ingestion_id": raw_ingestion.id,
-                }
-
-                # Add optional fields if present
-                if "external_ids" in extracted_data:
-                    entity_data["external_ids"] = json.dumps(extracted_data["external_ids"])
-
-                if "model_used" in extracted_data:
-                    entity_data["model_used"] = extracted_data["model_used"]
-
-                # Step 4: Create ExtractedEntity record
-                await self.db.extractedentity.create(data=entity_data)
-
+            else:
                 persisted_count += 1
 
-            except Exception as e:
-                # Log error with full context and stack trace
-                source = candidate.get("source", "unknown")
-                name = candidate.get("name", "unknown")
-                error_msg = f"Failed to persist entity from {source}: {str(e)}"
-
+        # Raw writes whose candidates failed extraction are not reported above
+        reported = {raw_ingestion_id for _, raw_ingestion_id, _ in entity_writes}
+        for content_hash, raw_write in raw_writes.items():
+            if raw_write.exception() is not None and known_ids[content_hash] not in reported:
                 logger.error(
-                    f"[PERSIST] Extraction failed: source={source}, entity_name={name}, "
-                    f"raw_ingestion_id={raw_ingestion.id if 'raw_ingestion' in locals() else 'N/A'}, "
-                    f"error={str(e)}",
-                    exc_info=True  # This includes the full stack trace
+                    f"[PERSIST] RawIngestion write failed: raw_ingestion_id={known_ids[content_hash]}, "
+                    f"error={raw_write.exception()}"
                 )
 
-                persistence_errors.append({
-                    "source": source,
-                    "error": error_msg,
-                    "entity_name": name,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                })
-
-                # Also append to main errors list
-                errors.append({
-                    "connector": source,
-                    "error": error_msg,
-                })
+        # Close out the run's raw writes (e.g. the segment of a segment store)
+        self.raw_store.finish()
 
         return {
-            "persisted_count": persisted_count,
+            "persisted_count": persisted_count + len(reused_entity_ids),
             "persistence_errors": persistence_errors,
+            "reused_count": len(reused_entity_ids),
+            "reused_entity_ids": reused_entity_ids,
         }
 
+    async def _find_reusable_extractions(self, reuse_keys: List[Optional[str]]) -> Dict[str, Any]:
+        """
+        Map reuse keys to stored ExtractedEntity records.
+
+        Reuse only saves work, so a failed lookup is logged and the batch is
+        extracted as usual.
+        """
+        keys = sorted({key for key in reuse_keys if key is not None})
+        if not keys:
+            return {}
+        try:
+            records = await self.db.extractedentity.find_many(
+                where={"extraction_hash": {"in": keys}},
+                order={"createdAt": "desc"},
+            )
+        except Exception as e:
+            logger.warning(f"[PERSIST] Extraction reuse lookup failed, extracting instead: {e}")
+            return {}
+
+        # Newest record per key
+        reusable: Dict[str, Any] = {}
+        for record in records:
+            reusable.setdefault(record.extraction_hash, record)
+        return reusable
+
+    async def _write_raw_ingestion(self, raw_ingestion_data: Dict[str, Any], raw_item: Any) -> Any:
+        """Save a payload to the raw store and create its RawIngestion record."""
+        file_path = await asyncio.to_thread(
+            self.raw_store.put, raw_ingestion_data["source"], raw_ingestion_data["hash"], raw_item
+        )
+        return await self.db.rawingestion.create(
+            data={**raw_ingestion_data, "file_path": file_path}  # Relative path from project root
+        )
+
+    def _record_failure(
+        self,
+        candidate: Dict[str, Any],
+        error: Exception,
+        raw_ingestion_id: Optional[str],
+        persistence_errors: List[Dict[str, Any]],
+        errors: List[Dict[str, Any]],
+    ) -> None:
+        """Log a candidate that failed to persist and record the error."""
+        # Log error with full context and stack trace
+        source = candidate.get("source", "unknown")
+        name = candidate.get("name", "unknown")
+        error_msg = f"Failed to persist entity from {source}: {str(error)}"
+
+        logger.error(
+            f"[PERSIST] Extraction failed: source={source}, entity_name={name}, "
+            f"raw_ingestion_id={raw_ingestion_id or 'N/A'}, "
+            f"error={str(error)}",
+            exc_info=error  # This includes the full stack trace
+        )
+
+        persistence_errors.append({
+            "source": source,
+            "error": error_msg,
+            "entity_name": name,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
+
+        # Also append to main errors list
+        errors.append({
+            "connector": source,
+            "error": error_msg,
+        })
+
     def _extract_source_url(self, raw_item: Dict[str, Any], source: str, fallback_name: str) -> str:
         """
         Extract the original source URL from raw API response.
@@ -254,9 +482,9 @@ def get_db_client() -> Prisma:
     Used for dependency injection in tests.
 
     Returns:
-        Prisma database client
+        Prisma database client (the process-wide client, see engine.db)
     """
-    return Prisma()
+    return get_db_provider().client
 
 
 def persist_entities_sync(
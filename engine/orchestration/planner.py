@@ -21,17 +21,20 @@ import asyncio
 import os
 from typing import Dict, List, Any
 
-from prisma import Prisma
-
+from engine.db import get_db_provider
 from engine.orchestration.adapters import ConnectorAdapter
 from engine.orchestration.execution_context import ExecutionContext
 from engine.orchestration.orchestrator_state import OrchestratorState
 from engine.orchestration.execution_plan import ConnectorSpec, ExecutionPhase, ExecutionPlan
 from engine.orchestration.query_features import QueryFeatures
-from engine.orchestration.registry import CONNECTOR_REGISTRY, get_connector_instance
+from engine.orchestration.registry import CONNECTOR_REGISTRY
+from engine.orchestration.connector_pool import acquire_connector, release_connector
 from engine.orchestration.types import IngestRequest, IngestionMode
 from engine.orchestration.persistence import PersistenceManager
 from engine.orchestration.entity_finalizer import EntityFinalizer
+from engine.ingestion.token_bucket import get_token_bucket_limiter
+from engine.ingestion.circuit_breaker import get_circuit_breaker
+from engine.ingestion.deduplication import get_hash_bloom_filter
 from engine.lenses.query_lens import get_active_lens
 
 
@@ -209,20 +212,30 @@ async def orchestrate(
     # 0. Create OrchestrationRun record if persisting
     orchestration_run_id = None
     db = None
+    leased_connectors = []
+    run_failed = False
 
     if request.persist:
-        db = Prisma()
-        await db.connect()
-
-        orchestration_run = await db.orchestrationrun.create(
-            data={
-                "query": request.query,
-                "ingestion_mode": request.ingestion_mode.value,
-                "status": "in_progress",
-            }
-        )
+        # Shared process-wide client; released in the finally block below
+        db = await get_db_provider().acquire()
+
+        try:
+            orchestration_run = await db.orchestrationrun.create(
+                data={
+                    "query": request.query,
+                    "ingestion_mode": request.ingestion_mode.value,
+                    "status": "in_progress",
+                }
+            )
+        except Exception:
+            await get_db_provider().release()
+            raise
         orchestration_run_id = orchestration_run.id
 
+    # Create mutable orchestrator state (separate from immutable context per docs/target-architecture.md 3.6)
+    # Created before the try block so a failed run still records its metrics
+    state = OrchestratorState()
+
     try:
         # 1. Extract query features
         query_features = QueryFeatures.extract(request.query, request)
@@ -244,9 +257,6 @@ async def orchestrate(
         # All callers must bootstrap lens before calling orchestrate()
         context = ctx
 
-        # Create mutable orchestrator state (separate from immutable context per docs/target-architecture.md 3.6)
-        state = OrchestratorState()
-
         # 4. Execute connectors via adapters (phase-aware with parallelism per PL-003)
         # Per docs/target-architecture.md 4.1 Stage 3: "Establish execution phases" implies
         # phase barriers with parallelism within phases
@@ -267,8 +277,15 @@ async def orchestrate(
                 connector_name = node.spec.name
 
                 try:
-                    connector = get_connector_instance(connector_name)
-                    adapter = ConnectorAdapter(connector, node.spec)
+                    # Pooled instance, reused across runs (see connector_pool.py)
+                    connector = await acquire_connector(connector_name, db=db)
+                    leased_connectors.append(connector)
+                    adapter = ConnectorAdapter(
+                        connector,
+                        node.spec,
+                        rate_limiter=get_token_bucket_limiter(connector.source_name),
+                        circuit_breaker=get_circuit_breaker(connector_name),
+                    )
 
                     # Create task for concurrent execution
                     # Pass db for rate limit tracking (PL-004)
@@ -300,11 +317,16 @@ async def orchestrate(
         extraction_errors = []
         entities_created = 0
         entities_updated = 0
+        reused_count = 0
+        reused_entity_ids = []
 
         if request.persist:
             try:
-                # Use async PersistenceManager with db connection
-                async with PersistenceManager(db=db) as persistence:
+                # Use async PersistenceManager with db connection; the bloom
+                # filter is warmed once per process and skips duplicate
+                # queries for payloads that are obviously new
+                bloom_filter = await get_hash_bloom_filter(db)
+                async with PersistenceManager(db=db, bloom_filter=bloom_filter) as persistence:
                     persistence_result = await persistence.persist_entities(
                         state.accepted_entities,
                         state.errors,
@@ -313,6 +335,8 @@ async def orchestrate(
                     )
                     persisted_count = persistence_result["persisted_count"]
                     persistence_errors = persistence_result["persistence_errors"]
+                    reused_count = persistence_result.get("reused_count", 0)
+                    reused_entity_ids = persistence_result.get("reused_entity_ids", [])
 
                     # Extraction errors are a subset of persistence_errors
                     # (failures during the extraction step)
@@ -323,7 +347,11 @@ async def orchestrate(
 
                 # ✅ NEW: Finalize entities to Entity table
                 finalizer = EntityFinalizer(db)
-                finalization_result = await finalizer.finalize_entities(orchestration_run_id)
+                finalization_result = await finalizer.finalize_entities(
+                    orchestration_run_id,
+                    context=context,
+                    extracted_entity_ids=reused_entity_ids,
+                )
                 entities_created = finalization_result.get("entities_created", 0)
                 entities_updated = finalization_result.get("entities_updated", 0)
 
@@ -365,23 +393,49 @@ async def orchestrate(
             report["extraction_success"] = extraction_success
             report["extraction_errors"] = extraction_errors
 
+            # Stored extractions of unchanged payloads reused instead of re-extracted
+            report["extraction_reused"] = reused_count
+            report["extraction_reuse_rate"] = (
+                reused_count / extraction_total if extraction_total else 0.0
+            )
+
             # Add entity finalization stats
             report["entities_created"] = entities_created
             report["entities_updated"] = entities_updated
 
+            report["orchestration_run_id"] = orchestration_run_id
+
+            # Process-wide DB client counters: connects should stay at 1 across
+            # runs that share the provider
+            report["db_connections"] = get_db_provider().stats()
+
         return report
 
+    except Exception:
+        run_failed = True
+        raise
+
     finally:
+        for connector in leased_connectors:
+            release_connector(connector)
+
         # Update OrchestrationRun status and metrics if created
         if db and orchestration_run_id:
             try:
                 # Calculate total budget spent
                 total_budget = sum(m.get("cost_usd", 0.0) for m in state.metrics.values())
 
+                if run_failed:
+                    status = "failed"
+                elif state.errors:
+                    status = "completed_with_errors"
+                else:
+                    status = "completed"
+
                 await db.orchestrationrun.update(
                     where={"id": orchestration_run_id},
                     data={
-                        "status": "completed" if not state.errors else "completed_with_errors",
+                        "status": status,
                         "candidates_found": len(state.candidates),
                         "accepted_entities": len(state.accepted_entities),
                         "budget_spent_usd": total_budget,
@@ -391,4 +445,5 @@ async def orchestrate(
                 # Don't crash if status update fails
                 pass
 
-            await db.disconnect()
+        if db:
+            await get_db_provider().release()
@@ -106,7 +106,8 @@ class QueryFeatures:
         without requiring code changes.
 
         Heuristics:
-        - Contains generic activity/facility terms (from Lens)
+        - Contains generic activity/facility terms (from Lens), matched at
+          word starts via the lens keyword automaton
         - Plural forms (courts, facilities, centres)
         - Lacks proper nouns or specific identifiers
         - Short queries (1-3 words) without geographic qualifiers
@@ -118,11 +119,6 @@ class QueryFeatures:
         Returns:
             True if query appears to be a category search
         """
-        # Load category indicator terms from Lens (VERTICAL-AGNOSTIC)
-        activity_keywords = lens.get_activity_keywords()
-        facility_keywords = lens.get_facility_keywords()
-        category_terms = activity_keywords + facility_keywords
-
         # Generic specific venue indicators (universal across verticals)
         # These suggest a branded/specific search rather than category search
         specific_indicators = [
@@ -140,10 +136,11 @@ class QueryFeatures:
                 # unless it also has clear category terms
                 return False
 
-        # Check for category terms (from Lens vocabulary)
-        for term in category_terms:
-            if term in normalized_query:
-                return True
+        # Check for category terms (from Lens vocabulary) - one automaton
+        # pass; terms must start on a word boundary so plurals still match
+        matches = lens.match_keywords(normalized_query)
+        if matches.any("activity") or matches.any("facility"):
+            return True
 
         # Default: if no category terms found, assume specific search
         return False
@@ -163,7 +160,8 @@ class QueryFeatures:
 
         Heuristics:
         - Contains "in", "near", "around", "at" (universal geo markers)
-        - Contains location names (from Lens - e.g., Edinburgh, Scotland, regions)
+        - Contains location names as whole words (from Lens - e.g., Edinburgh,
+          Scotland, regions)
         - Contains "near me" or similar proximity phrases (universal)
 
         Args:
@@ -189,14 +187,8 @@ class QueryFeatures:
             if marker in normalized_query:
                 return True
 
-        # Load location names from Lens (VERTICAL-AGNOSTIC)
+        # Check for location names from Lens vocabulary (VERTICAL-AGNOSTIC)
         # Padel lens: Edinburgh neighborhoods
         # Wine lens: Scotland wine regions
-        location_names = lens.get_location_indicators()
-
-        # Check for location names (from Lens vocabulary)
-        for location in location_names:
-            if location in normalized_query:
-                return True
-
-        return False
+        # Whole-word match: short indicators like "in" must not fire on "indoor"
+        return lens.match_keywords(normalized_query).any("location", mode="word")
@@ -9,17 +9,12 @@ to make intelligent selection decisions.
 Phase 1 includes: Serper (discovery) and GooglePlaces (enrichment).
 """
 
+import importlib
 from dataclasses import dataclass
-from typing import Dict, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
-from engine.ingestion.base import BaseConnector
-from engine.ingestion.connectors.serper import SerperConnector
-from engine.ingestion.connectors.google_places import GooglePlacesConnector
-from engine.ingestion.connectors.open_street_map import OSMConnector
-from engine.ingestion.connectors.sport_scotland import SportScotlandConnector
-from engine.ingestion.connectors.edinburgh_council import EdinburghCouncilConnector
-from engine.ingestion.connectors.open_charge_map import OpenChargeMapConnector
-from engine.ingestion.connectors.overture_release import OvertureReleaseConnector
+if TYPE_CHECKING:
+    from engine.ingestion.base import BaseConnector
 
 
 @dataclass(frozen=True)
@@ -117,29 +112,57 @@ CONNECTOR_REGISTRY: Dict[str, ConnectorSpec] = {
 }
 
 
-# Map connector names to their implementation classes
-# Extracted to module level to avoid recreating on every factory call
-_CONNECTOR_CLASSES: Dict[str, Type[BaseConnector]] = {
-    "serper": SerperConnector,
-    "google_places": GooglePlacesConnector,
-    "openstreetmap": OSMConnector,
-    "sport_scotland": SportScotlandConnector,
-    "edinburgh_council": EdinburghCouncilConnector,
-    "open_charge_map": OpenChargeMapConnector,
-    "overture_release": OvertureReleaseConnector,
-}
+# Connector classes resolved so far, keyed by connector name
+# Connector modules pull in aiohttp, Prisma and their parsers, so they are only
+# imported when a connector is first instantiated
+_CONNECTOR_CLASSES: Dict[str, Type["BaseConnector"]] = {}
+
+
+def get_connector_class(connector_name: str) -> Type["BaseConnector"]:
+    """
+    Resolve a connector's implementation class from its spec.
+
+    Imports the module named by ConnectorSpec.connector_class on first use and
+    caches the class.
+
+    Args:
+        connector_name: Name of the connector (must exist in CONNECTOR_REGISTRY)
 
+    Returns:
+        The connector class
 
-def get_connector_instance(connector_name: str) -> BaseConnector:
+    Raises:
+        KeyError: If connector_name is not in CONNECTOR_REGISTRY
+    """
+    if connector_name not in CONNECTOR_REGISTRY:
+        raise KeyError(
+            f"Unknown connector: {connector_name}. "
+            f"Available connectors: {list(CONNECTOR_REGISTRY.keys())}"
+        )
+
+    connector_class = _CONNECTOR_CLASSES.get(connector_name)
+    if connector_class is None:
+        module_path, _, class_name = CONNECTOR_REGISTRY[connector_name].connector_class.rpartition(".")
+        connector_class = getattr(importlib.import_module(module_path), class_name)
+        _CONNECTOR_CLASSES[connector_name] = connector_class
+    return connector_class
+
+
+def get_connector_instance(connector_name: str, db: Optional[Any] = None) -> "BaseConnector":
     """
     Factory function to create connector instances.
 
-    Creates a fresh instance of the specified connector. Each connector
-    initializes its own Prisma database client. Caller is responsible for
-    connecting to the database via await connector.db.connect().
+    Creates a fresh instance of the specified connector. Unless a shared
+    client is passed, each connector initializes its own Prisma database
+    client. Caller is responsible for connecting to the database via
+    await connector.db.connect().
+
+    Orchestration runs take reusable instances from
+    engine.orchestration.connector_pool instead.
 
     Args:
         connector_name: Name of the connector (must exist in CONNECTOR_REGISTRY)
+        db: Shared Prisma client to hand the connector (default: its own)
 
     Returns:
         BaseConnector: Fresh instance of the requested connector
@@ -153,13 +176,9 @@ def get_connector_instance(connector_name: str) -> BaseConnector:
         results = await connector.fetch("tennis courts Edinburgh")
         await connector.db.disconnect()
     """
-    if connector_name not in CONNECTOR_REGISTRY:
-        raise KeyError(
-            f"Unknown connector: {connector_name}. "
-            f"Available connectors: {list(CONNECTOR_REGISTRY.keys())}"
-        )
-
-    connector_class = _CONNECTOR_CLASSES[connector_name]
+    connector_class = get_connector_class(connector_name)
 
-    # Instantiate connector (it will create its own Prisma client)
-    return connector_class()
+    # Without a shared client the connector creates its own Prisma client
+    if db is None:
+        return connector_class()
+    return connector_class(db=db)
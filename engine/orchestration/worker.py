@@ -0,0 +1,219 @@
+"""
+Persistent orchestration worker.
+
+A standalone `cli run` connects the database, bootstraps the lens, builds
+connectors and extractors and tears it all down for one query. The worker
+keeps that state warm and pulls queries from a job queue instead
+(engine.orchestration.job_queue):
+
+- One database reference held for the worker's lifetime, so every run reuses
+  the same connection (engine.db).
+- One LensWatcher per lens: compiled once, hot-reloaded on edit.
+- Connectors and their HTTP session from the process-wide connector pool.
+- One extractor instance per source (share_extractors).
+- Up to `concurrency` jobs in flight; free slots are refilled as jobs finish.
+
+Each job runs orchestrate() under its lens and is marked completed or failed;
+persisting jobs record the OrchestrationRun they created (its status is
+updated by the planner, including "failed" when the run raised).
+
+Example:
+    queue = create_job_queue("sqlite")
+    worker = OrchestrationWorker(queue, concurrency=4, default_lens_id="edinburgh_finds")
+    await worker.run()
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import Any, Dict, Optional, Set
+
+from engine.db import get_db_provider
+from engine.orchestration.connector_pool import close_connector_pool
+from engine.orchestration.execution_context import ExecutionContext
+from engine.orchestration.extraction_integration import share_extractors
+from engine.orchestration.job_queue import QueuedJob
+from engine.orchestration.lens_watcher import LensWatcher
+from engine.orchestration.planner import orchestrate
+from engine.orchestration.types import IngestionMode, IngestRequest
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+
+
+class OrchestrationWorker:
+    """
+    Long-lived worker running queued orchestration jobs concurrently.
+
+    Attributes:
+        worker_id: Identifier recorded on claimed jobs
+        completed: Jobs finished successfully
+        failed: Jobs that raised
+    """
+
+    def __init__(
+        self,
+        queue: Any,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        default_lens_id: Optional[str] = None,
+        worker_id: Optional[str] = None,
+        hold_db: bool = True,
+        stale_after_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            queue: Job queue (SQLiteJobQueue or PostgresJobQueue)
+            concurrency: Maximum jobs running at once
+            poll_interval: Seconds between polls of an empty queue
+            default_lens_id: Lens for jobs that do not name one
+            worker_id: Identifier recorded on claimed jobs (default: host:pid:random)
+            hold_db: Keep a database reference for the worker's lifetime
+            stale_after_seconds: Requeue jobs left running longer than this at start-up
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.queue = queue
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.default_lens_id = default_lens_id
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.hold_db = hold_db
+        self.stale_after_seconds = stale_after_seconds
+        self.completed = 0
+        self.failed = 0
+        self._watchers: Dict[str, LensWatcher] = {}
+        self._stop: Optional[asyncio.Event] = None
+
+    def stop(self) -> None:
+        """Stop claiming jobs; run() returns once in-flight jobs finish."""
+        if self._stop is not None:
+            self._stop.set()
+
+    async def _context(self, lens_id: str) -> ExecutionContext:
+        """Current context of a lens, compiling and watching it on first use."""
+        watcher = self._watchers.get(lens_id)
+        if watcher is None:
+            watcher = LensWatcher(lens_id)
+            await watcher.start()
+            self._watchers[lens_id] = watcher
+        return watcher.current()
+
+    async def _run_job(self, job: QueuedJob) -> None:
+        run_id = None
+        try:
+            lens_id = job.lens_id or self.default_lens_id
+            if not lens_id:
+                raise ValueError("Job has no lens and the worker has no default lens")
+
+            ctx = await self._context(lens_id)
+            request = IngestRequest(
+                ingestion_mode=IngestionMode(job.ingestion_mode),
+                query=job.query,
+                persist=job.persist,
+            )
+            report = await orchestrate(request, ctx=ctx)
+            run_id = report.get("orchestration_run_id")
+            await self.queue.complete(job.id, run_id=run_id)
+            self.completed += 1
+            logger.info(
+                "Job %s completed: %s candidates, %s accepted",
+                job.id,
+                report.get("candidates_found"),
+                report.get("accepted_entities"),
+            )
+        except Exception as e:
+            self.failed += 1
+            logger.exception("Job %s failed: %s", job.id, e)
+            try:
+                await self.queue.fail(job.id, str(e), run_id=run_id)
+            except Exception as mark_error:
+                logger.error("Could not mark job %s failed: %s", job.id, mark_error)
+
+    async def run(self, max_jobs: Optional[int] = None, drain: bool = False) -> Dict[str, Any]:
+        """
+        Claim and run jobs until stopped.
+
+        Args:
+            max_jobs: Stop after claiming this many jobs
+            drain: Stop once the queue is empty and no job is running
+
+        Returns:
+            Counters: completed, failed
+        """
+        self._stop = asyncio.Event()
+        provider = get_db_provider()
+        holding_db = False
+        if self.hold_db:
+            try:
+                await provider.acquire()
+                holding_db = True
+            except Exception as e:
+                # Non-persisting jobs can still run; persisting ones connect per run
+                logger.warning("Worker %s started without a database connection: %s", self.worker_id, e)
+
+        share_extractors(True)
+        in_flight: Set[asyncio.Task] = set()
+        claimed = 0
+        try:
+            if self.default_lens_id:
+                # Compile the default lens up front: a broken lens fails start-up, not every job
+                await self._context(self.default_lens_id)
+
+            if self.stale_after_seconds is not None:
+                requeued = await self.queue.requeue_stale(self.stale_after_seconds)
+                if requeued:
+                    logger.info("Requeued %s stale jobs", requeued)
+
+            while not self._stop.is_set():
+                free_slots = self.concurrency - len(in_flight)
+                if max_jobs is not None:
+                    free_slots = min(free_slots, max_jobs - claimed)
+
+                jobs = []
+                if free_slots > 0:
+                    try:
+                        jobs = await self.queue.claim(self.worker_id, free_slots)
+                    except Exception as e:
+                        # A transient queue error must not take the worker down
+                        logger.error("Worker %s could not claim jobs: %s", self.worker_id, e)
+                claimed += len(jobs)
+                for job in jobs:
+                    in_flight.add(asyncio.create_task(self._run_job(job)))
+
+                if max_jobs is not None and claimed >= max_jobs and not in_flight:
+                    break
+                if drain and not jobs and not in_flight:
+                    break
+
+                if in_flight:
+                    # Every free slot was filled: wait for a job to finish. Otherwise
+                    # the queue ran short, so also poll it again after poll_interval
+                    timeout = None if free_slots <= len(jobs) else self.poll_interval
+                    _, in_flight = await asyncio.wait(
+                        in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                    )
+                else:
+                    try:
+                        await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            for watcher in self._watchers.values():
+                await watcher.stop()
+            self._watchers.clear()
+            share_extractors(False)
+            await close_connector_pool()
+            if holding_db:
+                await provider.release()
+
+        return {"completed": self.completed, "failed": self.failed}
@@ -130,12 +130,14 @@ model MergeConflict {
 model LensEntity {
   lensId    String
   entityId  String
+  lensHash  String?  // Hash of the lens contract last applied to this entity's canonical_* / modules
   entity    Entity   @relation(fields: [entityId], references: [id], onDelete: Cascade)
   createdAt DateTime @default(now())
 
   @@id([lensId, entityId])
   @@index([lensId])
   @@index([entityId])
+  @@index([lensId, lensHash])
 }
 
 model OrchestrationRun {
@@ -193,6 +195,34 @@ model ConnectorUsage {
   @@unique([connector_name, date])
   @@index([connector_name])
   @@index([date])
+}
+
+model RateLimitBucket {
+  key         String   // Rate-limited source (connector source_name)
+  window      String   // Bucket window, e.g. "per_minute", "per_hour"
+  tokens      Float    // Tokens left at refilled_at
+  refilled_at Float    // Unix seconds of the last refill
+  updatedAt   DateTime @updatedAt
+
+  @@id([key, window])
+}
+
+model OrchestrationJob {
+  id             String    @id @default(cuid())
+  query          String    // Query to orchestrate
+  lens_id        String?   // Lens to run under (default: the worker's lens)
+  ingestion_mode String    @default("discover_many")
+  persist        Boolean   @default(false)
+  status         String    @default("queued") // "queued", "running", "completed", "failed"
+  attempts       Int       @default(0)
+  worker_id      String?   // Worker holding the job while running
+  locked_at      DateTime? // When the job was claimed
+  run_id         String?   // OrchestrationRun created for the job
+  error          String?
+  createdAt      DateTime  @default(now())
+  updatedAt      DateTime  @updatedAt
+
+  @@index([status, createdAt])
 }"""
 
     ENTITY_EXTRA_FIELD_LINES = {
@@ -20,7 +20,6 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import asyncio
-import json
 import argparse
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -28,6 +27,7 @@ from datetime import datetime
 from prisma import Prisma, Json
 from tqdm import tqdm
 
+from engine.ingestion.raw_store import load_raw_payload
 from engine.lenses.loader import VerticalLens
 from tests.engine.extraction.test_helpers import extract_with_lens_for_testing
 
@@ -161,9 +161,10 @@ async def run_extraction(
         stats["processed"] += 1
 
         try:
-            # Load raw data from file
-            raw_data_path = Path(raw.file_path)
-            if not raw_data_path.exists():
+            # Load raw data (plain, compressed, segment or archive locator)
+            try:
+                raw_data = load_raw_payload(raw.file_path)
+            except FileNotFoundError:
                 stats["failed"] += 1
                 stats["validation_errors"].append({
                     "raw_id": raw.id,
@@ -171,9 +172,6 @@ async def run_extraction(
                 })
                 continue
 
-            with open(raw_data_path, "r", encoding="utf-8") as f:
-                raw_data = json.load(f)
-
             # Extract with lens contract
             extracted = extract_with_lens_for_testing(raw_data, lens_contract)
 
@@ -0,0 +1,417 @@
+"""Tests for the incremental re-lens job (contract diff + targeted recompute)."""
+
+import copy
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from engine.extraction.relens import (
+    diff_lens_contracts,
+    is_entity_affected,
+    load_contract_snapshot,
+    relens_entity,
+    run_relens,
+    save_contract_snapshot,
+)
+from engine.orchestration.entity_finalizer import EntityFinalizer
+from tests.utils import unwrap_prisma_json
+
+
+def _contract():
+    return {
+        "facets": {
+            "activity": {"dimension_source": "canonical_activities"},
+            "place_type": {"dimension_source": "canonical_place_types"},
+        },
+        "values": [
+            {"key": "padel", "facet": "activity"},
+            {"key": "tennis", "facet": "activity"},
+            {"key": "sports_facility", "facet": "place_type"},
+        ],
+        "mapping_rules": [
+            {"id": "map_padel", "pattern": "(?i)padel", "canonical": "padel", "confidence": 0.95},
+            {"id": "map_tennis", "pattern": "(?i)tennis", "canonical": "tennis", "confidence": 0.95},
+            {"id": "map_facility", "pattern": "(?i)sports centre", "canonical": "sports_facility", "confidence": 0.85},
+        ],
+        "module_triggers": [
+            {
+                "when": {"facet": "activity", "value": "padel"},
+                "add_modules": ["sports_facility"],
+                "conditions": [{"entity_class": "place"}],
+            },
+        ],
+        "modules": {
+            "sports_facility": {
+                "field_rules": [
+                    {
+                        "rule_id": "courts",
+                        "target_path": "padel_courts.total",
+                        "extractor": "regex_capture",
+                        "pattern": r"(\d+)\s+padel courts?",
+                        "source_fields": ["description"],
+                        "normalizers": ["round_integer"],
+                    }
+                ]
+            }
+        },
+        "confidence_threshold": 0.7,
+    }
+
+
+def _entity(**overrides):
+    entity = {
+        "id": "e1",
+        "entity_class": "place",
+        "entity_name": "Game4Padel",
+        "description": "Indoor venue with 4 padel courts",
+        "raw_categories": [],
+        "summary": None,
+        "street_address": None,
+        "canonical_activities": ["padel"],
+        "canonical_roles": [],
+        "canonical_place_types": [],
+        "canonical_access": [],
+        "modules": {"sports_facility": {"padel_courts": {"total": 4}}},
+        "discovered_attributes": {},
+        "source_info": {},
+        "external_ids": {"serper_id": "x"},
+    }
+    entity.update(overrides)
+    return entity
+
+
+class TestDiffLensContracts:
+    def test_identical_contracts_produce_empty_diff(self):
+        diff = diff_lens_contracts(_contract(), _contract())
+        assert diff.is_empty
+
+    def test_display_metadata_changes_are_ignored(self):
+        new = _contract()
+        new["values"][0]["display_name"] = "Padel!"
+        new["facets"]["activity"]["ui_label"] = "Sports"
+        assert diff_lens_contracts(_contract(), new).is_empty
+
+    def test_changed_rule_is_keyed_by_id(self):
+        new = _contract()
+        new["mapping_rules"][1]["pattern"] = "(?i)(tennis|lawn tennis)"
+        diff = diff_lens_contracts(_contract(), new)
+        assert len(diff.changed_rules) == 1
+        assert not diff.added_rules and not diff.removed_rules
+        assert diff.affected_canonicals == {"tennis"}
+
+    def test_added_and_removed_rules(self):
+        new = _contract()
+        removed = new["mapping_rules"].pop(0)
+        new["mapping_rules"].append({"id": "map_squash", "pattern": "(?i)squash", "canonical": "tennis"})
+        diff = diff_lens_contracts(_contract(), new)
+        assert diff.removed_rules == [removed]
+        assert [r["id"] for r in diff.added_rules] == ["map_squash"]
+        assert diff.affected_canonicals == {"padel", "tennis"}
+
+    def test_value_moved_to_other_facet(self):
+        new = _contract()
+        new["values"][2]["facet"] = "activity"
+        diff = diff_lens_contracts(_contract(), new)
+        assert diff.changed_values == {"sports_facility"}
+
+    def test_trigger_and_module_changes(self):
+        new = _contract()
+        new["module_triggers"].append(
+            {"when": {"facet": "activity", "value": "tennis"}, "add_modules": ["sports_facility"]}
+        )
+        new["modules"]["sports_facility"]["field_rules"][0]["pattern"] = r"(\d+)\s+courts?"
+        diff = diff_lens_contracts(_contract(), new)
+        assert diff.changed_trigger_values == {("activity", "tennis")}
+        assert diff.changed_modules == {"sports_facility"}
+
+    def test_facet_dimension_change_requires_full_relens(self):
+        new = _contract()
+        new["facets"]["place_type"]["dimension_source"] = "canonical_roles"
+        assert diff_lens_contracts(_contract(), new).requires_full_relens
+
+
+class TestIsEntityAffected:
+    def test_unrelated_rule_change_does_not_touch_entity(self):
+        new = _contract()
+        new["mapping_rules"][1]["pattern"] = "(?i)(tennis|lawn tennis)"
+        diff = diff_lens_contracts(_contract(), new)
+        assert not is_entity_affected(_entity(), diff, new)
+
+    def test_entity_matching_changed_rule_is_affected(self):
+        new = _contract()
+        new["mapping_rules"][1]["pattern"] = "(?i)(tennis|padel)"
+        diff = diff_lens_contracts(_contract(), new)
+        assert is_entity_affected(_entity(canonical_activities=[]), diff, new)
+
+    def test_entity_holding_removed_value_is_affected(self):
+        new = _contract()
+        new["mapping_rules"].pop(0)
+        diff = diff_lens_contracts(_contract(), new)
+        assert is_entity_affected(_entity(), diff, new)
+
+    def test_entity_with_redefined_module_is_affected(self):
+        new = _contract()
+        new["modules"]["sports_facility"]["description"] = "changed"
+        diff = diff_lens_contracts(_contract(), new)
+        assert is_entity_affected(_entity(), diff, new)
+        assert not is_entity_affected(
+            _entity(entity_name="Tennis Club", description="", canonical_activities=["tennis"], modules={}),
+            diff,
+            new,
+        )
+
+
+class TestRelensEntity:
+    def test_removed_rule_drops_value_and_module(self):
+        new = _contract()
+        new["mapping_rules"].pop(0)
+        diff = diff_lens_contracts(_contract(), new)
+
+        result = relens_entity(_entity(), new, diff)
+
+        assert result["canonical_activities"] == []
+        assert result["modules"] == {}
+
+    def test_untouched_values_and_modules_are_preserved(self):
+        new = _contract()
+        new["mapping_rules"].append({"id": "map_centre", "pattern": "(?i)venue", "canonical": "sports_facility"})
+        diff = diff_lens_contracts(_contract(), new)
+        # Stored module data is kept verbatim for unchanged module definitions
+        entity = _entity(modules={"sports_facility": {"padel_courts": {"total": 6}}})
+
+        result = relens_entity(entity, new, diff)
+
+        assert result["canonical_activities"] == ["padel"]
+        assert result["canonical_place_types"] == ["sports_facility"]
+        assert result["modules"] == {"sports_facility": {"padel_courts": {"total": 6}}}
+
+    def test_redefined_module_is_recomputed(self):
+        new = _contract()
+        new["modules"]["sports_facility"]["field_rules"][0]["target_path"] = "courts.total"
+        diff = diff_lens_contracts(_contract(), new)
+
+        result = relens_entity(_entity(), new, diff)
+
+        assert result["modules"] == {"sports_facility": {"courts": {"total": 4}}}
+
+    def test_full_relens_without_diff(self):
+        result = relens_entity(_entity(canonical_activities=[], modules={}), _contract())
+        assert result["canonical_activities"] == ["padel"]
+        assert result["modules"]["sports_facility"]["padel_courts"]["total"] == 4
+
+
+class TestContractSnapshots:
+    def test_snapshot_round_trip(self, tmp_path):
+        contract = _contract()
+        save_contract_snapshot("lens", "abc", contract, tmp_path)
+        assert load_contract_snapshot("lens", "abc", tmp_path) == contract
+        assert load_contract_snapshot("lens", "missing", tmp_path) is None
+
+
+def _row(entity):
+    return SimpleNamespace(**copy.deepcopy(entity))
+
+
+def _mock_db(rows, applied_hashes):
+    db = MagicMock()
+    db.entity.find_many = AsyncMock(side_effect=[rows, []])
+    db.entity.update = AsyncMock()
+    db.lensentity.find_many = AsyncMock(
+        return_value=[SimpleNamespace(entityId=k, lensHash=v) for k, v in applied_hashes.items()]
+    )
+    db.lensentity.update_many = AsyncMock(return_value=0)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_one_rule_change_updates_only_matching_rows(tmp_path):
+    """A single changed rule touches only the rows it can affect; others are re-stamped."""
+    old = _contract()
+    new = _contract()
+    new["mapping_rules"][1]["pattern"] = "(?i)(tennis|racquet)"
+    save_contract_snapshot("lens", "old", old, tmp_path)
+
+    padel = _entity()
+    racquet = _entity(
+        id="e2",
+        entity_name="Racquet Club",
+        description="",
+        canonical_activities=[],
+        modules={},
+    )
+    db = _mock_db([_row(padel), _row(racquet)], {"e1": "old", "e2": "old"})
+
+    stats = await run_relens(db, "lens", new, "new", snapshot_dir=tmp_path, batch_size=10)
+
+    assert stats["scanned"] == 2
+    assert stats["affected"] == 1
+    assert stats["updated"] == 1
+    # Members of the lens, and entities in no lens at all, are paged through
+    assert db.entity.find_many.await_args_list[0].kwargs["where"] == {
+        "OR": [
+            {"lensMemberships": {"some": {"lensId": "lens"}}},
+            {"lensMemberships": {"none": {}}},
+        ]
+    }
+    db.entity.update.assert_awaited_once()
+    update = db.entity.update.await_args.kwargs
+    assert update["where"] == {"id": "e2"}
+    assert update["data"]["canonical_activities"] == ["tennis"]
+    # Unaffected rows move to the new hash in one statement
+    restamp = db.lensentity.update_many.await_args_list[0].kwargs
+    assert restamp["where"] == {"lensId": "lens", "lensHash": "old"}
+    assert restamp["data"] == {"lensHash": "new"}
+    # Stamping never creates memberships
+    stamp = db.lensentity.update_many.await_args_list[-1].kwargs
+    assert stamp["where"] == {"lensId": "lens", "entityId": {"in": ["e2"]}}
+    db.lensentity.create_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_entities_on_current_hash_are_skipped(tmp_path):
+    db = _mock_db([_row(_entity())], {"e1": "current"})
+
+    stats = await run_relens(db, "lens", _contract(), "current", snapshot_dir=tmp_path, batch_size=10)
+
+    assert stats["current"] == 1
+    assert stats["affected"] == 0
+    db.entity.update.assert_not_awaited()
+
+
+class _Table:
+    def __init__(self, **methods):
+        for name, method in methods.items():
+            setattr(self, name, AsyncMock(side_effect=method))
+
+
+class InMemoryLensDb:
+    """Just enough of the Prisma client for finalize -> re-lens round trips."""
+
+    def __init__(self, extracted):
+        self.entities = {}
+        self.memberships = {}
+        self.updated_ids = []
+        self.orchestrationrun = _Table(find_unique=self._find_run)
+        self.extractedentity = _Table(find_many=lambda **kwargs: extracted)
+        self.entity = _Table(
+            find_unique=self._find_entity,
+            create=self._create_entity,
+            update=self._update_entity,
+            find_many=self._find_entities,
+        )
+        self.lensentity = _Table(
+            create_many=self._create_memberships,
+            update_many=self._update_memberships,
+            find_many=self._find_memberships,
+        )
+
+    async def _find_run(self, where):
+        return SimpleNamespace(id=where["id"], createdAt=0)
+
+    async def _find_entity(self, where):
+        return next((e for e in self.entities.values() if e.slug == where["slug"]), None)
+
+    async def _create_entity(self, data):
+        entity = SimpleNamespace(id=f"ent-{len(self.entities) + 1}", description=None,
+                                 raw_categories=[], **unwrap_prisma_json(data))
+        self.entities[entity.id] = entity
+        return entity
+
+    async def _update_entity(self, where, data):
+        self.updated_ids.append(where["id"])
+        for key, value in unwrap_prisma_json(data).items():
+            setattr(self.entities[where["id"]], key, value)
+
+    def _matches(self, entity, where):
+        if "OR" in where and not any(self._matches(entity, clause) for clause in where["OR"]):
+            return False
+        if "id" in where and not entity.id > where["id"]["gt"]:
+            return False
+        lenses = {lens_id for lens_id, entity_id in self.memberships if entity_id == entity.id}
+        memberships = where.get("lensMemberships", {})
+        if "some" in memberships and memberships["some"]["lensId"] not in lenses:
+            return False
+        if "none" in memberships and lenses:
+            return False
+        return True
+
+    async def _find_entities(self, where, take, order):
+        rows = sorted((e for e in self.entities.values() if self._matches(e, where)), key=lambda e: e.id)
+        return rows[:take]
+
+    async def _create_memberships(self, data, skip_duplicates):
+        created = 0
+        for row in data:
+            key = (row["lensId"], row["entityId"])
+            if key not in self.memberships:
+                self.memberships[key] = row.get("lensHash")
+                created += 1
+        return created
+
+    async def _update_memberships(self, where, data):
+        keys = [
+            key for key, lens_hash in self.memberships.items()
+            if key[0] == where["lensId"]
+            and ("entityId" not in where or key[1] in where["entityId"]["in"])
+            and ("lensHash" not in where or lens_hash == where["lensHash"])
+        ]
+        for key in keys:
+            self.memberships[key] = data["lensHash"]
+        return len(keys)
+
+    async def _find_memberships(self, where):
+        return [
+            SimpleNamespace(entityId=entity_id, lensHash=lens_hash)
+            for (lens_id, entity_id), lens_hash in self.memberships.items()
+            if lens_id == where["lensId"]
+        ]
+
+
+def _extracted(extracted_id, name, summary, activities):
+    attributes = {"entity_name": name, "summary": summary, "canonical_activities": activities}
+    return SimpleNamespace(
+        id=extracted_id, source="serper", entity_class="place",
+        attributes=json.dumps(attributes), discovered_attributes=None, external_ids="{}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_finalize_then_edited_lens_relens_touches_only_matching_rows():
+    """Finalized entities are attached and stamped, so a later re-lens finds them."""
+    db = InMemoryLensDb([
+        _extracted("x1", "Game4Padel", "Indoor padel venue", ["padel"]),
+        _extracted("x2", "Racquet Club", "Racquet sports", []),
+        _extracted("x3", "Tennis Hub", "Outdoor tennis courts", ["tennis"]),
+    ])
+    # Finalized before memberships were recorded: in no lens, no hash
+    legacy = await db._create_entity({
+        "slug": "old-racquet-hall", "entity_class": "place", "entity_name": "Old Racquet Hall",
+        "summary": "Racquet hall", "canonical_activities": [], "canonical_roles": [],
+        "canonical_place_types": [], "canonical_access": [], "modules": {},
+        "discovered_attributes": {}, "source_info": {}, "external_ids": {},
+    })
+    old = _contract()
+    context = SimpleNamespace(lens_id="lens", lens_hash="v1", lens_contract=old)
+
+    stats = await EntityFinalizer(db).finalize_entities("run-1", context=context)
+
+    assert stats["entities_created"] == 3
+    finalized = {e.entity_name: e.id for e in db.entities.values() if e.id != legacy.id}
+    assert db.memberships == {("lens", entity_id): "v1" for entity_id in finalized.values()}
+
+    new = _contract()
+    new["mapping_rules"][1]["pattern"] = "(?i)(tennis|racquet)"
+    stats = await run_relens(db, "lens", new, "v2", batch_size=2)
+
+    assert stats["scanned"] == 4
+    assert stats["full_relens"] == 1
+    assert sorted(db.updated_ids) == sorted([finalized["Racquet Club"], legacy.id])
+    assert db.entities[finalized["Racquet Club"]].canonical_activities == ["tennis"]
+    assert db.entities[legacy.id].canonical_activities == ["tennis"]
+    assert db.entities[finalized["Game4Padel"]].canonical_activities == ["padel"]
+    # Every entity, including the legacy one, now carries the new hash
+    assert db.memberships == {
+        ("lens", entity_id): "v2" for entity_id in [*finalized.values(), legacy.id]
+    }
@@ -0,0 +1,110 @@
+"""Tests for OSMConnector union queries over several activity terms."""
+
+import shutil
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+import yaml
+
+from engine.ingestion.connectors.open_street_map import (
+    OSMConnector,
+    index_elements_by_term,
+    normalize_terms,
+    split_response_by_term,
+)
+
+
+UNION_RESPONSE = {
+    "version": 0.6,
+    "osm3s": {"timestamp_osm_base": "2026-01-01T00:00:00Z"},
+    "elements": [
+        {"type": "node", "id": 1, "lat": 55.95, "lon": -3.19, "tags": {"sport": "tennis", "name": "Courts"}},
+        {"type": "way", "id": 10, "nodes": [100, 101], "tags": {"sport": "padel", "name": "Padel Club"}},
+        {"type": "way", "id": 11, "nodes": [101, 102], "tags": {"leisure": "sports_centre", "sport": "squash"}},
+        {"type": "node", "id": 100, "lat": 55.9, "lon": -3.2},
+        {"type": "node", "id": 101, "lat": 55.9, "lon": -3.21},
+        {"type": "node", "id": 102, "lat": 55.9, "lon": -3.22},
+    ],
+}
+
+
+@pytest.fixture
+def connector():
+    temp_dir = Path("tmp") / "test_open_street_map_connector" / uuid.uuid4().hex
+    temp_dir.mkdir(parents=True)
+    config_path = temp_dir / "sources.yaml"
+    config_path.write_text(
+        yaml.safe_dump({"openstreetmap": {"base_url": "https://overpass.example/api/interpreter"}}),
+        encoding="utf-8",
+    )
+    try:
+        yield OSMConnector(config_path=str(config_path))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_normalize_terms_dedupes_and_strips():
+    assert normalize_terms(" padel ") == ["padel"]
+    assert normalize_terms(["tennis", "padel", "tennis", " "]) == ["tennis", "padel"]
+
+
+def test_single_term_query_is_unchanged(connector):
+    query = connector._build_overpass_query("padel", 55.95, -3.19, 1000)
+    assert 'node["sport"="padel"](around:1000,55.95,-3.19);' in query
+    assert 'relation["leisure"~"padel"](around:1000,55.95,-3.19);' in query
+
+
+def test_union_query_uses_alternation_in_six_statements(connector):
+    query = connector._build_overpass_query(["tennis", "padel", "squash"], 55.95, -3.19, 1000)
+
+    assert 'way["sport"~"^(tennis|padel|squash)$"](around:1000,55.95,-3.19);' in query
+    assert 'node["leisure"~"tennis|padel|squash"](around:1000,55.95,-3.19);' in query
+    assert query.count("around:") == 6
+
+
+def test_index_attributes_member_nodes_to_their_ways():
+    index = index_elements_by_term(UNION_RESPONSE, ["tennis", "padel", "squash"])
+
+    assert index["tennis"] == ["node/1"]
+    assert index["padel"] == ["way/10", "node/100", "node/101"]
+    # Shared member node belongs to both ways' terms
+    assert index["squash"] == ["way/11", "node/101", "node/102"]
+
+
+def test_split_response_keeps_metadata():
+    per_term = split_response_by_term(UNION_RESPONSE, ["tennis", "padel"])
+
+    assert set(per_term) == {"tennis", "padel"}
+    assert per_term["tennis"]["version"] == 0.6
+    assert per_term["tennis"]["osm3s"] == UNION_RESPONSE["osm3s"]
+    assert [e["id"] for e in per_term["padel"]["elements"]] == [10, 100, 101]
+
+
+@pytest.mark.asyncio
+async def test_fetch_terms_is_one_round_trip(connector):
+    connector._post_overpass = AsyncMock(return_value=dict(UNION_RESPONSE))
+
+    per_term = await connector.fetch_terms(["tennis", "padel", "squash"])
+
+    connector._post_overpass.assert_awaited_once()
+    assert '"^(tennis|padel|squash)$"' in connector._post_overpass.await_args.args[1]
+    assert [e["id"] for e in per_term["tennis"]["elements"]] == [1]
+    assert "terms" not in per_term["squash"]
+
+
+@pytest.mark.asyncio
+async def test_union_fetch_records_term_provenance(connector):
+    connector._post_overpass = AsyncMock(return_value=dict(UNION_RESPONSE))
+
+    data = await connector.fetch(["tennis", "padel"])
+
+    assert len(data["elements"]) == len(UNION_RESPONSE["elements"])
+    assert data["terms"]["tennis"] == ["node/1"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_rejects_empty_terms(connector):
+    with pytest.raises(ValueError):
+        await connector.fetch([" "])
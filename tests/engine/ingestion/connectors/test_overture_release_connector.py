@@ -51,6 +51,14 @@ def _overture_rows(name_suffix: str = "Row") -> list[dict]:
         },
     ]
 
+def _download_writing(payload: bytes) -> AsyncMock:
+    async def _download(url: str, cache_path: Path) -> None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(payload)
+
+    return AsyncMock(side_effect=_download)
+
+
 def _workspace_temp_dir() -> Path:
     temp_dir = Path("tmp") / "test_overture_release_connector" / uuid4().hex
     temp_dir.mkdir(parents=True, exist_ok=False)
@@ -70,7 +78,7 @@ async def test_fetch_downloads_latest_places_artifact_and_returns_row_records():
             if url == connector.getting_data_url
             else _places_listing_xml()
         )
-        connector._fetch_bytes = AsyncMock(return_value=expected_bytes)
+        connector._download_artifact = _download_writing(expected_bytes)
         connector._decode_place_rows = Mock(return_value=expected_rows)
 
         payload = await connector.fetch("ignored query")
@@ -78,7 +86,7 @@ async def test_fetch_downloads_latest_places_artifact_and_returns_row_records():
         assert payload == {"results": expected_rows}
         connector._decode_place_rows.assert_called_once()
         decode_call = connector._decode_place_rows.call_args
-        assert decode_call.args[0] == expected_bytes
+        assert decode_call.args[0] == temp_dir / "2026-02-01.0" / "part-00000.parquet"
         assert decode_call.args[1].endswith("part-00000.parquet")
         assert (temp_dir / "2026-02-01.0" / "part-00000.parquet").read_bytes() == expected_bytes
     finally:
@@ -98,14 +106,14 @@ async def test_fetch_uses_cached_artifact_without_redownloading():
             if url == connector.getting_data_url
             else _places_listing_xml()
         )
-        connector._fetch_bytes = AsyncMock(return_value=expected_bytes)
+        connector._download_artifact = _download_writing(expected_bytes)
         connector._decode_place_rows = Mock(return_value=expected_rows)
 
         first_payload = await connector.fetch("ignored query")
-        connector._fetch_bytes.reset_mock()
+        connector._download_artifact.reset_mock()
         second_payload = await connector.fetch("ignored query")
 
-        connector._fetch_bytes.assert_not_awaited()
+        connector._download_artifact.assert_not_awaited()
         assert first_payload == {"results": expected_rows}
         assert second_payload == {"results": expected_rows}
         assert connector._decode_place_rows.call_count == 2
@@ -128,7 +136,7 @@ async def test_fetch_selects_smallest_eligible_artifact_with_deterministic_tie_b
                 ]
             )
         )
-        connector._fetch_bytes = AsyncMock(return_value=b"overture parquet bytes")
+        connector._download_artifact = _download_writing(b"overture parquet bytes")
         expected_rows = _overture_rows("TieBreak")
         connector._decode_place_rows = Mock(return_value=expected_rows)
 
@@ -150,10 +158,125 @@ async def test_fetch_raises_when_no_artifact_satisfies_size_cap():
             [("part-00000.parquet", 200), ("part-00001.parquet", 300)]
         )
     )
-    connector._fetch_bytes = AsyncMock(return_value=b"unused")
+    connector._download_artifact = AsyncMock()
 
     with pytest.raises(
         ValueError,
         match="No Overture places parquet artifact for release 2026-02-01.0 satisfies size cap 150 bytes",
     ):
         await connector.fetch("ignored query")
+
+
+def _place_row(index: int, lng: float, lat: float, name: str = None) -> dict:
+    return {
+        "id": f"place-{index}",
+        "names": {"primary": name or f"Place {index}"},
+        "categories": {"primary": "sports_club", "alternate": None},
+        "theme": "places",
+        "bbox": {"xmin": lng, "xmax": lng, "ymin": lat, "ymax": lat},
+    }
+
+
+def _write_places_parquet(path: Path, rows: list, row_group_size: int) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    pq.write_table(pa.Table.from_pylist(rows), path, row_group_size=row_group_size)
+
+
+def test_decode_streams_batches_with_projection_and_bbox_pushdown():
+    temp_dir = _workspace_temp_dir()
+    try:
+        artifact = temp_dir / "places.parquet"
+        # Row group 0: Glasgow, row group 1: Edinburgh, row group 2: London
+        rows = (
+            [_place_row(i, -4.25, 55.86) for i in range(0, 4)]
+            + [_place_row(i, -3.19, 55.95) for i in range(4, 8)]
+            + [_place_row(i, -0.12, 51.50) for i in range(8, 12)]
+        )
+        _write_places_parquet(artifact, rows, row_group_size=4)
+        connector = OvertureReleaseConnector(cache_dir=str(temp_dir), batch_size=3)
+
+        batches = list(connector.iter_place_batches(artifact, "https://example/places.parquet"))
+
+        assert all(batch.num_rows <= 3 for batch in batches)
+        assert "theme" not in batches[0].schema.names
+        decoded_ids = [row["id"] for batch in batches for row in batch.to_pylist()]
+        assert decoded_ids == [f"place-{i}" for i in range(4, 8)]
+
+        decoded = connector._decode_place_rows(artifact, "https://example/places.parquet")
+        assert [row["names"]["primary"] for row in decoded] == [f"Place {i}" for i in range(4, 8)]
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_decode_without_bbox_reads_all_supported_rows():
+    temp_dir = _workspace_temp_dir()
+    try:
+        artifact = temp_dir / "places.parquet"
+        rows = [_place_row(0, -4.25, 55.86), _place_row(1, -3.19, 55.95, name="  ")]
+        _write_places_parquet(artifact, rows, row_group_size=1)
+        connector = OvertureReleaseConnector(cache_dir=str(temp_dir), bbox=None)
+
+        decoded = connector._decode_place_rows(artifact, "https://example/places.parquet")
+
+        # Blank names are still dropped after the scan
+        assert [row["id"] for row in decoded] == ["place-0"]
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_decode_raises_runtime_error_for_invalid_artifact():
+    pytest.importorskip("pyarrow")
+    temp_dir = _workspace_temp_dir()
+    try:
+        artifact = temp_dir / "broken.parquet"
+        artifact.write_bytes(b"not a parquet file")
+        connector = OvertureReleaseConnector(cache_dir=str(temp_dir))
+
+        with pytest.raises(RuntimeError, match="Failed decoding Overture parquet artifact"):
+            connector._decode_place_rows(artifact, "https://example/broken.parquet")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.mark.asyncio
+async def test_fetch_batches_returns_record_batches_for_cached_artifact():
+    temp_dir = _workspace_temp_dir()
+    try:
+        release_dir = temp_dir / "2026-02-01.0"
+        release_dir.mkdir(parents=True)
+        rows = [_place_row(i, -3.19, 55.95) for i in range(5)]
+        _write_places_parquet(release_dir / "part-00000.parquet", rows, row_group_size=2)
+
+        connector = OvertureReleaseConnector(cache_dir=str(temp_dir), batch_size=2)
+        connector._fetch_text = AsyncMock(
+            side_effect=lambda url: _getting_data_html()
+            if url == connector.getting_data_url
+            else _places_listing_xml()
+        )
+        connector._download_artifact = AsyncMock()
+
+        batches = await connector.fetch_batches("ignored query")
+
+        connector._download_artifact.assert_not_awaited()
+        assert sum(batch.num_rows for batch in batches) == 5
+        assert batches[0].column(batches[0].schema.get_field_index("id"))[0].as_py() == "place-0"
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_remote_parquet_mode_is_read_from_sources_config():
+    temp_dir = _workspace_temp_dir()
+    try:
+        enabled = temp_dir / "enabled.yaml"
+        enabled.write_text("overture_release:\n  remote_parquet: true\n", encoding="utf-8")
+        without_block = temp_dir / "without_block.yaml"
+        without_block.write_text("serper:\n  api_key: test\n", encoding="utf-8")
+
+        assert OvertureReleaseConnector(config_path=str(enabled)).remote_parquet is True
+        assert OvertureReleaseConnector(config_path=str(without_block)).remote_parquet is False
+        assert OvertureReleaseConnector(config_path=str(temp_dir / "missing.yaml")).remote_parquet is False
+        # An explicit argument overrides the config
+        assert OvertureReleaseConnector(config_path=str(enabled), remote_parquet=False).remote_parquet is False
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,254 @@
+"""
+Tests for paged, streamed SportScotland WFS reads.
+
+A local WFS stub serves a layer built from a fixture feature, honours
+count/startIndex paging and writes each response feature by feature, so
+the connector's incremental parsing is exercised over a real socket.
+"""
+
+import asyncio
+import copy
+import json
+import shutil
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+from uuid import uuid4
+
+import pytest
+import yaml
+
+from engine.ingestion.connectors.sport_scotland import SportScotlandConnector
+from engine.ingestion.geojson_stream import FeatureStreamParser
+from engine.ingestion.http_mirror import HttpMirror
+
+
+FIXTURE = Path("tests/fixtures/connectors/sport_scotland/pub_sptk_feature.json")
+
+
+class _WfsHandler(BaseHTTPRequestHandler):
+    template = {}
+    total_features = 0
+    requests = []
+
+    def do_GET(self):
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        type(self).requests.append(params)
+
+        start = int(params.get("startIndex", 0))
+        count = int(params.get("count", self.total_features))
+        indices = range(start, min(start + count, self.total_features))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+
+        self.wfile.write(b'{"type":"FeatureCollection","features":[')
+        for n, index in enumerate(indices):
+            feature = copy.deepcopy(self.template)
+            feature["id"] = f"pub_sptk.{index}"
+            feature["properties"]["name"] = f"Facility {index}"
+            self.wfile.write((b"," if n else b"") + json.dumps(feature).encode("utf-8"))
+        tail = {
+            "totalFeatures": self.total_features,
+            "numberMatched": self.total_features,
+            "numberReturned": len(indices),
+            "crs": {"type": "name", "properties": {"name": "urn:ogc:def:crs:EPSG::4326"}},
+        }
+        self.wfile.write(b"]," + json.dumps(tail)[1:].encode("utf-8"))
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def wfs_server():
+    _WfsHandler.template = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    _WfsHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _WfsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def make_connector(wfs_server):
+    temp_dir = Path("tmp") / "test_sport_scotland_streaming" / uuid4().hex
+    temp_dir.mkdir(parents=True)
+
+    def make(total_features, paging=None):
+        _WfsHandler.total_features = total_features
+        source_config = {
+            "base_url": f"http://127.0.0.1:{wfs_server.server_port}/wfs",
+            "default_params": {"service": "WFS", "request": "GetFeature", "outputFormat": "application/json"},
+        }
+        if paging:
+            source_config["paging"] = paging
+        config_path = temp_dir / f"sources_{uuid4().hex}.yaml"
+        config_path.write_text(yaml.safe_dump({"sport_scotland": source_config}), encoding="utf-8")
+        return SportScotlandConnector(config_path=str(config_path))
+
+    try:
+        yield make
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_parser_handles_arbitrary_chunk_boundaries():
+    document = json.dumps({
+        "type": "FeatureCollection",
+        "features": [{"id": i, "properties": {"name": "Café " * i}} for i in range(20)],
+        "totalFeatures": 20,
+    }).encode("utf-8")
+
+    for size in (1, 2, 7, 4096):
+        parser = FeatureStreamParser()
+        features = []
+        for offset in range(0, len(document), size):
+            features.extend(parser.feed(document[offset:offset + size]))
+        features.extend(parser.close())
+        assert [f["id"] for f in features] == list(range(20))
+        assert parser.metadata == {"type": "FeatureCollection", "totalFeatures": 20}
+
+
+def test_parser_rejects_truncated_and_invalid_documents():
+    parser = FeatureStreamParser()
+    parser.feed(b'{"features":[{"id":1},')
+    with pytest.raises(ValueError):
+        parser.close()
+    with pytest.raises(ValueError):
+        FeatureStreamParser().feed(b'[{"id": 1}]')
+
+
+@pytest.mark.asyncio
+async def test_paged_fetch_requests_count_and_start_index(make_connector):
+    connector = make_connector(250, paging={"page_size": 100, "max_concurrency": 2})
+
+    data = await connector.fetch("pub_sptk")
+
+    ids = sorted(int(f["id"].split(".")[1]) for f in data["features"])
+    assert ids == list(range(250))
+    assert data["totalFeatures"] == 250
+    assert data["numberReturned"] == 250
+    page_starts = sorted(int(r["startIndex"]) for r in _WfsHandler.requests)
+    assert page_starts[:3] == [0, 100, 200]
+    assert all(r["count"] == "100" for r in _WfsHandler.requests)
+    assert all(r["typeName"] == "sh_sptk:pub_sptk" for r in _WfsHandler.requests)
+
+
+@pytest.mark.asyncio
+async def test_exact_multiple_of_page_size_stops_after_empty_page(make_connector):
+    connector = make_connector(200, paging={"page_size": 100, "max_concurrency": 1})
+
+    data = await connector.fetch("pub_sptk")
+
+    assert len(data["features"]) == 200
+    assert [int(r["startIndex"]) for r in _WfsHandler.requests] == [0, 100, 200]
+
+
+@pytest.mark.asyncio
+async def test_unpaged_fetch_matches_buffered_collection(make_connector):
+    connector = make_connector(30)
+
+    data = await connector.fetch("pub_sptk")
+
+    assert "count" not in _WfsHandler.requests[0]
+    assert len(data["features"]) == 30
+    assert data["features"][0]["properties"]["site_name"] == "Meadowbank Sports Centre"
+    assert data["crs"]["properties"]["name"] == "urn:ogc:def:crs:EPSG::4326"
+
+
+@pytest.mark.asyncio
+async def test_streaming_memory_is_bounded_by_page_not_layer(make_connector):
+    total = 20000
+    connector = make_connector(total, paging={"page_size": 2000, "max_concurrency": 2})
+    layer_bytes = total * len(json.dumps(_WfsHandler.template))
+
+    tracemalloc.start()
+    try:
+        received = 0
+        async for feature in connector.iter_features("pub_sptk"):
+            received += 1
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert received == total
+    # The layer is ~12MB of JSON; streaming holds a bounded window of it
+    assert peak < layer_bytes / 4
+
+
+@pytest.mark.asyncio
+async def test_page_failure_propagates(make_connector, monkeypatch):
+    connector = make_connector(500, paging={"page_size": 100, "max_concurrency": 3})
+    original = connector._stream_features
+
+    async def failing(session, params, metadata=None, outcomes=None):
+        if params["startIndex"] == 200:
+            raise RuntimeError("page 3 timed out")
+        async for feature in original(session, params, metadata, outcomes):
+            yield feature
+
+    monkeypatch.setattr(connector, "_stream_features", failing)
+
+    with pytest.raises(RuntimeError, match="page 3"):
+        await connector.fetch("pub_sptk")
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_adapter_maps_features_as_they_stream(make_connector):
+    from unittest.mock import MagicMock
+
+    from engine.orchestration.adapters import ConnectorAdapter
+    from engine.orchestration.execution_plan import ConnectorSpec, ExecutionPhase
+    from engine.orchestration.orchestrator_state import OrchestratorState
+    from engine.orchestration.query_features import QueryFeatures
+    from engine.orchestration.types import IngestionMode, IngestRequest
+
+    connector = make_connector(120, paging={"page_size": 50, "max_concurrency": 2})
+    connector.fetch = MagicMock(side_effect=AssertionError("buffered fetch should not be used"))
+    spec = ConnectorSpec(
+        name="sport_scotland",
+        phase=ExecutionPhase.ENRICHMENT,
+        trust_level=90,
+        requires=["request.query"],
+        provides=["context.candidates"],
+        supports_query_only=True,
+        estimated_cost_usd=0.0,
+    )
+    adapter = ConnectorAdapter(connector, spec)
+    state = OrchestratorState()
+    request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="sports halls")
+    features = QueryFeatures.extract(query=request.query, request=request)
+
+    await adapter.execute(request, features, MagicMock(), state)
+
+    assert len(state.candidates) == 120
+    assert state.metrics["sport_scotland"]["items_received"] == 120
+    assert {c["source"] for c in state.candidates} == {"sport_scotland"}
+
+
+@pytest.mark.asyncio
+async def test_mirrored_pages_report_not_modified_when_unchanged(make_connector):
+    mirror_dir = Path("tmp") / "test_sport_scotland_streaming" / f"mirror_{uuid4().hex}"
+    try:
+        connector = make_connector(150, paging={"page_size": 100, "max_concurrency": 2})
+        connector.mirror = HttpMirror("sport_scotland", str(mirror_dir))
+
+        first = await connector.fetch("pub_sptk")
+        assert connector.last_not_modified is False
+
+        # The stub sends no validators; identical page bodies still count as unchanged
+        data = await connector.fetch("pub_sptk")
+
+        assert len(data["features"]) == len(first["features"]) == 150
+        assert connector.last_not_modified is True
+    finally:
+        shutil.rmtree(mirror_dir, ignore_errors=True)
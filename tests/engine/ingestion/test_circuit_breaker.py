@@ -0,0 +1,204 @@
+"""
+Tests for the per-connector circuit breaker.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from engine.ingestion.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    SQLiteCircuitStateStore,
+    _reset_circuit_breakers,
+    create_circuit_state_store,
+    get_circuit_breaker,
+    load_circuit_breaker_config,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("serper", failure_threshold=3, recovery_timeout=30, clock=clock)
+
+
+class TestCircuitBreakerStates:
+    def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(2):
+            assert breaker.allow_request()
+            breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.rejected_calls == 1
+        assert breaker.transitions[-1].reason == "3 consecutive failures"
+
+    def test_success_resets_failure_count(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.consecutive_failures == 1
+
+    def test_half_open_after_recovery_timeout(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.retry_after() == pytest.approx(30)
+
+        clock.now += 30
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        # Only one probe at a time
+        assert not breaker.allow_request()
+
+    def test_probe_success_closes(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 31
+        assert breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert [t.to_state for t in breaker.transitions] == [
+            CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED,
+        ]
+
+    def test_probe_failure_reopens(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 31
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.retry_after() == pytest.approx(30)
+
+    def test_release_returns_probe_slot(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 31
+        assert breaker.allow_request()
+
+        breaker.release()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+
+    def test_check_raises_when_open(self, breaker):
+        for _ in range(3):
+            breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.check()
+        assert exc_info.value.name == "serper"
+        assert exc_info.value.retry_after == pytest.approx(30)
+
+    def test_rejects_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker("serper", failure_threshold=0)
+
+
+class TestCircuitBreakerConfig:
+    def test_source_overrides_global(self):
+        config = {
+            "global": {"circuit_breaker": {"failure_threshold": 5, "recovery_timeout": 60}},
+            "serper": {"circuit_breaker": {"failure_threshold": 2}},
+        }
+
+        settings = load_circuit_breaker_config("serper", config)
+
+        assert settings["failure_threshold"] == 2
+        assert settings["recovery_timeout"] == 60
+        assert settings["half_open_max_calls"] == 1
+
+    def test_sources_yaml_is_read_through_the_shared_cache(self, tmp_path, monkeypatch):
+        import engine.ingestion.circuit_breaker as circuit_breaker
+
+        config_path = tmp_path / "sources.yaml"
+        config_path.write_text("serper:\n  circuit_breaker:\n    failure_threshold: 2\n")
+        monkeypatch.setattr(circuit_breaker, "SOURCES_CONFIG_PATH", config_path)
+
+        with patch("engine.ingestion.sources_config.yaml.safe_load", wraps=yaml.safe_load) as parse:
+            assert load_circuit_breaker_config("serper")["failure_threshold"] == 2
+            assert load_circuit_breaker_config("serper")["failure_threshold"] == 2
+        assert parse.call_count == 1
+
+        monkeypatch.setattr(circuit_breaker, "SOURCES_CONFIG_PATH", tmp_path / "missing.yaml")
+        assert load_circuit_breaker_config("serper")["failure_threshold"] == 5
+
+    def test_registry_shares_breaker_per_name(self):
+        _reset_circuit_breakers()
+        try:
+            first = get_circuit_breaker("serper", config={})
+            assert get_circuit_breaker("serper") is first
+            assert get_circuit_breaker("google_places", config={}) is not first
+        finally:
+            _reset_circuit_breakers()
+
+
+class TestPersistedCircuitState:
+    def test_open_circuit_carries_over_to_a_new_process(self, tmp_path, clock):
+        store = SQLiteCircuitStateStore(tmp_path / "breakers.sqlite3")
+        wall = FakeClock()
+
+        # One failure per one-shot run: each run builds a fresh breaker
+        for _ in range(2):
+            run = CircuitBreaker("serper", failure_threshold=2, recovery_timeout=30,
+                                 clock=clock, store=SQLiteCircuitStateStore(store.path), wall_clock=wall)
+            assert run.allow_request()
+            run.record_failure()
+
+        # The next run skips the connector without waiting for a timeout
+        clock.now += 500  # Monotonic clocks do not carry across processes
+        wall.now += 10
+        blocked = CircuitBreaker("serper", failure_threshold=2, recovery_timeout=30,
+                                 clock=clock, store=store, wall_clock=wall)
+        assert blocked.state == CircuitState.OPEN
+        assert blocked.retry_after() == pytest.approx(20)
+        assert not blocked.allow_request()
+
+        wall.now += 25
+        probe = CircuitBreaker("serper", failure_threshold=2, recovery_timeout=30,
+                               clock=clock, store=store, wall_clock=wall)
+        assert probe.allow_request()
+        probe.record_success()
+
+        closed = CircuitBreaker("serper", failure_threshold=2, clock=clock, store=store, wall_clock=wall)
+        assert closed.state == CircuitState.CLOSED
+        assert closed.consecutive_failures == 0
+
+    def test_memory_backend_disables_persistence(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("CIRCUIT_BREAKER_BACKEND", "memory")
+        assert create_circuit_state_store({}) is None
+
+        monkeypatch.delenv("CIRCUIT_BREAKER_BACKEND")
+        config = {"global": {"circuit_breaker": {"state_path": str(tmp_path / "state.sqlite3")}}}
+        try:
+            store = create_circuit_state_store(config)
+            assert store.path == tmp_path / "state.sqlite3"
+            assert create_circuit_state_store(config) is store
+        finally:
+            _reset_circuit_breakers()
@@ -0,0 +1,185 @@
+"""Tests for batched raw-ingestion duplicate checks and the hash bloom filter."""
+
+import shutil
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from engine.ingestion.deduplication import (
+    HashBloomFilter,
+    _reset_hash_bloom_filter,
+    find_existing_hashes,
+    get_hash_bloom_filter,
+    warm_bloom_filter,
+)
+from engine.orchestration.persistence import PersistenceManager
+
+
+def _row(row_id, content_hash):
+    return SimpleNamespace(id=row_id, hash=content_hash)
+
+
+class FakeRawIngestionTable:
+    """In-memory rawingestion delegate answering `hash IN` and id-cursor queries."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.queries = []
+
+    async def find_many(self, where=None, order=None, take=None, cursor=None, skip=0):
+        self.queries.append({"where": where, "take": take, "cursor": cursor})
+        rows = sorted(self.rows, key=lambda row: row.id)
+        if where is not None:
+            wanted = set(where["hash"]["in"])
+            rows = [row for row in self.rows if row.hash in wanted]
+        if cursor is not None:
+            rows = [row for row in rows if row.id >= cursor["id"]][skip:]
+        return rows[:take] if take is not None else rows
+
+    async def count(self):
+        return len(self.rows)
+
+
+class TestHashBloomFilter:
+    def test_added_hashes_are_always_found(self):
+        bloom = HashBloomFilter(capacity=1000, error_rate=0.01)
+        hashes = [f"{i:016x}" for i in range(1000)]
+        bloom.update(hashes)
+        assert all(h in bloom for h in hashes)
+        assert bloom.count == 1000
+
+    def test_false_positive_rate_near_target(self):
+        bloom = HashBloomFilter(capacity=2000, error_rate=0.01)
+        bloom.update(f"present-{i}" for i in range(2000))
+        false_positives = sum(f"absent-{i}" in bloom for i in range(10000))
+        assert false_positives < 300  # 1% target, generous margin
+
+    def test_invalid_parameters_rejected(self):
+        with pytest.raises(ValueError):
+            HashBloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            HashBloomFilter(error_rate=1.5)
+
+
+class TestFindExistingHashes:
+    @pytest.mark.asyncio
+    async def test_one_query_per_batch(self):
+        table = FakeRawIngestionTable([_row("r1", "aaa"), _row("r2", "ccc")])
+        db = SimpleNamespace(rawingestion=table)
+
+        existing = await find_existing_hashes(db, ["aaa", "bbb", "ccc", "aaa", "ddd"], batch_size=2)
+
+        assert existing == {"aaa": "r1", "ccc": "r2"}
+        # 4 distinct hashes in batches of 2
+        assert [q["where"]["hash"]["in"] for q in table.queries] == [["aaa", "bbb"], ["ccc", "ddd"]]
+
+    @pytest.mark.asyncio
+    async def test_earliest_record_wins_for_repeated_hash(self):
+        table = FakeRawIngestionTable([_row("r1", "aaa"), _row("r2", "aaa")])
+        db = SimpleNamespace(rawingestion=table)
+
+        assert await find_existing_hashes(db, ["aaa"]) == {"aaa": "r1"}
+
+    @pytest.mark.asyncio
+    async def test_bloom_filter_skips_obvious_misses(self):
+        table = FakeRawIngestionTable([_row("r1", "aaa")])
+        db = SimpleNamespace(rawingestion=table)
+        bloom = HashBloomFilter(capacity=100)
+        bloom.add("aaa")
+
+        assert await find_existing_hashes(db, ["aaa", "new-1", "new-2"], bloom=bloom) == {"aaa": "r1"}
+        assert table.queries[0]["where"]["hash"]["in"] == ["aaa"]
+
+        table.queries.clear()
+        assert await find_existing_hashes(db, ["new-1", "new-2"], bloom=bloom) == {}
+        assert table.queries == []
+
+    @pytest.mark.asyncio
+    async def test_warm_bloom_filter_pages_through_table(self):
+        rows = [_row(f"r{i:03d}", f"hash-{i}") for i in range(25)]
+        table = FakeRawIngestionTable(rows)
+        db = SimpleNamespace(rawingestion=table)
+
+        bloom = await warm_bloom_filter(db, page_size=10)
+
+        assert all(row.hash in bloom for row in rows)
+        assert len(table.queries) == 3
+        assert table.queries[1]["cursor"] == {"id": "r009"}
+
+    @pytest.mark.asyncio
+    async def test_process_bloom_filter_is_warmed_once(self):
+        table = FakeRawIngestionTable([_row("r1", "aaa")])
+        db = SimpleNamespace(rawingestion=table)
+        _reset_hash_bloom_filter()
+        try:
+            bloom = await get_hash_bloom_filter(db)
+            assert "aaa" in bloom
+            queries = len(table.queries)
+
+            assert await get_hash_bloom_filter(db) is bloom
+            assert len(table.queries) == queries
+        finally:
+            _reset_hash_bloom_filter()
+
+
+@pytest.fixture
+def temp_cwd(monkeypatch):
+    path = Path("tmp") / "test_deduplication" / uuid.uuid4().hex
+    path.mkdir(parents=True)
+    monkeypatch.chdir(path)
+    yield path
+    monkeypatch.undo()
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.mark.asyncio
+async def test_persistence_checks_duplicates_in_batches(temp_cwd):
+    table = FakeRawIngestionTable([])
+    created = []
+
+    async def create(data):
+        record = _row(f"new-{len(created)}", data["hash"])
+        created.append(record)
+        table.rows.append(record)
+        return record
+
+    db = Mock()
+    db.rawingestion = table
+    db.rawingestion.create = create
+    db.extractedentity.create = AsyncMock()
+
+    candidates = [
+        {"source": "serper", "name": f"Venue {i}", "raw": {"title": f"Venue {i}"}}
+        for i in range(5)
+    ]
+    # Same payload twice in one run reuses the first record
+    candidates.append({"source": "serper", "name": "Venue 0", "raw": {"title": "Venue 0"}})
+
+    extracted = {"entity_class": "place", "attributes": {}, "discovered_attributes": {}}
+    with patch(
+        "engine.orchestration.persistence.extract_entity",
+        AsyncMock(return_value=extracted),
+    ) as extract:
+        manager = PersistenceManager(db=db, hash_batch_size=3)
+        result = await manager.persist_entities(candidates, errors=[])
+
+    assert result["persisted_count"] == 6
+    assert len(created) == 5
+    assert len(table.queries) == 2  # 6 candidates in batches of 3
+    assert extract.await_args_list[5].args[0] == extract.await_args_list[0].args[0]
+
+    # A second run finds every payload in one query and creates nothing
+    table.queries.clear()
+    with patch(
+        "engine.orchestration.persistence.extract_entity",
+        AsyncMock(return_value=extracted),
+    ):
+        manager = PersistenceManager(db=db)
+        result = await manager.persist_entities(candidates, errors=[])
+
+    assert result["persisted_count"] == 6
+    assert len(created) == 5
+    assert len(table.queries) == 1
@@ -0,0 +1,191 @@
+"""
+Tests for the conditional-request mirror.
+
+A local HTTP server serves a JSON document with ETag / Last-Modified
+validators and answers conditional requests with 304 when they match.
+"""
+
+import json
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from uuid import uuid4
+
+import aiohttp
+import pytest
+import yaml
+
+from engine.ingestion.connectors.edinburgh_council import EdinburghCouncilConnector
+from engine.ingestion.http_mirror import HttpMirror, load_mirror
+
+
+class _DatasetHandler(BaseHTTPRequestHandler):
+    payload = b""
+    etag = '"v1"'
+    last_modified = "Wed, 01 Jan 2026 00:00:00 GMT"
+    send_validators = True
+    status = 200
+    requests = []
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests.append(dict(self.headers))
+
+        if cls.status != 200:
+            self.send_response(cls.status)
+            self.end_headers()
+            self.wfile.write(b"upstream error")
+            return
+
+        # If-None-Match takes precedence over If-Modified-Since (RFC 7232)
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            matches = if_none_match == cls.etag
+        else:
+            matches = self.headers.get("If-Modified-Since") == cls.last_modified
+        if cls.send_validators and matches:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(cls.payload)))
+        if cls.send_validators:
+            self.send_header("ETag", cls.etag)
+            self.send_header("Last-Modified", cls.last_modified)
+        self.end_headers()
+        self.wfile.write(cls.payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _set_payload(features):
+    _DatasetHandler.payload = json.dumps({"type": "FeatureCollection", "features": features}).encode("utf-8")
+
+
+@pytest.fixture
+def server():
+    _DatasetHandler.requests = []
+    _DatasetHandler.etag = '"v1"'
+    _DatasetHandler.send_validators = True
+    _DatasetHandler.status = 200
+    _set_payload([{"id": 1}])
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _DatasetHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_port}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def mirror_dir():
+    path = Path("tmp") / "test_http_mirror" / uuid4().hex
+    path.mkdir(parents=True)
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.mark.asyncio
+async def test_second_request_is_conditional_and_served_from_mirror(server, mirror_dir):
+    mirror = HttpMirror("edinburgh_council", str(mirror_dir))
+
+    async with aiohttp.ClientSession() as session:
+        first, first_not_modified = await mirror.get_json(session, f"{server}/layer", params={"f": "geojson"})
+        second, second_not_modified = await mirror.get_json(session, f"{server}/layer", params={"f": "geojson"})
+
+    assert first == second == {"type": "FeatureCollection", "features": [{"id": 1}]}
+    assert first_not_modified is False
+    assert second_not_modified is True
+    assert "If-None-Match" not in _DatasetHandler.requests[0]
+    assert _DatasetHandler.requests[1]["If-None-Match"] == '"v1"'
+    assert _DatasetHandler.requests[1]["If-Modified-Since"] == _DatasetHandler.last_modified
+    assert mirror.stats.not_modified == 1
+    assert mirror.stats.bytes_served_from_mirror == len(_DatasetHandler.payload)
+
+
+@pytest.mark.asyncio
+async def test_changed_resource_replaces_mirrored_copy(server, mirror_dir):
+    mirror = HttpMirror("edinburgh_council", str(mirror_dir))
+
+    async with aiohttp.ClientSession() as session:
+        await mirror.get_json(session, f"{server}/layer")
+        _DatasetHandler.etag = '"v2"'
+        _set_payload([{"id": 1}, {"id": 2}])
+        data, not_modified = await mirror.get_json(session, f"{server}/layer")
+        again, again_not_modified = await mirror.get_json(session, f"{server}/layer")
+
+    assert not_modified is False
+    assert len(data["features"]) == 2
+    assert again == data and again_not_modified is True
+
+
+@pytest.mark.asyncio
+async def test_identical_body_without_validators_reports_not_modified(server, mirror_dir):
+    _DatasetHandler.send_validators = False
+    mirror = HttpMirror("open_charge_map", str(mirror_dir))
+
+    async with aiohttp.ClientSession() as session:
+        _, first = await mirror.get_json(session, f"{server}/poi/", params={"latitude": "55.95"})
+        _, second = await mirror.get_json(session, f"{server}/poi/", params={"latitude": "55.95"})
+        _, other_params = await mirror.get_json(session, f"{server}/poi/", params={"latitude": "56.00"})
+
+    assert (first, second, other_params) == (False, True, False)
+    assert mirror.stats.unchanged == 1
+    assert all("If-None-Match" not in headers for headers in _DatasetHandler.requests)
+
+
+@pytest.mark.asyncio
+async def test_error_status_raises_and_keeps_mirror(server, mirror_dir):
+    mirror = HttpMirror("edinburgh_council", str(mirror_dir))
+
+    async with aiohttp.ClientSession() as session:
+        await mirror.get_json(session, f"{server}/layer")
+        _DatasetHandler.status = 503
+        with pytest.raises(Exception, match="Edinburgh Council API request failed with status 503"):
+            await mirror.get_json(session, f"{server}/layer", label="Edinburgh Council API")
+
+    key = HttpMirror.request_key(f"{server}/layer")
+    assert mirror.load_entry(key).etag == '"v1"'
+    assert not list(mirror.directory.glob("*.part"))
+
+
+def test_params_are_not_written_to_disk(mirror_dir):
+    mirror = HttpMirror("open_charge_map", str(mirror_dir))
+    key = HttpMirror.request_key("https://api.example/poi/", {"key": "secret-api-key"})
+    assert "secret" not in key
+    assert key != HttpMirror.request_key("https://api.example/poi/", {"key": "other"})
+    assert mirror.load_entry(key) is None
+
+
+def test_load_mirror_requires_block():
+    assert load_mirror("sport_scotland", {"base_url": "x"}) is None
+    assert load_mirror("sport_scotland", {"mirror": {"enabled": False}}) is None
+    assert load_mirror("sport_scotland", {"mirror": {"enabled": True}}).directory == Path(
+        "engine/data/mirror/sport_scotland"
+    )
+
+
+@pytest.mark.asyncio
+async def test_edinburgh_council_signals_not_modified(server, mirror_dir):
+    config_path = mirror_dir / "sources.yaml"
+    config_path.write_text(yaml.safe_dump({"edinburgh_council": {
+        "base_url": f"{server}/datasets",
+        "mirror": {"enabled": True, "directory": str(mirror_dir / "mirror")},
+    }}), encoding="utf-8")
+    connector = EdinburghCouncilConnector(config_path=str(config_path))
+
+    first = await connector.fetch("sports_facilities")
+    assert connector.last_not_modified is False
+    second = await connector.fetch("sports_facilities")
+
+    assert second == first
+    assert connector.last_not_modified is True
+    assert (mirror_dir / "mirror" / "edinburgh_council").is_dir()
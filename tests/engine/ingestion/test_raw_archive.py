@@ -0,0 +1,300 @@
+"""Tests for raw archive compaction and bulk archive reads."""
+
+import json
+import shutil
+import uuid
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import engine.ingestion.compact_raw_archive as compact_raw_archive
+from engine.extraction.run import run_archive_extraction
+from engine.ingestion.compact_raw_archive import (
+    DEFAULT_MAX_ROWS_PER_FILE,
+    CompactionStats,
+    _flush_partition,
+    compact_raw_ingestions,
+)
+from engine.ingestion.raw_archive import (
+    iter_archived_records,
+    parse_archive_locator,
+    scan_archive,
+)
+from engine.ingestion.raw_store import ContentAddressedRawStore, load_raw_payload
+
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def temp_dir():
+    path = Path("tmp") / "test_raw_archive" / uuid.uuid4().hex
+    path.mkdir(parents=True)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class FakeRawIngestionTable:
+    def __init__(self, rows):
+        self.rows = {row.id: row for row in rows}
+
+    async def find_many(self, where=None, take=None, order=None, cursor=None, skip=0):
+        fields = [field for clause in order or [{"id": "asc"}] for field in clause]
+        ids = sorted(self.rows, key=lambda row_id: [getattr(self.rows[row_id], f) for f in fields])
+        if where is not None:
+            cutoff = where["ingested_at"]["lt"]
+            ids = [row_id for row_id in ids if self.rows[row_id].ingested_at < cutoff]
+        if cursor is not None:
+            ids = ids[ids.index(cursor["id"]):][skip:]
+        return [self.rows[row_id] for row_id in ids[:take]]
+
+    async def count(self, where):
+        return sum(row.file_path == where["file_path"] for row in self.rows.values())
+
+
+class FakeDb:
+    def __init__(self, rows):
+        self.rawingestion = FakeRawIngestionTable(rows)
+        self.fail_updates = False
+        self.statements = 0
+
+    @asynccontextmanager
+    async def tx(self, max_wait=None, timeout=None):
+        yield self
+
+    async def execute_raw(self, query, *params):
+        if self.fail_updates:
+            raise RuntimeError("connection lost")
+        assert query.startswith('UPDATE "RawIngestion"')
+        self.statements += 1
+        pairs = list(zip(params[::2], params[1::2]))
+        for row_id, file_path in pairs:
+            self.rawingestion.rows[row_id].file_path = file_path
+        return len(pairs)
+
+
+class DeadlineDb(FakeDb):
+    """Interactive transaction that is rolled back once it outlives its timeout."""
+
+    # Simulated round trip of one statement
+    STATEMENT_SECONDS = 0.01
+
+    def __init__(self, rows):
+        super().__init__(rows)
+        self.timeouts = []
+
+    @asynccontextmanager
+    async def tx(self, max_wait=None, timeout=timedelta(seconds=5)):
+        self.timeouts.append(timeout)
+        started = self.statements
+        yield self
+        if (self.statements - started) * self.STATEMENT_SECONDS > timeout.total_seconds():
+            raise RuntimeError("Transaction already closed: timeout")
+
+
+def _make_rows(temp_dir):
+    legacy_dir = temp_dir / "raw"
+    legacy_dir.mkdir()
+    rows = []
+    for i in range(6):
+        source = "serper" if i % 2 else "sport_scotland"
+        path = legacy_dir / f"{i}.json"
+        path.write_text(json.dumps({"n": i, "source": source}, indent=2), encoding="utf-8")
+        rows.append(SimpleNamespace(
+            id=f"r{i}",
+            source=source,
+            source_url=f"https://example.com/{i}",
+            file_path=path.as_posix(),
+            status="success",
+            hash=f"hash{i}",
+            ingested_at=NOW - timedelta(days=40 + i // 3),
+            metadata_json="{}",
+            orchestration_run_id=None,
+        ))
+    # Too recent to archive
+    rows[5].ingested_at = NOW - timedelta(days=2)
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_compaction_packs_partitions_and_repoints_records(temp_dir):
+    rows = _make_rows(temp_dir)
+    db = FakeDb(rows)
+    root = temp_dir / "archive"
+
+    dry = await compact_raw_ingestions(db, root=root, now=NOW, dry_run=True)
+    assert dry.archived == 5
+    assert not root.exists()
+
+    stats = await compact_raw_ingestions(db, root=root, now=NOW, delete_originals=True)
+
+    assert stats.records == 5
+    assert stats.archived == 5
+    # sport_scotland and serper on two ingest dates
+    assert stats.files_written == 4
+    assert stats.originals_deleted == 5
+    assert sorted(p.relative_to(root).parts[:2] for p in root.rglob("*.parquet")) == [
+        ("source=serper", "ingest_date=2026-01-19"),
+        ("source=serper", "ingest_date=2026-01-20"),
+        ("source=sport_scotland", "ingest_date=2026-01-19"),
+        ("source=sport_scotland", "ingest_date=2026-01-20"),
+    ]
+    for row in rows[:5]:
+        assert parse_archive_locator(row.file_path) is not None
+        assert load_raw_payload(row.file_path) == {"n": int(row.id[1:]), "source": row.source}
+    assert rows[5].file_path.endswith("5.json")
+
+    rerun = await compact_raw_ingestions(db, root=root, now=NOW)
+    assert rerun.already_archived == 5
+    assert rerun.files_written == 0
+
+
+@pytest.mark.asyncio
+async def test_compaction_buffers_one_partition_at_a_time(temp_dir):
+    """Ids interleave partitions; the (source, ingested_at) scan keeps each contiguous."""
+    rows = _make_rows(temp_dir)
+    db = FakeDb(rows)
+    built = []
+    flushed = []
+    real_archive_row = compact_raw_archive._archive_row
+    real_flush = compact_raw_archive._flush_partition
+
+    def archive_row(row, payload):
+        built.append(row.id)
+        return real_archive_row(row, payload)
+
+    async def flush(db, root, key, pending, stats):
+        # Nothing beyond the partition being flushed is held in memory
+        assert len(built) - sum(flushed) == len(pending)
+        flushed.append(len(pending))
+        await real_flush(db, root, key, pending, stats)
+
+    with patch.object(compact_raw_archive, "_archive_row", archive_row), \
+            patch.object(compact_raw_archive, "_flush_partition", flush):
+        stats = await compact_raw_ingestions(db, root=temp_dir / "archive", now=NOW, page_size=2)
+
+    assert stats.files_written == 4
+    assert sorted(flushed) == [1, 1, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_failed_pointer_update_removes_archive_file(temp_dir):
+    rows = _make_rows(temp_dir)
+    db = FakeDb(rows)
+    db.fail_updates = True
+    root = temp_dir / "archive"
+
+    with pytest.raises(RuntimeError):
+        await compact_raw_ingestions(db, root=root, now=NOW)
+
+    assert not list(root.rglob("*.parquet*"))
+    assert all(row.file_path.endswith(".json") for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_full_archive_file_repoints_within_transaction_timeout(temp_dir):
+    rows = [
+        SimpleNamespace(id=f"r{i:05d}", file_path=f"raw/{i}.json")
+        for i in range(DEFAULT_MAX_ROWS_PER_FILE)
+    ]
+    db = DeadlineDb(rows)
+    pending = [
+        (row, {
+            "raw_ingestion_id": row.id,
+            "source_url": None,
+            "status": "success",
+            "hash": "h",
+            "ingested_at": NOW,
+            "orchestration_run_id": None,
+            "metadata_json": None,
+            "original_file_path": row.file_path,
+            "payload": "{}",
+        })
+        for row in rows
+    ]
+    stats = CompactionStats()
+
+    await _flush_partition(db, temp_dir / "archive", ("serper", "2026-01-19"), pending, stats)
+
+    assert stats.archived == DEFAULT_MAX_ROWS_PER_FILE
+    assert len(db.timeouts) == 1
+    assert db.statements * DeadlineDb.STATEMENT_SECONDS < db.timeouts[0].total_seconds()
+    assert all(parse_archive_locator(row.file_path) for row in rows)
+    assert rows[-1].file_path.endswith(f"#{DEFAULT_MAX_ROWS_PER_FILE - 1}")
+
+
+@pytest.mark.asyncio
+async def test_shared_store_objects_are_kept_while_referenced(temp_dir):
+    store = ContentAddressedRawStore(root=temp_dir / "objects", compression="gzip")
+    shared = store.put("serper", "padel", {"title": "Game4Padel"})
+    rows = [
+        SimpleNamespace(
+            id=f"r{i}", source="serper", source_url=None, file_path=shared, status="success",
+            hash="h", ingested_at=NOW - timedelta(days=age), metadata_json=None,
+            orchestration_run_id=None,
+        )
+        for i, age in enumerate([60, 1])
+    ]
+    db = FakeDb(rows)
+
+    stats = await compact_raw_ingestions(db, root=temp_dir / "archive", now=NOW, delete_originals=True)
+
+    assert stats.archived == 1
+    assert stats.originals_deleted == 0
+    assert Path(shared).exists()
+
+
+@pytest.mark.asyncio
+async def test_scan_filters_partitions_and_projects_columns(temp_dir):
+    rows = _make_rows(temp_dir)
+    root = temp_dir / "archive"
+    await compact_raw_ingestions(FakeDb(rows), root=root, now=NOW)
+
+    batches = list(scan_archive(
+        root,
+        sources=["serper"],
+        since=date(2026, 1, 20),
+        columns=["raw_ingestion_id", "ingest_date"],
+    ))
+    assert [batch.schema.names for batch in batches] == [["raw_ingestion_id", "ingest_date"]]
+    assert batches[0].column(0).to_pylist() == ["r1"]
+
+    records = [record for batch in iter_archived_records(root) for record in batch]
+    assert sorted(raw_id for raw_id, _, _ in records) == ["r0", "r1", "r2", "r3", "r4"]
+    assert dict((raw_id, payload["n"]) for raw_id, _, payload in records)["r3"] == 3
+
+    assert list(scan_archive(temp_dir / "missing")) == []
+
+
+@pytest.mark.asyncio
+async def test_archive_extraction_reads_one_scan(temp_dir):
+    rows = _make_rows(temp_dir)
+    root = temp_dir / "archive"
+    await compact_raw_ingestions(FakeDb(rows), root=root, now=NOW)
+
+    db = SimpleNamespace(
+        extractedentity=SimpleNamespace(
+            find_many=AsyncMock(return_value=[SimpleNamespace(raw_ingestion_id="r2")]),
+            create=AsyncMock(),
+        ),
+    )
+    extracted = []
+
+    async def extract_and_save(db, raw_id, source, raw_data, dry_run):
+        extracted.append((raw_id, source, raw_data["n"]))
+        return None
+
+    with patch("engine.extraction.run._extract_and_save", side_effect=extract_and_save), \
+            patch("engine.extraction.run.load_raw_payload") as load:
+        result = await run_archive_extraction(db, source="sport_scotland", archive_root=str(root))
+
+    load.assert_not_called()
+    assert result["total_records"] == 3
+    assert result["already_extracted"] == 1
+    assert sorted(extracted) == [("r0", "sport_scotland", 0), ("r4", "sport_scotland", 4)]
@@ -0,0 +1,232 @@
+"""Tests for raw payload stores and the raw store migration."""
+
+import json
+import shutil
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from engine.ingestion.migrate_raw_store import migrate_raw_store
+from engine.ingestion.raw_store import (
+    ContentAddressedRawStore,
+    JsonFileRawStore,
+    SegmentLogRawStore,
+    load_raw_payload,
+    load_raw_store,
+    load_segment_index,
+    parse_segment_locator,
+    read_raw_text,
+)
+from engine.orchestration.persistence import PersistenceManager
+
+
+PAYLOAD = {"organic": [{"title": "Game4Padel", "snippet": "Padel courts in Edinburgh – book now"}]}
+
+
+@pytest.fixture
+def temp_dir():
+    path = Path("tmp") / "test_raw_store" / uuid.uuid4().hex
+    path.mkdir(parents=True)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class TestContentAddressedRawStore:
+    def test_round_trip_gzip(self, temp_dir):
+        store = ContentAddressedRawStore(root=temp_dir / "objects", compression="gzip")
+        file_path = store.put("serper", "padel", PAYLOAD)
+
+        assert file_path.endswith(".json.gz")
+        assert load_raw_payload(file_path) == PAYLOAD
+        assert json.loads(read_raw_text(file_path)) == PAYLOAD
+        assert store.owns(file_path)
+
+    def test_objects_are_sharded_by_content_hash(self, temp_dir):
+        store = ContentAddressedRawStore(root=temp_dir, compression="none")
+        path = Path(store.put("serper", "padel", PAYLOAD))
+
+        digest = path.name[: -len(".json")]
+        assert len(digest) == 64
+        assert path.parent == temp_dir / digest[:2] / digest[2:4]
+        # Compact serialization, not indent=2
+        assert b"\n" not in path.read_bytes()
+
+    def test_identical_payload_is_written_once(self, temp_dir):
+        store = ContentAddressedRawStore(root=temp_dir, compression="gzip")
+        first = store.put("serper", "padel", PAYLOAD)
+        mtime = Path(first).stat().st_mtime_ns
+
+        second = store.put("google_places", "other", json.loads(json.dumps(PAYLOAD)))
+
+        assert second == first
+        assert Path(first).stat().st_mtime_ns == mtime
+        assert store.stats.written == 1
+        assert store.stats.reused == 1
+        assert len(list(temp_dir.rglob("*.gz"))) == 1
+
+    def test_compression_shrinks_payload(self, temp_dir):
+        payload = {"elements": [{"type": "node", "id": i, "tags": {"sport": "padel"}} for i in range(200)]}
+        store = ContentAddressedRawStore(root=temp_dir, compression="gzip")
+        path = store.put("openstreetmap", "padel", payload)
+
+        assert Path(path).stat().st_size < len(json.dumps(payload, indent=2)) / 10
+
+    def test_unknown_compression_rejected(self, temp_dir):
+        with pytest.raises(ValueError):
+            ContentAddressedRawStore(root=temp_dir, compression="lz4")
+
+
+class TestSegmentLogRawStore:
+    def test_run_appends_to_one_segment(self, temp_dir):
+        store = SegmentLogRawStore(root=temp_dir)
+        payloads = [{"id": i, "name": f"Venue {i}"} for i in range(60)]
+        paths = [store.put("overture_release", f"row{i}", p) for i, p in enumerate(payloads)]
+        store.finish()
+
+        segments = list(temp_dir.glob("*.jsonl"))
+        assert len(segments) == 1
+        assert [load_raw_payload(path) for path in paths] == payloads
+        assert store.owns(paths[0])
+
+        index = load_segment_index(segments[0])
+        assert [(r.offset, r.length) for r in index] == [parse_segment_locator(p)[1:] for p in paths]
+        assert index[3].record_id == "row3"
+        assert index[3].source == "overture_release"
+
+    def test_buffered_record_is_readable_before_finish(self, temp_dir):
+        store = SegmentLogRawStore(root=temp_dir)
+        first = store.put("serper", "a", {"n": 1})
+        assert load_raw_payload(first) == {"n": 1}
+
+        # Segment grows after the first read was mapped
+        second = store.put("serper", "b", {"n": 2})
+        assert json.loads(read_raw_text(second)) == {"n": 2}
+        store.finish()
+
+    def test_identical_payloads_share_a_record(self, temp_dir):
+        store = SegmentLogRawStore(root=temp_dir)
+        assert store.put("serper", "a", PAYLOAD) == store.put("serper", "b", PAYLOAD)
+        assert store.stats.written == 1
+        assert store.stats.reused == 1
+        store.finish()
+
+    def test_segments_roll_over_and_runs_start_new_segments(self, temp_dir):
+        store = SegmentLogRawStore(root=temp_dir, max_segment_bytes=100)
+        paths = [store.put("serper", str(i), {"padding": "x" * 40, "n": i}) for i in range(4)]
+        store.finish()
+        store.put("serper", "next_run", {"n": 99})
+        store.finish()
+
+        assert len({parse_segment_locator(p)[0] for p in paths}) == 4
+        assert len(list(temp_dir.glob("*.jsonl"))) == 5
+        assert [load_raw_payload(p)["n"] for p in paths] == [0, 1, 2, 3]
+
+    def test_index_rebuilt_by_scan_when_missing(self, temp_dir):
+        store = SegmentLogRawStore(root=temp_dir)
+        paths = [store.put("serper", str(i), {"n": i}) for i in range(3)]
+        store.finish()
+        segment = Path(parse_segment_locator(paths[0])[0])
+        Path(str(segment) + ".idx").unlink()
+
+        index = load_segment_index(segment)
+        assert [(r.offset, r.length) for r in index] == [parse_segment_locator(p)[1:] for p in paths]
+        assert index[0].content_hash is None
+
+
+def test_legacy_json_files_still_load(temp_dir):
+    path = temp_dir / "20260113_padel.json"
+    path.write_text(json.dumps(PAYLOAD, indent=2), encoding="utf-8")
+    assert load_raw_payload(str(path)) == PAYLOAD
+
+
+def test_load_raw_store_backends(temp_dir):
+    assert isinstance(load_raw_store({"backend": "files"}), JsonFileRawStore)
+    store = load_raw_store({"root": str(temp_dir), "compression": "none"})
+    assert isinstance(store, ContentAddressedRawStore)
+    assert store.suffix == ".json"
+    assert isinstance(load_raw_store({"backend": "segments", "root": str(temp_dir)}), SegmentLogRawStore)
+    with pytest.raises(ValueError):
+        load_raw_store({"backend": "s3"})
+
+
+class FakeRawIngestionTable:
+    def __init__(self, rows):
+        self.rows = {row.id: row for row in rows}
+
+    async def find_many(self, take=None, order=None, cursor=None, skip=0):
+        ids = sorted(self.rows)
+        if cursor is not None:
+            ids = [row_id for row_id in ids if row_id >= cursor["id"]][skip:]
+        return [self.rows[row_id] for row_id in ids[:take]]
+
+    async def update(self, where, data):
+        self.rows[where["id"]].file_path = data["file_path"]
+
+
+@pytest.mark.asyncio
+async def test_migration_moves_files_into_store(temp_dir):
+    legacy_dir = temp_dir / "raw" / "serper"
+    legacy_dir.mkdir(parents=True)
+    rows = []
+    for i in range(5):
+        path = legacy_dir / f"2026011{i}_padel.json"
+        # Three files share one payload
+        path.write_text(json.dumps(PAYLOAD if i < 3 else {"n": i}, indent=2), encoding="utf-8")
+        rows.append(SimpleNamespace(id=f"r{i}", source="serper", file_path=path.as_posix()))
+    rows.append(SimpleNamespace(id="r9", source="serper", file_path=(legacy_dir / "gone.json").as_posix()))
+    db = SimpleNamespace(rawingestion=FakeRawIngestionTable(rows))
+    store = ContentAddressedRawStore(root=temp_dir / "objects", compression="gzip")
+
+    dry = await migrate_raw_store(db, store, dry_run=True, page_size=2)
+    assert dry.migrated == 5
+    assert dry.missing == 1
+    assert store.stats.written == 0
+
+    stats = await migrate_raw_store(db, store, delete_originals=True, page_size=2)
+
+    assert stats.migrated == 5
+    assert stats.objects_written == 3
+    assert stats.originals_deleted == 5
+    assert stats.bytes_after < stats.bytes_before
+    assert not list(legacy_dir.glob("*.json"))
+    assert rows[0].file_path == rows[1].file_path == rows[2].file_path
+    assert load_raw_payload(rows[0].file_path) == PAYLOAD
+    assert load_raw_payload(rows[4].file_path) == {"n": 4}
+
+    rerun = await migrate_raw_store(db, store, page_size=2)
+    assert rerun.already_migrated == 5
+    assert rerun.migrated == 0
+
+
+@pytest.mark.asyncio
+async def test_persistence_run_writes_one_segment(temp_dir):
+    rows = {}
+
+    async def create(data):
+        row = SimpleNamespace(**data)
+        rows[row.id] = row
+        return row
+
+    db = Mock()
+    db.rawingestion.find_many = AsyncMock(return_value=[])
+    db.rawingestion.create = create
+    db.extractedentity.create = AsyncMock()
+
+    extracted = {"entity_class": "place", "attributes": {}, "discovered_attributes": {}}
+    candidates = [
+        {"source": "overture_release", "name": f"Venue {i}", "raw": {"id": i}}
+        for i in range(60)
+    ]
+    store = SegmentLogRawStore(root=temp_dir)
+    with patch("engine.orchestration.persistence.extract_entity", AsyncMock(return_value=extracted)):
+        manager = PersistenceManager(db=db, raw_store=store)
+        result = await manager.persist_entities(candidates, errors=[])
+
+    assert result["persisted_count"] == 60
+    assert sorted(load_raw_payload(row.file_path)["id"] for row in rows.values()) == list(range(60))
+    assert len(list(temp_dir.glob("*.jsonl"))) == 1
+    assert len(list(temp_dir.glob("*.jsonl.idx"))) == 1  # segment closed at end of run
+    assert store.segment is None
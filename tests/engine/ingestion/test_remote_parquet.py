@@ -0,0 +1,206 @@
+"""
+Tests for HTTP range-request partial parquet downloads.
+
+A local HTTP server serves a generated Overture-shaped parquet fixture and
+records every Range header it receives.
+"""
+
+import hashlib
+import re
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from engine.ingestion.connectors.overture_release import OvertureReleaseConnector
+from engine.ingestion.remote_parquet import (
+    RangeRequestsNotSupported,
+    RemoteParquetFile,
+    SparseFileManifest,
+    merge_ranges,
+    parse_content_range,
+)
+
+
+EDINBURGH = {"minx": -3.4, "miny": 55.85, "maxx": -3.0, "maxy": 56.0}
+
+# (lng, lat) per row group: Glasgow, Edinburgh, London, Aberdeen
+ROW_GROUP_CENTRES = [(-4.25, 55.86), (-3.19, 55.95), (-0.12, 51.50), (-2.09, 57.15)]
+ROWS_PER_GROUP = 200
+
+
+def _fixture_rows():
+    rows = []
+    for group, (lng, lat) in enumerate(ROW_GROUP_CENTRES):
+        for i in range(ROWS_PER_GROUP):
+            index = group * ROWS_PER_GROUP + i
+            rows.append({
+                "id": f"place-{index}",
+                "names": {"primary": f"Place {index}"},
+                "bbox": {"xmin": lng, "xmax": lng + 0.001, "ymin": lat, "ymax": lat + 0.001},
+                # Incompressible, unprojected payload that must never be downloaded
+                "filler": "".join(
+                    hashlib.sha256(f"{index}-{k}".encode()).hexdigest() for k in range(32)
+                ),
+            })
+    return rows
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    payload = b""
+    supports_ranges = True
+    requests = []
+
+    def do_GET(self):
+        range_header = self.headers.get("Range")
+        type(self).requests.append(range_header)
+        size = len(self.payload)
+
+        if not range_header or not self.supports_ranges:
+            self.send_response(200)
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            self.wfile.write(self.payload)
+            return
+
+        suffix = re.fullmatch(r"bytes=-(\d+)", range_header)
+        if suffix:
+            start, end = max(0, size - int(suffix.group(1))), size - 1
+        else:
+            match = re.fullmatch(r"bytes=(\d+)-(\d+)", range_header)
+            start, end = int(match.group(1)), min(int(match.group(2)), size - 1)
+
+        body = self.payload[start:end + 1]
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def workspace():
+    temp_dir = Path("tmp") / "test_remote_parquet" / uuid4().hex
+    temp_dir.mkdir(parents=True, exist_ok=False)
+    yield temp_dir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def parquet_server(workspace):
+    fixture_path = workspace / "fixture.parquet"
+    pq.write_table(pa.Table.from_pylist(_fixture_rows()), fixture_path, row_group_size=ROWS_PER_GROUP)
+
+    handler = type("Handler", (_RangeHandler,), {
+        "payload": fixture_path.read_bytes(),
+        "supports_ranges": True,
+        "requests": [],
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_merge_and_missing_ranges():
+    assert merge_ranges([(10, 20), (0, 5), (18, 30)]) == [(0, 5), (10, 30)]
+    assert merge_ranges([(0, 5), (8, 10)], gap=3) == [(0, 10)]
+
+    manifest = SparseFileManifest(url="u", size=100, ranges=[(10, 20), (40, 50)])
+    assert manifest.missing([(0, 60)]) == [(0, 10), (20, 40), (50, 60)]
+    assert manifest.missing([(12, 18)]) == []
+    assert parse_content_range("bytes 90-99/100") == (90, 99, 100)
+
+
+@pytest.mark.asyncio
+async def test_fetches_footer_and_intersecting_row_groups_only(parquet_server, workspace):
+    base_url, handler = parquet_server
+    remote = RemoteParquetFile(f"{base_url}/part-00000.parquet", workspace / "cache" / "part-00000.parquet")
+
+    result = await remote.fetch_row_groups(bbox=EDINBURGH, columns=["id", "names", "bbox"])
+
+    assert result.row_groups == [1]
+    assert result.row_groups_total == 4
+    assert result.total_bytes == len(handler.payload)
+    # Filler column and the other row groups are never transferred
+    assert result.bytes_downloaded < result.total_bytes / 4
+
+    table = pq.ParquetFile(result.path).read_row_groups(result.row_groups, columns=["id", "names"])
+    assert table.column("id").to_pylist() == [f"place-{i}" for i in range(200, 400)]
+
+
+@pytest.mark.asyncio
+async def test_refresh_reuses_sparse_cache(parquet_server, workspace):
+    base_url, handler = parquet_server
+    url = f"{base_url}/part-00000.parquet"
+    cache_path = workspace / "cache" / "part-00000.parquet"
+
+    await RemoteParquetFile(url, cache_path).fetch_row_groups(bbox=EDINBURGH, columns=["id", "names"])
+    handler.requests.clear()
+
+    again = await RemoteParquetFile(url, cache_path).fetch_row_groups(bbox=EDINBURGH, columns=["id", "names"])
+
+    assert again.bytes_downloaded == 0
+    assert handler.requests == []
+
+    # Widening the projection downloads just the new column chunks
+    wider = await RemoteParquetFile(url, cache_path).fetch_row_groups(
+        bbox=EDINBURGH, columns=["id", "names", "bbox"]
+    )
+    assert 0 < wider.bytes_downloaded < wider.total_bytes / 4
+
+
+@pytest.mark.asyncio
+async def test_server_without_range_support_is_reported(parquet_server, workspace):
+    base_url, handler = parquet_server
+    handler.supports_ranges = False
+
+    remote = RemoteParquetFile(f"{base_url}/part-00000.parquet", workspace / "cache" / "p.parquet")
+
+    with pytest.raises(RangeRequestsNotSupported):
+        await remote.fetch_row_groups(bbox=EDINBURGH)
+
+
+@pytest.mark.asyncio
+async def test_connector_remote_mode_reads_only_lens_area(parquet_server, workspace):
+    base_url, handler = parquet_server
+    connector = OvertureReleaseConnector(
+        cache_dir=str(workspace / "overture"),
+        blob_base_url=base_url,
+        remote_parquet=True,
+        # Remote mode ignores the whole-file size cap
+        max_artifact_size_bytes=1,
+    )
+    listing = (
+        "<ListBucketResult><Contents>"
+        "<Key>release/2026-02-01.0/theme=places/type=place/part-00000.parquet</Key>"
+        f"<Size>{len(handler.payload)}</Size>"
+        "</Contents></ListBucketResult>"
+    )
+    connector._fetch_text = AsyncMock(
+        side_effect=lambda url: "release/2026-02-01.0/"
+        if url == connector.getting_data_url
+        else listing
+    )
+
+    payload = await connector.fetch("ignored query")
+
+    assert [row["id"] for row in payload["results"]] == [f"place-{i}" for i in range(200, 400)]
+    assert "filler" not in payload["results"][0]
+    transfer = connector.last_transfer[0]
+    assert transfer["row_groups"] == [1]
+    assert transfer["bytes_downloaded"] < transfer["total_bytes"] / 4
@@ -0,0 +1,131 @@
+"""
+Tests for jittered, Retry-After aware retries.
+"""
+
+import random
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from engine.ingestion.circuit_breaker import CircuitBreaker, CircuitOpenError
+from engine.ingestion.retry_logic import (
+    MaxRetriesExceeded,
+    compute_backoff_delay,
+    get_retry_after,
+    get_status_code,
+    parse_retry_after,
+    retry_with_backoff,
+)
+
+
+class HTTPError(Exception):
+    """Minimal stand-in for aiohttp.ClientResponseError."""
+
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers or {}
+
+
+class TestBackoffDelay:
+    def test_without_jitter_is_exponential_and_capped(self):
+        delays = [compute_backoff_delay(n, 1.0, 2.0, 5.0, jitter=False) for n in range(4)]
+        assert delays == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_stays_within_half_to_full_delay(self):
+        rng = random.Random(42)
+        for attempt in range(5):
+            nominal = min(2.0 ** attempt, 60.0)
+            delay = compute_backoff_delay(attempt, 1.0, 2.0, 60.0, jitter=True, rng=rng)
+            assert nominal / 2 <= delay <= nominal
+
+
+class TestRetryAfterParsing:
+    def test_parses_delay_seconds(self):
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(7) == 7.0
+
+    def test_parses_http_date(self):
+        now = datetime(2026, 10, 18, 12, 0, 0, tzinfo=timezone.utc)
+        assert parse_retry_after("Sun, 18 Oct 2026 12:00:30 GMT", now=now) == 30.0
+
+    def test_unparseable_value_is_ignored(self):
+        assert parse_retry_after("soon") is None
+
+    def test_reads_header_from_exception_or_response(self):
+        assert get_retry_after(HTTPError(429, {"Retry-After": "3"})) == 3.0
+
+        error = Exception("rate limited")
+        error.response = HTTPError(503, {"retry-after": "9"})
+        assert get_retry_after(error) == 9.0
+        assert get_status_code(error) == 503
+        assert get_retry_after(Exception("no response")) is None
+
+
+class TestRetryWithBackoff:
+    @pytest.mark.asyncio
+    async def test_delays_are_not_jittered_by_default(self):
+        calls = AsyncMock(side_effect=[ConnectionError("down"), ConnectionError("down"), "ok"])
+
+        @retry_with_backoff(max_retries=2, initial_delay=1.0, backoff_factor=2.0)
+        async def fetch():
+            return await calls()
+
+        with patch("engine.ingestion.retry_logic.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await fetch() == "ok"
+
+        assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_waits_at_least_retry_after(self):
+        calls = AsyncMock(side_effect=[HTTPError(429, {"Retry-After": "4"}), "ok"])
+
+        @retry_with_backoff(max_retries=2, initial_delay=0.1, max_delay=10)
+        async def fetch():
+            return await calls()
+
+        with patch("engine.ingestion.retry_logic.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await fetch() == "ok"
+
+        sleep.assert_awaited_once_with(4.0)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_retry_after_exceeds_max_delay(self):
+        calls = AsyncMock(side_effect=HTTPError(429, {"Retry-After": "3600"}))
+
+        @retry_with_backoff(max_retries=3, initial_delay=0.1, max_delay=10)
+        async def fetch():
+            return await calls()
+
+        with patch("engine.ingestion.retry_logic.asyncio.sleep", new=AsyncMock()) as sleep:
+            with pytest.raises(MaxRetriesExceeded):
+                await fetch()
+
+        assert calls.await_count == 1
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_status_raises_immediately(self):
+        calls = AsyncMock(side_effect=HTTPError(404))
+
+        @retry_with_backoff(max_retries=3, initial_delay=0, retry_on_status_codes=[429, 503])
+        async def fetch():
+            return await calls()
+
+        with pytest.raises(HTTPError):
+            await fetch()
+        assert calls.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stops_retrying_once_circuit_opens(self):
+        breaker = CircuitBreaker("serper", failure_threshold=2)
+        calls = AsyncMock(side_effect=ConnectionError("down"))
+
+        @retry_with_backoff(max_retries=5, initial_delay=0, circuit_breaker=breaker)
+        async def fetch():
+            return await calls()
+
+        with pytest.raises(CircuitOpenError):
+            await fetch()
+        assert calls.await_count == 2
@@ -0,0 +1,276 @@
+"""Tests for tiled area fetches and the OSM / SportScotland tiled paths."""
+
+import asyncio
+import shutil
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import yaml
+
+from engine.ingestion.connectors.open_street_map import OSMConnector
+from engine.ingestion.connectors.sport_scotland import SportScotlandConnector
+from engine.ingestion.tiling import (
+    BBox,
+    TileCache,
+    TiledFetchStats,
+    fetch_tiles,
+    load_tiling_config,
+    merge_unique,
+    split_bbox,
+)
+
+
+EDINBURGH = BBox(-3.4, 55.85, -3.0, 56.0)
+
+
+@pytest.fixture
+def temp_dir():
+    path = Path("tmp") / "test_tiling" / uuid.uuid4().hex
+    path.mkdir(parents=True)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    async def acquire(self, cost=1, timeout=None):
+        self.acquired += 1
+        return 0.0
+
+
+class TestSplitBBox:
+    def test_tiles_cover_area_without_gaps(self):
+        tiles = split_bbox(EDINBURGH, 10)
+
+        # ~16.7km tall x ~25km wide -> 2 rows x 3 cols
+        assert len(tiles) == 6
+        assert min(t.minx for t in tiles) == EDINBURGH.minx
+        assert max(t.maxx for t in tiles) == EDINBURGH.maxx
+        assert min(t.miny for t in tiles) == EDINBURGH.miny
+        assert max(t.maxy for t in tiles) == EDINBURGH.maxy
+        # Neighbouring tiles share edges exactly
+        assert tiles[0].maxx == tiles[1].minx
+        assert tiles[0].maxy == tiles[3].miny
+
+    def test_small_area_is_single_tile(self):
+        assert split_bbox(EDINBURGH, 100) == [EDINBURGH]
+
+    def test_around_contains_circle(self):
+        box = BBox.around(55.95, -3.19, 5000)
+        assert box.maxy - box.miny == pytest.approx(2 * 5 / 111.32)
+        assert box.maxx - box.minx > box.maxy - box.miny  # longitude degrees are shorter
+
+    def test_formats(self):
+        box = BBox.from_string("-3.5,55.8,-3.0,56.0")
+        assert box.to_wfs() == "-3.5,55.8,-3.0,56.0"
+        assert box.to_overpass() == "(55.8,-3.5,56.0,-3.0)"
+        with pytest.raises(ValueError):
+            BBox.from_string("1,2,3")
+
+
+class TestLoadTilingConfig:
+    def test_missing_block_disables_tiling(self):
+        assert load_tiling_config({"base_url": "x"}) is None
+        assert load_tiling_config({"tiling": {"enabled": False}}) is None
+
+    def test_block_overrides_defaults(self):
+        config = load_tiling_config({"tiling": {"tile_size_km": 5, "max_concurrency": 8}})
+        assert config.tile_size_km == 5
+        assert config.max_concurrency == 8
+
+    def test_invalid_values_rejected(self):
+        with pytest.raises(ValueError):
+            load_tiling_config({"tiling": {"max_concurrency": 0}})
+
+
+class TestFetchTiles:
+    @pytest.mark.asyncio
+    async def test_tiles_run_concurrently_up_to_limit(self):
+        tiles = split_bbox(EDINBURGH, 5)
+        in_flight = 0
+        peak = 0
+
+        async def fetch_tile(tile):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"tile": tile.key}
+
+        limiter = CountingLimiter()
+        results = await fetch_tiles(tiles, fetch_tile, max_concurrency=3, rate_limiter=limiter)
+
+        assert [r["tile"] for r in results] == [t.key for t in tiles]
+        assert peak == 3
+        assert limiter.acquired == len(tiles)
+
+    @pytest.mark.asyncio
+    async def test_cached_tiles_skip_fetch_and_limiter(self, temp_dir):
+        tiles = split_bbox(EDINBURGH, 10)
+        cache = TileCache(temp_dir, "openstreetmap", ttl_seconds=3600)
+        fetch_tile = AsyncMock(side_effect=lambda tile: {"tile": tile.key})
+
+        await fetch_tiles(tiles, fetch_tile, cache=cache, request_key="padel")
+        limiter = CountingLimiter()
+        stats = TiledFetchStats()
+        results = await fetch_tiles(
+            tiles, fetch_tile, rate_limiter=limiter, cache=cache, request_key="padel", stats=stats
+        )
+
+        assert fetch_tile.await_count == len(tiles)
+        assert limiter.acquired == 0
+        assert stats.cache_hits == len(tiles)
+        assert results[0] == {"tile": tiles[0].key}
+
+    @pytest.mark.asyncio
+    async def test_failed_tile_raises_after_others_are_cached(self, temp_dir):
+        tiles = split_bbox(EDINBURGH, 10)
+        cache = TileCache(temp_dir, "sport_scotland", ttl_seconds=3600)
+
+        async def flaky(tile):
+            if tile == tiles[2]:
+                raise RuntimeError("tile timed out")
+            return {"tile": tile.key}
+
+        stats = TiledFetchStats()
+        with pytest.raises(RuntimeError):
+            await fetch_tiles(tiles, flaky, cache=cache, request_key="pitches", stats=stats)
+        assert stats.failed == 1
+        assert stats.fetched == len(tiles) - 1
+
+        # Resume: only the failed tile is fetched again
+        retry = AsyncMock(side_effect=lambda tile: {"tile": tile.key})
+        results = await fetch_tiles(tiles, retry, cache=cache, request_key="pitches")
+        assert retry.await_count == 1
+        assert len(results) == len(tiles)
+
+    def test_expired_cache_entries_are_ignored(self, temp_dir):
+        now = [10_000_000_000.0]
+        cache = TileCache(temp_dir, "openstreetmap", ttl_seconds=60, clock=lambda: now[0])
+        cache.put("padel", EDINBURGH, {"ok": True})
+        assert cache.get("padel", EDINBURGH) is None  # clock is far past the file mtime
+        assert cache.get("tennis", EDINBURGH) is None
+
+
+def test_merge_unique_keeps_first_occurrence():
+    items = [{"id": 1, "tile": 0}, {"id": 2}, {"id": 1, "tile": 1}, {"name": "no id"}]
+    merged = merge_unique(items, key=lambda item: item.get("id"))
+    assert merged == [{"id": 1, "tile": 0}, {"id": 2}, {"name": "no id"}]
+
+
+def _write_config(temp_dir, section, source_config):
+    path = temp_dir / "sources.yaml"
+    path.write_text(yaml.safe_dump({section: source_config}), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_osm_tiled_fetch_merges_edge_duplicates(temp_dir):
+    config_path = _write_config(temp_dir, "openstreetmap", {
+        "base_url": "https://overpass.example/api/interpreter",
+        "default_params": {"bbox": "-3.4,55.85,-3.0,56.0"},
+        "tiling": {"tile_size_km": 10, "max_concurrency": 2, "cache_ttl_seconds": 0},
+    })
+    connector = OSMConnector(config_path=config_path)
+    connector.rate_limiter = CountingLimiter()
+
+    queries = []
+
+    async def post(session, overpass_query):
+        queries.append(overpass_query)
+        index = len(queries)
+        # Every tile returns the shared edge way plus one node of its own
+        return {
+            "version": 0.6,
+            "elements": [
+                {"type": "way", "id": 42, "nodes": [1, 2]},
+                {"type": "node", "id": 1000 + index, "lat": 55.9, "lon": -3.2},
+            ],
+        }
+
+    connector._post_overpass = post
+    data = await connector.fetch("padel")
+
+    assert len(queries) == 6
+    assert all("(around:" not in q for q in queries)
+    assert '["sport"="padel"](55.85,-3.4,' in queries[0]
+    assert data["version"] == 0.6
+    assert [e["id"] for e in data["elements"] if e["type"] == "way"] == [42]
+    assert len(data["elements"]) == 7
+    assert connector.rate_limiter.acquired == 6
+    assert connector.last_tile_stats.fetched == 6
+
+
+@pytest.mark.asyncio
+async def test_osm_explicit_location_skips_tiling(temp_dir):
+    config_path = _write_config(temp_dir, "openstreetmap", {
+        "base_url": "https://overpass.example/api/interpreter",
+        "tiling": {"tile_size_km": 10},
+    })
+    connector = OSMConnector(config_path=config_path)
+    connector._post_overpass = AsyncMock(return_value={"elements": []})
+
+    await connector.fetch("padel", lat=55.95, lon=-3.19, radius=1000)
+
+    overpass_query = connector._post_overpass.await_args.args[1]
+    assert "(around:1000,55.95,-3.19)" in overpass_query
+
+
+@pytest.mark.asyncio
+async def test_sport_scotland_tiled_fetch_merges_features(temp_dir):
+    config_path = _write_config(temp_dir, "sport_scotland", {
+        "default_params": {"service": "WFS", "request": "GetFeature"},
+        "tiling": {"tile_size_km": 10, "cache_ttl_seconds": 0},
+    })
+    connector = SportScotlandConnector(config_path=config_path)
+    connector.rate_limiter = CountingLimiter()
+
+    bboxes = []
+
+    async def get_features(session, layer_name, bbox_string):
+        bboxes.append(bbox_string)
+        return {
+            "type": "FeatureCollection",
+            "totalFeatures": 2,
+            "features": [
+                {"id": "pitches.edge", "properties": {}},
+                {"id": f"pitches.{len(bboxes)}", "properties": {}},
+            ],
+        }
+
+    connector._get_features = get_features
+    data = await connector.fetch("pitches")
+
+    assert len(bboxes) == 6
+    assert bboxes[0].startswith("-3.4,55.85,")
+    assert [f["id"] for f in data["features"]].count("pitches.edge") == 1
+    assert data["totalFeatures"] == len(data["features"]) == 7
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "connector_class, section",
+    [(OSMConnector, "openstreetmap"), (SportScotlandConnector, "sport_scotland")],
+)
+async def test_warm_up_resolves_shared_limiter(temp_dir, connector_class, section):
+    """Warm-up uses the shared limiter, not one bound to the connector's client."""
+    config_path = _write_config(temp_dir, section, {
+        "base_url": "https://example.invalid/api",
+        "tiling": {"tile_size_km": 10},
+    })
+    db = Mock()
+    connector = connector_class(config_path=config_path, db=db)
+
+    module = connector_class.__module__
+    with patch(f"{module}.get_token_bucket_limiter", return_value=CountingLimiter()) as get_limiter:
+        await connector.warm_up()
+
+    get_limiter.assert_called_once_with(connector.source_name)
+    assert isinstance(connector.rate_limiter, CountingLimiter)
+    # Tiles take their own tokens, so the adapter takes none per call
+    assert connector.rate_limits_per_request is True
@@ -0,0 +1,242 @@
+"""Tests for the async multi-window token-bucket limiter and its stores."""
+
+import asyncio
+import multiprocessing
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from engine.db import DbClientProvider, set_db_provider
+from engine.ingestion.rate_limiting import RateLimitExceeded, RateLimiter
+from engine.ingestion.token_bucket import (
+    MemoryBucketStore,
+    PostgresBucketStore,
+    RateWindow,
+    SQLiteBucketStore,
+    TokenBucketLimiter,
+    create_bucket_store,
+    load_rate_windows,
+    plan_acquire,
+)
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+MINUTE_AND_HOUR = [RateWindow("per_minute", 60, 60.0), RateWindow("per_hour", 100, 3600.0)]
+
+
+class TestPlanAcquire:
+    def test_new_buckets_start_full(self):
+        wait, window, state = plan_acquire({}, MINUTE_AND_HOUR, 1, 0.0)
+        assert wait == 0
+        assert state == {"per_minute": (59.0, 0.0), "per_hour": (99.0, 0.0)}
+
+    def test_empty_bucket_reports_wait_and_takes_nothing(self):
+        state = {"per_minute": (0.0, 0.0), "per_hour": (50.0, 0.0)}
+        wait, window, new_state = plan_acquire(state, MINUTE_AND_HOUR, 1, 0.5)
+        assert window == "per_minute"
+        assert wait == pytest.approx(0.5)
+        assert new_state["per_hour"][0] == pytest.approx(50.0 + 0.5 * 100 / 3600)
+
+    def test_slowest_window_determines_wait(self):
+        state = {"per_minute": (0.0, 0.0), "per_hour": (0.0, 0.0)}
+        wait, window, _ = plan_acquire(state, MINUTE_AND_HOUR, 1, 0.0)
+        assert window == "per_hour"
+        assert wait == pytest.approx(36.0)
+
+    def test_burst_caps_bucket_size(self):
+        windows = [RateWindow("per_minute", 60, 60.0, burst=5)]
+        _, _, state = plan_acquire({"per_minute": (0.0, 0.0)}, windows, 1, 3600.0)
+        assert state["per_minute"][0] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_acquire_smooths_burst_instead_of_rejecting():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(
+        "serper", [RateWindow("per_second", 2, 1.0)], clock=clock, sleep=clock.sleep
+    )
+
+    waits = [await limiter.acquire() for _ in range(5)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.5, 0.5, 0.5])
+    assert limiter.acquired == 5
+
+
+@pytest.mark.asyncio
+async def test_acquire_raises_when_wait_exceeds_timeout():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(
+        "serper", [RateWindow("per_hour", 1, 3600.0)], clock=clock, sleep=clock.sleep
+    )
+    await limiter.acquire()
+
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await limiter.acquire(timeout=30)
+
+    assert excinfo.value.limit_type == "per_hour"
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_cost_above_capacity_is_rejected():
+    limiter = TokenBucketLimiter("serper", [RateWindow("per_minute", 60, 60.0, burst=2)])
+    with pytest.raises(ValueError):
+        await limiter.acquire(cost=3)
+
+
+def _drain(path, results):
+    store = SQLiteBucketStore(path)
+    windows = [RateWindow("per_hour", 10, 3600.0)]
+    granted = 0
+    for _ in range(10):
+        wait, _ = asyncio.run(store.take("serper", windows, 1, 1000.0))
+        granted += wait == 0
+    results.put(granted)
+
+
+def test_sqlite_store_shares_budget_across_processes(tmp_path):
+    """Two worker processes draining one bucket never exceed its limit together."""
+    path = tmp_path / "buckets.sqlite3"
+    SQLiteBucketStore(path)  # Create schema up front
+
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    workers = [ctx.Process(target=_drain, args=(path, results)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+
+    assert results.get(timeout=5) + results.get(timeout=5) == 10
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_persists_between_instances(tmp_path):
+    windows = [RateWindow("per_second", 1, 1.0)]
+    path = tmp_path / "buckets.sqlite3"
+
+    assert await SQLiteBucketStore(path).take("osm", windows, 1, 50.0) == (0.0, None)
+    wait, window = await SQLiteBucketStore(path).take("osm", windows, 1, 50.0)
+    assert window == "per_second"
+    assert wait == pytest.approx(1.0)
+
+
+def _fake_bucket_db():
+    tx = MagicMock()
+    tx.query_raw = AsyncMock(return_value=[{"locked": 1}])
+    tx.ratelimitbucket.find_many = AsyncMock(
+        return_value=[SimpleNamespace(window="per_minute", tokens=0.0, refilled_at=0.0)]
+    )
+    tx.ratelimitbucket.upsert = AsyncMock()
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock(return_value=tx)
+    transaction.__aexit__ = AsyncMock(return_value=False)
+    db = MagicMock()
+    db.connect = AsyncMock()
+    db.disconnect = AsyncMock()
+    db.tx = MagicMock(return_value=transaction)
+    return db, tx
+
+
+@pytest.mark.asyncio
+async def test_postgres_store_locks_and_upserts_in_transaction():
+    db, tx = _fake_bucket_db()
+
+    store = PostgresBucketStore(db)
+    wait, window = await store.take("serper", [RateWindow("per_minute", 60, 60.0)], 1, 0.5)
+
+    assert window == "per_minute"
+    assert wait == pytest.approx(0.5)
+    assert "pg_advisory_xact_lock" in tx.query_raw.await_args.args[0]
+    upsert = tx.ratelimitbucket.upsert.await_args.kwargs
+    assert upsert["where"] == {"key_window": {"key": "serper", "window": "per_minute"}}
+
+
+@pytest.mark.asyncio
+async def test_postgres_store_resolves_shared_client_per_take():
+    """Without an injected client each take() uses the current engine.db client."""
+    first, _ = _fake_bucket_db()
+    second, _ = _fake_bucket_db()
+    store = PostgresBucketStore()
+    windows = [RateWindow("per_minute", 60, 60.0)]
+
+    try:
+        set_db_provider(DbClientProvider(lambda: first))
+        await store.take("serper", windows, 1, 0.5)
+        set_db_provider(DbClientProvider(lambda: second))
+        await store.take("serper", windows, 1, 0.5)
+    finally:
+        set_db_provider(None)
+
+    assert first.tx.call_count == 1
+    assert second.tx.call_count == 1
+    assert second.disconnect.await_count == 1
+
+
+class TestConfig:
+    def test_windows_loaded_from_sources_config(self):
+        config = {
+            "serper": {
+                "rate_limits": {"requests_per_minute": 60, "requests_per_hour": 1000, "burst": 10}
+            }
+        }
+        windows = load_rate_windows("serper", config)
+        assert [(w.name, w.limit, w.capacity) for w in windows] == [
+            ("per_minute", 60, 10.0),
+            ("per_hour", 1000, 10.0),
+        ]
+
+    def test_null_limits_mean_no_windows(self):
+        config = {"osm": {"rate_limits": {"requests_per_minute": None}}}
+        assert load_rate_windows("osm", config) == []
+
+    def test_unknown_source_raises(self):
+        with pytest.raises(KeyError):
+            load_rate_windows("missing", {})
+
+    def test_backend_selection(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("RATE_LIMIT_BACKEND", raising=False)
+        sqlite_config = {"global": {"rate_limiting": {"sqlite_path": str(tmp_path / "b.db")}}}
+        assert isinstance(create_bucket_store(sqlite_config), SQLiteBucketStore)
+
+        monkeypatch.setenv("RATE_LIMIT_BACKEND", "memory")
+        assert isinstance(create_bucket_store(sqlite_config), MemoryBucketStore)
+
+        monkeypatch.setenv("RATE_LIMIT_BACKEND", "postgres")
+        store = create_bucket_store(sqlite_config)
+        assert isinstance(store, PostgresBucketStore)
+        assert store.db is None
+
+
+def test_sliding_window_minute_count_keeps_hour_entries(monkeypatch):
+    """Counting the minute window must not drop entries the hour window needs."""
+    import engine.ingestion.rate_limiting as rate_limiting
+
+    now = [10_000.0]
+    monkeypatch.setattr(rate_limiting.time, "time", lambda: now[0])
+    limiter = RateLimiter("serper", requests_per_minute=10, requests_per_hour=2)
+
+    limiter.record_request()
+    now[0] += 120
+    limiter.record_request()
+
+    assert limiter.get_request_count_last_minute() == 1
+    assert limiter.get_request_count_last_hour() == 2
+    assert limiter.can_make_request() is False
+    assert limiter.get_time_until_next_request() == pytest.approx(3600 - 120)
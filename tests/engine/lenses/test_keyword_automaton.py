@@ -0,0 +1,93 @@
+"""Tests for the precompiled lens keyword automaton."""
+
+import pytest
+
+from engine.lenses.keyword_automaton import KeywordAutomaton
+from engine.lenses.query_lens import QueryLens, QueryLensConfig
+
+
+def _naive_hits(groups, text):
+    """Reference implementation: every (keyword, start) substring occurrence."""
+    hits = set()
+    for keywords in groups.values():
+        for kw in keywords:
+            kw = kw.lower()
+            start = text.find(kw)
+            while start != -1:
+                hits.add((kw, start))
+                start = text.find(kw, start + 1)
+    return hits
+
+
+class TestKeywordAutomaton:
+    def test_finds_all_overlapping_hits_in_one_pass(self):
+        groups = {"a": ["he", "she", "his", "hers"], "b": ["ushers"]}
+        text = "ushers and his hershey"
+        matches = KeywordAutomaton(groups).scan(text)
+        assert {(h.keyword, h.start) for h in matches.hits} == _naive_hits(groups, text)
+
+    def test_agrees_with_naive_substring_search(self):
+        groups = {
+            "activity": ["padel", "tennis", "racquet sport", "table tennis"],
+            "facility": ["club", "courts", "sports centre"],
+            "location": ["in", "near", "leith"],
+        }
+        text = "table tennis clubs near leith sports centres in indoor courts"
+        matches = KeywordAutomaton(groups).scan(text)
+        assert {(h.keyword, h.start) for h in matches.hits} == _naive_hits(groups, text)
+
+    def test_word_boundary_modes(self):
+        automaton = KeywordAutomaton({"location": ["in"], "facility": ["court"]})
+        matches = automaton.scan("indoor courts in leith")
+
+        assert matches.count("location", mode="substring") == 1
+        assert [h.start for h in matches.hits if h.keyword == "in" and h.whole_word] == [14]
+        assert matches.any("facility", mode="prefix")
+        assert not matches.any("facility", mode="word")
+
+    def test_keyword_shared_between_groups(self):
+        matches = KeywordAutomaton({"activity": ["winery"], "facility": ["Winery"]}).scan("a winery")
+        assert matches.keywords("activity") == {"winery"}
+        assert matches.keywords("facility") == {"winery"}
+
+    def test_empty_keywords_are_ignored(self):
+        automaton = KeywordAutomaton({"a": ["", "  ", None, "padel"]})
+        assert automaton.keyword_count == 1
+        assert automaton.scan("").hits == []
+
+    def test_unknown_mode_raises(self):
+        matches = KeywordAutomaton({"a": ["padel"]}).scan("padel")
+        with pytest.raises(ValueError):
+            matches.any("a", mode="fuzzy")
+
+
+class TestQueryLensAutomaton:
+    def _lens(self):
+        return QueryLens(
+            QueryLensConfig(
+                lens_name="test",
+                activity_keywords=["padel", "ball"],
+                location_indicators=["in", "leith"],
+                facility_keywords=["court"],
+                connector_rules={
+                    "sport_scotland": {
+                        "triggers": [{"type": "any_keyword_match", "keywords": ["padel", "courts"], "threshold": 2}]
+                    },
+                    "brand_api": {"triggers": [{"type": "brand_mention", "brands": ["game4padel"]}]},
+                },
+            )
+        )
+
+    def test_trigger_threshold_counts_distinct_keywords(self):
+        lens = self._lens()
+        assert lens.get_connectors_for_query("padel courts") == ["sport_scotland"]
+        assert lens.get_connectors_for_query("padel padel") == []
+
+    def test_keywords_do_not_match_mid_word(self):
+        lens = self._lens()
+        assert lens.get_connectors_for_query("Game4Padel Edinburgh") == ["brand_api"]
+        assert not lens.match_keywords("football").any("activity")
+
+    def test_scan_is_cached_per_query(self):
+        lens = self._lens()
+        assert lens.match_keywords("padel in leith") is lens.match_keywords("padel in leith")
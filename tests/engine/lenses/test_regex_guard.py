@@ -0,0 +1,92 @@
+"""Tests for the lens regex cost guard and lens-bench report."""
+
+import pytest
+
+from engine.lenses.bench import bench_lens, format_bench_report
+from engine.lenses.regex_guard import (
+    VALIDATION_COST_BUDGET_MS,
+    VALIDATION_PUMP_LENGTHS,
+    adversarial_inputs,
+    find_backtracking_hazards,
+    measure_pattern_cost,
+    measure_validation_cost,
+)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"(a+)+$",
+        r"(\w+\s?)*$",
+        r"^(\w+)*@",
+        r"(x\w|\wy)+",
+        r"(?i)(foo|\w+bar)+",
+        r"(?:a|aa)+$",
+        r"(ab|abab)*$",
+    ],
+)
+def test_catastrophic_shapes_are_flagged(pattern):
+    assert find_backtracking_hazards(pattern)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"(?i)padel",
+        r"(\d+)\s+padel courts?",
+        r"(?i)(sports[\s_]*(centre|center|facility|club)|leisure[\s_]*(centre|center))",
+        r"(ab+)*",
+        r"(?:a++)+",
+        r"(?>a+)+",
+        r"(foo|foobar)+",
+    ],
+)
+def test_safe_shapes_are_not_flagged(pattern):
+    assert find_backtracking_hazards(pattern) == []
+
+
+def test_adversarial_inputs_pump_repeats_and_fail_at_end():
+    inputs = adversarial_inputs(r"(a|ab)*c")
+    assert inputs[0].startswith("aaaa")
+    assert all(not text.endswith("c") for text in inputs)
+    assert len(inputs[-1]) > len(inputs[0])
+    assert adversarial_inputs(r"padel") == []
+
+
+def test_measure_stops_at_first_input_over_budget():
+    cost = measure_pattern_cost(r"(a+)+$", budget_ms=1.0)
+    assert cost.exceeds(1.0)
+    assert cost.hazards == ["nested unbounded quantifiers"]
+    # Exponential pattern is stopped long before the largest pump input
+    assert cost.worst_input_length < 100
+
+
+def test_validation_cost_times_pump_inputs_only():
+    cost = measure_validation_cost(r"(?i)\w+ club")
+    assert not cost.exceeds(VALIDATION_COST_BUDGET_MS)
+    # No corpus documents are timed
+    assert cost.inputs_tried == len(VALIDATION_PUMP_LENGTHS)
+
+
+def test_bench_lists_slowest_rules_first():
+    config = {
+        "mapping_rules": [
+            {"id": "fast", "pattern": r"(?i)padel", "canonical": "padel"},
+            {"id": "slow", "pattern": r"(a|ab)*c", "canonical": "padel"},
+            {"id": "broken", "pattern": r"(unclosed", "canonical": "padel"},
+        ],
+        "modules": {
+            "sports_facility": {
+                "field_rules": [{"rule_id": "courts", "pattern": r"(\d+)\s+courts?"}]
+            }
+        },
+    }
+
+    results = bench_lens(config, corpus=["4 padel courts"])
+
+    assert [r.rule_id for r in results][0] == "slow"
+    assert {r.rule_id for r in results} == {"fast", "slow", "broken", "courts"}
+    assert next(r for r in results if r.rule_id == "broken").error
+    report = format_bench_report("test", results, top=2)
+    assert "slow [mapping_rule]" in report
+    assert "broken" not in report
@@ -14,10 +14,27 @@ Each gate has positive tests (valid configs pass) and negative tests
 (invalid configs fail with clear error messages).
 """
 
+from unittest.mock import patch
+
 import pytest
 from engine.lenses.validator import validate_lens_config, ValidationError
 
 
+def _config_with_pattern(pattern):
+    return {
+        "schema": "lens/v1",
+        "facets": {
+            "activity": {"dimension_source": "canonical_activities", "ui_label": "Activity"}
+        },
+        "values": [
+            {"key": "tennis", "facet": "activity", "display_name": "Tennis"}
+        ],
+        "mapping_rules": [
+            {"pattern": pattern, "canonical": "tennis", "confidence": 0.9}
+        ],
+    }
+
+
 class TestGate1SchemaValidation:
     """
     Gate #1: Schema validation.
@@ -347,6 +364,32 @@ class TestGate5RegexCompilationValidation:
         with pytest.raises(ValidationError, match="Invalid regex pattern"):
             validate_lens_config(config)
 
+    def test_nested_quantifier_pattern_fails(self):
+        """Pattern with catastrophic-backtracking shape fails."""
+        config = _config_with_pattern(r"(?i)(\w+\s?)*tennis")
+        with pytest.raises(ValidationError, match="catastrophic backtracking"):
+            validate_lens_config(config)
+
+    def test_overlapping_alternation_pattern_fails(self):
+        """Alternatives that are prefixes of each other under a repeat fail."""
+        config = _config_with_pattern(r"(?:a|aa)+$")
+        with pytest.raises(ValidationError, match="catastrophic backtracking"):
+            validate_lens_config(config)
+
+    def test_pattern_over_cost_budget_fails(self, monkeypatch):
+        """A slow pattern the static check misses still fails the cost budget."""
+        import engine.lenses.validator as validator
+
+        monkeypatch.setattr(validator, "VALIDATION_COST_BUDGET_MS", 1.0)
+        with patch.object(validator, "find_backtracking_hazards", return_value=[]):
+            with pytest.raises(ValidationError, match="exceeds cost budget"):
+                validate_lens_config(_config_with_pattern(r"(?:a|aa)+$"))
+
+    def test_linear_patterns_pass_cost_budget(self):
+        """Only pump inputs are timed, so long linear scans never fail a lens."""
+        validate_lens_config(_config_with_pattern(r"(?i).*padel.*court"))
+        validate_lens_config(_config_with_pattern(r"(?i)\w+ club"))
+
 
 class TestGate6SmokeCoverageValidation:
     """
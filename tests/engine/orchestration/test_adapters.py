@@ -770,6 +770,100 @@ class TestConnectorAdapterExecute:
         assert metrics["cost_usd"] == 0.0  # No cost on timeout
 
 
+class TestNotModifiedSignal:
+    """Mirrored connectors surface unchanged upstream data in metrics."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_recorded_in_metrics(self, mock_context, mock_state):
+        connector = Mock(spec=BaseConnector)
+        connector.source_name = "edinburgh_council"
+        connector.fetch = AsyncMock(return_value={"features": []})
+        connector.last_not_modified = True
+        spec = ConnectorSpec(
+            name="edinburgh_council",
+            phase=ExecutionPhase.ENRICHMENT,
+            trust_level=90,
+            requires=["request.query"],
+            provides=["context.candidates"],
+            supports_query_only=True,
+            estimated_cost_usd=0.0,
+        )
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="sports")
+        features = QueryFeatures.extract(query=request.query, request=request)
+
+        await ConnectorAdapter(connector, spec).execute(request, features, mock_context, mock_state)
+
+        assert mock_state.metrics["edinburgh_council"]["not_modified"] is True
+
+    @pytest.mark.asyncio
+    async def test_plain_connectors_have_no_signal(self, mock_context, mock_state):
+        connector = Mock(spec=BaseConnector)
+        connector.source_name = "serper"
+        connector.fetch = AsyncMock(return_value={"organic": []})
+        spec = ConnectorSpec(
+            name="serper",
+            phase=ExecutionPhase.DISCOVERY,
+            trust_level=75,
+            requires=["request.query"],
+            provides=["context.candidates"],
+            supports_query_only=True,
+            estimated_cost_usd=0.01,
+        )
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="sports")
+        features = QueryFeatures.extract(query=request.query, request=request)
+
+        await ConnectorAdapter(connector, spec).execute(request, features, mock_context, mock_state)
+
+        assert "not_modified" not in mock_state.metrics["serper"]
+
+
+class TestOSMQueryTranslation:
+    """Multi-activity queries become one union OSM fetch."""
+
+    @staticmethod
+    def _adapter():
+        connector = Mock(spec=BaseConnector)
+        connector.source_name = "openstreetmap"
+        spec = ConnectorSpec(
+            name="openstreetmap",
+            phase=ExecutionPhase.DISCOVERY,
+            trust_level=60,
+            requires=["request.query"],
+            provides=["context.candidates"],
+            supports_query_only=True,
+            estimated_cost_usd=0.0,
+        )
+        return ConnectorAdapter(connector, spec)
+
+    def test_multiple_activities_translate_to_terms(self):
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="tennis padel squash")
+        features = QueryFeatures.extract(query=request.query, request=request)
+
+        terms = self._adapter()._translate_query(request.query, features)
+
+        assert terms == ["tennis", "padel", "squash"]
+
+    def test_single_activity_query_passes_through(self):
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="padel courts")
+        features = QueryFeatures.extract(query=request.query, request=request)
+
+        assert self._adapter()._translate_query(request.query, features) == "padel courts"
+
+    @pytest.mark.asyncio
+    async def test_execute_fetches_terms_once(self, mock_context, mock_state):
+        adapter = self._adapter()
+        adapter.connector.fetch = AsyncMock(return_value={
+            "elements": [{"type": "node", "id": 1, "lat": 55.9, "lon": -3.2, "tags": {"name": "Court"}}],
+        })
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="tennis and padel")
+        features = QueryFeatures.extract(query=request.query, request=request)
+
+        await adapter.execute(request, features, mock_context, mock_state)
+
+        adapter.connector.fetch.assert_awaited_once_with(["tennis", "padel"])
+        assert mock_state.candidates[0]["ids"] == {"osm": "node/1"}
+
+
 class TestRateLimitEnforcement:
     """Test rate limit enforcement (PL-004 Micro-Iteration 3)."""
 
@@ -979,3 +1073,176 @@ class TestRateLimitEnforcement:
         update_data = upsert_args[1]["data"]["update"]
         assert "request_count" in update_data
         assert update_data["request_count"]["increment"] == 1
+
+
+class TestTokenBucketLimiting:
+    """Adapter waits on the shared token-bucket limiter before fetching."""
+
+    def _adapter(self, rate_limiter):
+        mock_connector = Mock(spec=BaseConnector)
+        mock_connector.source_name = "serper"
+        mock_connector.fetch = AsyncMock(return_value={"organic": [{"title": "Result"}]})
+        spec = ConnectorSpec(
+            name="serper",
+            phase=ExecutionPhase.DISCOVERY,
+            trust_level=75,
+            requires=["request.query"],
+            provides=["context.candidates"],
+            supports_query_only=True,
+            timeout_seconds=5,
+        )
+        return ConnectorAdapter(mock_connector, spec, rate_limiter=rate_limiter), mock_connector
+
+    @pytest.mark.asyncio
+    async def test_acquires_token_before_fetch(self, mock_context, mock_state):
+        limiter = Mock()
+        limiter.acquire = AsyncMock(return_value=0.0)
+        adapter, connector = self._adapter(limiter)
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="padel")
+
+        await adapter.execute(
+            request, QueryFeatures.extract("padel", request), mock_context, mock_state
+        )
+
+        limiter.acquire.assert_awaited_once_with(timeout=5)
+        assert connector.fetch.called
+        assert mock_state.metrics["serper"]["executed"] is True
+
+    @pytest.mark.asyncio
+    async def test_connector_limiting_per_request_is_not_charged_again(self, mock_context, mock_state):
+        """Tiled connectors take a token per tile; the adapter must not add one per call."""
+        limiter = Mock()
+        limiter.acquire = AsyncMock(return_value=0.0)
+        adapter, connector = self._adapter(limiter)
+        connector.rate_limits_per_request = True
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="padel")
+
+        await adapter.execute(
+            request, QueryFeatures.extract("padel", request), mock_context, mock_state
+        )
+
+        limiter.acquire.assert_not_awaited()
+        assert connector.fetch.called
+
+    @pytest.mark.asyncio
+    async def test_wait_is_charged_to_fetch_timeout(self, mock_context, mock_state):
+        limiter = Mock()
+        limiter.acquire = AsyncMock(return_value=3.0)
+        adapter, connector = self._adapter(limiter)
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="padel")
+
+        real_wait_for = asyncio.wait_for
+        with patch("engine.orchestration.adapters.asyncio.wait_for", side_effect=real_wait_for) as wait_for:
+            await adapter.execute(
+                request, QueryFeatures.extract("padel", request), mock_context, mock_state
+            )
+
+        assert wait_for.call_args.kwargs["timeout"] == 2.0
+        assert mock_state.metrics["serper"]["executed"] is True
+
+    @pytest.mark.asyncio
+    async def test_wait_beyond_timeout_skips_connector(self, mock_context, mock_state):
+        from engine.ingestion.rate_limiting import RateLimitExceeded
+
+        limiter = Mock()
+        limiter.acquire = AsyncMock(side_effect=RateLimitExceeded("serper", "per_hour", 1000))
+        adapter, connector = self._adapter(limiter)
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="padel")
+
+        await adapter.execute(
+            request, QueryFeatures.extract("padel", request), mock_context, mock_state
+        )
+
+        assert not connector.fetch.called
+        assert mock_state.metrics["serper"]["rate_limited"] is True
+        assert mock_state.errors[0]["rate_limited"] is True
+
+
+class TestCircuitBreaker:
+    """Adapter fails fast while the connector's circuit is open."""
+
+    def _adapter(self, breaker, fetch):
+        mock_connector = Mock(spec=BaseConnector)
+        mock_connector.source_name = "serper"
+        mock_connector.fetch = fetch
+        spec = ConnectorSpec(
+            name="serper",
+            phase=ExecutionPhase.DISCOVERY,
+            trust_level=75,
+            requires=["request.query"],
+            provides=["context.candidates"],
+            supports_query_only=True,
+            timeout_seconds=30,
+        )
+        return ConnectorAdapter(mock_connector, spec, circuit_breaker=breaker)
+
+    async def _execute(self, adapter, mock_context, state):
+        request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="padel")
+        await adapter.execute(request, QueryFeatures.extract("padel", request), mock_context, state)
+
+    @pytest.mark.asyncio
+    async def test_failures_open_circuit_and_record_transition(self, mock_context):
+        from engine.ingestion.circuit_breaker import CircuitBreaker
+
+        breaker = CircuitBreaker("serper", failure_threshold=2)
+        adapter = self._adapter(breaker, AsyncMock(side_effect=ConnectionError("down")))
+
+        first, second = OrchestratorState(), OrchestratorState()
+        await self._execute(adapter, mock_context, first)
+        await self._execute(adapter, mock_context, second)
+
+        assert first.metrics["serper"]["circuit_state"] == "closed"
+        assert "circuit_transitions" not in first.metrics["serper"]
+        assert second.metrics["serper"]["circuit_state"] == "open"
+        assert second.metrics["serper"]["circuit_transitions"][0]["to"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_fetch_and_reports_time_saved(self, mock_context, mock_state):
+        from engine.ingestion.circuit_breaker import CircuitBreaker
+
+        breaker = CircuitBreaker("serper", failure_threshold=1)
+        breaker.record_failure()
+        fetch = AsyncMock(return_value={"organic": []})
+        adapter = self._adapter(breaker, fetch)
+
+        await self._execute(adapter, mock_context, mock_state)
+
+        assert not fetch.called
+        metrics = mock_state.metrics["serper"]
+        assert metrics["executed"] is False
+        assert metrics["circuit_open"] is True
+        assert metrics["time_saved_ms"] == 30000
+        assert mock_state.errors[0]["circuit_open"] is True
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_success_closes_circuit(self, mock_context, mock_state):
+        from engine.ingestion.circuit_breaker import CircuitBreaker
+
+        breaker = CircuitBreaker("serper", failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+        adapter = self._adapter(breaker, AsyncMock(return_value={"organic": [{"title": "Court"}]}))
+
+        await self._execute(adapter, mock_context, mock_state)
+
+        metrics = mock_state.metrics["serper"]
+        assert metrics["executed"] is True
+        assert metrics["circuit_state"] == "closed"
+        assert [t["to"] for t in metrics["circuit_transitions"]] == ["half_open", "closed"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_probe_releases_slot(self, mock_context, mock_state):
+        from engine.ingestion.circuit_breaker import CircuitBreaker, CircuitState
+        from engine.ingestion.rate_limiting import RateLimitExceeded
+
+        breaker = CircuitBreaker("serper", failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+        adapter = self._adapter(breaker, AsyncMock(return_value={"organic": []}))
+        adapter.rate_limiter = Mock()
+        adapter.rate_limiter.acquire = AsyncMock(
+            side_effect=RateLimitExceeded("serper", "per_minute", 60)
+        )
+
+        await self._execute(adapter, mock_context, mock_state)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
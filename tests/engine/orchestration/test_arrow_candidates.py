@@ -0,0 +1,164 @@
+"""
+Tests for the Arrow-native Overture candidate path.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from engine.ingestion.base import BaseConnector
+from engine.orchestration.adapters import ConnectorAdapter
+from engine.orchestration.arrow_candidates import LazyRawRow, map_overture_batch, resolve_raw
+from engine.orchestration.execution_context import ExecutionContext
+from engine.orchestration.execution_plan import ConnectorSpec, ExecutionPhase
+from engine.orchestration.orchestrator_state import OrchestratorState
+from engine.orchestration.query_features import QueryFeatures
+from engine.orchestration.types import IngestRequest, IngestionMode
+
+
+def _valid_samples() -> list:
+    fixture_path = Path(__file__).parents[2] / "fixtures" / "overture" / "overture_places_contract_samples.json"
+    return json.loads(fixture_path.read_text(encoding="utf-8"))["valid_samples"]
+
+
+def _adapter(connector) -> ConnectorAdapter:
+    spec = ConnectorSpec(
+        name="overture_release",
+        phase=ExecutionPhase.DISCOVERY,
+        trust_level=85,
+        requires=["request.query"],
+        provides=["context.candidates"],
+        supports_query_only=True,
+    )
+    return ConnectorAdapter(connector, spec)
+
+
+class TestMapOvertureBatch:
+    def test_matches_row_mapping_for_contract_samples(self):
+        rows = _valid_samples()
+        row_adapter = _adapter(Mock(spec=BaseConnector, source_name="overture_release"))
+        expected = [row_adapter._map_to_candidate(row) for row in rows]
+
+        candidates, failures = map_overture_batch(pa.RecordBatch.from_pylist(rows))
+
+        assert failures == 0
+        for candidate, reference in zip(candidates, expected):
+            for key in ("ids", "lat", "lng", "name", "source"):
+                assert candidate[key] == reference[key]
+            assert resolve_raw(candidate["raw"])["id"] == reference["raw"]["id"]
+
+    def test_name_fallbacks_and_failures(self):
+        batch = pa.RecordBatch.from_pylist([
+            {"id": "a", "name": "  Direct  ", "names": {"primary": "Ignored"}},
+            {"id": "b", "name": "   ", "names": {"primary": " Primary "}},
+            {"id": "c", "name": None, "names": {"primary": ""}},
+            {"id": None, "name": "No id", "names": None},
+        ])
+
+        candidates, failures = map_overture_batch(batch)
+
+        assert [c["name"] for c in candidates] == ["Direct", "Primary"]
+        assert failures == 2
+
+    def test_bbox_centre_and_first_address_when_geometry_is_wkb(self):
+        batch = pa.RecordBatch.from_pylist([
+            {
+                "id": "wkb",
+                "names": {"primary": "Court"},
+                "geometry": b"\x01\x01\x00\x00\x00",
+                "bbox": {"xmin": -3.2, "xmax": -3.0, "ymin": 55.9, "ymax": 56.0},
+                "addresses": [{"freeform": "1 Leith Walk"}, {"freeform": "ignored"}],
+            },
+            {
+                "id": "no-address",
+                "names": {"primary": "Pitch"},
+                "geometry": b"\x01\x01\x00\x00\x00",
+                "bbox": {"xmin": -3.1, "xmax": -3.1, "ymin": 55.95, "ymax": 55.95},
+                "addresses": [],
+            },
+        ])
+
+        candidates, _ = map_overture_batch(batch)
+
+        assert candidates[0]["lng"] == pytest.approx(-3.1)
+        assert candidates[0]["lat"] == pytest.approx(55.95)
+        assert candidates[0]["address"] == "1 Leith Walk"
+        assert "address" not in candidates[1]
+
+
+class TestLazyRaw:
+    def test_raw_is_materialized_on_demand_and_cached(self):
+        batch = pa.RecordBatch.from_pylist(_valid_samples())
+        raw = LazyRawRow(batch, 1)
+
+        assert not raw.materialized
+        first = resolve_raw(raw)
+        assert raw.materialized
+        assert first["id"] == "08f2a3f1b87c9b1f03f0c1671dc10001"
+        assert resolve_raw(raw) is first
+        assert resolve_raw({"plain": True}) == {"plain": True}
+
+    def test_dedupe_losers_are_never_materialized(self):
+        rows = _valid_samples()
+        batch = pa.RecordBatch.from_pylist(rows + rows)
+        candidates, _ = map_overture_batch(batch)
+
+        state = OrchestratorState()
+        for candidate in candidates:
+            state.accept_entity(candidate)
+
+        assert len(state.accepted_entities) == len(rows)
+        rejected = [c for c in candidates if c not in state.accepted_entities]
+        assert rejected and not any(c["raw"].materialized for c in rejected)
+
+
+class _BatchConnector(BaseConnector):
+    def __init__(self, batches):
+        self.batches = batches
+        self.fetch_called = False
+
+    @property
+    def source_name(self) -> str:
+        return "overture_release"
+
+    async def fetch(self, query):
+        self.fetch_called = True
+        return {"results": []}
+
+    async def fetch_batches(self, query):
+        return self.batches
+
+    async def save(self, data, source_url):
+        raise NotImplementedError
+
+    async def is_duplicate(self, content_hash):
+        raise NotImplementedError
+
+
+@pytest.mark.asyncio
+async def test_adapter_uses_record_batches_for_overture():
+    rows = _valid_samples()
+    connector = _BatchConnector([
+        pa.RecordBatch.from_pylist(rows),
+        pa.RecordBatch.from_pylist([{"id": "x", "names": {"primary": " "}, "geometry": None}]),
+    ])
+    adapter = _adapter(connector)
+    context = ExecutionContext(lens_id="test", lens_contract={
+        "mapping_rules": [], "module_triggers": [], "modules": {}, "facets": {}, "values": [],
+        "confidence_threshold": 0.7,
+    })
+    state = OrchestratorState()
+    request = IngestRequest(ingestion_mode=IngestionMode.DISCOVER_MANY, query="overture")
+
+    await adapter.execute(request, QueryFeatures.extract("overture", request), context, state)
+
+    assert not connector.fetch_called
+    metrics = state.metrics["overture_release"]
+    assert metrics["items_received"] == len(rows) + 1
+    assert metrics["candidates_added"] == len(rows)
+    assert metrics["mapping_failures"] == 1
+    assert all(isinstance(c["raw"], LazyRawRow) for c in state.candidates)
@@ -69,6 +69,28 @@ class TestFormatReport:
         assert "15" in formatted, "report should include candidates_found"
         assert "10" in formatted, "report should include accepted_entities"
 
+    def test_format_report_includes_db_connection_counters(self):
+        """format_report should show DB client connects/disconnects when present."""
+        report = {
+            "query": "tennis courts Edinburgh",
+            "candidates_found": 1,
+            "accepted_entities": 1,
+            "persisted_count": 1,
+            "db_connections": {
+                "connects": 1,
+                "disconnects": 0,
+                "connect_seconds": 0.0125,
+                "refs": 1,
+                "connected": True,
+            },
+            "connectors": {},
+            "errors": [],
+        }
+
+        formatted = format_report(report)
+
+        assert "1 connects, 0 disconnects" in formatted
+
     def test_format_report_includes_connector_metrics(self):
         """format_report should display per-connector metrics."""
         report = {
@@ -0,0 +1,121 @@
+"""Tests for the connector instance pool and cached sources.yaml parsing."""
+
+import os
+import shutil
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from engine.ingestion.base import BaseConnector
+from engine.ingestion.sources_config import load_sources_config
+from engine.orchestration.connector_pool import ConnectorPool
+
+
+@pytest.fixture
+def temp_dir():
+    path = Path("tmp") / "test_connector_pool" / uuid.uuid4().hex
+    path.mkdir(parents=True)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class FakeConnector(BaseConnector):
+    def __init__(self, db=None):
+        self.db = db
+        self.warm_ups = 0
+
+    @property
+    def source_name(self) -> str:
+        return "fake"
+
+    async def warm_up(self) -> None:
+        self.warm_ups += 1
+
+    async def fetch(self, query: str) -> dict:
+        return {}
+
+    async def save(self, data: dict, source_url: str) -> str:
+        return ""
+
+    async def is_duplicate(self, content_hash: str) -> bool:
+        return False
+
+
+def _pool(config_path):
+    return ConnectorPool(factory=lambda name, db=None: FakeConnector(db=db), config_path=config_path)
+
+
+def _touch(path, text):
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    # Force a new mtime even on coarse-grained filesystems
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_sources_config_parsed_once_until_file_changes(temp_dir):
+    config_path = temp_dir / "sources.yaml"
+    _touch(config_path, "serper:\n  timeout_seconds: 30\n")
+
+    with patch("engine.ingestion.sources_config.yaml.safe_load", wraps=yaml.safe_load) as parse:
+        first = load_sources_config(config_path)
+        first["serper"]["timeout_seconds"] = 1  # Callers get their own copy
+        assert load_sources_config(config_path) == {"serper": {"timeout_seconds": 30}}
+        assert parse.call_count == 1
+
+        _touch(config_path, "serper:\n  timeout_seconds: 450\n")
+        assert load_sources_config(config_path) == {"serper": {"timeout_seconds": 450}}
+        assert parse.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_released_connector_is_reused_with_injected_clients(temp_dir):
+    config_path = temp_dir / "sources.yaml"
+    _touch(config_path, "{}\n")
+    pool = _pool(config_path)
+    run_db = object()
+
+    try:
+        first = await pool.acquire("serper", db=run_db)
+        assert first.db is run_db
+        assert first.http_session is not None
+        # Leased instances are not shared between concurrent runs
+        second = await pool.acquire("serper")
+        assert second is not first
+        assert second.db is not run_db
+
+        pool.release(first)
+        pool.release(second)
+        assert first.db is not run_db
+
+        again = await pool.acquire("serper")
+        assert again in (first, second)
+        assert again.http_session is first.http_session
+        assert again.warm_ups == 1
+        assert (pool.built, pool.reused) == (2, 1)
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_config_change_rebuilds_idle_connectors(temp_dir):
+    config_path = temp_dir / "sources.yaml"
+    _touch(config_path, "{}\n")
+    pool = _pool(config_path)
+
+    try:
+        first = await pool.acquire("serper")
+        pool.release(first)
+        _touch(config_path, "serper: {}\n")
+
+        rebuilt = await pool.acquire("serper")
+        assert rebuilt is not first
+        assert rebuilt.warm_ups == 1
+        assert pool.built == 2
+
+        # Connectors the pool did not lease are ignored
+        pool.release(FakeConnector())
+    finally:
+        await pool.close()
@@ -288,3 +288,35 @@ class TestExtractEntity:
 
                 with pytest.raises(Exception, match="Extraction failed for source serper"):
                     await extract_entity("raw_error", mock_db)
+
+    @pytest.mark.asyncio
+    async def test_extract_entity_uses_handed_over_payload(self):
+        """
+        Test the in-memory handoff from persistence.
+
+        Acceptance Criteria:
+        - No RawIngestion lookup when the record is passed in
+        - No raw file read when the parsed payload is passed in
+        - Extractor receives the payload as given
+        """
+        mock_db = MagicMock()
+        mock_db.rawingestion.find_unique = AsyncMock()
+        raw_ingestion = MagicMock(id="raw_mem", source="google_places")
+        raw_data = {"name": "Test Venue"}
+
+        mock_extractor = Mock()
+        mock_extractor.extract = Mock(return_value={"name": "Test Venue", "entity_class": "place"})
+        mock_extractor.validate = Mock(return_value={"name": "Test Venue", "entity_class": "place"})
+        mock_extractor.split_attributes = Mock(return_value=({"name": "Test Venue"}, {}))
+
+        with patch("engine.orchestration.extraction_integration.read_raw_text") as mock_read, \
+                patch("engine.orchestration.extraction_integration.get_extractor_for_source",
+                      return_value=mock_extractor):
+            result = await extract_entity(
+                "raw_mem", mock_db, raw_data=raw_data, raw_ingestion=raw_ingestion
+            )
+
+        mock_db.rawingestion.find_unique.assert_not_called()
+        mock_read.assert_not_called()
+        assert mock_extractor.extract.call_args.args[0] is raw_data
+        assert result["attributes"]["name"] == "Test Venue"
@@ -0,0 +1,142 @@
+"""
+Tests for reusing stored extractions of unchanged raw payloads.
+
+A candidate whose (raw hash, extractor version, lens, model) key matches a
+stored ExtractedEntity is linked to the run instead of being re-extracted.
+"""
+
+import hashlib
+import json
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+from engine.extraction.extractors import SerperExtractor
+from engine.orchestration.entity_finalizer import EntityFinalizer
+from engine.orchestration.execution_context import ExecutionContext
+from engine.orchestration.extraction_integration import extraction_reuse_key
+from engine.orchestration.persistence import PersistenceManager
+
+
+CONTEXT = ExecutionContext(lens_id="edinburgh_finds", lens_contract={}, lens_hash="lens-v1")
+EXTRACTED = {"entity_class": "place", "attributes": {}, "discovered_attributes": {}}
+
+
+class TestExtractionReuseKey:
+    def test_key_is_stable(self):
+        assert extraction_reuse_key("abc", "serper", CONTEXT) == extraction_reuse_key("abc", "serper", CONTEXT)
+
+    def test_key_changes_with_each_input(self):
+        base = extraction_reuse_key("abc", "serper", CONTEXT)
+        structured = extraction_reuse_key("abc", "google_places", CONTEXT)
+        other_lens = ExecutionContext(lens_id="edinburgh_finds", lens_contract={}, lens_hash="lens-v2")
+
+        assert extraction_reuse_key("abd", "serper", CONTEXT) != base
+        assert extraction_reuse_key("abc", "serper", other_lens) != base
+        with patch.object(SerperExtractor, "extractor_version", "2"):
+            assert extraction_reuse_key("abc", "serper", CONTEXT) != base
+        with patch(
+            "engine.orchestration.extraction_integration._configured_llm_model",
+            return_value="another-model",
+        ):
+            assert extraction_reuse_key("abc", "serper", CONTEXT) != base
+            # Deterministic extractors do not depend on the model
+            assert extraction_reuse_key("abc", "google_places", CONTEXT) == structured
+
+    def test_lens_contract_hashed_when_no_lens_hash(self):
+        first = ExecutionContext(lens_id="x", lens_contract={"facets": {"a": 1}})
+        second = ExecutionContext(lens_id="x", lens_contract={"facets": {"a": 2}})
+        assert extraction_reuse_key("abc", "serper", first) != extraction_reuse_key("abc", "serper", second)
+
+    def test_no_key_for_source_without_extractor(self):
+        assert extraction_reuse_key("abc", "overture_release", CONTEXT) is None
+
+
+def _db(stored_entities):
+    db = Mock()
+    db.rawingestion.find_many = AsyncMock(return_value=[
+        SimpleNamespace(id="raw-existing", hash=entity.content_hash) for entity in stored_entities
+    ])
+    db.rawingestion.create = AsyncMock(side_effect=lambda *, data: SimpleNamespace(**data))
+    db.extractedentity.find_many = AsyncMock(return_value=stored_entities)
+    db.extractedentity.create = AsyncMock()
+    return db
+
+
+def _candidate(title):
+    return {"source": "serper", "name": title, "raw": {"title": title}}
+
+
+def _content_hash(candidate):
+    return hashlib.sha256(json.dumps(candidate["raw"], indent=2).encode()).hexdigest()[:16]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_payload_is_linked_not_re_extracted():
+    unchanged = _candidate("Game4Padel")
+    content_hash = _content_hash(unchanged)
+    stored = SimpleNamespace(
+        id="ext-1",
+        content_hash=content_hash,
+        extraction_hash=extraction_reuse_key(content_hash, "serper", CONTEXT),
+    )
+    db = _db([stored])
+
+    with patch(
+        "engine.orchestration.persistence.extract_entity",
+        AsyncMock(return_value=EXTRACTED),
+    ) as extract:
+        manager = PersistenceManager(db=db, raw_store=Mock())
+        result = await manager.persist_entities(
+            [unchanged, _candidate("New Venue")], errors=[], context=CONTEXT
+        )
+
+    assert result["persisted_count"] == 2
+    assert result["reused_count"] == 1
+    assert result["reused_entity_ids"] == ["ext-1"]
+    # Only the new payload is extracted and inserted, under its reuse key
+    assert extract.await_count == 1
+    assert db.extractedentity.create.await_count == 1
+    data = db.extractedentity.create.await_args.kwargs["data"]
+    new_hash = db.rawingestion.create.await_args.kwargs["data"]["hash"]
+    assert data["extraction_hash"] == extraction_reuse_key(new_hash, "serper", CONTEXT)
+    # One batched reuse lookup
+    assert db.extractedentity.find_many.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_lens_re_extracts():
+    unchanged = _candidate("Game4Padel")
+    content_hash = _content_hash(unchanged)
+    stored = SimpleNamespace(
+        id="ext-1",
+        content_hash=content_hash,
+        extraction_hash=extraction_reuse_key(content_hash, "serper", CONTEXT),
+    )
+    db = _db([stored])
+    new_lens = ExecutionContext(lens_id="edinburgh_finds", lens_contract={}, lens_hash="lens-v2")
+
+    with patch(
+        "engine.orchestration.persistence.extract_entity",
+        AsyncMock(return_value=EXTRACTED),
+    ) as extract:
+        manager = PersistenceManager(db=db, raw_store=Mock())
+        result = await manager.persist_entities([unchanged], errors=[], context=new_lens)
+
+    assert result["reused_count"] == 0
+    assert extract.await_count == 1
+    assert extract.await_args.args[0] == "raw-existing"
+
+
+@pytest.mark.asyncio
+async def test_finalizer_includes_reused_extractions():
+    db = Mock()
+    db.orchestrationrun.find_unique = AsyncMock(return_value=SimpleNamespace(createdAt="2026-01-01"))
+    db.extractedentity.find_many = AsyncMock(return_value=[])
+
+    await EntityFinalizer(db).finalize_entities("run-1", extracted_entity_ids=["ext-1"])
+
+    assert db.extractedentity.find_many.await_args.kwargs["where"] == {
+        "OR": [{"createdAt": {"gte": "2026-01-01"}}, {"id": {"in": ["ext-1"]}}]
+    }
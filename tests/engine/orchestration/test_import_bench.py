@@ -0,0 +1,40 @@
+"""Tests for lazy CLI imports and the import-time benchmark."""
+
+from engine.orchestration.import_bench import bench_import, find_deferred, parse_importtime
+from engine.orchestration.registry import CONNECTOR_REGISTRY, get_connector_class
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   anthropic._types
+import time:       300 |        420 | anthropic
+import time:        50 |        470 | engine.orchestration.cli
+"""
+
+
+def test_parse_importtime_and_find_deferred():
+    timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [t.module for t in timings] == ["anthropic._types", "anthropic", "engine.orchestration.cli"]
+    assert timings[1].self_us == 300 and timings[1].cumulative_us == 420
+    assert find_deferred(timings) == ["anthropic"]
+
+
+def test_cli_import_defers_connectors_and_llm_stack():
+    result = bench_import("engine.orchestration.cli")
+
+    assert result.module_ms > 0
+    for module in (
+        "anthropic",
+        "instructor",
+        "engine.orchestration.planner",
+        "engine.ingestion.connectors",
+        "engine.extraction.extractors",
+    ):
+        assert module not in result.deferred_loaded
+
+
+def test_connector_classes_resolve_from_spec_paths():
+    for name, spec in CONNECTOR_REGISTRY.items():
+        connector_class = get_connector_class(name)
+        assert f"{connector_class.__module__}.{connector_class.__name__}" == spec.connector_class
@@ -0,0 +1,133 @@
+"""Tests for lens hot reload (LensWatcher) and registry/query-lens refresh."""
+
+import asyncio
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from engine.lenses.loader import LensConfigError, LensRegistry
+from engine.orchestration.lens_bootstrap import bootstrap_lens
+from engine.orchestration.lens_watcher import LensWatcher
+
+LENS_YAML = Path(__file__).resolve().parents[3] / "engine" / "lenses" / "edinburgh_finds" / "lens.yaml"
+
+
+@pytest.fixture
+def lens_file(tmp_path):
+    path = tmp_path / "lens.yaml"
+    shutil.copy(LENS_YAML, path)
+    return path
+
+
+def _edit(path: Path, old: str, new: str) -> None:
+    text = path.read_text()
+    assert old in text
+    path.write_text(text.replace(old, new))
+    # Force a visible mtime change even on coarse-grained filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_initial_context_matches_bootstrap(lens_file):
+    watcher = LensWatcher("edinburgh_finds", lens_path=lens_file)
+    assert watcher.current().lens_hash == bootstrap_lens("edinburgh_finds").lens_hash
+    assert watcher.metrics.lens_hash == watcher.current().lens_hash
+
+
+def test_unchanged_file_is_not_reloaded(lens_file):
+    watcher = LensWatcher("edinburgh_finds", lens_path=lens_file)
+    assert watcher.check_for_changes() is False
+    assert watcher.metrics.checks == 1
+    assert watcher.metrics.reloads == 0
+
+
+def test_changed_file_swaps_context_for_new_runs_only(lens_file):
+    watcher = LensWatcher("edinburgh_finds", lens_path=lens_file)
+    in_flight = watcher.current()
+
+    _edit(lens_file, "confidence_threshold: 0.7", "confidence_threshold: 0.8")
+    assert watcher.check_for_changes() is True
+
+    # In-flight run keeps its snapshot; new runs see the new contract
+    assert in_flight.lens_contract["confidence_threshold"] == 0.7
+    assert watcher.current().lens_contract["confidence_threshold"] == 0.8
+    assert watcher.current().lens_hash != in_flight.lens_hash
+    assert watcher.metrics.reloads == 1
+    assert watcher.metrics.last_reload_ms > 0
+
+
+def test_invalid_edit_keeps_previous_contract(lens_file):
+    watcher = LensWatcher("edinburgh_finds", lens_path=lens_file)
+    good = watcher.current()
+
+    _edit(lens_file, "schema: lens/v1", "schema: lens/v1\nunknown_top_level_key: [")
+    assert watcher.check_for_changes() is False
+
+    assert watcher.current() is good
+    assert watcher.metrics.failures == 1
+    assert watcher.metrics.last_error
+
+    # Same broken content is not re-validated on every poll
+    stat = lens_file.stat()
+    os.utime(lens_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert watcher.check_for_changes() is False
+    assert watcher.metrics.failures == 1
+
+
+def test_comment_only_edit_does_not_swap(lens_file):
+    watcher = LensWatcher("edinburgh_finds", lens_path=lens_file)
+    before = watcher.current()
+
+    _edit(lens_file, "schema: lens/v1", "# tweak\nschema: lens/v1")
+    assert watcher.check_for_changes() is False
+    assert watcher.current() is before
+    assert watcher.metrics.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_background_polling_picks_up_edit(lens_file):
+    watcher = LensWatcher("edinburgh_finds", lens_path=lens_file, poll_interval=0.01)
+    await watcher.start()
+    try:
+        _edit(lens_file, "confidence_threshold: 0.7", "confidence_threshold: 0.9")
+        for _ in range(200):
+            if watcher.metrics.reloads:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await watcher.stop()
+
+    assert watcher.current().lens_contract["confidence_threshold"] == 0.9
+
+
+def test_missing_lens_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        LensWatcher("nope", lens_path=tmp_path / "lens.yaml")
+
+
+class TestLensRegistryRefresh:
+    def test_refresh_reloads_changed_file(self, lens_file):
+        LensRegistry.register("watch_test", lens_file)
+        try:
+            assert LensRegistry.refresh("watch_test") is False
+
+            _edit(lens_file, "confidence_threshold: 0.7", "confidence_threshold: 0.8")
+            assert LensRegistry.refresh("watch_test") is True
+            assert LensRegistry.get_lens("watch_test").confidence_threshold == 0.8
+        finally:
+            LensRegistry._lenses.pop("watch_test", None)
+            LensRegistry._signatures.pop("watch_test", None)
+
+    def test_refresh_failure_keeps_registered_lens(self, lens_file):
+        LensRegistry.register("watch_test", lens_file)
+        try:
+            original = LensRegistry.get_lens("watch_test")
+            _edit(lens_file, "schema: lens/v1", "schema: lens/v1\nunknown_top_level_key: [")
+            with pytest.raises(LensConfigError):
+                LensRegistry.refresh("watch_test")
+            assert LensRegistry.get_lens("watch_test") is original
+        finally:
+            LensRegistry._lenses.pop("watch_test", None)
+            LensRegistry._signatures.pop("watch_test", None)
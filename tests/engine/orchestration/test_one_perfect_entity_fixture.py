@@ -29,6 +29,7 @@ from unittest.mock import AsyncMock, patch
 from engine.orchestration.planner import orchestrate
 from engine.orchestration.types import IngestRequest, IngestionMode
 from engine.orchestration.cli import bootstrap_lens
+from engine.db import DbClientProvider
 from tests.utils import unwrap_prisma_json
 
 
@@ -86,8 +87,8 @@ async def test_one_perfect_entity_fixture_based():
         noop.source_name = name
         return noop
 
-    # Patch get_connector_instance to return mocks
-    def mock_get_connector(connector_name: str):
+    # Patch acquire_connector to return mocks
+    def mock_get_connector(connector_name: str, **kwargs):
         if connector_name == "serper":
             return mock_serper
         elif connector_name == "google_places":
@@ -110,6 +111,8 @@ async def test_one_perfect_entity_fixture_based():
     # Mock raw ingestion and extraction records (created during persist_entities)
     mock_db.rawingestion.create = AsyncMock(return_value=AsyncMock(id="test-raw-id", file_path="test.json"))
     mock_db.rawingestion.find_first = AsyncMock(return_value=None)  # No duplicates
+    mock_db.rawingestion.count = AsyncMock(return_value=0)
+    mock_db.rawingestion.find_many = AsyncMock(return_value=[])
     mock_db.rawingestion.find_unique = AsyncMock(return_value=AsyncMock(id="test-raw-id", file_path="test.json"))
     # Track extracted entities for finalization
     extracted_entities_for_finalization = []
@@ -150,7 +153,7 @@ async def test_one_perfect_entity_fixture_based():
     # Mock extract_entity to return realistic extracted data with lens application
     extraction_call_count = [0]  # Mutable to track calls
 
-    async def mock_extract_entity(raw_ingestion_id, db, context):
+    async def mock_extract_entity(raw_ingestion_id, db, context, **kwargs):
         """Mock extraction - returns lens-enriched extracted entity data"""
         extraction_call_count[0] += 1
         call_num = extraction_call_count[0]
@@ -196,9 +199,9 @@ async def test_one_perfect_entity_fixture_based():
 
     # Patch connectors, Prisma, file I/O, and extraction
     # CRITICAL: Patch extract_entity where it's IMPORTED (persistence.py), not where it's defined
-    with patch("engine.orchestration.planner.get_connector_instance", side_effect=mock_get_connector), \
-         patch("engine.orchestration.planner.Prisma", return_value=mock_db), \
-         patch("engine.orchestration.persistence.Path.write_text"), \
+    with patch("engine.orchestration.planner.acquire_connector", side_effect=mock_get_connector), \
+         patch("engine.orchestration.planner.get_db_provider", return_value=DbClientProvider(lambda: mock_db)), \
+         patch("engine.orchestration.persistence.get_raw_store"), \
          patch("engine.orchestration.persistence.extract_entity", side_effect=mock_extract_entity):
 
         # Create orchestration request with persistence enabled
@@ -77,6 +77,7 @@ async def test_overture_adapter_path_persists_raw_ingestion_even_when_extraction
     mock_db = Mock()
     mock_db.rawingestion = Mock()
     mock_db.rawingestion.find_first = AsyncMock(return_value=None)
+    mock_db.rawingestion.find_many = AsyncMock(return_value=[])
     mock_db.rawingestion.create = AsyncMock(side_effect=create_raw_ingestion)
     mock_db.extractedentity = Mock()
     mock_db.extractedentity.create = AsyncMock()
@@ -85,7 +86,7 @@ async def test_overture_adapter_path_persists_raw_ingestion_even_when_extraction
     with patch(
         "engine.orchestration.persistence.extract_entity",
         side_effect=ValueError("No extractor found for source: overture_local"),
-    ), patch("engine.orchestration.persistence.Path.write_text", return_value=0):
+    ), patch("engine.orchestration.persistence.get_raw_store"):
         manager = PersistenceManager(db=mock_db)
         result = await manager.persist_entities(state.accepted_entities, errors)
 
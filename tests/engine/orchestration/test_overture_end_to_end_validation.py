@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from engine.db import DbClientProvider
 from engine.ingestion.connectors.overture_local import OvertureLocalConnector
 from engine.orchestration.cli import bootstrap_lens
 from engine.orchestration.execution_plan import ConnectorSpec, ExecutionPhase, ExecutionPlan
@@ -78,7 +79,8 @@ async def test_overture_fixture_pipeline_persists_entity_with_canonicals_and_mod
     mock_db.connectorusage.upsert = AsyncMock()
 
     async def create_raw_ingestion(*, data):
-        raw_id = f"raw-{len(raw_rows) + 1}"
+        # Persistence supplies the id so extraction can run before the insert
+        raw_id = data.get("id", f"raw-{len(raw_rows) + 1}")
         row = SimpleNamespace(
             id=raw_id,
             source=data["source"],
@@ -92,6 +94,8 @@ async def test_overture_fixture_pipeline_persists_entity_with_canonicals_and_mod
         return raw_rows.get(where["id"])
 
     mock_db.rawingestion.find_first = AsyncMock(return_value=None)
+    mock_db.rawingestion.count = AsyncMock(return_value=0)
+    mock_db.rawingestion.find_many = AsyncMock(return_value=[])
     mock_db.rawingestion.create = AsyncMock(side_effect=create_raw_ingestion)
     mock_db.rawingestion.find_unique = AsyncMock(side_effect=find_raw_ingestion)
 
@@ -126,11 +130,11 @@ async def test_overture_fixture_pipeline_persists_entity_with_canonicals_and_mod
     mock_db.entity.update = AsyncMock()
 
     try:
-        with patch("engine.orchestration.planner.Prisma", return_value=mock_db), patch(
+        with patch("engine.orchestration.planner.get_db_provider", return_value=DbClientProvider(lambda: mock_db)), patch(
             "engine.orchestration.planner.select_connectors",
             return_value=_build_overture_only_plan(),
         ), patch(
-            "engine.orchestration.planner.get_connector_instance",
+            "engine.orchestration.planner.acquire_connector",
             return_value=overture_connector,
         ):
             request = IngestRequest(
@@ -146,6 +150,10 @@ async def test_overture_fixture_pipeline_persists_entity_with_canonicals_and_mod
         assert report["entities_created"] == 1
         assert report["entities_updated"] == 0
         assert report["persistence_errors"] == []
+        # Bloom filter warmed from RawIngestion before persisting
+        mock_db.rawingestion.count.assert_awaited_once()
+        assert report["db_connections"]["connects"] == 1
+        assert report["db_connections"]["disconnects"] == 0
 
         assert len(captured_entities) == 1
         entity = unwrap_prisma_json(captured_entities[0])
@@ -163,7 +163,7 @@ async def test_overture_live_single_run_persists_entity_with_canonicals_and_modu
             "engine.orchestration.planner.select_connectors",
             return_value=_build_overture_release_only_plan(),
         ), patch(
-            "engine.orchestration.planner.get_connector_instance",
+            "engine.orchestration.planner.acquire_connector",
             return_value=connector,
         ), patch(
             "engine.orchestration.extraction_integration.get_extractor_for_source",
@@ -0,0 +1,98 @@
+"""
+Tests for the persistence write-behind path.
+
+Extraction receives each candidate's payload in memory while the raw store
+write and the RawIngestion/ExtractedEntity inserts complete behind it.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+from engine.orchestration.persistence import PersistenceManager
+
+
+EXTRACTED = {"entity_class": "place", "attributes": {}, "discovered_attributes": {}}
+
+
+def _mock_db(create_raw):
+    db = Mock()
+    db.rawingestion.find_many = AsyncMock(return_value=[])
+    db.rawingestion.find_unique = AsyncMock()
+    db.rawingestion.create = AsyncMock(side_effect=create_raw)
+    db.extractedentity.create = AsyncMock()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_extraction_gets_payload_without_reading_it_back():
+    order = []
+    payloads = []
+
+    async def create_raw(*, data):
+        order.append(("raw", data["id"]))
+        return SimpleNamespace(**data)
+
+    async def extract(raw_ingestion_id, db, context=None, raw_data=None, raw_ingestion=None):
+        order.append(("extract", raw_ingestion_id))
+        assert raw_ingestion.source == "serper"
+        payloads.append(raw_data)
+        return EXTRACTED
+
+    db = _mock_db(create_raw)
+    db.extractedentity.create = AsyncMock(
+        side_effect=lambda *, data: order.append(("entity", data["raw_ingestion_id"]))
+    )
+    store = Mock()
+    store.put = Mock(return_value="engine/data/raw/objects/ab/cd/abcd.json.gz")
+
+    candidates = [
+        {"source": "serper", "name": f"Venue {i}", "raw": {"title": f"Venue {i}"}}
+        for i in range(3)
+    ]
+    with patch("engine.orchestration.persistence.extract_entity", side_effect=extract), \
+            patch("engine.orchestration.extraction_integration.read_raw_text") as read:
+        manager = PersistenceManager(db=db, raw_store=store)
+        result = await manager.persist_entities(candidates, errors=[])
+
+    assert result["persisted_count"] == 3
+    db.rawingestion.find_unique.assert_not_called()
+    read.assert_not_called()
+    assert store.put.call_count == 3
+    assert payloads == [candidate["raw"] for candidate in candidates]
+
+    raw_ids = [raw_id for kind, raw_id in order if kind == "raw"]
+    assert [raw_id for kind, raw_id in order if kind == "entity"] == raw_ids
+    # Each entity is inserted after its RawIngestion, using the id extraction saw
+    for raw_id in raw_ids:
+        assert order.index(("raw", raw_id)) < order.index(("entity", raw_id))
+        assert ("extract", raw_id) in order
+    for call in db.rawingestion.create.await_args_list:
+        assert call.kwargs["data"]["file_path"] == "engine/data/raw/objects/ab/cd/abcd.json.gz"
+
+
+@pytest.mark.asyncio
+async def test_failed_raw_insert_fails_its_entities():
+    async def create_raw(*, data):
+        if data["source_url"].endswith("Venue 1"):
+            raise RuntimeError("unique constraint")
+        return SimpleNamespace(**data)
+
+    db = _mock_db(create_raw)
+    candidates = [
+        {"source": "overture_release", "name": f"Venue {i}", "raw": {"n": i}}
+        for i in range(3)
+    ]
+    # Same payload as Venue 1: depends on the failed insert
+    candidates.append({"source": "overture_release", "name": "Venue 1", "raw": {"n": 1}})
+
+    errors = []
+    with patch("engine.orchestration.persistence.extract_entity", AsyncMock(return_value=EXTRACTED)):
+        manager = PersistenceManager(db=db, raw_store=Mock())
+        result = await manager.persist_entities(candidates, errors)
+
+    assert result["persisted_count"] == 2
+    assert len(result["persistence_errors"]) == 2
+    assert all("unique constraint" in error["error"] for error in errors)
+    assert db.rawingestion.create.await_count == 3
+    assert db.extractedentity.create.await_count == 2
@@ -701,7 +701,7 @@ class TestPhaseBasedParallelExecution:
         # Patch ConnectorAdapter to inject our tracking
         with patch('engine.orchestration.planner.ConnectorAdapter') as MockAdapter:
             # Setup mock to track execution
-            def create_mock_adapter(connector, spec):
+            def create_mock_adapter(connector, spec, rate_limiter=None, circuit_breaker=None):
                 mock_adapter = MagicMock()
                 phase_name = spec.phase.name
                 # Create AsyncMock that calls our tracking function
@@ -712,8 +712,8 @@ class TestPhaseBasedParallelExecution:
 
             MockAdapter.side_effect = create_mock_adapter
 
-            # Patch get_connector_instance to return dummy connectors
-            with patch('engine.orchestration.planner.get_connector_instance') as mock_get:
+            # Patch acquire_connector to return dummy connectors
+            with patch('engine.orchestration.planner.acquire_connector') as mock_get:
                 mock_get.return_value = MagicMock()
 
                 request = IngestRequest(
@@ -758,7 +758,7 @@ class TestPhaseBasedParallelExecution:
         with patch('engine.orchestration.planner.ConnectorAdapter') as MockAdapter:
             connector_count = 0
 
-            def create_mock_adapter(connector, spec):
+            def create_mock_adapter(connector, spec, rate_limiter=None, circuit_breaker=None):
                 nonlocal connector_count, max_concurrent
                 connector_count += 1
                 mock_adapter = MagicMock()
@@ -781,7 +781,7 @@ class TestPhaseBasedParallelExecution:
 
             MockAdapter.side_effect = create_mock_adapter
 
-            with patch('engine.orchestration.planner.get_connector_instance') as mock_get:
+            with patch('engine.orchestration.planner.acquire_connector') as mock_get:
                 mock_get.return_value = MagicMock()
 
                 request = IngestRequest(
@@ -0,0 +1,112 @@
+"""Tests for the orchestration job queue and the persistent worker."""
+
+import asyncio
+import shutil
+import sqlite3
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from engine.orchestration.job_queue import PostgresJobQueue, SQLiteJobQueue
+from engine.orchestration.worker import OrchestrationWorker
+
+
+@pytest.fixture
+def temp_dir():
+    path = Path("tmp") / "test_worker" / uuid.uuid4().hex
+    path.mkdir(parents=True)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _statuses(queue):
+    with sqlite3.connect(queue.path) as conn:
+        rows = conn.execute("SELECT query, status, run_id, error, attempts FROM orchestration_job").fetchall()
+    return {query: (status, run_id, error, attempts) for query, status, run_id, error, attempts in rows}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_queue_claims_each_job_once(temp_dir):
+    queue = SQLiteJobQueue(temp_dir / "jobs.sqlite3")
+    for query in ("first", "second", "third"):
+        await queue.enqueue(query, lens_id="edinburgh_finds")
+
+    first, second = await asyncio.gather(queue.claim("w1", 2), queue.claim("w2", 2))
+    claimed = [job.query for job in first + second]
+    assert sorted(claimed) == ["first", "second", "third"]
+    assert await queue.claim("w3", 2) == []
+
+    job = first[0]
+    await queue.complete(job.id, run_id="run-1")
+    assert _statuses(queue)[job.query] == ("completed", "run-1", None, 1)
+
+    # Jobs of a worker that died go back to the queue
+    assert await queue.requeue_stale(0) == 2
+    again = await queue.claim("w4", 5)
+    assert len(again) == 2 and all(job.attempts == 2 for job in again)
+
+
+@pytest.mark.asyncio
+async def test_postgres_claim_skips_locked_rows():
+    db = Mock()
+    db.query_raw = AsyncMock(return_value=[
+        {"id": "j2", "query": "b", "lens_id": None, "ingestion_mode": "discover_many",
+         "persist": False, "attempts": 1, "createdAt": "2026-10-18T10:00:02"},
+        {"id": "j1", "query": "a", "lens_id": "edinburgh_finds", "ingestion_mode": "resolve_one",
+         "persist": True, "attempts": 2, "createdAt": "2026-10-18T10:00:01"},
+    ])
+
+    jobs = await PostgresJobQueue(db).claim("worker-1", 2)
+
+    sql, *params = db.query_raw.await_args.args
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert params == ["running", "worker-1", "queued", 2]
+    assert [job.id for job in jobs] == ["j1", "j2"]
+    assert jobs[0].persist is True and jobs[0].lens_id == "edinburgh_finds"
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_jobs_concurrently_and_records_outcomes(temp_dir):
+    queue = SQLiteJobQueue(temp_dir / "jobs.sqlite3")
+    for query in ("q1", "q2", "q3", "q4", "boom"):
+        await queue.enqueue(query, persist=query == "q1")
+
+    running = 0
+    peak = 0
+    contexts = set()
+
+    async def fake_orchestrate(request, *, ctx):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        contexts.add(id(ctx))
+        await asyncio.sleep(0.01)
+        running -= 1
+        if request.query == "boom":
+            raise RuntimeError("connector exploded")
+        report = {"query": request.query, "candidates_found": 1, "accepted_entities": 1}
+        if request.persist:
+            report["orchestration_run_id"] = f"run-{request.query}"
+        return report
+
+    worker = OrchestrationWorker(
+        queue,
+        concurrency=2,
+        poll_interval=0.01,
+        default_lens_id="edinburgh_finds",
+        hold_db=False,
+    )
+    with patch("engine.orchestration.worker.orchestrate", side_effect=fake_orchestrate):
+        stats = await worker.run(drain=True)
+
+    assert stats == {"completed": 4, "failed": 1}
+    assert peak == 2
+    assert len(contexts) == 1  # The compiled lens is reused across jobs
+
+    statuses = _statuses(queue)
+    assert statuses["q1"][:2] == ("completed", "run-q1")
+    assert statuses["q2"][0] == "completed"
+    assert statuses["boom"][0] == "failed"
+    assert "connector exploded" in statuses["boom"][2]
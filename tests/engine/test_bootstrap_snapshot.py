@@ -0,0 +1,103 @@
+"""Tests for the warm bootstrap snapshot of compiled configs."""
+
+import datetime
+import json
+import shutil
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from engine.bootstrap import BootstrapSnapshot, set_bootstrap_snapshot, warm_bootstrap
+from engine.ingestion.sources_config import load_sources_config
+from engine.orchestration.lens_bootstrap import bootstrap_lens
+
+
+@pytest.fixture
+def temp_dir():
+    path = Path("tmp") / "test_bootstrap_snapshot" / uuid.uuid4().hex
+    path.mkdir(parents=True)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _parse(path):
+    return yaml.safe_load(path.read_text(encoding="utf-8"))
+
+
+def test_unchanged_inputs_load_from_snapshot_in_a_new_process(temp_dir):
+    snapshot_path = temp_dir / "snapshot.json"
+    first, second = temp_dir / "first.yaml", temp_dir / "second.yaml"
+    first.write_text("a: 1\n", encoding="utf-8")
+    second.write_text("b: 2\n", encoding="utf-8")
+
+    cold = BootstrapSnapshot(snapshot_path)
+    assert cold.load("yaml", first, _parse) == {"a": 1}
+    assert cold.load("yaml", second, _parse) == {"b": 2}
+    assert cold.compiled == 2
+
+    # A new process reads the file once and only recompiles the edited input
+    second.write_text("b: 3\n", encoding="utf-8")
+    warm = BootstrapSnapshot(snapshot_path)
+    with patch(f"{__name__}.yaml.safe_load", wraps=yaml.safe_load) as parse:
+        value = warm.load("yaml", first, _parse)
+        value["a"] = 99  # Callers get their own copy
+        assert warm.load("yaml", first, _parse) == {"a": 1}
+        assert warm.load("yaml", second, _parse) == {"b": 3}
+    assert parse.call_count == 1
+    assert (warm.hits, warm.compiled) == (2, 1)
+
+
+def test_stale_engine_version_and_unstable_values_are_not_reused(temp_dir):
+    snapshot_path = temp_dir / "snapshot.json"
+    source = temp_dir / "config.yaml"
+    source.write_text("released: 2025-01-01\n", encoding="utf-8")
+
+    snapshot = BootstrapSnapshot(snapshot_path)
+    # YAML dates do not survive JSON, so the value is compiled but not stored
+    assert snapshot.load("yaml", source, _parse) == {"released": datetime.date(2025, 1, 1)}
+    assert not snapshot_path.exists()
+
+    source.write_text("released: '2025-01-01'\n", encoding="utf-8")
+    snapshot.load("yaml", source, _parse)
+    data = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    data["engine_version"] = "older-engine"
+    snapshot_path.write_text(json.dumps(data), encoding="utf-8")
+
+    rebuilt = BootstrapSnapshot(snapshot_path)
+    rebuilt.load("yaml", source, _parse)
+    assert rebuilt.compiled == 1
+
+
+def test_bootstrap_lens_reuses_compiled_contract(temp_dir):
+    lens_path = Path("engine/lenses/edinburgh_finds/lens.yaml")
+    snapshot_path = temp_dir / "snapshot.json"
+
+    try:
+        set_bootstrap_snapshot(BootstrapSnapshot(snapshot_path))
+        cold = bootstrap_lens("edinburgh_finds")
+
+        set_bootstrap_snapshot(BootstrapSnapshot(snapshot_path))
+        with patch("engine.orchestration.lens_bootstrap.VerticalLens") as vertical_lens:
+            warm = bootstrap_lens("edinburgh_finds")
+        vertical_lens.assert_not_called()
+    finally:
+        set_bootstrap_snapshot(None)
+
+    assert lens_path.exists()
+    assert warm.lens_hash == cold.lens_hash
+    assert warm.lens_contract == cold.lens_contract
+
+
+def test_sources_config_is_never_written_to_snapshot(temp_dir):
+    snapshot_path = temp_dir / "snapshot.json"
+    sources = temp_dir / "sources.yaml"
+    sources.write_text("serper:\n  api_key: secret-key\n", encoding="utf-8")
+
+    set_bootstrap_snapshot(BootstrapSnapshot(snapshot_path))
+    assert load_sources_config(sources)["serper"]["api_key"] == "secret-key"
+    warm_bootstrap()
+
+    assert "secret-key" not in snapshot_path.read_text(encoding="utf-8")
@@ -0,0 +1,83 @@
+"""Tests for the shared, ref-counted Prisma client provider."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from engine.db import DbClientProvider
+from engine.extraction.llm_cache import check_llm_cache
+from engine.orchestration.persistence import PersistenceManager
+
+
+def _fake_client():
+    client = Mock()
+    client.connect = AsyncMock()
+    client.disconnect = AsyncMock()
+    client.extractedlisting.find_first = AsyncMock(return_value=None)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_nested_and_concurrent_users_share_one_connection():
+    client = _fake_client()
+    provider = DbClientProvider(lambda: client)
+
+    async def use():
+        async with provider.session() as db:
+            await asyncio.sleep(0)
+            return db
+
+    async with provider.session() as outer:
+        used = await asyncio.gather(use(), use(), use())
+
+    assert all(db is outer for db in used)
+    assert client.connect.await_count == 1
+    assert client.disconnect.await_count == 1
+    assert provider.stats()["connects"] == 1
+    assert provider.stats()["disconnects"] == 1
+    assert provider.refs == 0
+
+    # A new reference after the last release reconnects the same client
+    async with provider.session() as again:
+        assert again is client
+    assert provider.stats()["connects"] == 2
+
+
+@pytest.mark.asyncio
+async def test_injected_client_is_not_counted():
+    provider = DbClientProvider(_fake_client)
+    injected = _fake_client()
+
+    async with provider.session(injected) as db:
+        assert db is injected
+
+    assert provider.stats()["connects"] == 0
+    injected.connect.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_takes_no_reference():
+    client = _fake_client()
+    client.connect.side_effect = RuntimeError("database down")
+    provider = DbClientProvider(lambda: client)
+
+    with pytest.raises(RuntimeError):
+        await provider.acquire()
+
+    assert provider.refs == 0
+    assert provider.stats()["connects"] == 0
+
+
+@pytest.mark.asyncio
+async def test_modules_fall_back_to_the_shared_client():
+    client = _fake_client()
+    provider = DbClientProvider(lambda: client)
+
+    with patch("engine.db.client._default_provider", provider):
+        async with PersistenceManager(raw_store=Mock()) as persistence:
+            assert persistence.db is client
+            assert await check_llm_cache("abc") is None
+
+    assert client.connect.await_count == 1
+    assert client.disconnect.await_count == 1
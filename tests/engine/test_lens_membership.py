@@ -5,13 +5,19 @@ Tests the explicit lens membership API in engine.lenses.ops.
 """
 
 import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from prisma import Prisma
 from engine.lenses.ops import (
+    attach_entities_to_lenses,
     attach_entity_to_lens,
+    detach_entities_from_lenses,
     detach_entity_from_lens,
     get_entity_lenses,
     get_lens_entities,
+    sync_lens_membership,
 )
 
 
@@ -233,3 +239,79 @@ async def test_multiple_entities_multiple_lenses():
         await detach_entity_from_lens("entity-c", "lens-y")
         for entity_id in entities:
             await delete_test_entity(entity_id)
+
+
+def _mock_db(existing_entity_ids=()):
+    """Injected client stub: bulk ops must not open their own connection."""
+    db = MagicMock()
+    db.lensentity.find_many = AsyncMock(
+        return_value=[SimpleNamespace(entityId=e, lensId="lens-x") for e in existing_entity_ids]
+    )
+    db.lensentity.create_many = AsyncMock(side_effect=lambda data, skip_duplicates: len(data))
+    db.lensentity.delete_many = AsyncMock(side_effect=lambda where: len(where["entityId"]["in"]))
+    return db
+
+
+@pytest.mark.asyncio
+async def test_attach_many_uses_batched_create_many_with_skip_duplicates():
+    db = _mock_db()
+    pairs = [("lens-x", f"e{i}") for i in range(5)] + [("lens-x", "e0")]
+
+    created = await attach_entities_to_lenses(pairs, db=db, batch_size=2)
+
+    assert created == 5
+    assert db.lensentity.create_many.await_count == 3
+    for call in db.lensentity.create_many.await_args_list:
+        assert call.kwargs["skip_duplicates"] is True
+
+
+@pytest.mark.asyncio
+async def test_detach_many_groups_delete_many_per_lens():
+    db = _mock_db()
+
+    deleted = await detach_entities_from_lenses(
+        [("lens-x", "e1"), ("lens-y", "e1"), ("lens-x", "e2")], db=db
+    )
+
+    assert deleted == 3
+    wheres = [call.kwargs["where"] for call in db.lensentity.delete_many.await_args_list]
+    assert wheres == [
+        {"lensId": "lens-x", "entityId": {"in": ["e1", "e2"]}},
+        {"lensId": "lens-y", "entityId": {"in": ["e1"]}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_ops_with_no_pairs_do_not_touch_db():
+    db = _mock_db()
+    assert await attach_entities_to_lenses([], db=db) == 0
+    assert await detach_entities_from_lenses([], db=db) == 0
+    db.lensentity.create_many.assert_not_awaited()
+    db.lensentity.delete_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sync_lens_membership_applies_set_diff():
+    db = _mock_db(existing_entity_ids=["keep", "stale"])
+
+    result = await sync_lens_membership("lens-x", ["keep", "new-1", "new-2"], db=db)
+
+    assert result == {"added": 2, "removed": 1, "unchanged": 1}
+    db.lensentity.find_many.assert_awaited_once_with(where={"lensId": "lens-x"})
+    created = db.lensentity.create_many.await_args.kwargs["data"]
+    assert created == [
+        {"lensId": "lens-x", "entityId": "new-1"},
+        {"lensId": "lens-x", "entityId": "new-2"},
+    ]
+    assert db.lensentity.delete_many.await_args.kwargs["where"] == {
+        "lensId": "lens-x",
+        "entityId": {"in": ["stale"]},
+    }
+
+
+@pytest.mark.asyncio
+async def test_single_attach_with_injected_client_is_one_statement():
+    db = _mock_db()
+    assert await attach_entity_to_lens("e1", "lens-x", db=db) is True
+    db.lensentity.find_unique.assert_not_called()
+    db.lensentity.create_many.assert_awaited_once()
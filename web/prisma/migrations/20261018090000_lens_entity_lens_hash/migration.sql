@@ -0,0 +1,5 @@
+-- AlterTable
+ALTER TABLE "LensEntity" ADD COLUMN     "lensHash" TEXT;
+
+-- CreateIndex
+CREATE INDEX "LensEntity_lensId_lensHash_idx" ON "LensEntity"("lensId", "lensHash");
@@ -0,0 +1,10 @@
+-- CreateTable
+CREATE TABLE "RateLimitBucket" (
+    "key" TEXT NOT NULL,
+    "window" TEXT NOT NULL,
+    "tokens" DOUBLE PRECISION NOT NULL,
+    "refilled_at" DOUBLE PRECISION NOT NULL,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "RateLimitBucket_pkey" PRIMARY KEY ("key","window")
+);